@@ -1,6 +1,21 @@
 -- 세밀한 리소스 권한 초기화 스크립트
 -- MCP Retriever 프로젝트의 역할별 기본 권한 설정
 
+-- 관리자 목록 필터용 인덱스 (schema.sql과 동일, 기존 DB 업그레이드용)
+-- 단일 컬럼 인덱스는 복합 인덱스와 id로 끝나는 키셋 인덱스로 대체
+DROP INDEX IF EXISTS idx_resource_permissions_resource_type;
+DROP INDEX IF EXISTS idx_resource_permissions_resource_name;
+DROP INDEX IF EXISTS idx_resource_permissions_user_id;
+DROP INDEX IF EXISTS idx_resource_permissions_role_name;
+CREATE INDEX IF NOT EXISTS idx_resource_permissions_type_role_name
+    ON resource_permissions(resource_type, role_name, resource_name);
+CREATE INDEX IF NOT EXISTS idx_resource_permissions_type_role_id
+    ON resource_permissions(resource_type, role_name, id);
+CREATE INDEX IF NOT EXISTS idx_resource_permissions_user_keyset
+    ON resource_permissions(user_id, id);
+CREATE INDEX IF NOT EXISTS idx_resource_permissions_role_keyset
+    ON resource_permissions(role_name, id);
+
 -- 기존 권한 삭제 (테스트용)
 DELETE FROM resource_permissions WHERE role_name IS NOT NULL;
 
@@ -27,8 +27,12 @@ MCP 서버 인증 시스템 데이터베이스 설정 및 모델
 """
 
 import os
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Table
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Table, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from datetime import datetime, UTC
 
@@ -154,14 +158,128 @@ class RevokedToken(Base):
 # Docker 환경에서는 /data/auth.db로 저장하여 볼륨 마운트 가능
 AUTH_DATABASE_URL = os.getenv("AUTH_DATABASE_URL", "sqlite+aiosqlite:///./auth.db")
 
+
+@dataclass
+class SQLiteEngineProfile:
+    """
+    SQLite 엔진 튜닝 프로파일
+
+    연결이 열릴 때마다(connect 이벤트) PRAGMA를 적용합니다.
+
+        - journal_mode=WAL: 읽기가 쓰기를 막지 않음 (DB 파일에 영구 저장)
+        - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 손상 없음
+        - busy_timeout: 잠금 충돌 시 즉시 실패하지 않고 대기 (밀리초)
+        - mmap_size: 메모리 맵 I/O 크기 (바이트, 0이면 사용 안 함)
+        - cache_size: 연결별 페이지 캐시 (KiB)
+
+    SQLite는 동시에 하나의 쓰기만 허용하므로 쓰기 엔진은 연결 하나로
+    고정하고, 읽기 엔진은 query_only 연결 풀로 분리합니다.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size_kb: int = 64 * 1024
+    read_pool_size: int = 4
+
+    @classmethod
+    def from_env(cls) -> "SQLiteEngineProfile":
+        """환경변수(AUTH_DB_*)에서 프로파일 생성"""
+        return cls(
+            journal_mode=os.getenv("AUTH_DB_JOURNAL_MODE", cls.journal_mode).upper(),
+            synchronous=os.getenv("AUTH_DB_SYNCHRONOUS", cls.synchronous).upper(),
+            busy_timeout_ms=int(
+                os.getenv("AUTH_DB_BUSY_TIMEOUT_MS", str(cls.busy_timeout_ms))
+            ),
+            mmap_size=int(os.getenv("AUTH_DB_MMAP_SIZE", str(cls.mmap_size))),
+            cache_size_kb=int(
+                os.getenv("AUTH_DB_CACHE_SIZE_KB", str(cls.cache_size_kb))
+            ),
+            read_pool_size=int(
+                os.getenv("AUTH_DB_READ_POOL_SIZE", str(cls.read_pool_size))
+            ),
+        )
+
+    def pragmas(self, read_only: bool = False) -> list[str]:
+        """연결에 적용할 PRAGMA 문 목록"""
+        statements = [
+            # WAL 전환은 쓰기 잠금이 필요하므로 대기 시간을 먼저 설정
+            f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}",
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA mmap_size={int(self.mmap_size)}",
+            # 음수는 페이지 수가 아닌 KiB 단위
+            f"PRAGMA cache_size={-int(self.cache_size_kb)}",
+        ]
+        if read_only:
+            statements.append("PRAGMA query_only=ON")
+        return statements
+
+
+def _is_file_sqlite(url: str) -> bool:
+    """파일 기반 SQLite URL 여부 (메모리 DB는 연결마다 별도 DB라 분리 불가)"""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def _install_pragmas(
+    async_engine: AsyncEngine, profile: SQLiteEngineProfile, read_only: bool
+) -> None:
+    """엔진의 connect 이벤트에 PRAGMA 적용 등록"""
+    statements = profile.pragmas(read_only=read_only)
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def create_engines(
+    url: str = AUTH_DATABASE_URL, profile: Optional[SQLiteEngineProfile] = None
+) -> tuple[AsyncEngine, AsyncEngine]:
+    """
+    쓰기/읽기 엔진 생성
+
+    파일 기반 SQLite이면 연결 하나짜리 쓰기 엔진과 query_only 읽기
+    풀을 만들고, 그 외(메모리 SQLite, 다른 DB)에는 같은 엔진을 둘 다로
+    반환합니다.
+
+    Args:
+        url: 데이터베이스 URL
+        profile: SQLite 튜닝 프로파일 (없으면 환경변수에서 생성)
+
+    Returns:
+        tuple[AsyncEngine, AsyncEngine]: (쓰기 엔진, 읽기 엔진)
+    """
+    echo = os.getenv("SQLALCHEMY_ECHO", "False").lower() == "true"
+    if not _is_file_sqlite(url):
+        # pool_pre_ping=True로 연결 유효성 자동 확인
+        shared = create_async_engine(url, echo=echo, pool_pre_ping=True)
+        return shared, shared
+
+    profile = profile or SQLiteEngineProfile.from_env()
+    # 쓰기는 연결 하나로 직렬화: 다른 쓰기는 SQLite 잠금 대신 풀에서 대기
+    writer = create_async_engine(url, echo=echo, pool_size=1, max_overflow=0)
+    reader = create_async_engine(
+        url, echo=echo, pool_size=max(1, profile.read_pool_size), max_overflow=0
+    )
+    _install_pragmas(writer, profile, read_only=False)
+    _install_pragmas(reader, profile, read_only=True)
+    return writer, reader
+
+
 # 비동기 SQLAlchemy 엔진 생성
-# pool_pre_ping=True로 연결 유효성 자동 확인
-engine = create_async_engine(
-    AUTH_DATABASE_URL,
-    echo=os.getenv("SQLALCHEMY_ECHO", "False").lower()
-    == "true",  # 환경변수로 SQL 로깅 제어
-    pool_pre_ping=True,  # 연결 풀에서 연결 사용 전 ping 테스트
-)
+# engine은 쓰기(및 기존 호출부) 전용, read_engine은 조회 전용
+engine, read_engine = create_engines(AUTH_DATABASE_URL)
 
 # 비동기 세션 팩토리 생성
 # expire_on_commit=False로 커밋 후에도 객체 접근 가능
@@ -170,6 +288,11 @@ async_session_maker = sessionmaker(
     class_=AsyncSession,
     expire_on_commit=False,  # 커밋 후 객체 만료 방지
 )
+async_read_session_maker = sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
 
 
 async def get_db():
@@ -203,6 +326,31 @@ async def get_db():
             await session.close()
 
 
+async def get_read_db():
+    """
+    FastAPI 의존성 주입용 읽기 전용 데이터베이스 세션 제공
+
+    로그인, 토큰 갱신, /auth/me처럼 조회만 하는 요청에 사용합니다.
+    파일 기반 SQLite에서는 읽기 연결 풀에서 세션을 만들어 쓰기 연결과
+    경쟁하지 않으며, 쓰기를 시도하면 query_only로 인해 실패합니다.
+
+    Yields:
+        AsyncSession: 읽기 전용 비동기 데이터베이스 세션
+    """
+    async with async_read_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def dispose_engines():
+    """쓰기/읽기 엔진의 연결 풀 정리"""
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
+
+
 async def init_db():
     """
     데이터베이스 테이블 초기화
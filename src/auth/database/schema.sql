@@ -14,10 +14,17 @@ CREATE TABLE IF NOT EXISTS resource_permissions (
 );
 
 -- 인덱스 생성
-CREATE INDEX idx_resource_permissions_user_id ON resource_permissions(user_id);
-CREATE INDEX idx_resource_permissions_role_name ON resource_permissions(role_name);
-CREATE INDEX idx_resource_permissions_resource_type ON resource_permissions(resource_type);
-CREATE INDEX idx_resource_permissions_resource_name ON resource_permissions(resource_name);
+-- 관리자 목록 필터: 타입 → 역할 → 리소스 이름 순 복합 인덱스 (리소스 이름 조건까지 사용)
+CREATE INDEX IF NOT EXISTS idx_resource_permissions_type_role_name
+    ON resource_permissions(resource_type, role_name, resource_name);
+-- 키셋 페이지(ORDER BY id)는 등호 조건 뒤에 id가 와야 정렬 없이 LIMIT까지만 읽음
+CREATE INDEX IF NOT EXISTS idx_resource_permissions_type_role_id
+    ON resource_permissions(resource_type, role_name, id);
+CREATE INDEX IF NOT EXISTS idx_resource_permissions_user_keyset
+    ON resource_permissions(user_id, id);
+-- 타입 없이 역할만으로 거르는 경우 (복합 인덱스의 선두 컬럼이 아님)
+CREATE INDEX IF NOT EXISTS idx_resource_permissions_role_keyset
+    ON resource_permissions(role_name, id);
 
 -- 권한 감사 로그 테이블
 CREATE TABLE IF NOT EXISTS permission_audit_log (
@@ -203,7 +203,7 @@ async def get_current_user(
         # SQLite 기반 인증 서비스 사용
         from .services.auth_service_sqlite import SQLiteAuthService
         from .services.jwt_service import JWTService
-        from .database import get_db
+        from .database import get_read_db
         import os
 
         # JWT 서비스 생성
@@ -217,8 +217,8 @@ async def get_current_user(
         # SQLite auth service 생성
         auth_service = SQLiteAuthService(jwt_service)
 
-        # 데이터베이스 세션 가져오기
-        async for db in get_db():
+        # 읽기 전용 데이터베이스 세션 가져오기
+        async for db in get_read_db():
             try:
                 return await auth_service.get_current_user(token, db)
             finally:
@@ -319,20 +319,30 @@ def get_rbac_service() -> "RBACService":
     return RBACService()
 
 
-def get_permission_service():
+async def get_permission_service():
     """
     리소스 권한 관리 서비스 의존성
 
     세밀한 리소스 권한을 관리하는 서비스 인스턴스를 제공합니다.
-    현재는 기본 역할 기반 권한만 제공하지만, DB 연결 시 사용자별 권한도 지원합니다.
+    AUTH_USER_STORE=postgres면 인증 저장소 연결 풀에서 요청 동안 쓸 연결을
+    빌려 전달하고, sqlite 저장소에서는 DB 없이 기본 역할 기반 권한만 제공합니다.
 
-    Returns:
+    Yields:
         PermissionService: 권한 관리 서비스 인스턴스
+
+    Note:
+        StreamingResponse 본문은 의존성 정리 뒤에 전송되므로, 내보내기는 이
+        연결 대신 user_store.iter_permission_export_batches의 전용 연결을 씁니다.
     """
     from .services import PermissionService
+    from .user_store import get_pool_manager, use_postgres
+
+    if not use_postgres():
+        yield PermissionService(db_conn=None)
+        return
 
-    # TODO: 실제 구현에서는 DB 연결을 전달해야 함
-    return PermissionService(db_conn=None)
+    async with get_pool_manager().acquire() as conn:
+        yield PermissionService(db_conn=conn)
 
 
 class RoleChecker:
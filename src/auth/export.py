@@ -0,0 +1,314 @@
+"""
+관리자 데이터 내보내기 스트리밍
+
+DB 커서에서 배치 단위로 읽은 행을 CSV / NDJSON / Parquet 바이트로
+인코딩하여 바로 응답으로 흘려보냅니다. 전체 행을 메모리에 올리지 않으므로
+게이트웨이 메모리 사용량은 행 수와 무관하게 배치 크기에만 비례합니다.
+
+    rows (AsyncIterator[list[dict]]) → RowEncoder → (gzip) → StreamingResponse
+
+    - CSV: 배치마다 csv.writer 출력을 모아 한 번에 인코딩 (행마다
+      StringIO를 비우는 write/seek/truncate 반복 없음)
+    - NDJSON: 한 줄에 JSON 객체 하나
+    - Parquet: 배치 하나가 row group 하나 (pyarrow 필요, 자체 압축 사용)
+    - gzip: zlib 스트리밍 압축 (Content-Encoding: gzip)
+"""
+
+import csv
+import importlib.util
+import json
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import UTC
+from typing import Any, AsyncIterator, Callable, Optional, Sequence
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    """
+    내보내기 컬럼 정의
+
+    Attributes:
+        name: NDJSON/Parquet 필드 이름 (행 dict의 키)
+        label: CSV 헤더
+        kind: 값 종류 (str, int, bool, datetime, list, json)
+    """
+
+    name: str
+    label: str
+    kind: str = "str"
+
+
+USER_EXPORT_COLUMNS = (
+    ExportColumn("id", "ID"),
+    ExportColumn("username", "사용자명"),
+    ExportColumn("email", "이메일"),
+    ExportColumn("roles", "역할", "list"),
+    ExportColumn("is_active", "활성화", "bool"),
+    ExportColumn("is_verified", "이메일 인증", "bool"),
+    ExportColumn("created_at", "생성일", "datetime"),
+    ExportColumn("updated_at", "수정일", "datetime"),
+)
+
+PERMISSION_EXPORT_COLUMNS = (
+    ExportColumn("id", "ID", "int"),
+    ExportColumn("user_id", "사용자ID", "int"),
+    ExportColumn("role_name", "역할명"),
+    ExportColumn("resource_type", "리소스타입"),
+    ExportColumn("resource_name", "리소스명"),
+    ExportColumn("actions", "액션", "list"),
+    ExportColumn("conditions", "조건", "json"),
+    ExportColumn("granted_at", "부여일", "datetime"),
+    ExportColumn("expires_at", "만료일", "datetime"),
+)
+
+
+class _ChunkBuffer:
+    """write()로 받은 조각을 모았다가 한 번에 꺼내는 버퍼 (파일 객체 대용)"""
+
+    def __init__(self):
+        self.parts: list = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.parts.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self, joiner):
+        data = joiner.join(self.parts)
+        self.parts.clear()
+        return data
+
+
+def _csv_value(kind: str, value: Any) -> Any:
+    if value is None:
+        return ""
+    if kind == "bool":
+        return "예" if value else "아니오"
+    if kind == "datetime":
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if kind == "list":
+        return ", ".join(value)
+    if kind == "json":
+        return json.dumps(value, ensure_ascii=False) if value else ""
+    return value
+
+
+def _json_value(kind: str, value: Any) -> Any:
+    if value is not None and kind == "datetime":
+        return value.isoformat()
+    if kind == "list" and value is not None:
+        return list(value)
+    return value
+
+
+class RowEncoder(ABC):
+    """행 배치를 바이트로 바꾸는 인코더 (형식별 구현)"""
+
+    def __init__(self, columns: Sequence[ExportColumn]):
+        self.columns = columns
+
+    def header(self) -> bytes:
+        return b""
+
+    @abstractmethod
+    def encode(self, rows: Sequence[dict]) -> bytes:
+        """행 배치 인코딩"""
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class CSVEncoder(RowEncoder):
+    """CSV (UTF-8)"""
+
+    def __init__(self, columns: Sequence[ExportColumn]):
+        super().__init__(columns)
+        self._buffer = _ChunkBuffer()
+        self._writer = csv.writer(self._buffer)
+
+    def header(self) -> bytes:
+        self._writer.writerow([column.label for column in self.columns])
+        return self._buffer.drain("").encode()
+
+    def encode(self, rows: Sequence[dict]) -> bytes:
+        columns = [(column.name, column.kind) for column in self.columns]
+        self._writer.writerows(
+            [_csv_value(kind, row.get(name)) for name, kind in columns] for row in rows
+        )
+        return self._buffer.drain("").encode()
+
+
+class NDJSONEncoder(RowEncoder):
+    """줄 단위 JSON"""
+
+    def encode(self, rows: Sequence[dict]) -> bytes:
+        columns = [(column.name, column.kind) for column in self.columns]
+        lines = [
+            json.dumps(
+                {name: _json_value(kind, row.get(name)) for name, kind in columns},
+                ensure_ascii=False,
+                default=str,
+            )
+            for row in rows
+        ]
+        return ("\n".join(lines) + "\n").encode() if lines else b""
+
+
+class ParquetEncoder(RowEncoder):
+    """Parquet (배치마다 row group 하나, pyarrow 필요)"""
+
+    def __init__(self, columns: Sequence[ExportColumn]):
+        super().__init__(columns)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        types = {
+            "str": pa.string(),
+            "int": pa.int64(),
+            "bool": pa.bool_(),
+            "datetime": pa.timestamp("us", tz="UTC"),
+            "list": pa.list_(pa.string()),
+            "json": pa.string(),
+        }
+        self._schema = pa.schema(
+            [(column.name, types[column.kind]) for column in columns]
+        )
+        self._buffer = _ChunkBuffer()
+        self._writer = pq.ParquetWriter(
+            self._buffer, self._schema, compression="zstd"
+        )
+
+    @staticmethod
+    def _value(kind: str, value: Any) -> Any:
+        if value is None:
+            return None
+        if kind == "datetime" and value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        if kind == "json":
+            return json.dumps(value, ensure_ascii=False)
+        if kind == "list":
+            return list(value)
+        return value
+
+    def encode(self, rows: Sequence[dict]) -> bytes:
+        if not rows:
+            return b""
+        arrays = {
+            column.name: [self._value(column.kind, row.get(column.name)) for row in rows]
+            for column in self.columns
+        }
+        self._writer.write_table(
+            self._pa.table(arrays, schema=self._schema), row_group_size=len(rows)
+        )
+        return self._buffer.drain(b"")
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._buffer.drain(b"")
+
+
+ENCODERS: dict[str, Callable[[Sequence[ExportColumn]], RowEncoder]] = {
+    "csv": CSVEncoder,
+    "ndjson": NDJSONEncoder,
+    "parquet": ParquetEncoder,
+}
+
+
+def parquet_available() -> bool:
+    """pyarrow 설치 여부 (Parquet 내보내기 가능 여부)"""
+    # 하위 모듈 조회는 상위 패키지를 가져오므로 pyarrow부터 확인
+    return (
+        importlib.util.find_spec("pyarrow") is not None
+        and importlib.util.find_spec("pyarrow.parquet") is not None
+    )
+
+
+def wants_gzip(accept_encoding: Optional[str], fmt: str, compress: bool = True) -> bool:
+    """gzip 응답 여부 (클라이언트가 gzip을 받고, 형식 자체가 압축이 아닐 때)"""
+    return (
+        compress
+        and fmt != "parquet"
+        and "gzip" in (accept_encoding or "").lower()
+    )
+
+
+async def stream_export(
+    batches: AsyncIterator[Sequence[dict]],
+    columns: Sequence[ExportColumn],
+    fmt: str = "csv",
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    행 배치를 내보내기 바이트 스트림으로 변환
+
+    Args:
+        batches: DB 커서에서 읽은 행 배치 (dict 목록)
+        columns: 내보낼 컬럼
+        fmt: csv | ndjson | parquet
+        gzip: gzip 스트리밍 압축 여부
+
+    Yields:
+        응답 본문 조각 (배치 하나당 최대 한 조각)
+    """
+    encoder = ENCODERS[fmt](columns)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzip else None
+    rows = 0
+
+    def output(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor and data else data
+
+    try:
+        chunk = output(encoder.header())
+        if chunk:
+            yield chunk
+        async for batch in batches:
+            rows += len(batch)
+            chunk = output(encoder.encode(batch))
+            if chunk:
+                yield chunk
+        chunk = output(encoder.finish())
+        if compressor:
+            chunk += compressor.flush()
+        if chunk:
+            yield chunk
+    finally:
+        logger.info("데이터 내보내기 종료", format=fmt, gzip=gzip, rows=rows)
+
+
+def export_headers(filename: str, fmt: str, gzip: bool) -> dict[str, str]:
+    """내보내기 응답 헤더 (다운로드 파일명, 압축 여부)"""
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}.{fmt}",
+        "X-Content-Type-Options": "nosniff",
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return headers
+
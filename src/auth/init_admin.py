@@ -26,6 +26,7 @@ sys.path.insert(0, str(project_root))
 from src.auth.database import init_db, async_session_maker, User
 from src.auth.services.auth_service_sqlite import SQLiteAuthService
 from src.auth.services.jwt_service import JWTService
+from src.auth.user_store import get_user_repository, init_user_store, use_postgres
 from sqlalchemy import select, text
 import uuid
 
@@ -69,6 +70,10 @@ class AdminInitializer:
             username=self.admin_username
         )
 
+        # PostgreSQL 사용자 저장소는 Repository 인터페이스로 처리
+        if use_postgres():
+            return await self._ensure_admin_in_repository(get_user_repository())
+
         async with async_session_maker() as session:
             try:
                 # 기존 계정 확인
@@ -88,6 +93,42 @@ class AdminInitializer:
                 await session.rollback()
                 return False
 
+    async def _ensure_admin_in_repository(self, repository) -> bool:
+        """Repository(PostgreSQL)로 관리자 계정 생성 또는 admin 역할 추가"""
+        try:
+            user = await repository.get_by_email(self.admin_email)
+            if user is None:
+                await repository.create(
+                    {
+                        "email": self.admin_email,
+                        "username": self.admin_username,
+                        "password_hash": self.auth_service.hash_password(
+                            self.admin_password
+                        ),
+                        "roles": ["admin"],
+                        "is_active": True,
+                        "is_verified": True,
+                    }
+                )
+                logger.info("✅ 새 관리자 계정 생성 완료", email=self.admin_email)
+                return True
+
+            if "admin" in user.roles:
+                logger.info(
+                    "관리자 계정이 이미 admin 권한을 가지고 있습니다",
+                    email=self.admin_email,
+                    current_roles=user.roles,
+                )
+                return False
+
+            await repository.update(user.id, {"roles": [*user.roles, "admin"]})
+            logger.info("✅ 기존 계정에 admin 권한 추가 완료", email=self.admin_email)
+            return True
+
+        except Exception as e:
+            logger.error("관리자 계정 초기화 실패", error=str(e))
+            return False
+
     async def _create_admin_account(self, session, user_id: Optional[str] = None) -> bool:
         """새 관리자 계정 생성"""
         try:
@@ -167,6 +208,20 @@ class AdminInitializer:
 
     async def list_admin_accounts(self) -> list[dict]:
         """현재 admin 권한을 가진 모든 계정 조회"""
+        if use_postgres():
+            users = await get_user_repository().list_all(limit=1000)
+            return [
+                {
+                    "id": user.id,
+                    "email": user.email,
+                    "username": user.username,
+                    "is_active": user.is_active,
+                    "created_at": user.created_at,
+                }
+                for user in users
+                if "admin" in user.roles
+            ]
+
         async with async_session_maker() as session:
             try:
                 result = await session.execute(
@@ -206,6 +261,7 @@ async def init_admin_on_startup() -> bool:
     try:
         # 데이터베이스 초기화 (테이블이 없는 경우에만)
         await init_db()
+        await init_user_store()
         
         # 관리자 계정 초기화
         initializer = AdminInitializer()
@@ -10,6 +10,7 @@ This module provides comprehensive JWT token management including:
 
 import asyncio
 import json
+import random
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, Tuple
@@ -19,6 +20,8 @@ import redis.asyncio as redis
 import httpx
 import structlog
 
+from src.utils.redis_pool import get_redis_registry
+
 logger = structlog.get_logger(__name__)
 
 
@@ -55,7 +58,10 @@ class RefreshTokenStore:
     async def connect(self):
         """Connect to Redis."""
         if self._redis is None:
-            self._redis = await redis.from_url(self.redis_url)
+            # Shared pool; the store keeps raw bytes (no decode_responses)
+            self._redis = get_redis_registry().get_client(
+                self.redis_url, decode_responses=False
+            )
 
     async def disconnect(self):
         """Disconnect from Redis."""
@@ -390,7 +396,17 @@ class JWTManager:
 
 
 class AutoRefreshClient:
-    """HTTP client with automatic token refresh."""
+    """HTTP client with automatic token refresh.
+
+    Refreshes are single-flight: the first caller that needs a new token
+    starts the refresh and every other request (401 replays and requests
+    started meanwhile) waits on the same future, then replays with the new
+    token. Refresh tokens rotate on every refresh, so a second concurrent
+    refresh with the old refresh token would fail and log the client out.
+
+    Proactive renewal adds a random jitter to the expiry threshold so that
+    clients which logged in together do not all refresh in the same second.
+    """
 
     def __init__(
         self,
@@ -399,6 +415,8 @@ class AutoRefreshClient:
         refresh_threshold_minutes: int = 5,
         retry_attempts: int = 3,
         retry_delay_seconds: float = 1.0,
+        refresh_jitter_seconds: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         """Initialize auto-refresh client.
 
@@ -407,20 +425,27 @@ class AutoRefreshClient:
             base_url: Optional base URL for requests
             refresh_threshold_minutes: Minutes before expiry to refresh
             retry_attempts: Number of retry attempts on 401
-            retry_delay_seconds: Delay between retries
+            retry_delay_seconds: Delay before retrying a 401 that persists
+                after a fresh token
+            refresh_jitter_seconds: Random extra seconds added to the
+                refresh threshold (0 disables jitter)
+            transport: Optional httpx transport (tests, in-process gateways)
         """
         self.jwt_manager = jwt_manager
         self.base_url = base_url
         self.refresh_threshold_minutes = refresh_threshold_minutes
         self.retry_attempts = retry_attempts
         self.retry_delay_seconds = retry_delay_seconds
+        self.refresh_jitter_seconds = refresh_jitter_seconds
 
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._device_id: Optional[str] = None
-        self._refresh_lock = asyncio.Lock()
+        self._refresh_future: Optional[asyncio.Future] = None
+        self._renewal_threshold_minutes = self._jittered_threshold()
         self._refresh_task: Optional[asyncio.Task] = None
-        self._client = httpx.AsyncClient(base_url=base_url)
+        self.refresh_count = 0
+        self._client = httpx.AsyncClient(base_url=base_url or "", transport=transport)
 
     def set_tokens(self, access_token: str, refresh_token: str, device_id: str) -> None:
         """Set current tokens.
@@ -433,23 +458,44 @@ class AutoRefreshClient:
         self._access_token = access_token
         self._refresh_token = refresh_token
         self._device_id = device_id
+        self._renewal_threshold_minutes = self._jittered_threshold()
 
-    async def _refresh_tokens(self) -> TokenPair:
-        """Refresh tokens with lock to prevent concurrent refresh."""
-        async with self._refresh_lock:
-            # Check if already refreshed by another coroutine
-            if self._access_token and not self.jwt_manager.is_token_near_expiry(
-                self._access_token
-            ):
-                # Token already refreshed
-                return TokenPair(
-                    access_token=self._access_token,
-                    refresh_token=self._refresh_token,
-                    expires_in=0,  # Not used
-                    refresh_expires_in=0,  # Not used
-                )
+    def _jittered_threshold(self) -> float:
+        """Refresh threshold for the current token, in minutes, with jitter."""
+        jitter = random.uniform(0, self.refresh_jitter_seconds)
+        return self.refresh_threshold_minutes + jitter / 60
+
+    def _needs_renewal(self) -> bool:
+        """Whether the current access token is inside its renewal window."""
+        return bool(self._access_token) and self.jwt_manager.is_token_near_expiry(
+            self._access_token, self._renewal_threshold_minutes
+        )
+
+    async def _refresh_tokens(self, stale_token: Optional[str] = None) -> TokenPair:
+        """Refresh tokens once for all concurrent callers.
+
+        Args:
+            stale_token: Access token the caller saw rejected. If the current
+                token is already different, another caller refreshed it and
+                no new refresh is started.
+
+        Returns:
+            Current token pair after the (shared) refresh
 
-            # Perform refresh
+        Raises:
+            TokenRefreshError: If the shared refresh fails
+        """
+        if stale_token is not None and stale_token != self._access_token:
+            return self._current_pair()
+
+        if self._refresh_future is None:
+            self._refresh_future = asyncio.ensure_future(self._do_refresh())
+        # shield: a cancelled waiter must not cancel the refresh for the others
+        return await asyncio.shield(self._refresh_future)
+
+    async def _do_refresh(self) -> TokenPair:
+        try:
+            self.refresh_count += 1
             new_pair = await self.jwt_manager.refresh_tokens(
                 self._refresh_token, self._device_id
             )
@@ -457,8 +503,18 @@ class AutoRefreshClient:
             # Update tokens
             self._access_token = new_pair.access_token
             self._refresh_token = new_pair.refresh_token
-
+            self._renewal_threshold_minutes = self._jittered_threshold()
             return new_pair
+        finally:
+            self._refresh_future = None
+
+    def _current_pair(self) -> TokenPair:
+        return TokenPair(
+            access_token=self._access_token,
+            refresh_token=self._refresh_token,
+            expires_in=0,  # Not used
+            refresh_expires_in=0,  # Not used
+        )
 
     async def _make_authenticated_request(self, method: str, url: str, **kwargs) -> Any:
         """Make authenticated HTTP request.
@@ -471,7 +527,8 @@ class AutoRefreshClient:
         Returns:
             Response data
         """
-        headers = kwargs.pop("headers", {})
+        # Copy: the caller's headers are reused when the request is replayed
+        headers = dict(kwargs.pop("headers", None) or {})
         headers["Authorization"] = f"Bearer {self._access_token}"
 
         response = await self._client.request(method, url, headers=headers, **kwargs)
@@ -482,6 +539,10 @@ class AutoRefreshClient:
     async def request(self, method: str, url: str, **kwargs) -> Any:
         """Make HTTP request with automatic token refresh.
 
+        Requests issued while a refresh is in flight wait for it instead of
+        going out with a token that is about to be replaced; a 401 joins the
+        in-flight refresh (or starts one) and replays with the new token.
+
         Args:
             method: HTTP method
             url: Request URL
@@ -490,14 +551,13 @@ class AutoRefreshClient:
         Returns:
             Response data
         """
-        # Check if token needs refresh
-        if self._access_token and self.jwt_manager.is_token_near_expiry(
-            self._access_token, self.refresh_threshold_minutes
-        ):
+        # Queue behind an in-flight refresh, or renew proactively
+        if self._refresh_future is not None or self._needs_renewal():
             await self._refresh_tokens()
 
         # Attempt request with retries
         for attempt in range(self.retry_attempts):
+            token = self._access_token
             try:
                 return await self._make_authenticated_request(method, url, **kwargs)
 
@@ -506,9 +566,11 @@ class AutoRefreshClient:
                     # Token might be invalid, try refresh
                     logger.debug("Got 401, attempting token refresh", attempt=attempt)
 
-                    try:
-                        await self._refresh_tokens()
+                    if attempt:
+                        # Still rejected with a fresh token; back off first
                         await asyncio.sleep(self.retry_delay_seconds)
+                    try:
+                        await self._refresh_tokens(stale_token=token)
                         continue
                     except TokenRefreshError:
                         logger.error("Token refresh failed")
@@ -535,9 +597,7 @@ class AutoRefreshClient:
                 try:
                     await asyncio.sleep(check_interval_seconds)
 
-                    if self._access_token and self.jwt_manager.is_token_near_expiry(
-                        self._access_token, self.refresh_threshold_minutes
-                    ):
+                    if self._needs_renewal():
                         logger.info("Background refresh triggered")
                         await self._refresh_tokens()
 
@@ -0,0 +1,231 @@
+"""
+사용자 프로필 캐시 (/auth/me 핫 패스)
+
+MCP 서버의 AuthMiddleware는 요청마다 게이트웨이의 /auth/me를 호출하고,
+get_current_user는 JWT 검증 후 매번 사용자와 역할을 DB에서 읽습니다.
+이 모듈은 사용자 ID를 키로 하는 짧은 TTL 프로필 캐시를 제공하여
+워밍업 이후 /auth/me 비용을 딕셔너리 조회 한 번으로 줄입니다.
+
+    1. 프로세스 내 LRU (기본 계층, TTL 만료)
+    2. Redis (선택): auth_profile:{user_id}:{version} 키로 게이트웨이 인스턴스
+       간 공유. version은 auth_profile:ver:{user_id}에 있는 공유 무효화 표식.
+       REDIS_CLIENT_CACHE_PREFIXES에 auth_profile:을 넣으면 Redis 조회도
+       클라이언트 측 캐시에서 처리됨
+    3. 무효화: 역할 변경, 비활성화, 삭제 시 Repository가 invalidate() 호출.
+       표식을 새 값으로 바꾸므로, 다른 인스턴스가 무효화 전에 읽은 프로필을
+       나중에 써도 이전 version 키에 들어가 아무도 읽지 않음.
+       다른 인스턴스의 프로세스 내 사본은 TTL 안에 만료됨
+
+환경 변수:
+    AUTH_PROFILE_CACHE_TTL: 프로세스 내 TTL (초, 0이면 캐시 사용 안 함)
+    AUTH_PROFILE_CACHE_MAX: 프로세스 내 최대 사용자 수
+    AUTH_PROFILE_CACHE_REDIS: Redis 계층 사용 여부 (REDIS_URL 필요)
+    AUTH_PROFILE_CACHE_REDIS_TTL: Redis 계층 TTL (초)
+"""
+
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional
+
+import structlog
+
+from .models import UserResponse
+
+logger = structlog.get_logger(__name__)
+
+PROFILE_KEY_PREFIX = "auth_profile:"
+VERSION_KEY_PREFIX = f"{PROFILE_KEY_PREFIX}ver:"
+
+
+class UserProfileCache:
+    """
+    사용자 ID별 UserResponse 캐시
+
+    DB 조회가 끝나기 전에 무효화가 일어나면 조회 결과(이전 값)를
+    저장하지 않도록 generation을 비교합니다. 조회 전에 generation을
+    받아 두고 set()에 넘기면 됩니다. Redis 계층은 get()이 미스 때 읽은
+    공유 version 키에 저장하므로 다른 인스턴스의 무효화에도 안전합니다.
+
+    Example:
+        ```python
+        cache = UserProfileCache(ttl=30)
+        profile = await cache.get(user_id)
+        if profile is None:
+            generation = cache.generation
+            profile = await load_from_db(user_id)
+            await cache.set(profile, generation)
+        ```
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_entries: int = 10000,
+        redis_client: Optional[Any] = None,
+        redis_ttl: float = 300.0,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.redis = redis_client
+        self.redis_ttl = redis_ttl
+        self.generation = 0
+        self._entries: "OrderedDict[str, tuple[float, UserResponse]]" = OrderedDict()
+        # get() 미스 때 읽은 Redis version (set()이 이 version 키에 저장)
+        self._read_versions: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @classmethod
+    def from_env(cls) -> "UserProfileCache":
+        """환경변수(AUTH_PROFILE_CACHE_*)에서 캐시 생성"""
+        redis_client = None
+        redis_url = os.getenv("REDIS_URL")
+        use_redis = os.getenv("AUTH_PROFILE_CACHE_REDIS", "false").lower() == "true"
+        if use_redis and redis_url:
+            try:
+                from src.utils.redis_pool import get_redis_registry
+
+                redis_client = get_redis_registry().get_client(
+                    redis_url, decode_responses=True
+                )
+            except Exception as e:
+                logger.warning("프로필 캐시 Redis 계층 비활성화", error=str(e))
+        return cls(
+            ttl=float(os.getenv("AUTH_PROFILE_CACHE_TTL", "30")),
+            max_entries=int(os.getenv("AUTH_PROFILE_CACHE_MAX", "10000")),
+            redis_client=redis_client,
+            redis_ttl=float(os.getenv("AUTH_PROFILE_CACHE_REDIS_TTL", "300")),
+        )
+
+    async def get(self, user_id: str) -> Optional[UserResponse]:
+        """캐시된 프로필 (없거나 만료되었으면 None)"""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+        if self.redis is not None:
+            generation = self.generation
+            try:
+                version = await self._redis_version(user_id)
+                raw = await self.redis.get(self._redis_key(user_id, version))
+            except Exception as e:
+                logger.warning("프로필 캐시 Redis 조회 실패", error=str(e))
+                version, raw = None, None
+            if version is not None and not raw:
+                self._read_versions[user_id] = version
+                self._read_versions.move_to_end(user_id)
+                while len(self._read_versions) > self.max_entries:
+                    self._read_versions.popitem(last=False)
+            if raw:
+                profile = UserResponse.model_validate_json(raw)
+                self._store(profile, generation)
+                self.redis_hits += 1
+                return profile
+
+        self.misses += 1
+        return None
+
+    @staticmethod
+    def _redis_key(user_id: str, version: str) -> str:
+        return f"{PROFILE_KEY_PREFIX}{user_id}:{version}"
+
+    async def _redis_version(self, user_id: str) -> str:
+        """공유 무효화 표식 (한 번도 무효화되지 않았으면 "0")"""
+        return await self.redis.get(f"{VERSION_KEY_PREFIX}{user_id}") or "0"
+
+    def _store(self, profile: UserResponse, generation: int) -> bool:
+        if generation != self.generation:
+            return False
+        self._entries[profile.id] = (time.monotonic() + self.ttl, profile)
+        self._entries.move_to_end(profile.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    async def set(self, profile: UserResponse, generation: Optional[int] = None) -> None:
+        """
+        프로필 저장
+
+        Args:
+            profile: 저장할 프로필
+            generation: DB 조회 전에 읽은 generation (그 사이 무효화되었으면 저장 안 함)
+        """
+        if not self.enabled:
+            return
+        generation = self.generation if generation is None else generation
+        version = self._read_versions.pop(profile.id, None)
+        if not self._store(profile, generation):
+            return
+        if self.redis is not None:
+            try:
+                if version is None:
+                    version = await self._redis_version(profile.id)
+                await self.redis.setex(
+                    self._redis_key(profile.id, version),
+                    int(self.redis_ttl),
+                    profile.model_dump_json(),
+                )
+            except Exception as e:
+                logger.warning("프로필 캐시 Redis 저장 실패", error=str(e))
+
+    async def invalidate(self, user_id: str) -> None:
+        """사용자 프로필 무효화 (역할 변경, 비활성화, 삭제 시)"""
+        self.generation += 1
+        self.invalidations += 1
+        self._entries.pop(user_id, None)
+        self._read_versions.pop(user_id, None)
+        if self.redis is not None:
+            try:
+                # 새 표식으로 바꾸면 이전 version 키는 읽히지 않고 TTL로 만료됨.
+                # 표식은 프로필 키보다 오래 유지해야 만료 후 "0"으로 돌아가도
+                # 이전 "0" 키가 남아 있지 않음
+                await self.redis.set(
+                    f"{VERSION_KEY_PREFIX}{user_id}",
+                    uuid.uuid4().hex,
+                    ex=int(self.redis_ttl) * 2 + 60,
+                )
+            except Exception as e:
+                logger.warning("프로필 캐시 Redis 무효화 실패", error=str(e))
+
+    def clear(self) -> None:
+        """프로세스 내 캐시 전체 비우기"""
+        self.generation += 1
+        self._entries.clear()
+        self._read_versions.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.redis_hits) / lookups, 4)
+            if lookups
+            else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+_profile_cache: Optional[UserProfileCache] = None
+
+
+def get_profile_cache() -> UserProfileCache:
+    """프로세스 전체가 공유하는 프로필 캐시"""
+    global _profile_cache
+    if _profile_cache is None:
+        _profile_cache = UserProfileCache.from_env()
+    return _profile_cache
@@ -0,0 +1,237 @@
+"""
+관리자 HTMX 화면 렌더 캐시 (ETag / 304)
+
+/admin/roles/matrix, /admin/permissions/table 같은 화면은 폴링이나 탭 이동마다
+DB를 다시 읽고 FastHTML 컴포넌트 트리 전체를 새로 만듭니다. 이 모듈은
+데이터 버전을 키로 렌더 결과(HTML 조각)를 언어별로 캐시합니다.
+
+    1. 데이터 버전: 테이블별 변경 카운터 (users, permissions, roles).
+       쓰기 경로에서 bump()로 올림
+    2. ETag: 화면 이름 + 언어 + 조회 조건 + 데이터 버전의 해시.
+       If-None-Match가 일치하면 DB 조회와 렌더 없이 304 응답
+    3. 조각 캐시: ETag와 같은 키로 렌더된 HTML 보관 (LRU + TTL).
+       사용자별 레이아웃을 씌우는 전체 페이지는 조각만 공유
+    4. 분석 화면: 메트릭은 다른 프로세스(MCP 서버)가 기록하므로 카운터 대신
+       시간 구간(ADMIN_RENDER_CACHE_WINDOW)을 버전으로 사용
+
+카운터는 프로세스 단위입니다. ETag에 프로세스 epoch가 들어가므로 재시작이나
+다른 게이트웨이 인스턴스의 ETag는 일치하지 않습니다(200으로 다시 렌더).
+다른 인스턴스에서 일어난 쓰기나 카운터를 올리지 않는 쓰기 경로는 카운터로
+알 수 없으므로, 키와 ETag에 TTL 길이의 시간 구간도 넣습니다. 구간이 바뀌면
+조각과 ETag가 모두 새로 만들어지므로 이런 쓰기도 TTL 안에 반영됩니다.
+
+환경 변수:
+    ADMIN_RENDER_CACHE_TTL: 조각 캐시 TTL (초, 0이면 캐시와 ETag 사용 안 함)
+    ADMIN_RENDER_CACHE_MAX: 최대 조각 수
+    ADMIN_RENDER_CACHE_WINDOW: 분석 화면 버전 구간 (초, 분 단위 롤업과 맞춤)
+"""
+
+import hashlib
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable, Optional, Sequence
+
+import structlog
+from fastapi import Request, Response
+from fastapi.responses import HTMLResponse
+
+from .translations import get_user_language
+
+logger = structlog.get_logger(__name__)
+
+USERS = "users"
+PERMISSIONS = "permissions"
+ROLES = "roles"
+# 쓰기 카운터 대신 시간 구간을 버전으로 쓰는 화면 (MCP 서버 메트릭 롤업)
+METRICS = "metrics"
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+class RenderCache:
+    """
+    데이터 버전 기반 HTML 조각 캐시
+
+    키를 계산할 때 읽은 버전이 키에 들어가므로, 렌더 도중 쓰기가 일어나도
+    렌더 결과는 이전 버전 키에 저장되고 다음 요청은 새 키로 다시 렌더합니다.
+
+    Example:
+        ```python
+        cache = RenderCache(ttl=300)
+        key = cache.key("roles_matrix", [ROLES], "ko")
+        html = await cache.fragment(key, render)
+        cache.bump(ROLES)  # 역할 변경 후
+        ```
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 512, window: float = 60.0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.window = window
+        self.epoch = uuid.uuid4().hex[:8]
+        self.versions: dict[str, int] = {}
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @classmethod
+    def from_env(cls) -> "RenderCache":
+        """환경변수(ADMIN_RENDER_CACHE_*)에서 캐시 생성"""
+        return cls(
+            ttl=float(os.getenv("ADMIN_RENDER_CACHE_TTL", "300")),
+            max_entries=int(os.getenv("ADMIN_RENDER_CACHE_MAX", "512")),
+            window=float(os.getenv("ADMIN_RENDER_CACHE_WINDOW", "60")),
+        )
+
+    def bump(self, *tables: str) -> None:
+        """테이블 데이터 변경 (해당 테이블을 읽는 화면의 캐시와 ETag 무효화)"""
+        for table in tables:
+            self.versions[table] = self.versions.get(table, 0) + 1
+        logger.debug("관리자 화면 데이터 버전 갱신", tables=tables)
+
+    def version(self, table: str) -> int:
+        """테이블 데이터 버전 (METRICS는 현재 시간 구간)"""
+        if table == METRICS:
+            return int(time.time() // self.window) if self.window > 0 else time.time_ns()
+        return self.versions.get(table, 0)
+
+    def key(self, name: str, tables: Iterable[str], *parts: Any) -> str:
+        """
+        조각 캐시 키
+
+        Args:
+            name: 화면 이름
+            tables: 화면이 읽는 테이블 (버전이 키에 포함됨)
+            parts: 언어, 조회 조건 등 렌더 결과를 바꾸는 값
+        """
+        versions = ",".join(f"{t}:{self.version(t)}" for t in sorted(tables))
+        # 카운터로 알 수 없는 쓰기(다른 인스턴스 등)가 TTL 안에 반영되도록
+        bucket = str(int(time.time() // self.ttl)) if self.ttl > 0 else "0"
+        raw = "|".join([self.epoch, bucket, name, versions, *map(repr, parts)])
+        return hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+    def etag(self, key: str, *vary: Any) -> str:
+        """조각 키 (+ 사용자 ID 같은 응답별 값)로 만든 약한 ETag"""
+        if vary:
+            raw = "|".join([key, *map(repr, vary)])
+            key = hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+        return f'W/"{key}"'
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def set(self, key: str, html: str) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, html)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def fragment(self, key: str, render: Callable[[], Awaitable[str]]) -> str:
+        """캐시된 조각, 없으면 render() 결과를 저장하고 반환"""
+        html = self.get(key) if self.enabled else None
+        if html is None:
+            html = await render()
+            self.set(key, html)
+        return html
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "versions": dict(self.versions),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_render_cache: Optional[RenderCache] = None
+
+
+def get_render_cache() -> RenderCache:
+    """프로세스 전체가 공유하는 렌더 캐시"""
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = RenderCache.from_env()
+    return _render_cache
+
+
+def bump_data_version(*tables: str) -> None:
+    """쓰기 경로에서 호출: 해당 테이블을 읽는 관리자 화면 무효화"""
+    get_render_cache().bump(*tables)
+
+
+async def cached_html_response(
+    request: Request,
+    name: str,
+    tables: Sequence[str],
+    render: Callable[[str], Awaitable[str]],
+    *,
+    params: Sequence[Any] = (),
+    wrap: Optional[Callable[[str], str]] = None,
+    vary: Sequence[Any] = (),
+) -> Response:
+    """
+    ETag / 304와 언어별 조각 캐시를 적용한 HTML 응답
+
+    Args:
+        request: 요청 (언어, If-None-Match)
+        name: 화면 이름
+        tables: 화면이 읽는 테이블
+        render: 언어 코드를 받아 HTML 조각을 만드는 함수
+        params: 조회 조건 (필터, 페이지, 기간 등)
+        wrap: 조각에 사용자별 레이아웃을 씌우는 함수 (전체 페이지)
+        vary: 조각은 같지만 응답이 달라지는 값 (레이아웃의 현재 사용자 등)
+    """
+    cache = get_render_cache()
+    lang = get_user_language(request)
+    if not cache.enabled:
+        html = await render(lang)
+        return HTMLResponse(content=wrap(html) if wrap else html)
+
+    key = cache.key(name, tables, lang, *params)
+    etag = cache.etag(key, *vary)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Cookie, Accept-Language",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        cache.not_modified += 1
+        return Response(status_code=304, headers=headers)
+
+    html = await cache.fragment(key, lambda: render(lang))
+    return HTMLResponse(content=wrap(html) if wrap else html, headers=headers)
@@ -1,10 +1,33 @@
-"""인증 레포지토리 모듈"""
+"""인증 레포지토리 모듈
+
+SQLiteUserRepository는 SQLAlchemy를, PostgreSQL 구현체는 asyncpg 연결 풀을
+끌어오므로 처음 접근할 때 임포트합니다.
+"""
+
+import importlib
 
 from .user_repository import UserRepository, InMemoryUserRepository
-from .sqlite_user_repository import SQLiteUserRepository
+
+_LAZY_EXPORTS = {
+    "SQLiteUserRepository": ".sqlite_user_repository",
+    "PostgresUserRepository": ".postgres_user_repository",
+    "PostgresTokenRepository": ".postgres_user_repository",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "UserRepository",
     "InMemoryUserRepository",
     "SQLiteUserRepository",
+    "PostgresUserRepository",
+    "PostgresTokenRepository",
 ]
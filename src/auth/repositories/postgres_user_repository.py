@@ -0,0 +1,552 @@
+"""
+PostgreSQL 기반 사용자/토큰 Repository 구현
+
+SQLite 사용자 저장소는 파일 하나에 묶여 있어 인증 게이트웨이를 여러
+인스턴스로 띄울 수 없습니다. 이 모듈은 같은 UserRepository /
+TokenRepository 인터페이스를 asyncpg 연결 풀(PostgreSQLPoolManager) 위에
+구현하여 게이트웨이를 로드밸런서 뒤에서 수평 확장할 수 있게 합니다.
+
+특징:
+    - 전용 스키마(기본값 auth)에 테이블 생성 (검색용 PostgreSQL과 공존)
+    - 사용자와 역할을 한 번의 쿼리로 조회 (array_agg)
+    - 생성/수정은 트랜잭션 하나로 처리
+    - 인덱스: 이메일(고유), 역할별 사용자, 토큰 jti(기본키), 만료 시각
+    - 목록/통계 조회는 읽기 복제본으로 라우팅 (readonly=True)
+"""
+
+import re
+import uuid
+from datetime import datetime, UTC
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import structlog
+
+from ..models import User
+from ..profile_cache import get_profile_cache
+from ..render_cache import USERS, bump_data_version
+from .token_repository import TokenRepository
+from .user_repository import UserRepository
+
+
+logger = structlog.get_logger(__name__)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# {schema}는 생성자에서 검증된 식별자로 치환
+SCHEMA_STATEMENTS = (
+    "CREATE SCHEMA IF NOT EXISTS {schema}",
+    """
+    CREATE TABLE IF NOT EXISTS {schema}.users (
+        id TEXT PRIMARY KEY,
+        email TEXT NOT NULL,
+        username TEXT,
+        password_hash TEXT NOT NULL,
+        is_active BOOLEAN NOT NULL DEFAULT TRUE,
+        is_verified BOOLEAN NOT NULL DEFAULT FALSE,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        updated_at TIMESTAMPTZ
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS users_email_key ON {schema}.users (email)",
+    "CREATE INDEX IF NOT EXISTS users_created_at_idx ON {schema}.users (created_at)",
+    """
+    CREATE TABLE IF NOT EXISTS {schema}.user_roles (
+        user_id TEXT NOT NULL REFERENCES {schema}.users (id) ON DELETE CASCADE,
+        role TEXT NOT NULL,
+        PRIMARY KEY (user_id, role)
+    )
+    """,
+    # 역할별 사용자 조회/통계 (기본키는 user_id 선행이라 별도 인덱스 필요)
+    "CREATE INDEX IF NOT EXISTS user_roles_role_idx ON {schema}.user_roles (role, user_id)",
+    """
+    CREATE TABLE IF NOT EXISTS {schema}.refresh_tokens (
+        jti TEXT PRIMARY KEY,
+        user_id TEXT NOT NULL,
+        issued_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        expires_at TIMESTAMPTZ NOT NULL,
+        revoked_at TIMESTAMPTZ,
+        metadata JSONB NOT NULL DEFAULT '{{}}'
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS refresh_tokens_user_idx ON {schema}.refresh_tokens (user_id)",
+    "CREATE INDEX IF NOT EXISTS refresh_tokens_expires_idx ON {schema}.refresh_tokens (expires_at)",
+)
+
+# 수정 가능한 사용자 컬럼 (roles는 별도 테이블)
+_UPDATABLE_COLUMNS = ("email", "username", "password_hash", "is_active", "is_verified")
+
+
+def validate_schema(schema: str) -> str:
+    """스키마 이름 검증 (SQL에 직접 삽입되므로 식별자만 허용)"""
+    if not _IDENTIFIER.match(schema):
+        raise ValueError(f"잘못된 스키마 이름입니다: {schema!r}")
+    return schema
+
+
+def _write_error(
+    error: Exception, email: Optional[str], message: str, user_id: str
+) -> ValueError:
+    """asyncpg 쓰기 오류를 SQLite 구현과 같은 ValueError로 변환"""
+    import asyncpg
+
+    if isinstance(error, asyncpg.UniqueViolationError):
+        return ValueError(f"이미 등록된 이메일입니다: {email}")
+    logger.error(message, error=str(error), user_id=user_id)
+    return ValueError(f"데이터베이스 오류: {str(error)}")
+
+
+async def ensure_schema(pool_manager, schema: str = "auth") -> None:
+    """
+    인증 스키마, 테이블, 인덱스 생성 (이미 있으면 건너뜀)
+
+    Args:
+        pool_manager: PostgreSQLPoolManager
+        schema: 테이블을 만들 스키마 이름
+    """
+    schema = validate_schema(schema)
+    async with pool_manager.acquire() as conn:
+        async with conn.transaction():
+            for statement in SCHEMA_STATEMENTS:
+                await conn.execute(statement.format(schema=schema))
+    logger.info("PostgreSQL 인증 스키마 준비 완료", schema=schema)
+
+
+class PostgresUserRepository(UserRepository):
+    """
+    PostgreSQL 기반 사용자 Repository 구현체
+
+    세션 대신 연결 풀 관리자를 받으므로 인스턴스 하나를 모든 요청이
+    공유합니다. 로그인 경로의 조회(get_by_id, get_by_email)는 방금
+    생성/수정된 사용자를 놓치지 않도록 주 서버에서 읽고, 관리 화면용
+    목록/통계 조회만 복제본으로 보냅니다.
+
+    사용 예:
+        ```python
+        manager = PostgreSQLPoolManager({"dsn": dsn, "min_size": 2, "max_size": 20})
+        await ensure_schema(manager)
+        repo = PostgresUserRepository(manager)
+        user = await repo.get_by_email("user@example.com")
+        ```
+    """
+
+    def __init__(self, pool_manager, schema: str = "auth"):
+        """
+        PostgreSQL Repository 초기화
+
+        Args:
+            pool_manager: PostgreSQLPoolManager (acquire(readonly=...) 제공)
+            schema: 인증 테이블 스키마 이름
+        """
+        self.pool_manager = pool_manager
+        self.schema = validate_schema(schema)
+        self._select_user = f"""
+            SELECT u.id, u.email, u.username, u.password_hash, u.is_active,
+                   u.is_verified, u.created_at, u.updated_at,
+                   COALESCE(
+                       array_agg(r.role ORDER BY r.role)
+                           FILTER (WHERE r.role IS NOT NULL),
+                       '{{}}'
+                   ) AS roles
+            FROM {self.schema}.users u
+            LEFT JOIN {self.schema}.user_roles r ON r.user_id = u.id
+        """
+
+    async def create(self, user_data: dict) -> User:
+        """
+        새 사용자 생성 (사용자와 역할을 한 트랜잭션으로 저장)
+
+        Raises:
+            ValueError: 이메일 중복 또는 기타 데이터베이스 오류 시
+        """
+        import asyncpg
+
+        user_id = user_data.get("id") or str(uuid.uuid4())
+        roles = list(dict.fromkeys(user_data.get("roles") or ["user"]))
+        now = datetime.now(UTC)
+        try:
+            async with self.pool_manager.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        f"""
+                        INSERT INTO {self.schema}.users
+                            (id, email, username, password_hash, is_active,
+                             is_verified, created_at, updated_at)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, $7)
+                        """,
+                        user_id,
+                        user_data["email"],
+                        user_data.get("username"),
+                        user_data["password_hash"],
+                        user_data.get("is_active", True),
+                        user_data.get("is_verified", False),
+                        now,
+                    )
+                    await conn.execute(
+                        f"INSERT INTO {self.schema}.user_roles (user_id, role) "
+                        "SELECT $1, unnest($2::text[])",
+                        user_id,
+                        roles,
+                    )
+        except asyncpg.PostgresError as e:
+            raise _write_error(e, user_data["email"], "사용자 생성 실패", user_id) from e
+
+        bump_data_version(USERS)
+        return User(
+            id=user_id,
+            email=user_data["email"],
+            username=user_data.get("username"),
+            password_hash=user_data["password_hash"],
+            roles=roles,
+            is_active=user_data.get("is_active", True),
+            is_verified=user_data.get("is_verified", False),
+            created_at=now,
+            updated_at=now,
+        )
+
+    async def _fetch_one(self, where: str, value: Any) -> Optional[User]:
+        async with self.pool_manager.acquire() as conn:
+            row = await conn.fetchrow(
+                f"{self._select_user} WHERE {where} GROUP BY u.id", value
+            )
+        return self._row_to_model(row) if row else None
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """사용자 ID로 조회 (역할 포함, 쿼리 1회)"""
+        try:
+            return await self._fetch_one("u.id = $1", user_id)
+        except Exception as e:
+            logger.error("사용자 조회 실패", error=str(e), user_id=user_id)
+            return None
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """이메일로 조회 (users_email_key 인덱스 사용)"""
+        try:
+            return await self._fetch_one("u.email = $1", email)
+        except Exception as e:
+            logger.error("이메일로 사용자 조회 실패", error=str(e), email=email)
+            return None
+
+    async def update(self, user_id: str, update_data: dict) -> Optional[User]:
+        """
+        사용자 정보 수정
+
+        Raises:
+            ValueError: 변경할 이메일이 이미 사용 중이거나 기타 데이터베이스 오류 시
+        """
+        import asyncpg
+
+        columns = [c for c in _UPDATABLE_COLUMNS if c in update_data]
+        assignments = [f"{c} = ${i}" for i, c in enumerate(columns, start=2)]
+        assignments.append(f"updated_at = ${len(columns) + 2}")
+        try:
+            async with self.pool_manager.acquire() as conn:
+                async with conn.transaction():
+                    status = await conn.execute(
+                        f"UPDATE {self.schema}.users SET {', '.join(assignments)} "
+                        "WHERE id = $1",
+                        user_id,
+                        *(update_data[c] for c in columns),
+                        datetime.now(UTC),
+                    )
+                    if status.endswith(" 0"):
+                        return None
+                    if "roles" in update_data:
+                        await conn.execute(
+                            f"DELETE FROM {self.schema}.user_roles WHERE user_id = $1",
+                            user_id,
+                        )
+                        await conn.execute(
+                            f"INSERT INTO {self.schema}.user_roles (user_id, role) "
+                            "SELECT $1, unnest($2::text[])",
+                            user_id,
+                            list(dict.fromkeys(update_data["roles"])),
+                        )
+        except asyncpg.PostgresError as e:
+            raise _write_error(e, update_data.get("email"), "사용자 수정 실패", user_id) from e
+
+        # 역할 변경, 비활성화 등이 /auth/me에 바로 반영되도록 프로필 캐시 무효화
+        await get_profile_cache().invalidate(user_id)
+        bump_data_version(USERS)
+        return await self.get_by_id(user_id)
+
+    async def delete(self, user_id: str) -> bool:
+        """사용자 삭제 (역할은 ON DELETE CASCADE)"""
+        try:
+            async with self.pool_manager.acquire() as conn:
+                status = await conn.execute(
+                    f"DELETE FROM {self.schema}.users WHERE id = $1", user_id
+                )
+            await get_profile_cache().invalidate(user_id)
+            bump_data_version(USERS)
+            return not status.endswith(" 0")
+        except Exception as e:
+            logger.error("사용자 삭제 실패", error=str(e), user_id=user_id)
+            return False
+
+    async def _fetch_many(self, tail: str, *params: Any) -> list[User]:
+        async with self.pool_manager.acquire(readonly=True) as conn:
+            rows = await conn.fetch(f"{self._select_user} {tail}", *params)
+        return [self._row_to_model(row) for row in rows]
+
+    async def list_all(self, skip: int = 0, limit: int = 100) -> list[User]:
+        """모든 사용자 목록 조회 (생성일 내림차순, 페이지네이션)"""
+        try:
+            return await self._fetch_many(
+                "GROUP BY u.id ORDER BY u.created_at DESC OFFSET $1 LIMIT $2",
+                skip,
+                limit,
+            )
+        except Exception as e:
+            logger.error("사용자 목록 조회 실패", error=str(e))
+            return []
+
+    async def search_by_email(self, email_pattern: str) -> list[User]:
+        """이메일 패턴으로 사용자 검색 (대소문자 무시 부분 일치)"""
+        try:
+            return await self._fetch_many(
+                "WHERE u.email ILIKE '%' || $1 || '%' GROUP BY u.id ORDER BY u.email",
+                email_pattern,
+            )
+        except Exception as e:
+            logger.error("이메일 검색 실패", error=str(e), pattern=email_pattern)
+            return []
+
+    async def get_recent_users(self, days: int = 7, limit: int = 10) -> list[User]:
+        """최근 N일 이내 가입한 사용자 조회"""
+        try:
+            return await self._fetch_many(
+                "WHERE u.created_at >= now() - make_interval(days => $1) "
+                "GROUP BY u.id ORDER BY u.created_at DESC LIMIT $2",
+                days,
+                limit,
+            )
+        except Exception as e:
+            logger.error("최근 사용자 조회 실패", error=str(e))
+            return []
+
+    async def iter_export_batches(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[list[dict]]:
+        """
+        내보내기용 사용자 행을 배치 단위로 스트리밍
+
+        읽기 전용 REPEATABLE READ 트랜잭션 안에서 서버 측 커서로 batch_size개씩
+        가져오므로 내보내기 도중 변경이 있어도 한 시점의 스냅샷이 나가고,
+        메모리 사용량은 사용자 수와 무관합니다. 비밀번호 해시는 제외합니다.
+        """
+        query = (
+            f"{self._select_user} GROUP BY u.id ORDER BY u.created_at, u.id"
+        )
+        async with self.pool_manager.acquire(readonly=True) as conn:
+            async with conn.transaction(isolation="repeatable_read", readonly=True):
+                batch: list[dict] = []
+                async for row in conn.cursor(query, prefetch=batch_size):
+                    batch.append(
+                        {
+                            "id": row["id"],
+                            "username": row["username"],
+                            "email": row["email"],
+                            "roles": list(row["roles"]) or ["user"],
+                            "is_active": row["is_active"],
+                            "is_verified": row["is_verified"],
+                            "created_at": row["created_at"],
+                            "updated_at": row["updated_at"],
+                        }
+                    )
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+
+    async def get_user_count(self) -> int:
+        """전체 사용자 수 조회"""
+        try:
+            async with self.pool_manager.acquire(readonly=True) as conn:
+                return await conn.fetchval(
+                    f"SELECT count(*) FROM {self.schema}.users"
+                ) or 0
+        except Exception as e:
+            logger.error("사용자 수 조회 실패", error=str(e))
+            return 0
+
+    async def get_user_stats(self) -> dict:
+        """사용자 통계 정보 조회 (SQLiteUserRepository와 같은 형식)"""
+        try:
+            async with self.pool_manager.acquire(readonly=True) as conn:
+                totals = await conn.fetchrow(
+                    f"""
+                    SELECT count(*) AS total_users,
+                           count(*) FILTER (WHERE is_active) AS active_users,
+                           count(*) FILTER (WHERE is_verified) AS verified_users
+                    FROM {self.schema}.users
+                    """
+                )
+                roles = await conn.fetch(
+                    f"SELECT role, count(*) AS users FROM {self.schema}.user_roles "
+                    "GROUP BY role"
+                )
+            return {
+                **dict(totals),
+                "users_by_role": {row["role"]: row["users"] for row in roles},
+            }
+        except Exception as e:
+            logger.error("사용자 통계 조회 실패", error=str(e))
+            return {
+                "total_users": 0,
+                "active_users": 0,
+                "verified_users": 0,
+                "users_by_role": {},
+            }
+
+    def _row_to_model(self, row) -> User:
+        """조회 결과 행을 도메인 모델로 변환"""
+        return User(
+            id=row["id"],
+            email=row["email"],
+            username=row["username"],
+            password_hash=row["password_hash"],
+            roles=list(row["roles"]) or ["user"],
+            is_active=row["is_active"],
+            is_verified=row["is_verified"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+
+class PostgresTokenRepository(TokenRepository):
+    """
+    PostgreSQL 기반 리프레시 토큰 저장소
+
+    Redis 없이 여러 게이트웨이 인스턴스가 토큰 무효화 상태를 공유합니다.
+    jti가 기본키이므로 유효성 확인은 인덱스 조회 한 번입니다.
+    """
+
+    def __init__(self, pool_manager, schema: str = "auth"):
+        self.pool_manager = pool_manager
+        self.schema = validate_schema(schema)
+
+    async def store_refresh_token(
+        self,
+        jti: str,
+        user_id: str,
+        expires_at: datetime,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """리프레시 토큰 저장"""
+        import json
+
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=UTC)
+        if expires_at <= datetime.now(UTC):
+            logger.warning("토큰이 이미 만료됨", jti=jti)
+            return False
+        try:
+            async with self.pool_manager.acquire() as conn:
+                await conn.execute(
+                    f"""
+                    INSERT INTO {self.schema}.refresh_tokens
+                        (jti, user_id, expires_at, metadata)
+                    VALUES ($1, $2, $3, $4::jsonb)
+                    ON CONFLICT (jti) DO NOTHING
+                    """,
+                    jti,
+                    user_id,
+                    expires_at,
+                    json.dumps(metadata or {}),
+                )
+            return True
+        except Exception as e:
+            logger.error("토큰 저장 실패", error=str(e), jti=jti)
+            return False
+
+    async def is_token_valid(self, jti: str) -> bool:
+        """저장되어 있고, 무효화되지 않았고, 만료되지 않은 토큰인지 확인"""
+        try:
+            async with self.pool_manager.acquire() as conn:
+                return bool(
+                    await conn.fetchval(
+                        f"""
+                        SELECT 1 FROM {self.schema}.refresh_tokens
+                        WHERE jti = $1 AND revoked_at IS NULL AND expires_at > now()
+                        """,
+                        jti,
+                    )
+                )
+        except Exception as e:
+            logger.error("토큰 유효성 확인 실패", error=str(e), jti=jti)
+            return False
+
+    async def revoke_token(self, jti: str) -> bool:
+        """특정 토큰 무효화"""
+        try:
+            async with self.pool_manager.acquire() as conn:
+                status = await conn.execute(
+                    f"UPDATE {self.schema}.refresh_tokens SET revoked_at = now() "
+                    "WHERE jti = $1 AND revoked_at IS NULL",
+                    jti,
+                )
+            revoked = not status.endswith(" 0")
+            if not revoked:
+                logger.warning("존재하지 않는 토큰", jti=jti)
+            return revoked
+        except Exception as e:
+            logger.error("토큰 무효화 실패", error=str(e), jti=jti)
+            return False
+
+    async def revoke_user_tokens(self, user_id: str) -> int:
+        """사용자의 모든 토큰 무효화"""
+        try:
+            async with self.pool_manager.acquire() as conn:
+                status = await conn.execute(
+                    f"UPDATE {self.schema}.refresh_tokens SET revoked_at = now() "
+                    "WHERE user_id = $1 AND revoked_at IS NULL",
+                    user_id,
+                )
+            count = int(status.rsplit(" ", 1)[-1])
+            logger.info("사용자 토큰 모두 무효화됨", user_id=user_id, revoked_count=count)
+            return count
+        except Exception as e:
+            logger.error("사용자 토큰 무효화 실패", error=str(e), user_id=user_id)
+            return 0
+
+    async def get_user_active_tokens(self, user_id: str) -> List[Dict[str, Any]]:
+        """사용자의 활성 토큰 목록 조회"""
+        import json
+
+        try:
+            async with self.pool_manager.acquire() as conn:
+                rows = await conn.fetch(
+                    f"""
+                    SELECT jti, user_id, issued_at, expires_at, metadata
+                    FROM {self.schema}.refresh_tokens
+                    WHERE user_id = $1 AND revoked_at IS NULL AND expires_at > now()
+                    ORDER BY issued_at
+                    """,
+                    user_id,
+                )
+            return [
+                {
+                    "jti": row["jti"],
+                    "user_id": row["user_id"],
+                    "issued_at": row["issued_at"].isoformat(),
+                    "expires_at": row["expires_at"].isoformat(),
+                    "metadata": json.loads(row["metadata"]),
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            logger.error("활성 토큰 조회 실패", error=str(e), user_id=user_id)
+            return []
+
+    async def cleanup_expired_tokens(self) -> int:
+        """만료된 토큰 삭제 (refresh_tokens_expires_idx 사용)"""
+        try:
+            async with self.pool_manager.acquire() as conn:
+                status = await conn.execute(
+                    f"DELETE FROM {self.schema}.refresh_tokens WHERE expires_at <= now()"
+                )
+            return int(status.rsplit(" ", 1)[-1])
+        except Exception as e:
+            logger.error("만료 토큰 정리 실패", error=str(e))
+            return 0
@@ -13,7 +13,7 @@ SQLite 기반 사용자 Repository 구현
 """
 
 from datetime import datetime, UTC
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 import uuid
 
 from sqlalchemy import select, delete, func, text
@@ -22,7 +22,9 @@ from sqlalchemy.exc import IntegrityError
 import structlog
 
 from ..models import User
-from ..database import User as UserDB
+from ..database import User as UserDB, user_roles
+from ..profile_cache import get_profile_cache
+from ..render_cache import USERS, bump_data_version
 from .user_repository import UserRepository
 
 
@@ -110,6 +112,7 @@ class SQLiteUserRepository(UserRepository):
                     {"user_id": db_user.id, "role": role},
                 )
             await self.session.commit()
+            bump_data_version(USERS)
 
             # User 모델로 변환하여 반환
             return self._db_to_model(db_user, roles)
@@ -242,6 +245,9 @@ class SQLiteUserRepository(UserRepository):
                     )
 
             await self.session.commit()
+            # 역할 변경, 비활성화 등이 /auth/me에 바로 반영되도록 프로필 캐시 무효화
+            await get_profile_cache().invalidate(user_id)
+            bump_data_version(USERS)
             await self.session.refresh(db_user)
 
             # 최종 역할 정보 조회
@@ -287,6 +293,8 @@ class SQLiteUserRepository(UserRepository):
             )
 
             await self.session.commit()
+            await get_profile_cache().invalidate(user_id)
+            bump_data_version(USERS)
             return result.rowcount > 0
 
         except Exception as e:
@@ -409,6 +417,57 @@ class SQLiteUserRepository(UserRepository):
             logger.error("최근 사용자 조회 실패", error=str(e))
             return []
 
+    async def iter_export_batches(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[list[dict]]:
+        """
+        내보내기용 사용자 행을 배치 단위로 스트리밍
+
+        서버 측 커서(stream + yield_per)로 batch_size개씩 읽으므로 사용자 수와
+        무관하게 메모리 사용량이 일정합니다. 역할은 group_concat으로 같은
+        쿼리에서 읽습니다. 비밀번호 해시는 포함하지 않습니다.
+
+        Args:
+            batch_size (int): 한 번에 읽을 행 수
+
+        Yields:
+            list[dict]: 사용자 행 (id, username, email, roles, is_active,
+                is_verified, created_at, updated_at)
+        """
+        roles = (
+            select(func.group_concat(user_roles.c.role, ","))
+            .where(user_roles.c.user_id == UserDB.id)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                UserDB.id,
+                UserDB.username,
+                UserDB.email,
+                roles.label("roles"),
+                UserDB.is_active,
+                UserDB.is_verified,
+                UserDB.created_at,
+                UserDB.updated_at,
+            )
+            .order_by(UserDB.created_at, UserDB.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        try:
+            async for partition in result.partitions(batch_size):
+                yield [
+                    {
+                        **row._asdict(),
+                        "roles": sorted(set(row.roles.split(",")))
+                        if row.roles
+                        else ["user"],
+                    }
+                    for row in partition
+                ]
+        finally:
+            await result.close()
+
     async def get_user_count(self) -> int:
         """
         전체 사용자 수 조회
@@ -12,16 +12,24 @@ Redis를 사용하여 발급된 리프레시 토큰을 추적하고 무효화합
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import AsyncIterator, Optional, List, Dict, Any, TYPE_CHECKING
+from datetime import UTC, datetime
 import json
 
 import redis.asyncio as redis
 import structlog
 
+if TYPE_CHECKING:
+    from ..revocation_filter import RevokedTokenFilter
+
 logger = structlog.get_logger(__name__)
 
 
+def _as_utc(value: datetime) -> datetime:
+    """naive datetime은 UTC로 간주 (JWTService는 aware, 이전 저장값은 naive)"""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
 class TokenRepository(ABC):
     """토큰 저장소 추상 클래스"""
 
@@ -113,14 +121,21 @@ class TokenRepository(ABC):
 class RedisTokenRepository(TokenRepository):
     """Redis 기반 토큰 저장소 구현"""
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        revocation_filter: Optional["RevokedTokenFilter"] = None,
+    ):
         """
         Redis 토큰 저장소 초기화
 
         Args:
             redis_client: Redis 비동기 클라이언트
+            revocation_filter: 무효화된 jti Bloom 필터. 있으면 필터가
+                "확실히 없음"이라고 답한 jti는 무효화 목록 조회를 건너뜀
         """
         self.redis = redis_client
+        self.revocation_filter = revocation_filter
         self.token_prefix = "refresh_token:"
         self.user_tokens_prefix = "user_tokens:"
         self.revoked_tokens_prefix = "revoked_tokens:"
@@ -138,13 +153,13 @@ class RedisTokenRepository(TokenRepository):
             token_data = {
                 "jti": jti,
                 "user_id": user_id,
-                "issued_at": datetime.utcnow().isoformat(),
+                "issued_at": datetime.now(UTC).isoformat(),
                 "expires_at": expires_at.isoformat(),
                 "metadata": metadata or {},
             }
 
             # Redis에 토큰 저장 (만료 시간 설정)
-            ttl = int((expires_at - datetime.utcnow()).total_seconds())
+            ttl = int((_as_utc(expires_at) - datetime.now(UTC)).total_seconds())
             if ttl > 0:
                 # 토큰 정보 저장
                 await self.redis.setex(
@@ -172,9 +187,14 @@ class RedisTokenRepository(TokenRepository):
     async def is_token_valid(self, jti: str) -> bool:
         """토큰 유효성 확인"""
         try:
-            # 무효화된 토큰인지 확인
-            if await self.redis.exists(f"{self.revoked_tokens_prefix}{jti}"):
-                return False
+            # 무효화된 토큰인지 확인 (필터가 "확실히 없음"이면 조회 생략)
+            if self.revocation_filter is None or self.revocation_filter.might_be_revoked(
+                jti
+            ):
+                if await self.redis.exists(f"{self.revoked_tokens_prefix}{jti}"):
+                    return False
+                if self.revocation_filter is not None:
+                    self.revocation_filter.false_positives += 1
 
             # 저장된 토큰인지 확인
             return bool(await self.redis.exists(f"{self.token_prefix}{jti}"))
@@ -195,8 +215,8 @@ class RedisTokenRepository(TokenRepository):
             token_info = json.loads(token_data)
 
             # 무효화 목록에 추가 (원래 만료시간까지 유지)
-            expires_at = datetime.fromisoformat(token_info["expires_at"])
-            ttl = int((expires_at - datetime.utcnow()).total_seconds())
+            expires_at = _as_utc(datetime.fromisoformat(token_info["expires_at"]))
+            ttl = int((expires_at - datetime.now(UTC)).total_seconds())
 
             if ttl > 0:
                 await self.redis.setex(
@@ -204,12 +224,16 @@ class RedisTokenRepository(TokenRepository):
                     ttl,
                     json.dumps(
                         {
-                            "revoked_at": datetime.utcnow().isoformat(),
+                            "revoked_at": datetime.now(UTC).isoformat(),
                             "user_id": token_info["user_id"],
                         }
                     ),
                 )
 
+            # 다른 게이트웨이 인스턴스의 필터에 전파
+            if self.revocation_filter is not None:
+                await self.revocation_filter.publish(jti)
+
             # 원본 토큰 삭제
             await self.redis.delete(f"{self.token_prefix}{jti}")
 
@@ -283,6 +307,33 @@ class RedisTokenRepository(TokenRepository):
             logger.error("활성 토큰 조회 실패", error=str(e), user_id=user_id)
             return []
 
+    async def iter_revoked_jtis(self) -> AsyncIterator[str]:
+        """무효화 목록의 jti (필터 생성용, 만료된 항목은 TTL로 이미 삭제됨)"""
+        prefix_length = len(self.revoked_tokens_prefix)
+        async for key in self.redis.scan_iter(
+            match=f"{self.revoked_tokens_prefix}*", count=1000
+        ):
+            key = key.decode() if isinstance(key, bytes) else key
+            yield key[prefix_length:]
+
+    async def iter_refresh_tokens(self) -> AsyncIterator[Dict[str, Any]]:
+        """저장된 (무효화되지 않은) 리프레시 토큰 정보 (저장소 이전용)"""
+        async for key in self.redis.scan_iter(
+            match=f"{self.token_prefix}*", count=1000
+        ):
+            token_data = await self.redis.get(key)
+            if token_data:
+                yield json.loads(token_data)
+
+    async def start_revocation_filter(self) -> None:
+        """무효화 필터 생성 및 pub/sub 구독 시작 (필터가 없으면 아무 작업 안 함)"""
+        if self.revocation_filter is not None:
+            await self.revocation_filter.start(self.iter_revoked_jtis)
+
+    async def stop_revocation_filter(self) -> None:
+        if self.revocation_filter is not None:
+            await self.revocation_filter.stop()
+
     async def cleanup_expired_tokens(self) -> int:
         """만료된 토큰 정리 (Redis TTL이 자동으로 처리하므로 추가 작업 불필요)"""
         # Redis의 TTL 메커니즘이 자동으로 만료된 키를 삭제함
@@ -309,8 +360,8 @@ class InMemoryTokenRepository(TokenRepository):
         self.tokens[jti] = {
             "jti": jti,
             "user_id": user_id,
-            "issued_at": datetime.utcnow(),
-            "expires_at": expires_at,
+            "issued_at": datetime.now(UTC),
+            "expires_at": _as_utc(expires_at),
             "metadata": metadata or {},
         }
 
@@ -330,7 +381,7 @@ class InMemoryTokenRepository(TokenRepository):
             return False
 
         # 만료 확인
-        return token["expires_at"] > datetime.utcnow()
+        return token["expires_at"] > datetime.now(UTC)
 
     async def revoke_token(self, jti: str) -> bool:
         """특정 토큰 무효화"""
@@ -371,7 +422,7 @@ class InMemoryTokenRepository(TokenRepository):
         """만료된 토큰 정리"""
         expired = []
         for jti, token in self.tokens.items():
-            if token["expires_at"] <= datetime.utcnow():
+            if token["expires_at"] <= datetime.now(UTC):
                 expired.append(jti)
 
         for jti in expired:
@@ -0,0 +1,238 @@
+"""
+무효화된 토큰 jti Bloom 필터
+
+RedisTokenRepository.is_token_valid는 검증마다 무효화 목록(revoked_tokens:)과
+토큰 키를 각각 EXISTS로 확인합니다. 이 모듈은 무효화된 jti를 프로세스 내
+Bloom 필터로 들고 있어서, 필터가 "확실히 없음"이라고 답하는 대부분의 토큰은
+무효화 목록 조회를 건너뛰게 합니다. "있을 수도 있음"일 때만 저장소를 확인합니다.
+
+    1. 시작 시 저장소(Redis SCAN)에서 무효화된 jti를 읽어 필터 생성
+    2. 무효화는 Redis pub/sub 채널(auth:revoked_jti)로 전파되어 모든
+       게이트웨이 인스턴스의 필터에 추가됨
+    3. 구독이 끊겼다 다시 연결되면 놓친 메시지가 있을 수 있으므로 다시 생성.
+       만료된 jti를 비우기 위해 주기적으로도 다시 생성
+    4. 필터가 준비되기 전(시작 직후, 재구독 중)에는 모든 jti를 "있을 수도
+       있음"으로 답해 기존처럼 저장소를 확인
+
+Bloom 필터는 거짓 음성이 없으므로 무효화된 토큰을 통과시키지 않습니다.
+거짓 양성(유효한 토큰인데 "있을 수도 있음")은 저장소 조회 한 번으로 끝납니다.
+
+환경 변수:
+    AUTH_REVOCATION_FILTER: 필터 사용 여부 (Redis 토큰 저장소에서만 사용)
+    AUTH_REVOCATION_FILTER_CAPACITY: 예상 무효화 jti 수 (넘으면 다음 재생성 때 확장)
+    AUTH_REVOCATION_FILTER_ERROR_RATE: 목표 거짓 양성 비율
+    AUTH_REVOCATION_FILTER_REBUILD_INTERVAL: 주기적 재생성 간격 (초)
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import time
+from typing import Any, AsyncIterator, Callable, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+REVOCATION_CHANNEL = "auth:revoked_jti"
+
+
+class BloomFilter:
+    """
+    bytearray 기반 Bloom 필터
+
+    blake2b 해시 하나를 두 64비트 값으로 나눠 k개 위치를 만듭니다
+    (double hashing).
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class RevokedTokenFilter:
+    """
+    무효화된 jti 필터 (Redis pub/sub 동기화)
+
+    Example:
+        ```python
+        revoked = RevokedTokenFilter(redis_client)
+        await revoked.start(repository.iter_revoked_jtis)
+        if revoked.might_be_revoked(jti):
+            ...  # 저장소에서 확인
+        await revoked.publish(jti)  # 무효화 후
+        ```
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        rebuild_interval: float = 3600.0,
+        channel: str = REVOCATION_CHANNEL,
+    ):
+        self.redis = redis_client
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self.channel = channel
+        self.reconnect_delay = 1.0
+        self._filter: Optional[BloomFilter] = None
+        self._loader: Optional[Callable[[], AsyncIterator[str]]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._built_at = 0.0
+        self.checks = 0
+        self.maybe = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._filter is not None
+
+    @classmethod
+    def from_env(cls, redis_client: Optional[Any] = None) -> Optional["RevokedTokenFilter"]:
+        """환경변수(AUTH_REVOCATION_FILTER_*)에서 필터 생성 (비활성화면 None)"""
+        if os.getenv("AUTH_REVOCATION_FILTER", "true").lower() != "true":
+            return None
+        return cls(
+            redis_client=redis_client,
+            capacity=int(os.getenv("AUTH_REVOCATION_FILTER_CAPACITY", "100000")),
+            error_rate=float(os.getenv("AUTH_REVOCATION_FILTER_ERROR_RATE", "0.001")),
+            rebuild_interval=float(
+                os.getenv("AUTH_REVOCATION_FILTER_REBUILD_INTERVAL", "3600")
+            ),
+        )
+
+    def might_be_revoked(self, jti: str) -> bool:
+        """False면 확실히 무효화되지 않은 jti, True면 저장소 확인 필요"""
+        self.checks += 1
+        if self._filter is not None and jti not in self._filter:
+            return False
+        self.maybe += 1
+        return True
+
+    def add(self, jti: str) -> None:
+        """이 프로세스의 필터에 jti 추가"""
+        if self._filter is not None:
+            self._filter.add(jti)
+
+    async def publish(self, jti: str) -> None:
+        """무효화된 jti를 로컬 필터에 추가하고 다른 인스턴스에 전파"""
+        self.add(jti)
+        if self.redis is None:
+            return
+        try:
+            await self.redis.publish(self.channel, jti)
+        except Exception as e:
+            # 다른 인스턴스는 재구독/주기적 재생성 때 반영
+            logger.warning("무효화 jti 전파 실패", error=str(e), jti=jti)
+
+    async def rebuild(self, loader: Callable[[], AsyncIterator[str]]) -> int:
+        """
+        저장소에서 무효화된 jti를 읽어 새 필터로 교체
+
+        읽는 동안에는 이전 필터가 계속 쓰이고, 다 읽은 뒤 한 번에 바꿉니다.
+        무효화된 jti가 용량을 넘으면 두 배로 키운 필터를 만듭니다.
+
+        Returns:
+            필터에 넣은 jti 수
+        """
+        jtis = [jti async for jti in loader()]
+        capacity = max(self.capacity, 2 * len(jtis))
+        bloom = BloomFilter(capacity, self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        self._filter = bloom
+        self._built_at = time.monotonic()
+        self.rebuilds += 1
+        logger.info(
+            "무효화 토큰 필터 생성", revoked=len(jtis), capacity=capacity, bits=bloom.size
+        )
+        return len(jtis)
+
+    async def start(self, loader: Callable[[], AsyncIterator[str]]) -> None:
+        """구독 후 필터를 생성하고 백그라운드에서 무효화 메시지를 반영"""
+        self._loader = loader
+        if self.redis is None:
+            await self.rebuild(loader)
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        backoff = self.reconnect_delay
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                # 구독을 먼저 해 두면 생성 중 무효화 메시지는 대기열에 쌓임
+                await pubsub.subscribe(self.channel)
+                await self.rebuild(self._loader)
+                backoff = self.reconnect_delay
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message and message.get("type") == "message":
+                        data = message["data"]
+                        self.add(data.decode() if isinstance(data, bytes) else data)
+                    if time.monotonic() - self._built_at >= self.rebuild_interval:
+                        await self.rebuild(self._loader)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 끊긴 동안의 메시지는 잃었으므로 다시 생성할 때까지 저장소 확인
+                self._filter = None
+                logger.warning("무효화 토큰 구독 실패, 재연결", error=str(e))
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "revoked": self._filter.count if self._filter else 0,
+            "bits": self._filter.size if self._filter else 0,
+            "checks": self.checks,
+            "maybe": self.maybe,
+            "false_positives": self.false_positives,
+            "rebuilds": self.rebuilds,
+        }
@@ -71,13 +71,12 @@ API 엔드포인트:
     ```
 """
 
-import csv
-import io
 import json
 import asyncio
+import time
 from datetime import datetime
 from contextlib import asynccontextmanager
-from typing import Annotated, Optional, AsyncGenerator
+from typing import Annotated, Any, Dict, Optional, AsyncGenerator
 from collections import deque
 
 # 재사용 가능한 컴포넌트 import
@@ -91,7 +90,7 @@ from .components import (
 from .translations import T, get_user_language, set_user_language, SUPPORTED_LANGUAGES
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi import FastAPI, Depends, HTTPException, status, Request, Response
+from fastapi import FastAPI, Depends, HTTPException, Query, status, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
 from sse_starlette import EventSourceResponse
@@ -129,6 +128,10 @@ from fasthtml.common import (
     Textarea,
     Ul,
     Li,
+    Strong,
+    Details,
+    Summary,
+    NotStr,
 )
 from fastcore.xml import to_xml
 import structlog
@@ -160,10 +163,34 @@ from .dependencies import (
     get_permission_service,
     get_rbac_service,
 )
-from .database import get_db
+from .database import get_db, get_read_db
 from .services.auth_service_sqlite import SQLiteAuthService
 from .services.jwt_service import JWTService
-from .repositories.sqlite_user_repository import SQLiteUserRepository
+from .user_store import (
+    get_user_repository,
+    iter_permission_export_batches,
+    iter_user_export_batches,
+    use_postgres,
+)
+from .export import (
+    DEFAULT_BATCH_SIZE as EXPORT_BATCH_SIZE,
+    MEDIA_TYPES as EXPORT_MEDIA_TYPES,
+    PERMISSION_EXPORT_COLUMNS,
+    USER_EXPORT_COLUMNS,
+    export_headers,
+    parquet_available,
+    stream_export,
+    wants_gzip,
+)
+from .render_cache import (
+    METRICS,
+    PERMISSIONS,
+    ROLES,
+    USERS,
+    bump_data_version,
+    cached_html_response,
+)
+from src.utils.metrics_store import LATENCY_BUCKETS_MS, get_metrics_store
 
 
 # SQLite 기반 AuthService 의존성
@@ -175,8 +202,9 @@ def get_sqlite_auth_service() -> SQLiteAuthService:
     global _sqlite_auth_service
     if _sqlite_auth_service is None:
         import os
-        import redis.asyncio as redis
+        from src.utils.redis_pool import get_redis_registry
         from .repositories.token_repository import RedisTokenRepository
+        from .revocation_filter import RevokedTokenFilter
 
         jwt_secret = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 
@@ -185,12 +213,22 @@ def get_sqlite_auth_service() -> SQLiteAuthService:
         redis_url = os.getenv("REDIS_URL")
         if redis_url:
             try:
-                redis_client = redis.from_url(redis_url, decode_responses=True)
-                token_repository = RedisTokenRepository(redis_client)
+                redis_client = get_redis_registry().get_client(
+                    redis_url, decode_responses=True
+                )
+                token_repository = RedisTokenRepository(
+                    redis_client, RevokedTokenFilter.from_env(redis_client)
+                )
                 logger.info("Redis 토큰 저장소 활성화됨")
             except Exception as e:
                 logger.warning(f"Redis 연결 실패, 토큰 무효화 기능 비활성화: {e}")
 
+        # Redis가 없으면 PostgreSQL 사용자 저장소의 토큰 테이블 사용
+        if token_repository is None:
+            from .user_store import get_token_repository
+
+            token_repository = get_token_repository()
+
         jwt_service = JWTService(
             secret_key=jwt_secret, token_repository=token_repository
         )
@@ -247,7 +285,8 @@ async def lifespan(app: FastAPI):
     logger.info("인증 게이트웨이 서버 시작", port=8000)
 
     # 데이터베이스 초기화
-    from .database import init_db, engine, async_session_maker
+    from .database import init_db, dispose_engines
+    from .user_store import init_user_store, close_user_store
     from .services.auth_service_sqlite import SQLiteAuthService
     from .services.jwt_service import JWTService
     from .models import UserCreate
@@ -255,6 +294,7 @@ async def lifespan(app: FastAPI):
 
     logger.info("데이터베이스 초기화 시작")
     await init_db()
+    await init_user_store()
     logger.info("데이터베이스 테이블 생성 완료")
 
     # 초기 관리자 계정 생성
@@ -264,10 +304,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("초기 관리자 계정 생성 실패", error=str(e))
 
+    # 무효화 토큰 필터 생성 및 구독 (Redis 토큰 저장소일 때)
+    token_repository = get_sqlite_auth_service().jwt_service.token_repository
+    if hasattr(token_repository, "start_revocation_filter"):
+        await token_repository.start_revocation_filter()
+
     yield
 
     # 종료 시
-    await engine.dispose()
+    if hasattr(token_repository, "stop_revocation_filter"):
+        await token_repository.stop_revocation_filter()
+    await close_user_store()
+    await dispose_engines()
     logger.info("인증 게이트웨이 서버 종료")
 
 
@@ -431,7 +479,7 @@ async def register(
 async def login(
     user_login: UserLogin,
     auth_service: Annotated[SQLiteAuthService, Depends(get_sqlite_auth_service)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     response: Response,
 ):
     """
@@ -494,7 +542,7 @@ async def login(
 async def refresh_tokens(
     request: RefreshTokenRequest,
     auth_service: Annotated[SQLiteAuthService, Depends(get_sqlite_auth_service)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ):
     """
     토큰 갱신
@@ -740,75 +788,50 @@ async def login_page():
     "/api/v1/permissions/resources", response_model=list[ResourcePermissionResponse]
 )
 async def list_resource_permissions(
+    response: Response,
     current_user: Annotated[UserResponse, Depends(require_admin)],
     permission_service=Depends(get_permission_service),
     resource_type: Optional[ResourceType] = None,
     resource_name: Optional[str] = None,
     user_id: Optional[int] = None,
     role_name: Optional[str] = None,
-    skip: int = 0,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
 ):
-    """리소스 권한 목록 조회 (관리자 전용)"""
+    """
+    리소스 권한 목록 조회 (관리자 전용)
+
+    최신 권한부터 키셋 페이지네이션으로 반환합니다. 다음/이전 페이지 커서와
+    전체 개수는 응답 헤더로 전달됩니다.
+
+    skip은 기존 클라이언트 호환을 위해 남겨 둔 폐기 예정 파라미터로, 첫
+    페이지의 시작 위치에만 적용됩니다. 이후 페이지는 커서를 사용하세요.
+
+    응답 헤더:
+        - X-Next-Cursor / X-Prev-Cursor: 다음/이전 페이지 cursor 값
+        - X-Total-Count: 필터에 맞는 권한 수
+        - X-Total-Count-Estimated: true면 플래너 추정치
+    """
     if not permission_service.db_conn:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="데이터베이스 연결이 필요합니다",
         )
 
-    # 쿼리 조건 구성
-    conditions = []
-    params = []
-
-    if resource_type:
-        conditions.append(f"resource_type = ${len(params) + 1}")
-        params.append(resource_type.value)
-
-    if resource_name:
-        conditions.append(f"resource_name ILIKE ${len(params) + 1}")
-        params.append(f"%{resource_name}%")
-
-    if user_id:
-        conditions.append(f"user_id = ${len(params) + 1}")
-        params.append(user_id)
-
-    if role_name:
-        conditions.append(f"role_name = ${len(params) + 1}")
-        params.append(role_name)
-
-    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-    query = f"""
-        SELECT id, user_id, role_name, resource_type, resource_name, 
-               actions, conditions, granted_at, granted_by, expires_at
-        FROM resource_permissions
-        {where_clause}
-        ORDER BY granted_at DESC
-        LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
-    """
-    params.extend([limit, skip])
-
+    filters = dict(
+        resource_type=resource_type,
+        resource_name=resource_name,
+        user_id=user_id,
+        role_name=role_name,
+    )
     try:
-        rows = await permission_service.db_conn.fetch(query, *params)
-
-        permissions = []
-        for row in rows:
-            perm = ResourcePermissionResponse(
-                id=row["id"],
-                user_id=row["user_id"],
-                role_name=row["role_name"],
-                resource_type=ResourceType(row["resource_type"]),
-                resource_name=row["resource_name"],
-                actions=[ActionType(a) for a in row["actions"]],
-                conditions=row["conditions"],
-                granted_at=row["granted_at"],
-                granted_by=row["granted_by"],
-                expires_at=row["expires_at"],
-            )
-            permissions.append(perm)
-
-        return permissions
-
+        page = await permission_service.list_resource_permissions(
+            **filters, limit=limit, cursor=cursor, offset=skip
+        )
+        total, estimated = await permission_service.estimate_permission_count(**filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error("권한 목록 조회 실패", error=str(e))
         raise HTTPException(
@@ -816,6 +839,31 @@ async def list_resource_permissions(
             detail="권한 목록 조회에 실패했습니다",
         )
 
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    if page.prev_cursor:
+        response.headers["X-Prev-Cursor"] = page.prev_cursor
+    response.headers["X-Total-Count"] = str(total)
+    response.headers["X-Total-Count-Estimated"] = "true" if estimated else "false"
+    if skip:
+        response.headers["Deprecation"] = "true"
+
+    return [
+        ResourcePermissionResponse(
+            id=row["id"],
+            user_id=row["user_id"],
+            role_name=row["role_name"],
+            resource_type=ResourceType(row["resource_type"]),
+            resource_name=row["resource_name"],
+            actions=[ActionType(a) for a in row["actions"]],
+            conditions=row["conditions"],
+            granted_at=row["granted_at"],
+            granted_by=row["granted_by"],
+            expires_at=row["expires_at"],
+        )
+        for row in page.rows
+    ]
+
 
 @app.post("/api/v1/permissions/resources", response_model=ResourcePermissionResponse)
 async def create_resource_permission(
@@ -976,6 +1024,7 @@ async def update_resource_permission(
         params.append(permission_id)
 
         updated_row = await permission_service.db_conn.fetchrow(update_query, *params)
+        bump_data_version(PERMISSIONS)
 
         # 캐시 클리어
         if existing_row["user_id"]:
@@ -1036,6 +1085,7 @@ async def delete_resource_permission(
         # 권한 삭제
         delete_query = "DELETE FROM resource_permissions WHERE id = $1"
         await permission_service.db_conn.execute(delete_query, permission_id)
+        bump_data_version(PERMISSIONS)
 
         # 캐시 클리어
         if existing_row["user_id"]:
@@ -1257,6 +1307,7 @@ async def create_role(
         # 새 역할 생성
         permissions = role_data.permissions or []
         rbac_service.role_permissions[role_data.name] = permissions
+        bump_data_version(ROLES)
 
         logger.info(
             "새 역할 생성",
@@ -1299,6 +1350,7 @@ async def update_role(
         # 권한 업데이트
         if role_data.permissions is not None:
             rbac_service.role_permissions[role_name] = role_data.permissions
+            bump_data_version(ROLES)
 
         logger.info("역할 수정 완료", role_name=role_name, admin_id=current_user.id)
 
@@ -1341,6 +1393,7 @@ async def delete_role(
 
         # 역할 삭제
         del rbac_service.role_permissions[role_name]
+        bump_data_version(ROLES)
 
         logger.info("역할 삭제 완료", role_name=role_name, admin_id=current_user.id)
 
@@ -1507,15 +1560,16 @@ async def update_user_roles(
         HTTPException 403: 관리자 권한 없음
     """
     # 사용자 조회
-    user = await auth_service.user_repository.get_by_id(user_id)
+    repository = get_user_repository(db)
+    user = await repository.get_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"사용자를 찾을 수 없습니다: {user_id}",
         )
 
-    # 역할 업데이트
-    updated_user = await auth_service.user_repository.update(user_id, {"roles": roles})
+    # 역할 업데이트 (Repository가 /auth/me 프로필 캐시도 무효화)
+    updated_user = await repository.update(user_id, {"roles": roles})
 
     if not updated_user:
         raise HTTPException(
@@ -1688,7 +1742,7 @@ async def get_all_active_sessions(
         모든 사용자의 활성 세션 정보
     """
     # 모든 사용자 조회
-    repository = SQLiteUserRepository(db)
+    repository = get_user_repository(db)
     users = await repository.list_all(limit=limit)
 
     all_sessions = []
@@ -1723,9 +1777,7 @@ async def admin_sessions_page(
         all_sessions = []
 
         # 모든 사용자 조회 (제한적으로)
-        from .repositories.sqlite_user_repository import SQLiteUserRepository
-
-        repository = SQLiteUserRepository(db)
+        repository = get_user_repository(db)
         users = await repository.list_all(limit=100)
 
         # 각 사용자의 세션 조회
@@ -1954,8 +2006,7 @@ async def search_user_sessions_htmx(
             )
 
         # 사용자 검색
-        from .repositories.sqlite_user_repository import SQLiteUserRepository
-        repository = SQLiteUserRepository(db)
+        repository = get_user_repository(db)
         
         # ID로 검색을 시도하고, 실패하면 이메일로 검색
         users = []
@@ -2053,8 +2104,7 @@ async def revoke_session_htmx(
             return HTMLResponse(
                 content='<div class="text-green-600 p-3 bg-green-50 rounded mb-4">'
                 '토큰이 무효화되었습니다.'
-                '</div>'
-                
+                '</div>',
                 headers={"HX-Refresh": "true"}
             )
         else:
@@ -2087,8 +2137,7 @@ async def revoke_all_user_sessions_htmx(
         return HTMLResponse(
             content=f'<div class="text-green-600 p-3 bg-green-50 rounded mb-4">'
             f'{revoked_count}개의 토큰이 무효화되었습니다.'
-            '</div>'
-            
+            '</div>',
             headers={"HX-Refresh": "true"}
         )
         
@@ -2149,139 +2198,129 @@ async def placeholder_add_user():
         '</div>'
     )
 
-@app.get("/admin/export/users.csv")
-async def export_users_csv(
+def _export_response(
+    request: Request,
+    batches: AsyncGenerator[list[dict], None],
+    columns,
+    filename: str,
+    fmt: str,
+    compress: bool,
+) -> StreamingResponse:
+    """커서 배치를 형식별로 인코딩하여 스트리밍 (Accept-Encoding에 gzip이 있으면 압축)"""
+    gzip = wants_gzip(request.headers.get("accept-encoding"), fmt, compress)
+    return StreamingResponse(
+        stream_export(batches, columns, fmt, gzip),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers=export_headers(filename, fmt, gzip),
+    )
+
+
+def _check_export_format(fmt: str) -> None:
+    if fmt not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=404, detail="지원하지 않는 내보내기 형식입니다")
+    if fmt == "parquet" and not parquet_available():
+        raise HTTPException(
+            status_code=501, detail="Parquet 내보내기에는 pyarrow 패키지가 필요합니다"
+        )
+
+
+@app.get("/admin/export/users.{fmt}")
+async def export_users(
+    request: Request,
     current_user: Annotated[UserResponse, Depends(require_admin)],
-    auth_service: Annotated[SQLiteAuthService, Depends(get_sqlite_auth_service)],
-    db: Annotated[AsyncSession, Depends(get_db)]
+    fmt: str,
+    compress: bool = True
 ):
-    """사용자 데이터를 CSV 형태로 내보내기"""
-    try:
-        logger.info("사용자 CSV 내보내기 시작", user_id=current_user.id)
-        
-        # 모든 사용자 데이터 조회
-        users = await auth_service.list_users(db)
-        
-        # CSV 스트림 생성
-        def generate_csv():
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # 헤더 작성
-            writer.writerow(['ID', '사용자명', '이메일', '역할', '활성화', '생성일', '최종로그인'])
-            yield output.getvalue()
-            output.seek(0)
-            output.truncate(0)
-            
-            # 데이터 행 작성
-            for user in users:
-                writer.writerow([
-                    user.id,
-                    user.username or '',
-                    user.email,
-                    ', '.join(user.roles) if user.roles else '',
-                    '예' if user.is_active else '아니오',
-                    user.created_at.strftime('%Y-%m-%d %H:%M:%S') if user.created_at else '',
-                    user.last_login.strftime('%Y-%m-%d %H:%M:%S') if user.last_login else ''
-                ])
-                yield output.getvalue()
-                output.seek(0)
-                output.truncate(0)
-        
-        logger.info("사용자 CSV 내보내기 완료", user_count=len(users))
-        
-        return StreamingResponse(
-            generate_csv(),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=users.csv"}
-        )
-        
-    except Exception as e:
-        logger.error("사용자 CSV 내보내기 실패", error=str(e))
-        raise HTTPException(status_code=500, detail="내보내기 중 오류가 발생했습니다")
+    """
+    사용자 데이터 내보내기 (csv, ndjson, parquet)
+
+    사용자 저장소의 커서에서 배치 단위로 읽어 바로 전송하므로
+    사용자 수와 무관하게 메모리 사용량이 일정합니다.
+    """
+    _check_export_format(fmt)
+    logger.info("사용자 내보내기 시작", user_id=current_user.id, format=fmt)
+    return _export_response(
+        request,
+        iter_user_export_batches(EXPORT_BATCH_SIZE),
+        USER_EXPORT_COLUMNS,
+        "users",
+        fmt,
+        compress,
+    )
 
-@app.get("/admin/export/permissions.csv")
-async def export_permissions_csv(
+@app.get("/admin/export/permissions.{fmt}")
+async def export_permissions(
+    request: Request,
     current_user: Annotated[UserResponse, Depends(require_admin)],
-    permission_service=Depends(get_permission_service)
+    fmt: str,
+    compress: bool = True
 ):
-    """권한 데이터를 CSV 형태로 내보내기"""
-    try:
-        logger.info("권한 CSV 내보내기 시작", user_id=current_user.id)
-        
-        # 모든 권한 데이터 조회
-        permissions = await permission_service.list_permissions()
-        
-        # CSV 스트림 생성
-        def generate_csv():
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # 헤더 작성
-            writer.writerow(['ID', '사용자ID', '역할명', '리소스타입', '리소스명', '액션', '조건', '부여일', '만료일'])
-            yield output.getvalue()
-            output.seek(0)
-            output.truncate(0)
-            
-            # 데이터 행 작성
-            for permission in permissions:
-                writer.writerow([
-                    permission.id,
-                    permission.user_id or '',
-                    permission.role_name or '',
-                    permission.resource_type,
-                    permission.resource_name,
-                    ', '.join(permission.actions) if permission.actions else '',
-                    json.dumps(permission.conditions, ensure_ascii=False) if permission.conditions else '',
-                    permission.granted_at.strftime('%Y-%m-%d %H:%M:%S') if permission.granted_at else '',
-                    permission.expires_at.strftime('%Y-%m-%d %H:%M:%S') if permission.expires_at else ''
-                ])
-                yield output.getvalue()
-                output.seek(0)
-                output.truncate(0)
-        
-        logger.info("권한 CSV 내보내기 완료", permission_count=len(permissions))
-        
-        return StreamingResponse(
-            generate_csv(),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=permissions.csv"}
+    """
+    권한 데이터 내보내기 (csv, ndjson, parquet, 커서 기반 스트리밍)
+
+    권한 테이블은 PostgreSQL에 있으므로 postgres 저장소에서만 가능하며,
+    내보내기 전용 읽기 연결에서 스트리밍합니다.
+    """
+    _check_export_format(fmt)
+    if not use_postgres():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결이 필요합니다",
         )
-        
-    except Exception as e:
-        logger.error("권한 CSV 내보내기 실패", error=str(e))
-        raise HTTPException(status_code=500, detail="내보내기 중 오류가 발생했습니다")
+    logger.info("권한 내보내기 시작", user_id=current_user.id, format=fmt)
+    return _export_response(
+        request,
+        iter_permission_export_batches(EXPORT_BATCH_SIZE),
+        PERMISSION_EXPORT_COLUMNS,
+        "permissions",
+        fmt,
+        compress,
+    )
 
 @app.get("/admin/export/metrics.json")
 async def export_metrics_json(
-    current_user: Annotated[UserResponse, Depends(require_admin)]
+    current_user: Annotated[UserResponse, Depends(require_admin)],
+    period: Optional[str] = None
 ):
-    """시스템 메트릭을 JSON 형태로 내보내기"""
+    """시스템 메트릭을 JSON 형태로 내보내기 (메트릭 롤업 기반)"""
     try:
-        logger.info("메트릭 JSON 내보내기 시작", user_id=current_user.id)
+        logger.info("메트릭 JSON 내보내기 시작", user_id=current_user.id, period=period)
         
-        # 기본 시스템 메트릭 생성 (향후 MetricsMiddleware 통합 예정)
+        analytics = await get_analytics_data(period=period)
+        total_requests = analytics["total_requests"]
         metrics_data = {
             "export_timestamp": datetime.now().isoformat(),
             "export_user": current_user.email,
+            "period": analytics["period"],
             "system_metrics": {
-                "total_requests": 0,
-                "error_rate": 0.0,
-                "avg_response_time_ms": 0.0
+                "total_requests": total_requests,
+                "error_rate": round(100.0 - analytics["success_rate"], 2) if total_requests else 0.0,
+                "avg_response_time_ms": round(analytics["avg_response_time"], 1)
             },
             "tool_metrics": {
-                "search_web": {"count": 0, "avg_duration_ms": 0},
-                "search_vectors": {"count": 0, "avg_duration_ms": 0},
-                "search_database": {"count": 0, "avg_duration_ms": 0},
-                "health_check": {"count": 0, "avg_duration_ms": 0}
+                tool_name: {
+                    "count": stats["count"],
+                    "avg_duration_ms": round(stats["avg_duration"], 1),
+                    "success_rate": round(stats["success_rate"], 2),
+                    "last_used": stats["last_used"]
+                }
+                for tool_name, stats in analytics["tool_stats"].items()
             },
             "user_metrics": {
-                "active_users": 0,
-                "total_sessions": 0,
-                "avg_requests_per_user": 0.0
+                "active_users": analytics["active_users"],
+                "requests_by_role": analytics["role_activity"],
+                "avg_requests_per_user": round(total_requests / analytics["active_users"], 2)
+                if analytics["active_users"]
+                else 0.0
             },
-            "note": "메트릭 수집 시스템 통합 예정"
+            "response_time_histogram": analytics["response_time_histogram"],
+            "timeline": [
+                {"timestamp": datetime.fromtimestamp(ts).isoformat(), "requests": count}
+                for ts, count in analytics["timeline"]
+            ]
         }
+        if not analytics["available"]:
+            metrics_data["note"] = "메트릭 저장소(METRICS_STORE_URL)가 설정되지 않았습니다"
         
         # JSON 스트림 생성
         def generate_json():
@@ -2302,10 +2341,12 @@ async def export_metrics_json(
 
 @app.get("/admin/analytics", response_class=HTMLResponse)
 async def admin_analytics_page(
+    request: Request,
     current_user: Annotated[UserResponse, Depends(require_admin)]
 ):
-    """사용 분석 대시보드"""
-    try:
+    """사용 분석 대시보드 (메트릭 롤업 구간마다 한 번 렌더 / 304)"""
+
+    async def render(lang: str) -> str:
         logger.info("분석 페이지 로딩 시작", user_id=current_user.id)
         
         # Breadcrumb
@@ -2314,7 +2355,7 @@ async def admin_analytics_page(
             {"label": "사용 분석"}
         ])
         
-        # 메트릭 데이터 조회 (현재는 Mock 데이터, 향후 실제 MetricsMiddleware 연동)
+        # 메트릭 롤업 조회 (기본 기간: 최근 24시간)
         metrics_data = await get_analytics_data()
         
         # Chart.js 데이터 생성
@@ -2327,28 +2368,25 @@ async def admin_analytics_page(
                 value=metrics_data["total_requests"],
                 color="blue",
                 icon="📊",
-                trend={"value": "+12%", "positive": True}
+                subtitle="최근 24시간"
             ),
             StatsCard(
-                title="성공률",
+                title=T("success_rate", default_lang=lang),
                 value=f"{metrics_data['success_rate']:.1f}%",
                 color="green",
-                icon="✅",
-                trend={"value": "+2.3%", "positive": True}
+                icon="✅"
             ),
             StatsCard(
-                title="평균 응답시간",
+                title=T("avg_response_time", default_lang=lang),
                 value=f"{metrics_data['avg_response_time']:.0f}ms",
                 color="yellow",
-                icon="⚡",
-                trend={"value": "-15ms", "positive": True}
+                icon="⚡"
             ),
             StatsCard(
                 title="활성 사용자",
                 value=metrics_data["active_users"],
                 color="purple",
-                icon="👥",
-                trend={"value": "+5", "positive": True}
+                icon="👥"
             ),
             cls="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8"
         )
@@ -2424,7 +2462,7 @@ async def admin_analytics_page(
         )
         
         # 도구별 사용 통계 테이블
-        tool_headers = ["도구명", "사용 횟수", "평균 응답시간", "성공률", "마지막 사용"]
+        tool_headers = _analytics_tool_headers(lang)
         tool_rows = []
         for tool_name, stats in metrics_data["tool_stats"].items():
             tool_rows.append([
@@ -2500,7 +2538,12 @@ async def admin_analytics_page(
                 title="시스템 정보",
                 content=Div(
                     P(f"마지막 업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", cls="text-sm text-gray-600"),
-                    P("데이터 소스: MCP Server 메트릭 (향후 실시간 연동 예정)", cls="text-xs text-gray-500"),
+                    P(
+                        "데이터 소스: MCP Server 메트릭 롤업 (1분/1시간 단위)"
+                        if metrics_data["available"]
+                        else "데이터 소스: 메트릭 저장소 미설정 (METRICS_STORE_URL)",
+                        cls="text-xs text-gray-500"
+                    ),
                     cls="space-y-2"
                 ),
                 color="gray"
@@ -2508,13 +2551,20 @@ async def admin_analytics_page(
             
             cls="space-y-8"
         )
-        
-        logger.info("분석 페이지 로딩 완료", user_id=current_user.id)
-        
-        page = create_layout("사용 분석", content, current_user)
-        html_content = to_xml(page)
-        return HTMLResponse(content=html_content)
-        
+        return to_xml(content)
+
+    try:
+        return await cached_html_response(
+            request,
+            "analytics_page",
+            [METRICS],
+            render,
+            wrap=lambda html: to_xml(
+                create_layout("사용 분석", NotStr(html), current_user, request)
+            ),
+            vary=(current_user.id,),
+        )
+
     except Exception as e:
         logger.error("분석 페이지 로딩 실패", error=str(e))
         error_content = Div(
@@ -2525,22 +2575,35 @@ async def admin_analytics_page(
         html_content = to_xml(page)
         return HTMLResponse(content=html_content, status_code=500)
 
+
+def _analytics_tool_headers(lang: str) -> list[str]:
+    """도구별 사용 통계 테이블 헤더"""
+    return [
+        "도구명",
+        "사용 횟수",
+        T("avg_response_time", default_lang=lang),
+        T("success_rate", default_lang=lang),
+        T("last_used", default_lang=lang),
+    ]
+
+
 @app.get("/admin/analytics/data", response_class=HTMLResponse)
 async def admin_analytics_data(
+    request: Request,
     current_user: Annotated[UserResponse, Depends(require_admin)],
     period: Optional[str] = None,
     tool: Optional[str] = None,
     search: Optional[str] = None
 ):
-    """분석 데이터 (HTMX 자동 새로고침용)"""
-    try:
+    """분석 데이터 (HTMX 자동 새로고침용, 같은 롤업 구간 안에서는 304)"""
+
+    async def render(lang: str) -> str:
         logger.debug("분석 데이터 업데이트", user_id=current_user.id, period=period, tool=tool)
         
         # 필터링된 메트릭 데이터 조회
         metrics_data = await get_analytics_data(period=period, tool_filter=tool, search=search)
         
         # 도구별 사용 통계 테이블 재생성
-        tool_headers = ["도구명", "사용 횟수", "평균 응답시간", "성공률", "마지막 사용"]
         tool_rows = []
         for tool_name, stats in metrics_data["tool_stats"].items():
             tool_rows.append([
@@ -2552,14 +2615,22 @@ async def admin_analytics_data(
             ])
         
         table = AdminTable(
-            headers=tool_headers,
+            headers=_analytics_tool_headers(lang),
             rows=tool_rows,
             table_id="tool-usage-table",
             empty_message="필터 조건에 맞는 데이터가 없습니다."
         )
-        
-        return HTMLResponse(content=to_xml(table))
-        
+        return to_xml(table)
+
+    try:
+        return await cached_html_response(
+            request,
+            "analytics_data",
+            [METRICS],
+            render,
+            params=(period, tool, search),
+        )
+
     except Exception as e:
         logger.error("분석 데이터 업데이트 실패", error=str(e))
         return HTMLResponse(
@@ -2591,59 +2662,93 @@ async def admin_analytics_charts_data(
             status_code=500
         )
 
+# 분석 기간별 (조회 범위, 시간별 활동 차트 간격) - 초 단위
+ANALYTICS_PERIODS = {
+    "1h": (3600, 60),
+    "24h": (86400, 3600),
+    "7d": (7 * 86400, 6 * 3600),
+    "30d": (30 * 86400, 86400),
+}
+DEFAULT_ANALYTICS_PERIOD = "24h"
+
+
+def _format_elapsed(timestamp: Optional[float], now: float) -> str:
+    """마지막 사용 시각을 '2분 전' 형태로 표시"""
+    if timestamp is None:
+        return "-"
+    elapsed = max(0, int(now - timestamp))
+    if elapsed < 60:
+        return f"{elapsed}초 전"
+    if elapsed < 3600:
+        return f"{elapsed // 60}분 전"
+    if elapsed < 86400:
+        return f"{elapsed // 3600}시간 전"
+    return f"{elapsed // 86400}일 전"
+
+
 async def get_analytics_data(
     period: Optional[str] = None,
     tool_filter: Optional[str] = None,
     search: Optional[str] = None
 ) -> Dict[str, Any]:
-    """분석 데이터 조회 (현재는 Mock 데이터, 향후 실제 메트릭 연동)"""
-    
-    # TODO: 실제 MetricsMiddleware 데이터 연동
-    # 현재는 Mock 데이터로 기본 구조 구현
-    
-    base_data = {
-        "total_requests": 1247,
-        "success_rate": 97.8,
-        "avg_response_time": 156.3,
-        "active_users": 12,
-        "tool_stats": {
-            "search_web": {
-                "count": 456,
-                "avg_duration": 234.5,
-                "success_rate": 98.2,
-                "last_used": "2분 전"
-            },
-            "search_vectors": {
-                "count": 234,
-                "avg_duration": 189.3,
-                "success_rate": 96.5,
-                "last_used": "5분 전"
-            },
-            "search_database": {
-                "count": 345,
-                "avg_duration": 78.9,
-                "success_rate": 99.1,
-                "last_used": "1분 전"
-            },
-            "health_check": {
-                "count": 212,
-                "avg_duration": 12.1,
-                "success_rate": 100.0,
-                "last_used": "30초 전"
-            }
-        }
+    """
+    분석 데이터 조회
+
+    MCP 서버의 MetricsMiddleware가 기록한 1분/1시간 롤업(src.utils.metrics_store)을
+    조회합니다. 기간이 길수록 1시간 롤업을 읽으므로 30일 조회도 키 720개 이내입니다.
+    메트릭 저장소가 설정되지 않았으면 빈 데이터를 반환합니다.
+    """
+    period = period if period in ANALYTICS_PERIODS else DEFAULT_ANALYTICS_PERIOD
+    span, step = ANALYTICS_PERIODS[period]
+    now = time.time()
+
+    data: Dict[str, Any] = {
+        "period": period,
+        "total_requests": 0,
+        "success_rate": 0.0,
+        "avg_response_time": 0.0,
+        "active_users": 0,
+        "tool_stats": {},
+        "timeline": [],
+        "timeline_step": step,
+        "response_time_histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+        "role_activity": {},
+        "available": False,
     }
-    
-    # 필터 적용 시뮬레이션
-    if tool_filter:
-        filtered_stats = {k: v for k, v in base_data["tool_stats"].items() if k == tool_filter}
-        base_data["tool_stats"] = filtered_stats
-    
-    if search:
-        # 사용자 검색 시뮬레이션 (실제로는 사용자별 메트릭 필터링)
-        pass
-    
-    return base_data
+
+    store = get_metrics_store()
+    if store is None:
+        return data
+
+    # 사용자 검색(search)은 롤업에 사용자별 시계열이 없어 적용하지 않음
+    window = await store.query(now - span, now, tool=tool_filter or None, step=step)
+    totals = window["totals"]
+    count = totals["count"]
+
+    data.update(
+        total_requests=count,
+        success_rate=(count - totals["errors"]) / count * 100 if count else 0.0,
+        avg_response_time=totals["duration_ms"] / count if count else 0.0,
+        active_users=window["active_users"],
+        timeline=window["timeline"],
+        response_time_histogram=window["histogram"],
+        role_activity=window["roles"],
+        available=True,
+    )
+    for tool_name, stats in sorted(
+        window["tools"].items(), key=lambda item: item[1]["count"], reverse=True
+    ):
+        tool_count = stats["count"]
+        data["tool_stats"][tool_name] = {
+            "count": tool_count,
+            "avg_duration": stats["duration_ms"] / tool_count if tool_count else 0.0,
+            "success_rate": (tool_count - stats["errors"]) / tool_count * 100
+            if tool_count
+            else 0.0,
+            "last_used": _format_elapsed(stats["last_used"], now),
+        }
+
+    return data
 
 def generate_chart_data(metrics_data: Dict[str, Any]) -> Dict[str, Any]:
     """메트릭 데이터를 Chart.js 형식으로 변환"""
@@ -2673,12 +2778,15 @@ def generate_chart_data(metrics_data: Dict[str, Any]) -> Dict[str, Any]:
         }]
     }
     
-    # 시간별 활동 라인차트 데이터 (Mock 시간 데이터)
+    # 시간별 활동 라인차트 데이터 (1일 이상 간격이면 날짜, 6시간 이상이면 날짜와 시각)
+    step = metrics_data.get("timeline_step", 3600)
+    label_format = "%m-%d" if step >= 86400 else "%m-%d %H:00" if step >= 6 * 3600 else "%H:%M"
+    timeline = metrics_data.get("timeline", [])
     activity_timeline_data = {
-        "labels": ["06:00", "09:00", "12:00", "15:00", "18:00", "21:00"],
+        "labels": [datetime.fromtimestamp(ts).strftime(label_format) for ts, _ in timeline],
         "datasets": [{
             "label": "요청 수",
-            "data": [45, 120, 89, 156, 203, 78],
+            "data": [count for _, count in timeline],
             "borderColor": "rgb(59, 130, 246)",
             "backgroundColor": "rgba(59, 130, 246, 0.1)",
             "tension": 0.4,
@@ -2686,35 +2794,52 @@ def generate_chart_data(metrics_data: Dict[str, Any]) -> Dict[str, Any]:
         }]
     }
     
-    # 응답시간 히스토그램 데이터
+    # 응답시간 히스토그램 데이터 (구간 경계는 LATENCY_BUCKETS_MS)
+    bounds = (0, *LATENCY_BUCKETS_MS)
     response_time_data = {
-        "labels": ["0-50ms", "50-100ms", "100-200ms", "200-500ms", "500ms+"],
+        "labels": [f"{low}-{high}ms" for low, high in zip(bounds, bounds[1:])]
+        + [f"{LATENCY_BUCKETS_MS[-1]}ms+"],
         "datasets": [{
             "label": "요청 수",
-            "data": [234, 456, 189, 67, 12],
+            "data": metrics_data.get(
+                "response_time_histogram", [0] * len(bounds)
+            ),
             "backgroundColor": "rgba(16, 185, 129, 0.8)",
             "borderColor": "rgb(16, 185, 129)",
             "borderWidth": 1
         }]
     }
     
-    # 사용자별 활동 도넛차트 데이터
+    # 역할별 활동 도넛차트 데이터
+    role_labels = {
+        "admin": "Admin",
+        "user": "일반 사용자",
+        "analyst": "분석가",
+        "guest": "게스트",
+        "anonymous": "익명",
+        "service": "서비스",
+    }
+    role_activity = metrics_data.get("role_activity", {})
     user_activity_data = {
-        "labels": ["Admin", "일반 사용자", "분석가", "게스트"],
+        "labels": [role_labels.get(role, role) for role in role_activity],
         "datasets": [{
             "label": "활동량",
-            "data": [35, 45, 15, 5],
+            "data": list(role_activity.values()),
             "backgroundColor": [
                 "rgba(239, 68, 68, 0.8)",     # Red
                 "rgba(59, 130, 246, 0.8)",    # Blue
                 "rgba(245, 158, 11, 0.8)",    # Yellow
-                "rgba(107, 114, 128, 0.8)"    # Gray
+                "rgba(107, 114, 128, 0.8)",   # Gray
+                "rgba(16, 185, 129, 0.8)",    # Green
+                "rgba(139, 92, 246, 0.8)"     # Purple
             ],
             "borderColor": [
                 "rgb(239, 68, 68)",
                 "rgb(59, 130, 246)",
                 "rgb(245, 158, 11)", 
-                "rgb(107, 114, 128)"
+                "rgb(107, 114, 128)",
+                "rgb(16, 185, 129)",
+                "rgb(139, 92, 246)"
             ],
             "borderWidth": 2
         }]
@@ -3122,9 +3247,7 @@ async def admin_dashboard(
     """관리자 대시보드"""
     try:
         # 사용자 통계 조회
-        from .repositories.sqlite_user_repository import SQLiteUserRepository
-
-        repository = SQLiteUserRepository(db)
+        repository = get_user_repository(db)
         stats = await repository.get_user_stats()
 
         # AdminBreadcrumb 사용 (번역 적용)
@@ -3289,16 +3412,16 @@ async def admin_dashboard(
 
 @app.get("/admin/users", response_class=HTMLResponse)
 async def admin_users_page(
+    request: Request,
     current_user: Annotated[UserResponse, Depends(require_admin)],
     auth_service: Annotated[SQLiteAuthService, Depends(get_sqlite_auth_service)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    """사용자 관리 페이지"""
-    try:
-        # 사용자 목록 조회
-        from .repositories.sqlite_user_repository import SQLiteUserRepository
+    """사용자 관리 페이지 (사용자 변경 전까지 캐시된 조각 / 304)"""
 
-        repository = SQLiteUserRepository(db)
+    async def render(lang: str) -> str:
+        # 사용자 목록 조회
+        repository = get_user_repository(db)
         users = await repository.list_all(skip=0, limit=50)
 
         # Breadcrumb 생성
@@ -3308,7 +3431,14 @@ async def admin_users_page(
         ])
 
         # AdminTable을 위한 헤더와 데이터 준비
-        headers = ["ID", "이메일", "사용자명", "역할", "상태", "가입일"]
+        headers = [
+            "ID",
+            T("email", default_lang=lang),
+            T("username", default_lang=lang),
+            T("role", default_lang=lang),
+            T("status", default_lang=lang),
+            "가입일",
+        ]
         
         # 테이블 행 데이터 생성
         table_rows = []
@@ -3470,10 +3600,19 @@ async def admin_users_page(
             Div(id="modalContainer"),
             
         )
+        return to_xml(content)
 
-        page = create_layout("사용자 관리", content, current_user)
-        html_content = to_xml(page)
-        return HTMLResponse(content=html_content)
+    try:
+        return await cached_html_response(
+            request,
+            "users_page",
+            [USERS],
+            render,
+            wrap=lambda html: to_xml(
+                create_layout("사용자 관리", NotStr(html), current_user, request)
+            ),
+            vary=(current_user.id,),
+        )
 
     except Exception as e:
         logger.error("사용자 관리 페이지 로딩 실패", error=str(e))
@@ -3499,9 +3638,7 @@ async def get_role_change_modal(
     """사용자 역할 변경 모달 콘텐츠 반환"""
     try:
         # 사용자 조회
-        from .repositories.sqlite_user_repository import SQLiteUserRepository
-        
-        repository = SQLiteUserRepository(db)
+        repository = get_user_repository(db)
         user = await repository.get_by_id(user_id)
         
         if not user:
@@ -3634,15 +3771,16 @@ async def update_user_roles_htmx(
         roles = form.getlist("roles")  # 체크박스에서 선택된 역할들
         
         # 기존 API 로직 재사용
-        user = await auth_service.user_repository.get_by_id(user_id)
+        repository = get_user_repository(db)
+        user = await repository.get_by_id(user_id)
         if not user:
             return HTMLResponse(
                 content='<div class="text-red-600 p-4">사용자를 찾을 수 없습니다.</div>',
                 status_code=404
             )
         
-        # 역할 업데이트
-        updated_user = await auth_service.user_repository.update(user_id, {"roles": roles})
+        # 역할 업데이트 (Repository가 /auth/me 프로필 캐시도 무효화)
+        updated_user = await repository.update(user_id, {"roles": roles})
         
         if not updated_user:
             return HTMLResponse(
@@ -3692,9 +3830,7 @@ async def refresh_user_row(
     """사용자 테이블 행 새로고침"""
     try:
         # 사용자 조회
-        from .repositories.sqlite_user_repository import SQLiteUserRepository
-        
-        repository = SQLiteUserRepository(db)
+        repository = get_user_repository(db)
         user = await repository.get_by_id(user_id)
         
         if not user:
@@ -3981,72 +4117,50 @@ async def admin_permissions_page(
 
 @app.get("/admin/permissions/table", response_class=HTMLResponse)
 async def admin_permissions_table(
+    request: Request,
     current_user: Annotated[UserResponse, Depends(require_admin)],
     permission_service=Depends(get_permission_service),
     resource_type_filter: Optional[str] = None,
     resource_name_filter: Optional[str] = None,
-    user_id_filter: Optional[int] = None,
+    user_id_filter: Optional[str] = None,
     role_name_filter: Optional[str] = None,
-    skip: int = 0,
-    limit: int = 50,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
 ):
-    """권한 목록 테이블 HTMX 엔드포인트"""
-    try:
-        # 기존 list_resource_permissions API와 동일한 로직 사용
-        if not permission_service.db_conn:
-            return Div(
-                P("데이터베이스 연결이 필요합니다.", cls="text-red-600 p-4"),
-                cls="text-center"
+    """권한 목록 테이블 HTMX 엔드포인트 (권한 변경 전까지 캐시된 조각 / 304)"""
+    # 기존 list_resource_permissions API와 동일한 로직 사용
+    if not permission_service.db_conn:
+        return HTMLResponse(
+            content=to_xml(
+                Div(
+                    P("데이터베이스 연결이 필요합니다.", cls="text-red-600 p-4"),
+                    cls="text-center"
+                )
             )
+        )
 
-        # 쿼리 조건 구성
-        conditions = []
-        params = []
-
-        # 필터 파라미터 처리
-        if resource_type_filter:
-            try:
-                resource_type = ResourceType(resource_type_filter)
-                conditions.append(f"resource_type = ${len(params) + 1}")
-                params.append(resource_type.value)
-            except ValueError:
-                pass  # 유효하지 않은 리소스 타입은 무시
-
-        if resource_name_filter:
-            conditions.append(f"resource_name ILIKE ${len(params) + 1}")
-            params.append(f"%{resource_name_filter}%")
-
-        if user_id_filter:
-            conditions.append(f"user_id = ${len(params) + 1}")
-            params.append(user_id_filter)
-
-        if role_name_filter:
-            conditions.append(f"role_name = ${len(params) + 1}")
-            params.append(role_name_filter)
-
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-        # 총 개수 조회
-        count_query = f"""
-            SELECT COUNT(*) as total
-            FROM resource_permissions
-            {where_clause}
-        """
-        count_result = await permission_service.db_conn.fetchrow(count_query, *params[:len(params)-2] if params else [])
-        total_count = count_result["total"] if count_result else 0
-
-        # 권한 목록 조회
-        query = f"""
-            SELECT id, user_id, role_name, resource_type, resource_name, 
-                   actions, conditions, granted_at, granted_by, expires_at
-            FROM resource_permissions
-            {where_clause}
-            ORDER BY granted_at DESC
-            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
-        """
-        params.extend([limit, skip])
+    # 필터 파라미터 처리 (빈 입력과 유효하지 않은 값은 무시)
+    filters = dict(
+        resource_type=None,
+        resource_name=resource_name_filter or None,
+        user_id=int(user_id_filter) if (user_id_filter or "").isdigit() else None,
+        role_name=role_name_filter or None,
+    )
+    if resource_type_filter:
+        try:
+            filters["resource_type"] = ResourceType(resource_type_filter)
+        except ValueError:
+            pass
 
-        rows = await permission_service.db_conn.fetch(query, *params)
+    async def render(lang: str) -> str:
+        # DB에서 필터링한 키셋 페이지와 추정 개수
+        page = await permission_service.list_resource_permissions(
+            **filters, limit=limit, cursor=cursor
+        )
+        total_count, estimated = await permission_service.estimate_permission_count(
+            **filters
+        )
+        rows = page.rows
 
         # HTML 테이블 생성
         permission_rows = []
@@ -4068,7 +4182,7 @@ async def admin_permissions_table(
                     Td(expires_date, cls="px-6 py-4 whitespace-nowrap text-sm text-gray-500"),
                     Td(
                         Button(
-                            "삭제",
+                            T("delete", default_lang=lang),
                             **{
                                 "hx-delete": f"/admin/permissions/{row['id']}",
                                 "hx-target": "#permissions-table",
@@ -4082,11 +4196,8 @@ async def admin_permissions_table(
                 )
             )
 
-        # 페이지네이션 정보
-        has_next = skip + limit < total_count
-        has_prev = skip > 0
-        current_page = (skip // limit) + 1
-        total_pages = (total_count + limit - 1) // limit
+        # 페이지네이션 정보 (필터는 hx-include로 커서와 함께 전송)
+        total_label = f"약 {total_count:,}" if estimated else f"{total_count:,}"
 
         table_content = Div(
             # 테이블 헤더와 데이터
@@ -4094,12 +4205,12 @@ async def admin_permissions_table(
                 Thead(
                     Tr(
                         Th("대상", cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
-                        Th("리소스 타입", cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
-                        Th("리소스 이름", cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
+                        Th(T("resource_type", default_lang=lang), cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
+                        Th(T("resource_name", default_lang=lang), cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
                         Th("권한", cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
                         Th("부여일", cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
-                        Th("만료일", cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
-                        Th("액션", cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
+                        Th(T("expires_at", default_lang=lang), cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
+                        Th(T("table_actions", default_lang=lang), cls="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider"),
                         cls="bg-gray-50"
                     )
                 ),
@@ -4120,7 +4231,7 @@ async def admin_permissions_table(
             # 페이지네이션
             Div(
                 Div(
-                    P(f"총 {total_count}개 권한 중 {skip + 1}-{min(skip + limit, total_count)}번째 표시", 
+                    P(f"총 {total_label}개 권한 중 {len(rows)}개 표시",
                       cls="text-sm text-gray-700"),
                     cls="flex-1"
                 ),
@@ -4128,22 +4239,21 @@ async def admin_permissions_table(
                     Button(
                         "이전",
                         **{
-                            "hx-get": f"/admin/permissions/table?skip={max(0, skip - limit)}&limit={limit}",
+                            "hx-get": f"/admin/permissions/table?cursor={page.prev_cursor or ''}&limit={limit}",
                             "hx-target": "#permissions-table",
                             "hx-include": "#permissions-filters",
                         },
-                        disabled=not has_prev,
+                        disabled=page.prev_cursor is None,
                         cls="mr-2 px-3 py-1 text-sm bg-gray-300 hover:bg-gray-400 text-gray-700 rounded disabled:opacity-50"
                     ),
-                    Span(f"페이지 {current_page} / {total_pages}", cls="mx-2 text-sm text-gray-700"),
                     Button(
                         "다음",
                         **{
-                            "hx-get": f"/admin/permissions/table?skip={skip + limit}&limit={limit}",
+                            "hx-get": f"/admin/permissions/table?cursor={page.next_cursor or ''}&limit={limit}",
                             "hx-target": "#permissions-table", 
                             "hx-include": "#permissions-filters",
                         },
-                        disabled=not has_next,
+                        disabled=page.next_cursor is None,
                         cls="ml-2 px-3 py-1 text-sm bg-gray-300 hover:bg-gray-400 text-gray-700 rounded disabled:opacity-50"
                     ),
                     cls="flex items-center"
@@ -4152,20 +4262,33 @@ async def admin_permissions_table(
             ),
             id="permissions-table"
         )
+        return to_xml(table_content)
 
-        return table_content
+    try:
+        return await cached_html_response(
+            request,
+            "permissions_table",
+            [PERMISSIONS],
+            render,
+            params=(*filters.values(), cursor, limit),
+        )
 
     except Exception as e:
         logger.error("권한 테이블 로딩 실패", error=str(e))
-        return Div(
-            P(f"권한 목록을 불러오는 중 오류가 발생했습니다: {str(e)}", cls="text-red-600 p-4"),
-            cls="text-center"
+        return HTMLResponse(
+            content=to_xml(
+                Div(
+                    P(f"권한 목록을 불러오는 중 오류가 발생했습니다: {str(e)}", cls="text-red-600 p-4"),
+                    cls="text-center"
+                )
+            )
         )
 
 
 @app.delete("/admin/permissions/{permission_id}", response_class=HTMLResponse)
 async def delete_permission(
     permission_id: int,
+    request: Request,
     current_user: Annotated[UserResponse, Depends(require_admin)],
     permission_service=Depends(get_permission_service),
 ):
@@ -4180,6 +4303,7 @@ async def delete_permission(
         # 권한 삭제
         delete_query = "DELETE FROM resource_permissions WHERE id = $1"
         result = await permission_service.db_conn.execute(delete_query, permission_id)
+        bump_data_version(PERMISSIONS)
         
         if result == "DELETE 0":
             raise HTTPException(
@@ -4190,7 +4314,9 @@ async def delete_permission(
         logger.info("권한 삭제", permission_id=permission_id, admin_user=current_user.email)
         
         # 테이블 새로고침을 위해 HTMX 응답으로 업데이트된 테이블 반환
-        return await admin_permissions_table(current_user, permission_service)
+        return await admin_permissions_table(
+            request, current_user, permission_service, limit=50
+        )
 
     except HTTPException:
         raise
@@ -4615,13 +4741,13 @@ async def admin_roles_table(
 
 @app.get("/admin/roles/matrix", response_class=HTMLResponse)
 async def admin_roles_matrix(
+    request: Request,
     current_user: Annotated[UserResponse, Depends(require_admin)],
     rbac_service=Depends(get_rbac_service),
 ):
-    """권한 매트릭스 HTMX 엔드포인트"""
-    try:
-        from ..models import ResourceType, ActionType
-        
+    """권한 매트릭스 HTMX 엔드포인트 (역할 변경 전까지 캐시된 조각 / 304)"""
+
+    async def render(lang: str) -> str:
         # 모든 리소스와 액션 조합
         resources = [ResourceType.WEB_SEARCH, ResourceType.VECTOR_DB, ResourceType.DATABASE]
         actions = [ActionType.READ, ActionType.WRITE]
@@ -4716,14 +4842,20 @@ async def admin_roles_matrix(
             ),
             id="roles-matrix"
         )
+        return to_xml(matrix_content)
 
-        return matrix_content
+    try:
+        return await cached_html_response(request, "roles_matrix", [ROLES], render)
 
     except Exception as e:
         logger.error("권한 매트릭스 로딩 실패", error=str(e))
-        return Div(
-            P(f"권한 매트릭스를 불러오는 중 오류가 발생했습니다: {str(e)}", cls="text-red-600 p-4"),
-            cls="text-center"
+        return HTMLResponse(
+            content=to_xml(
+                Div(
+                    P(f"권한 매트릭스를 불러오는 중 오류가 발생했습니다: {str(e)}", cls="text-red-600 p-4"),
+                    cls="text-center"
+                )
+            )
         )
 
 
@@ -4828,6 +4960,7 @@ async def delete_role(
         
         # 역할 삭제 (현재는 메모리에서만)
         del rbac_service.role_permissions[role_name]
+        bump_data_version(ROLES)
         
         logger.info("역할 삭제", role_name=role_name, admin_user=current_user.email)
         
@@ -5003,6 +5136,7 @@ async def update_role(
         
         # 권한 업데이트
         rbac_service.role_permissions[role_name] = new_permissions
+        bump_data_version(ROLES)
         
         logger.info(
             "역할 권한 업데이트", 
@@ -5065,6 +5199,7 @@ async def create_role(
         
         # 새 역할 생성 (기본적으로 빈 권한)
         rbac_service.role_permissions[role_name] = []
+        bump_data_version(ROLES)
         
         logger.info(
             "새 역할 생성", 
@@ -1,9 +1,30 @@
-"""인증 서비스 모듈"""
+"""인증 서비스 모듈
+
+서비스는 처음 접근할 때 임포트합니다. AuthService는 SQLAlchemy 기반
+저장소를 끌어오므로, JWT 검증만 필요한 MCP 서버는 이를 로드하지 않습니다.
+"""
+
+import importlib
+
+_LAZY_EXPORTS = {
+    "AuthService": ".auth_service",
+    "AuthenticationError": ".auth_service",
+    "JWTService": ".jwt_service",
+    "TokenData": ".jwt_service",
+    "RBACService": ".rbac_service",
+    "PermissionDeniedError": ".rbac_service",
+    "PermissionService": ".permission_service",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-from .auth_service import AuthService, AuthenticationError
-from .jwt_service import JWTService, TokenData
-from .rbac_service import RBACService, PermissionDeniedError
-from .permission_service import PermissionService
 
 __all__ = [
     "AuthService",
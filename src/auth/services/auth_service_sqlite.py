@@ -5,6 +5,8 @@ SQLite 기반 인증 서비스
 데이터베이스 세션을 직접 받아서 사용하여 영구 저장을 지원합니다.
 """
 
+from typing import Optional
+
 from passlib.context import CryptContext
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,7 +17,8 @@ from ..models import (
     UserResponse,
     AuthTokens,
 )
-from ..repositories.sqlite_user_repository import SQLiteUserRepository
+from ..profile_cache import UserProfileCache, get_profile_cache
+from ..user_store import get_user_repository
 from .jwt_service import JWTService
 
 
@@ -30,14 +33,21 @@ class SQLiteAuthService:
     비동기 데이터베이스 세션을 활용하여 영구 저장을 지원합니다.
     """
 
-    def __init__(self, jwt_service: JWTService):
+    def __init__(
+        self,
+        jwt_service: JWTService,
+        profile_cache: Optional[UserProfileCache] = None,
+    ):
         """
         인증 서비스 초기화
 
         Args:
             jwt_service (JWTService): JWT 토큰 관리 서비스
+            profile_cache (Optional[UserProfileCache]): 프로필 캐시
+                (기본값: 프로세스 공유 캐시)
         """
         self.jwt_service = jwt_service
+        self.profile_cache = profile_cache or get_profile_cache()
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
     def hash_password(self, password: str) -> str:
@@ -64,8 +74,8 @@ class SQLiteAuthService:
         Raises:
             AuthenticationError: 이메일 중복 등 유효성 검사 실패
         """
-        # SQLite Repository 생성
-        repository = SQLiteUserRepository(session)
+        # 사용자 Repository 생성 (AUTH_USER_STORE에 따라 SQLite/PostgreSQL)
+        repository = get_user_repository(session)
 
         # 이메일 중복 확인
         existing_user = await repository.get_by_email(user_data.email)
@@ -123,8 +133,8 @@ class SQLiteAuthService:
         Raises:
             AuthenticationError: 인증 실패
         """
-        # SQLite Repository 생성
-        repository = SQLiteUserRepository(session)
+        # 사용자 Repository 생성 (AUTH_USER_STORE에 따라 SQLite/PostgreSQL)
+        repository = get_user_repository(session)
 
         # 사용자 조회
         user = await repository.get_by_email(credentials.email)
@@ -176,11 +186,13 @@ class SQLiteAuthService:
         Raises:
             AuthenticationError: 토큰 검증 실패
         """
-        # 리프레시 토큰 검증
-        token_data = self.jwt_service.decode_token(refresh_token)
+        # 리프레시 토큰 검증 (무효화 목록 포함)
+        token_data = await self.jwt_service.verify_refresh_token_async(refresh_token)
+        if not token_data:
+            raise AuthenticationError("유효하지 않거나 무효화된 리프레시 토큰입니다")
 
-        # SQLite Repository 생성
-        repository = SQLiteUserRepository(session)
+        # 사용자 Repository 생성 (AUTH_USER_STORE에 따라 SQLite/PostgreSQL)
+        repository = get_user_repository(session)
 
         # 사용자 조회
         user = await repository.get_by_id(token_data.user_id)
@@ -221,8 +233,14 @@ class SQLiteAuthService:
         # 토큰 검증
         token_data = self.jwt_service.decode_token(token)
 
-        # SQLite Repository 생성
-        repository = SQLiteUserRepository(session)
+        # 프로필 캐시 확인 (활성 사용자만 캐시되며 변경 시 무효화됨)
+        cached = await self.profile_cache.get(token_data.user_id)
+        if cached is not None:
+            return cached
+        generation = self.profile_cache.generation
+
+        # 사용자 Repository 생성 (AUTH_USER_STORE에 따라 SQLite/PostgreSQL)
+        repository = get_user_repository(session)
 
         # 사용자 조회
         user = await repository.get_by_id(token_data.user_id)
@@ -233,7 +251,7 @@ class SQLiteAuthService:
             raise AuthenticationError("계정이 비활성화되었습니다")
 
         # 응답 모델로 변환
-        return UserResponse(
+        profile = UserResponse(
             id=user.id,
             email=user.email,
             username=user.username,
@@ -242,6 +260,8 @@ class SQLiteAuthService:
             roles=user.roles,
             created_at=user.created_at,
         )
+        await self.profile_cache.set(profile, generation)
+        return profile
 
 
 class AuthenticationError(Exception):
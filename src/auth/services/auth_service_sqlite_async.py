@@ -17,7 +17,8 @@ from ..models import (
     UserResponse,
     AuthTokens,
 )
-from ..repositories.sqlite_user_repository import SQLiteUserRepository
+from ..profile_cache import UserProfileCache, get_profile_cache
+from ..user_store import get_user_repository
 from ..repositories.token_repository import TokenRepository
 from .jwt_service import JWTService
 
@@ -37,6 +38,7 @@ class AsyncSQLiteAuthService:
         self,
         jwt_service: JWTService,
         token_repository: Optional[TokenRepository] = None,
+        profile_cache: Optional[UserProfileCache] = None,
     ):
         """
         인증 서비스 초기화
@@ -44,9 +46,12 @@ class AsyncSQLiteAuthService:
         Args:
             jwt_service (JWTService): JWT 토큰 관리 서비스
             token_repository (Optional[TokenRepository]): 토큰 저장소
+            profile_cache (Optional[UserProfileCache]): 프로필 캐시
+                (기본값: 프로세스 공유 캐시)
         """
         self.jwt_service = jwt_service
         self.token_repository = token_repository
+        self.profile_cache = profile_cache or get_profile_cache()
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
     def hash_password(self, password: str) -> str:
@@ -73,8 +78,8 @@ class AsyncSQLiteAuthService:
         Raises:
             AuthenticationError: 이메일 중복 등 유효성 검사 실패
         """
-        # SQLite Repository 생성
-        repository = SQLiteUserRepository(session)
+        # 사용자 Repository 생성 (AUTH_USER_STORE에 따라 SQLite/PostgreSQL)
+        repository = get_user_repository(session)
 
         # 이메일 중복 확인
         existing_user = await repository.get_by_email(user_data.email)
@@ -132,8 +137,8 @@ class AsyncSQLiteAuthService:
         Raises:
             AuthenticationError: 인증 실패
         """
-        # SQLite Repository 생성
-        repository = SQLiteUserRepository(session)
+        # 사용자 Repository 생성 (AUTH_USER_STORE에 따라 SQLite/PostgreSQL)
+        repository = get_user_repository(session)
 
         # 사용자 조회
         user = await repository.get_by_email(credentials.email)
@@ -199,8 +204,8 @@ class AsyncSQLiteAuthService:
             except Exception as e:
                 logger.error("토큰 무효화 실패", error=str(e), jti=token_data.jti)
 
-        # SQLite Repository 생성
-        repository = SQLiteUserRepository(session)
+        # 사용자 Repository 생성 (AUTH_USER_STORE에 따라 SQLite/PostgreSQL)
+        repository = get_user_repository(session)
 
         # 사용자 조회
         user = await repository.get_by_id(token_data.user_id)
@@ -266,8 +271,14 @@ class AsyncSQLiteAuthService:
         if not token_data:
             raise AuthenticationError("유효하지 않은 토큰입니다")
 
-        # SQLite Repository 생성
-        repository = SQLiteUserRepository(session)
+        # 프로필 캐시 확인 (활성 사용자만 캐시되며 변경 시 무효화됨)
+        cached = await self.profile_cache.get(token_data.user_id)
+        if cached is not None:
+            return cached
+        generation = self.profile_cache.generation
+
+        # 사용자 Repository 생성 (AUTH_USER_STORE에 따라 SQLite/PostgreSQL)
+        repository = get_user_repository(session)
 
         # 사용자 조회
         user = await repository.get_by_id(token_data.user_id)
@@ -278,7 +289,7 @@ class AsyncSQLiteAuthService:
             raise AuthenticationError("계정이 비활성화되었습니다")
 
         # 응답 모델로 변환
-        return UserResponse(
+        profile = UserResponse(
             id=user.id,
             email=user.email,
             username=user.username,
@@ -287,6 +298,8 @@ class AsyncSQLiteAuthService:
             roles=user.roles,
             created_at=user.created_at,
         )
+        await self.profile_cache.set(profile, generation)
+        return profile
 
 
 class AuthenticationError(Exception):
@@ -441,7 +441,8 @@ class JWTService:
                 try:
                     loop = asyncio.get_event_loop()
                     if loop.is_running():
-                        # 비동기 환경에서는 동기 호출 불가, 일단 통과
+                        # 비동기 환경에서는 동기 호출 불가 - 갱신 경로는
+                        # verify_refresh_token_async에서 저장소(필터)를 확인
                         logger.debug("비동기 환경에서 토큰 유효성 확인 건너뜀")
                     else:
                         # 동기 환경에서 비동기 호출
@@ -512,6 +513,40 @@ class JWTService:
 
         return token_data.user_id
 
+    async def verify_refresh_token_async(
+        self, refresh_token: str
+    ) -> Optional[TokenData]:
+        """
+        리프레시 토큰 검증 (무효화 여부 포함, 비동기)
+
+        decode_token은 이벤트 루프 안에서 저장소 확인을 건너뛰므로, 토큰 갱신
+        경로에서는 이 메서드로 무효화 목록까지 확인합니다. RedisTokenRepository에
+        Bloom 필터가 있으면 필터가 먼저 "확실히 없음"을 판정합니다.
+
+        Args:
+            refresh_token: 검증할 리프레시 토큰
+
+        Returns:
+            검증 성공 시 TokenData, 실패하거나 무효화된 토큰이면 None
+        """
+        token_data = self.decode_token(refresh_token)
+
+        if not token_data:
+            return None
+
+        if token_data.token_type != "refresh":
+            logger.warning(
+                "잘못된 토큰 타입", expected="refresh", actual=token_data.token_type
+            )
+            return None
+
+        if self.token_repository and token_data.jti:
+            if not await self.token_repository.is_token_valid(token_data.jti):
+                logger.warning("무효화된 리프레시 토큰", jti=token_data.jti)
+                return None
+
+        return token_data
+
     def is_token_near_expiry(self, token: str, threshold_minutes: int = 5) -> bool:
         """
         토큰이 곧 만료되는지 확인
@@ -5,15 +5,107 @@
 DB에서 권한을 로드하고 캐싱합니다.
 """
 
-from typing import Optional
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional
 from asyncpg import Connection
 import structlog
 
 from ..models import ResourceType, ActionType, ResourcePermission
+from ..render_cache import PERMISSIONS, bump_data_version
 
 
 logger = structlog.get_logger()
 
+# 추정치가 이 값 이하면 정확한 COUNT(*)를 실행 (작은 결과는 세는 비용이 작음)
+EXACT_COUNT_THRESHOLD = 10_000
+
+PERMISSION_LIST_COLUMNS = """
+    id, user_id, role_name, resource_type, resource_name,
+    actions, conditions, granted_at, granted_by, expires_at
+"""
+
+
+def encode_cursor(permission_id: int, direction: str = "next") -> str:
+    """
+    키셋 페이지네이션 커서 생성 (클라이언트에는 불투명한 문자열)
+
+    Args:
+        permission_id: 기준 행 ID (next: 이 ID보다 오래된 행, prev: 최신 행)
+        direction: next | prev
+    """
+    raw = json.dumps([direction, permission_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str]:
+    """
+    커서 해석
+
+    Returns:
+        (기준 행 ID, 방향)
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, permission_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise ValueError("잘못된 페이지 커서입니다") from e
+    if direction not in ("next", "prev") or not isinstance(permission_id, int):
+        raise ValueError("잘못된 페이지 커서입니다")
+    return permission_id, direction
+
+
+def build_permission_filters(
+    resource_type: Optional[ResourceType] = None,
+    resource_name: Optional[str] = None,
+    user_id: Optional[int] = None,
+    role_name: Optional[str] = None,
+) -> tuple[list[str], list[Any]]:
+    """
+    권한 목록 필터를 WHERE 조건과 바인드 파라미터로 변환
+
+    resource_type, role_name 동등 조건은 (resource_type, role_name,
+    resource_name) 복합 인덱스, user_id는 (user_id) 인덱스를 사용합니다.
+    """
+    conditions: list[str] = []
+    params: list[Any] = []
+
+    if resource_type:
+        params.append(resource_type.value)
+        conditions.append(f"resource_type = ${len(params)}")
+    if role_name:
+        params.append(role_name)
+        conditions.append(f"role_name = ${len(params)}")
+    if resource_name:
+        params.append(f"%{resource_name}%")
+        conditions.append(f"resource_name ILIKE ${len(params)}")
+    if user_id:
+        params.append(user_id)
+        conditions.append(f"user_id = ${len(params)}")
+
+    return conditions, params
+
+
+@dataclass
+class PermissionPage:
+    """
+    키셋 페이지 하나
+
+    Attributes:
+        rows: 권한 행 (최신순)
+        next_cursor: 다음(더 오래된) 페이지 커서, 마지막 페이지면 None
+        prev_cursor: 이전(더 최신) 페이지 커서, 첫 페이지면 None
+    """
+
+    rows: list[dict] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
 
 class PermissionService:
     """리소스 권한 관리 서비스"""
@@ -123,6 +215,165 @@ class PermissionService:
 
         return permissions
 
+    async def iter_export_batches(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[list[dict]]:
+        """
+        내보내기용 권한 행을 배치 단위로 스트리밍
+
+        읽기 전용 트랜잭션 안에서 서버 측 커서로 batch_size개씩 가져오므로
+        권한 수와 무관하게 메모리 사용량이 일정합니다.
+
+        Args:
+            batch_size: 한 번에 가져올 행 수
+
+        Yields:
+            권한 행 목록 (resource_permissions 컬럼)
+        """
+        if not self.db_conn:
+            raise RuntimeError("데이터베이스 연결이 필요합니다")
+
+        query = """
+            SELECT id, user_id, role_name, resource_type, resource_name,
+                   actions, conditions, granted_at, expires_at
+            FROM resource_permissions
+            ORDER BY id
+        """
+        async with self.db_conn.transaction(readonly=True):
+            batch: list[dict] = []
+            async for row in self.db_conn.cursor(query, prefetch=batch_size):
+                record = dict(row)
+                # asyncpg는 코덱 없이 JSONB를 문자열로 돌려줌
+                if isinstance(record["conditions"], str):
+                    record["conditions"] = json.loads(record["conditions"])
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+    async def list_resource_permissions(
+        self,
+        resource_type: Optional[ResourceType] = None,
+        resource_name: Optional[str] = None,
+        user_id: Optional[int] = None,
+        role_name: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> PermissionPage:
+        """
+        리소스 권한 목록 (DB 필터 + 키셋 페이지네이션)
+
+        OFFSET 대신 마지막으로 본 ID를 기준으로 읽으므로 뒤쪽 페이지도
+        첫 페이지와 같은 비용입니다. limit + 1개를 읽어 다음 페이지 유무를
+        판단합니다.
+
+        Args:
+            resource_type, resource_name, user_id, role_name: 필터
+            limit: 페이지 크기
+            cursor: encode_cursor()로 만든 커서 (None이면 첫 페이지)
+            offset: 첫 페이지에서 건너뛸 행 수 (구 skip 파라미터 호환용,
+                커서가 있으면 무시)
+
+        Raises:
+            RuntimeError: DB 연결이 없을 때
+            ValueError: 잘못된 커서
+        """
+        if not self.db_conn:
+            raise RuntimeError("DB 연결이 필요합니다")
+
+        conditions, params = build_permission_filters(
+            resource_type, resource_name, user_id, role_name
+        )
+        direction = "next"
+        if cursor:
+            after_id, direction = decode_cursor(cursor)
+            params.append(after_id)
+            conditions.append(
+                f"id {'<' if direction == 'next' else '>'} ${len(params)}"
+            )
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit + 1)
+
+        query = f"""
+            SELECT {PERMISSION_LIST_COLUMNS}
+            FROM resource_permissions
+            {where_clause}
+            ORDER BY id {'DESC' if direction == 'next' else 'ASC'}
+            LIMIT ${len(params)}
+        """
+        if offset and not cursor:
+            params.append(offset)
+            query += f"OFFSET ${len(params)}"
+        rows = [self._list_row(row) for row in await self.db_conn.fetch(query, *params)]
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == "prev":
+            rows.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, cursor is not None or offset > 0
+
+        return PermissionPage(
+            rows=rows,
+            next_cursor=encode_cursor(rows[-1]["id"], "next")
+            if rows and has_next
+            else None,
+            prev_cursor=encode_cursor(rows[0]["id"], "prev")
+            if rows and has_prev
+            else None,
+        )
+
+    async def estimate_permission_count(
+        self,
+        resource_type: Optional[ResourceType] = None,
+        resource_name: Optional[str] = None,
+        user_id: Optional[int] = None,
+        role_name: Optional[str] = None,
+    ) -> tuple[int, bool]:
+        """
+        필터에 맞는 권한 수 (플래너 추정치)
+
+        COUNT(*)는 조건에 맞는 행을 모두 읽으므로, EXPLAIN의 예상 행 수를
+        사용합니다. 추정치가 EXACT_COUNT_THRESHOLD 이하이면 정확히 셉니다.
+
+        Returns:
+            (개수, 추정치 여부)
+        """
+        if not self.db_conn:
+            raise RuntimeError("DB 연결이 필요합니다")
+
+        conditions, params = build_permission_filters(
+            resource_type, resource_name, user_id, role_name
+        )
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        plan = await self.db_conn.fetchval(
+            f"EXPLAIN (FORMAT JSON) SELECT 1 FROM resource_permissions {where_clause}",
+            *params,
+        )
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate > EXACT_COUNT_THRESHOLD:
+            return estimate, True
+
+        total = await self.db_conn.fetchval(
+            f"SELECT COUNT(*) FROM resource_permissions {where_clause}", *params
+        )
+        return int(total or 0), False
+
+    @staticmethod
+    def _list_row(row) -> dict:
+        record = dict(row)
+        # asyncpg는 코덱 없이 JSONB를 문자열로 돌려줌
+        if isinstance(record.get("conditions"), str):
+            record["conditions"] = json.loads(record["conditions"])
+        return record
+
     def _merge_permissions(
         self, permissions: list[ResourcePermission]
     ) -> list[ResourcePermission]:
@@ -260,6 +511,7 @@ class PermissionService:
         # 캐시 클리어
         if user_id:
             self.clear_cache(user_id)
+        bump_data_version(PERMISSIONS)
 
         logger.info(
             "권한 부여 완료",
@@ -317,6 +569,7 @@ class PermissionService:
         # 캐시 클리어
         if user_id:
             self.clear_cache(user_id)
+        bump_data_version(PERMISSIONS)
 
         logger.info(
             "권한 회수 완료",
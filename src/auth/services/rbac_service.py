@@ -6,6 +6,7 @@ import fnmatch
 import structlog
 
 from ..models import Permission, ResourceType, ActionType, ResourcePermission
+from ..render_cache import ROLES, bump_data_version
 
 
 logger = structlog.get_logger()
@@ -56,6 +57,13 @@ class RBACService:
             "create_database_record": (ResourceType.DATABASE, ActionType.WRITE),
             "update_database_record": (ResourceType.DATABASE, ActionType.WRITE),
             "delete_database_record": (ResourceType.DATABASE, ActionType.WRITE),
+            "bulk_create_database_records": (ResourceType.DATABASE, ActionType.WRITE),
+            "bulk_update_database_records": (ResourceType.DATABASE, ActionType.WRITE),
+            "bulk_delete_database_records": (ResourceType.DATABASE, ActionType.WRITE),
+            # 관리 도구 - 모든 리소스 READ 권한 + 최소 역할로 제한
+            "get_metrics": None,
+            "cache_stats": None,
+            "invalidate_cache": None,
         }
 
         # 도구별 최소 필요 역할 (추가 제약)
@@ -81,6 +89,14 @@ class RBACService:
             "create_database_record": ["user", "admin"],  # user(analyst 포함)와 admin
             "update_database_record": ["user", "admin"],  # user(analyst 포함)와 admin
             "delete_database_record": ["admin"],  # 삭제는 admin만 가능
+            # 대량 쓰기 도구는 단건 도구와 같은 역할 제약
+            "bulk_create_database_records": ["user", "admin"],
+            "bulk_update_database_records": ["user", "admin"],
+            "bulk_delete_database_records": ["admin"],  # 삭제는 admin만 가능
+            # 관리 도구 - 조회는 user 이상, 캐시 무효화는 admin만
+            "get_metrics": ["user", "admin"],
+            "cache_stats": ["user", "admin"],
+            "invalidate_cache": ["admin"],
         }
 
     def _get_default_permissions(self) -> dict[str, list[Permission]]:
@@ -269,7 +285,7 @@ class RBACService:
         if tool_name == "health_check":
             return True
 
-        # search_all은 모든 리소스에 대한 읽기 권한 필요
+        # search_all/관리 도구는 모든 리소스에 대한 읽기 권한 필요
         if required_permission is None:
             required_resources = [
                 ResourceType.WEB_SEARCH,
@@ -280,7 +296,7 @@ class RBACService:
             for resource in required_resources:
                 if not self.check_permission(roles, resource, ActionType.READ):
                     logger.debug(
-                        "search_all 권한 부족",
+                        "모든 리소스 읽기 권한 부족",
                         roles=roles,
                         missing_resource=resource,
                     )
@@ -304,6 +320,7 @@ class RBACService:
 
         if permission not in self.role_permissions[role]:
             self.role_permissions[role].append(permission)
+            bump_data_version(ROLES)
             logger.info(
                 "권한 추가",
                 role=role,
@@ -321,6 +338,7 @@ class RBACService:
         if role in self.role_permissions:
             try:
                 self.role_permissions[role].remove(permission)
+                bump_data_version(ROLES)
                 logger.info(
                     "권한 제거",
                     role=role,
@@ -493,8 +493,8 @@ def get_user_language(request: Request) -> str:
     Returns:
         언어 코드 (기본값: 'ko')
     """
-    # 세션에서 언어 설정 확인
-    if hasattr(request, 'session') and request.session:
+    # 세션에서 언어 설정 확인 (SessionMiddleware가 없으면 request.session 접근 시 예외)
+    if 'session' in request.scope and request.session:
         lang = request.session.get('language', 'ko')
         if lang in SUPPORTED_LANGUAGES:
             return lang
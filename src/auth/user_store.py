@@ -0,0 +1,164 @@
+"""
+인증 게이트웨이 사용자 저장소 선택
+
+AUTH_USER_STORE 환경변수로 사용자/토큰 저장소를 고릅니다.
+
+    - sqlite (기본값): 요청 세션마다 SQLiteUserRepository 생성.
+      파일 DB이므로 게이트웨이는 인스턴스 하나로만 실행 가능
+    - postgres: 프로세스 전체가 공유하는 asyncpg 연결 풀 위의
+      PostgresUserRepository. 여러 인스턴스가 같은 DB를 쓰므로
+      로드밸런서 뒤에서 수평 확장 가능
+
+환경 변수:
+    AUTH_USER_STORE: sqlite | postgres
+    AUTH_POSTGRES_DSN: PostgreSQL 연결 문자열 (postgres일 때 필수)
+    AUTH_POSTGRES_SCHEMA: 인증 테이블 스키마 (기본값: auth)
+    AUTH_POSTGRES_POOL_MIN / AUTH_POSTGRES_POOL_MAX: 연결 풀 크기
+    AUTH_POSTGRES_REPLICA_DSNS: 읽기 복제본 DSN (쉼표 구분, 선택)
+"""
+
+import os
+from typing import AsyncIterator
+
+import structlog
+
+from .repositories.user_repository import UserRepository
+
+logger = structlog.get_logger(__name__)
+
+_pool_manager = None
+_user_repository = None
+_token_repository = None
+_schema_ready = False
+
+
+def use_postgres() -> bool:
+    """PostgreSQL 사용자 저장소 사용 여부"""
+    return os.getenv("AUTH_USER_STORE", "sqlite").lower() == "postgres"
+
+
+def _schema() -> str:
+    return os.getenv("AUTH_POSTGRES_SCHEMA", "auth")
+
+
+def get_pool_manager():
+    """인증 저장소용 PostgreSQLPoolManager 싱글톤 (연결은 첫 사용 시)"""
+    global _pool_manager
+    if _pool_manager is None:
+        from src.utils.connection_manager import PostgreSQLPoolManager
+
+        dsn = os.getenv("AUTH_POSTGRES_DSN")
+        if not dsn:
+            raise ValueError("AUTH_USER_STORE=postgres에는 AUTH_POSTGRES_DSN이 필요합니다")
+        replicas = os.getenv("AUTH_POSTGRES_REPLICA_DSNS", "")
+        _pool_manager = PostgreSQLPoolManager(
+            {
+                "dsn": dsn,
+                "min_size": int(os.getenv("AUTH_POSTGRES_POOL_MIN", "2")),
+                "max_size": int(os.getenv("AUTH_POSTGRES_POOL_MAX", "20")),
+                "replica_dsns": [d.strip() for d in replicas.split(",") if d.strip()],
+            }
+        )
+    return _pool_manager
+
+
+def get_user_repository(session=None) -> UserRepository:
+    """
+    설정된 사용자 Repository 반환
+
+    Args:
+        session: SQLite 저장소가 사용할 AsyncSession (postgres에서는 무시)
+    """
+    global _user_repository
+    if use_postgres():
+        if _user_repository is None:
+            from .repositories.postgres_user_repository import PostgresUserRepository
+
+            _user_repository = PostgresUserRepository(get_pool_manager(), _schema())
+        return _user_repository
+
+    from .repositories.sqlite_user_repository import SQLiteUserRepository
+
+    return SQLiteUserRepository(session)
+
+
+async def iter_user_export_batches(
+    batch_size: int = 1000,
+) -> AsyncIterator[list[dict]]:
+    """
+    사용자 내보내기 행 배치 (설정된 저장소의 커서에서 스트리밍)
+
+    StreamingResponse는 요청 의존성(get_db 세션)이 정리된 뒤에도 본문을
+    보내므로, sqlite 저장소에서는 여기서 읽기 전용 세션을 직접 엽니다.
+    """
+    if use_postgres():
+        async for batch in get_user_repository().iter_export_batches(batch_size):
+            yield batch
+        return
+
+    from .database import async_read_session_maker
+
+    async with async_read_session_maker() as session:
+        repository = get_user_repository(session)
+        async for batch in repository.iter_export_batches(batch_size):
+            yield batch
+
+
+async def iter_permission_export_batches(
+    batch_size: int = 1000,
+) -> AsyncIterator[list[dict]]:
+    """
+    권한 내보내기 행 배치 (postgres 저장소 전용)
+
+    요청 의존성의 연결은 스트리밍 도중 반환되므로, 내보내기가 끝날 때까지
+    쓸 읽기 전용 연결(복제본 우선)을 여기서 따로 빌립니다. 긴 읽기 트랜잭션이
+    요청 처리용 연결을 붙잡지 않습니다.
+
+    Raises:
+        RuntimeError: postgres 저장소가 아닐 때
+    """
+    if not use_postgres():
+        raise RuntimeError("권한 내보내기에는 AUTH_USER_STORE=postgres가 필요합니다")
+
+    from .services.permission_service import PermissionService
+
+    async with get_pool_manager().acquire(readonly=True) as conn:
+        service = PermissionService(db_conn=conn)
+        async for batch in service.iter_export_batches(batch_size):
+            yield batch
+
+
+def get_token_repository():
+    """PostgreSQL 토큰 저장소 (sqlite 저장소에서는 None)"""
+    global _token_repository
+    if not use_postgres():
+        return None
+    if _token_repository is None:
+        from .repositories.postgres_user_repository import PostgresTokenRepository
+
+        _token_repository = PostgresTokenRepository(get_pool_manager(), _schema())
+    return _token_repository
+
+
+async def init_user_store() -> None:
+    """postgres 저장소면 연결 풀을 열고 스키마/인덱스 생성 (한 번만)"""
+    global _schema_ready
+    if not use_postgres() or _schema_ready:
+        return
+    from .repositories.postgres_user_repository import ensure_schema
+
+    manager = get_pool_manager()
+    await manager.initialize()
+    await ensure_schema(manager, _schema())
+    _schema_ready = True
+    logger.info("PostgreSQL 사용자 저장소 사용", schema=_schema())
+
+
+async def close_user_store() -> None:
+    """연결 풀 종료 및 싱글톤 초기화"""
+    global _pool_manager, _user_repository, _token_repository, _schema_ready
+    manager = _pool_manager
+    _pool_manager = _user_repository = _token_repository = None
+    _schema_ready = False
+    if manager is not None:
+        await manager.close()
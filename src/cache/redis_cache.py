@@ -36,6 +36,8 @@ import redis.asyncio as redis
 from pydantic import BaseModel
 import structlog
 
+from src.utils.redis_pool import get_redis_registry
+
 # 모듈별 구조화된 로거
 logger = structlog.get_logger(__name__)
 
@@ -147,8 +149,8 @@ class RedisCache:
             모든 캐시 작업은 기본값을 반환합니다.
         """
         try:
-            # Redis 클라이언트 생성 (연결 풀 포함)
-            self._client = redis.from_url(
+            # 프로세스 공유 연결 풀에서 클라이언트 획득 (URL당 하나의 풀)
+            self._client = get_redis_registry().get_client(
                 self.config.redis_url,
                 decode_responses=True,  # 바이트를 문자열로 자동 변환
             )
@@ -183,8 +185,8 @@ class RedisCache:
             4. 연결 해제 로깅
 
         리소스 정리:
-            - TCP 연결 종료
-            - 연결 풀 정리
+            - 클라이언트 정리 (공유 연결 풀은 유지되며
+              ConnectionManager.cleanup_all에서 닫힘)
             - 메모리 해제
             - 내부 상태 초기화
 
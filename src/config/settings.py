@@ -105,11 +105,19 @@ class RateLimitConfig:
     속도 제한 설정
 
     API 남용 방지를 위한 속도 제한 설정입니다.
+    도구 호출은 비용(tool_costs)만큼 한도를 소모하고, 백엔드별 예산
+    (backend_budgets, 사용자당 분당 호출 수)을 넘으면 캐시된 결과만 반환합니다.
     """
 
     requests_per_minute: int = 60
     requests_per_hour: int = 1000
     burst_size: int = 10
+    # 도구별 호출 비용 (없는 도구는 1)
+    tool_costs: Dict[str, int] = field(
+        default_factory=lambda: {"search_all": 3, "search_web": 2}
+    )
+    # 백엔드별 사용자당 분당 호출 예산 (없는 백엔드는 제한 없음)
+    backend_budgets: Dict[str, int] = field(default_factory=dict)
 
     @classmethod
     def from_env(cls) -> "RateLimitConfig":
@@ -118,9 +126,26 @@ class RateLimitConfig:
             requests_per_minute=int(os.getenv("RATE_LIMIT_PER_MINUTE", "60")),
             requests_per_hour=int(os.getenv("RATE_LIMIT_PER_HOUR", "1000")),
             burst_size=int(os.getenv("RATE_LIMIT_BURST", "10")),
+            tool_costs=_parse_int_mapping(
+                os.getenv("RATE_LIMIT_TOOL_COSTS", "search_all=3,search_web=2")
+            ),
+            backend_budgets=_parse_int_mapping(
+                os.getenv("RATE_LIMIT_BACKEND_BUDGETS", "")
+            ),
         )
 
 
+def _parse_int_mapping(value: str) -> Dict[str, int]:
+    """"name=3,other=2" 형식의 환경 변수 값을 딕셔너리로 변환"""
+    mapping = {}
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        name, number = item.split("=", 1)
+        mapping[name.strip()] = int(number)
+    return mapping
+
+
 @dataclass
 class LoggingConfig:
     """
@@ -136,6 +161,13 @@ class LoggingConfig:
     sensitive_fields: list[str] = field(
         default_factory=lambda: ["password", "token", "api_key", "secret", "auth"]
     )
+    # 비동기 배치 로그 싱크
+    async_sink: bool = True
+    log_queue_size: int = 10000
+    log_batch_size: int = 100
+    log_flush_interval: float = 0.5
+    # 성공한 빠른 요청의 로그 샘플링 비율 (1.0 = 전부 기록)
+    success_sample_rate: float = 1.0
 
     @classmethod
     def from_env(cls) -> "LoggingConfig":
@@ -148,6 +180,11 @@ class LoggingConfig:
             sensitive_fields=os.getenv(
                 "SENSITIVE_FIELDS", "password,token,api_key,secret,auth"
             ).split(","),
+            async_sink=os.getenv("LOG_ASYNC_SINK", "true").lower() == "true",
+            log_queue_size=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+            log_batch_size=int(os.getenv("LOG_BATCH_SIZE", "100")),
+            log_flush_interval=float(os.getenv("LOG_FLUSH_INTERVAL", "0.5")),
+            success_sample_rate=float(os.getenv("LOG_SUCCESS_SAMPLE_RATE", "1.0")),
         )
 
 
@@ -166,6 +203,36 @@ class RetrieverConfig:
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
     qdrant_grpc_port: int = 6334
+    # PostgreSQL 연결별 준비된 문 캐시 크기 (PgBouncer 트랜잭션 모드에서는 0)
+    postgres_statement_cache_size: int = 100
+    # 읽기 복제본 (읽기 전용 쿼리 라우팅, 지연 한도, 읽기 연결 예산)
+    postgres_replica_dsns: list[str] = field(default_factory=list)
+    postgres_read_pool_size: Optional[int] = None
+    postgres_max_replica_lag: float = 5.0
+    # 풀 크기 자동 조절 (p95 획득 대기 시간과 사용률 기반)
+    postgres_pool_autoscale: bool = False
+    postgres_pool_target_wait_ms: float = 50.0
+    # 사용할 리트리버 (목록에 없는 백엔드는 라이브러리도 로드하지 않음)
+    enabled_retrievers: list[str] = field(
+        default_factory=lambda: ["tavily", "postgres", "qdrant"]
+    )
+    # search_all 지연 예산 (초)
+    search_source_timeout: float = 10.0
+    search_total_timeout: float = 15.0
+    # 복원력 계층 (적응형 타임아웃, 헤지 요청, 서킷 브레이커, 재시도 예산)
+    resilience_enabled: bool = True
+    hedge_requests: bool = True
+    retriever_max_timeout: float = 30.0
+    breaker_failure_threshold: int = 5
+    breaker_recovery_timeout: float = 30.0
+    retry_budget_ratio: float = 0.1
+    # 시작 시 연결 (백엔드별 제한 시간, 첫 사용 시 지연 연결)
+    connect_timeout: float = 10.0
+    lazy_connect: bool = False
+    # 준비 완료 보고 전 워밍업 (풀 연결, 임베딩 모델, 인기 쿼리 캐시 적재)
+    warmup_enabled: bool = False
+    warmup_queries_file: Optional[str] = None
+    warmup_top_n: int = 50
 
     @classmethod
     def from_env(cls) -> "RetrieverConfig":
@@ -179,6 +246,52 @@ class RetrieverConfig:
             qdrant_host=os.getenv("QDRANT_HOST", "localhost"),
             qdrant_port=int(os.getenv("QDRANT_PORT", "6333")),
             qdrant_grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+            postgres_statement_cache_size=int(
+                os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", "100")
+            ),
+            postgres_replica_dsns=[
+                dsn.strip()
+                for dsn in os.getenv("POSTGRES_REPLICA_DSNS", "").split(",")
+                if dsn.strip()
+            ],
+            postgres_read_pool_size=(
+                int(os.environ["POSTGRES_READ_POOL_SIZE"])
+                if os.getenv("POSTGRES_READ_POOL_SIZE")
+                else None
+            ),
+            postgres_max_replica_lag=float(
+                os.getenv("POSTGRES_MAX_REPLICA_LAG", "5.0")
+            ),
+            postgres_pool_autoscale=os.getenv("POSTGRES_POOL_AUTOSCALE", "false").lower()
+            == "true",
+            postgres_pool_target_wait_ms=float(
+                os.getenv("POSTGRES_POOL_TARGET_WAIT_MS", "50.0")
+            ),
+            enabled_retrievers=[
+                name.strip()
+                for name in os.getenv("RETRIEVERS", "tavily,postgres,qdrant").split(",")
+                if name.strip()
+            ],
+            search_source_timeout=float(os.getenv("SEARCH_SOURCE_TIMEOUT", "10.0")),
+            search_total_timeout=float(os.getenv("SEARCH_TOTAL_TIMEOUT", "15.0")),
+            resilience_enabled=os.getenv("RETRIEVER_RESILIENCE", "true").lower()
+            == "true",
+            hedge_requests=os.getenv("RETRIEVER_HEDGE_REQUESTS", "true").lower()
+            == "true",
+            retriever_max_timeout=float(os.getenv("RETRIEVER_MAX_TIMEOUT", "30.0")),
+            breaker_failure_threshold=int(
+                os.getenv("BREAKER_FAILURE_THRESHOLD", "5")
+            ),
+            breaker_recovery_timeout=float(
+                os.getenv("BREAKER_RECOVERY_TIMEOUT", "30.0")
+            ),
+            retry_budget_ratio=float(os.getenv("RETRY_BUDGET_RATIO", "0.1")),
+            connect_timeout=float(os.getenv("RETRIEVER_CONNECT_TIMEOUT", "10.0")),
+            lazy_connect=os.getenv("RETRIEVER_LAZY_CONNECT", "false").lower()
+            == "true",
+            warmup_enabled=os.getenv("RETRIEVER_WARMUP", "false").lower() == "true",
+            warmup_queries_file=os.getenv("WARMUP_QUERIES_FILE"),
+            warmup_top_n=int(os.getenv("WARMUP_TOP_N", "50")),
         )
 
 
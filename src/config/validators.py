@@ -191,6 +191,17 @@ def _validate_rate_limit_settings(config: ServerConfig) -> List[str]:
         errors.append(f"잘못된 시간당 요청 수: {rate_limit.requests_per_hour}")
     if rate_limit.burst_size <= 0:
         errors.append(f"잘못된 버스트 크기: {rate_limit.burst_size}")
+    for tool, cost in rate_limit.tool_costs.items():
+        if cost < 1:
+            errors.append(f"잘못된 도구 비용: {tool}={cost} (1 이상)")
+        elif cost > rate_limit.requests_per_minute:
+            errors.append(
+                f"도구 비용({tool}={cost})이 분당 요청 수"
+                f"({rate_limit.requests_per_minute})보다 큼"
+            )
+    for backend, budget in rate_limit.backend_budgets.items():
+        if budget <= 0:
+            errors.append(f"잘못된 백엔드 호출 예산: {backend}={budget}")
 
     # 일관성 검증 (Docker 배포용 임시 비활성화)
     # if rate_limit.requests_per_hour < rate_limit.requests_per_minute * 60:
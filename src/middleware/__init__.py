@@ -35,6 +35,11 @@ MCP 서버용 미들웨어 컴포넌트 모음
         - 스택 트레이스 로깅
         - 사용자 친화적 에러 메시지
 
+    MiddlewarePipeline: 딕셔너리 기반 미들웨어의 컴파일된 실행 체인
+        - 요청을 한 번만 파싱한 RequestEnvelope 공유
+        - 미들웨어별 적용 메서드(applies_to)에 따른 메서드별 체인 사전 계산
+        - 계층별 실행 시간 통계
+
 사용 패턴:
     ```python
     from fastapi import FastAPI
@@ -59,12 +64,29 @@ MCP 서버용 미들웨어 컴포넌트 모음
     응답: 엔드포인트 → ErrorHandlerMiddleware → MetricsMiddleware → AuthMiddleware → RateLimitMiddleware → LoggingMiddleware
 """
 
-from .auth import AuthMiddleware
-from .logging import LoggingMiddleware
-from .rate_limit import RateLimitMiddleware
-from .validation import ValidationMiddleware
-from .metrics import MetricsMiddleware
-from .error_handler import ErrorHandlerMiddleware
+import importlib
+
+from .pipeline import MiddlewarePipeline, RequestEnvelope, LayerTiming
+
+# 개별 미들웨어는 처음 접근할 때 임포트 (프로파일에서 켠 기능만 로드)
+_LAZY_EXPORTS = {
+    "AuthMiddleware": ".auth",
+    "LoggingMiddleware": ".logging",
+    "RateLimitMiddleware": ".rate_limit",
+    "ValidationMiddleware": ".validation",
+    "MetricsMiddleware": ".metrics",
+    "ErrorHandlerMiddleware": ".error_handler",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "AuthMiddleware",
@@ -73,4 +95,7 @@ __all__ = [
     "ValidationMiddleware",
     "MetricsMiddleware",
     "ErrorHandlerMiddleware",
+    "MiddlewarePipeline",
+    "RequestEnvelope",
+    "LayerTiming",
 ]
@@ -29,6 +29,11 @@ MCP 서버용 향상된 로깅 미들웨어
         - 에러 컨텍스트 보존
         - JSON-RPC 에러 응답 로깅
 
+    비동기 출력 (선택):
+        - AsyncLogSink를 통한 백그라운드 배치 출력
+        - 큐 포화 시 레코드 폐기 및 카운터 집계
+        - 성공한 빠른 요청 샘플링, 출력되는 레코드만 본문 정리
+
 로깅 구조:
     배치를 사용한 구조화된 로깅으로 다음과 같은 정보를 제공합니다:
     - request_id: 요청 고유 식별자
@@ -50,9 +55,11 @@ MCP 서버용 향상된 로깅 미들웨어
 
 from typing import Any, Callable, Dict
 import structlog
+import random
 import time
-import uuid
-from datetime import datetime, timezone
+
+from ..utils.log_sink import AsyncLogSink
+from .pipeline import RequestEnvelope
 
 logger = structlog.get_logger(__name__)
 
@@ -80,11 +87,17 @@ class LoggingMiddleware:
         - 개인정보 노출 방지
     """
 
+    # 모든 메서드에 적용 (MiddlewarePipeline 참조)
+    applies_to: frozenset[str] | None = None
+
     def __init__(
         self,
         log_request_body: bool = False,
         log_response_body: bool = False,
         sensitive_fields: list[str] | None = None,
+        sink: AsyncLogSink | None = None,
+        success_sample_rate: float = 1.0,
+        slow_request_threshold_ms: float = 1000.0,
     ):
         """
         로깅 미들웨어 초기화
@@ -103,6 +116,17 @@ class LoggingMiddleware:
                 예: ["credit_card", "ssn", "personal_id"]
                 이 필드들은 "[REDACTED]"로 대체됨
 
+            sink (AsyncLogSink | None): 비동기 배치 로그 싱크
+                지정하면 로그 출력이 백그라운드 스레드로 넘어가고
+                본문 정리(_sanitize_data)도 출력 시점에만 수행됨
+                None: 기존처럼 이벤트 루프에서 즉시 출력
+
+            success_sample_rate (float): 성공한 빠른 요청의 로그 샘플링 비율
+                1.0: 모두 기록 (기본값)
+                0.1: 10%만 기록 (에러/느린 요청은 항상 기록)
+
+            slow_request_threshold_ms (float): 느린 요청 기준 (밀리초)
+
         초기화 과정:
             - 로깅 옵션 설정 저장
             - 민감 필드 리스트 준비
@@ -121,6 +145,10 @@ class LoggingMiddleware:
             "api_key",
             "secret",
         ]
+        self.sink = sink
+        self.success_sample_rate = success_sample_rate
+        self.slow_request_threshold_ms = slow_request_threshold_ms
+        self._sampled_out = 0
 
     async def __call__(
         self, request: Dict[str, Any], call_next: Callable
@@ -153,7 +181,7 @@ class LoggingMiddleware:
 
         성능 모니터링:
             - 요청 처리 시간 측정 (밀리초)
-            - 1초 이상 요청에 대한 느린 요청 경고
+            - 느린 요청 경고 (기본 1초 이상)
             - 에러율 및 성능 메트릭 수집
 
         에러 처리:
@@ -162,49 +190,42 @@ class LoggingMiddleware:
             - 에러 컨텍스트 보존
         """
         start_time = time.time()
-        request_id = str(uuid.uuid4())
-
-        # 요청 정보 추출
-        method = request.get("method", "unknown")
-        params = request.get("params", {})
-        user = request.get("user", {})
+        envelope = RequestEnvelope.of(request)
+        request_id = envelope.request_id
+        user = envelope.user_info
 
         # 로그 컨텍스트 준비
         log_context = {
             "request_id": request_id,
-            "method": method,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "user_id": user.get("id") if isinstance(user, dict) else None,
-            "user_email": user.get("email") if isinstance(user, dict) else None,
-            "user_type": user.get("type", "unknown")
-            if isinstance(user, dict)
-            else "unknown",
+            "method": envelope.method,
+            "timestamp": envelope.timestamp,
+            "user_id": user.get("id"),
+            "user_email": user.get("email"),
+            "user_type": user.get("type", "unknown"),
         }
 
         # 도구별 세부 정보 로깅
-        if method == "tools/call" and isinstance(params, dict):
-            log_context["tool_name"] = params.get("name")
-            log_context["tool_args_keys"] = (
-                list(params.get("arguments", {}).keys())
-                if isinstance(params.get("arguments"), dict)
-                else []
-            )
+        if envelope.method == "tools/call" and isinstance(envelope.params, dict):
+            log_context["tool_name"] = envelope.tool_name
+            log_context["tool_args_keys"] = list(envelope.tool_args.keys())
 
-        # 요청 로깅
-        logger.info(
-            "MCP 요청 수신",
-            **log_context,
-            request_body=self._sanitize_data(request)
-            if self.log_request_body
-            else None,
+        # 요청 본문 정리는 레코드가 실제로 출력될 때만 수행
+        request_body = (
+            self._lazy_sanitize(request) if self.log_request_body else None
         )
 
+        # 샘플링 중에는 수신 로그를 완료 시점까지 미룸 (버려질 수 있으므로)
+        defer_received = self.sink is not None and self.success_sample_rate < 1.0
+        if not defer_received:
+            self._emit("info", "MCP 요청 수신", log_context, request_body=request_body)
+
         # 하위 처리를 위해 요청 ID를 요청에 추가
         request["request_id"] = request_id
 
         # 요청 처리
         error_occurred = False
         error_details = None
+        response = None
 
         try:
             response = await call_next(request)
@@ -219,6 +240,7 @@ class LoggingMiddleware:
         except Exception as e:
             error_occurred = True
             error_details = str(e)
+            # 스택 트레이스가 필요하므로 싱크를 거치지 않고 즉시 기록
             logger.exception(
                 "요청 처리 중 미처리 예외 발생", **log_context, error=str(e)
             )
@@ -227,30 +249,104 @@ class LoggingMiddleware:
         finally:
             # 소요 시간 계산
             duration_ms = (time.time() - start_time) * 1000
+            slow = duration_ms > self.slow_request_threshold_ms
+
+            if error_occurred or slow or self._sampled_in():
+                # 최종 로그 컨텍스트 준비
+                final_context = {
+                    **log_context,
+                    "duration_ms": duration_ms,
+                    "error_occurred": error_occurred,
+                }
+
+                if error_occurred and error_details:
+                    final_context["error_details"] = error_details
+
+                if defer_received:
+                    self._emit(
+                        "info", "MCP 요청 수신", log_context, request_body=request_body
+                    )
+
+                # 응답 로깅
+                log_level = "error" if error_occurred else "info"
+                self._emit(
+                    log_level,
+                    "MCP 요청 완료",
+                    final_context,
+                    response_body=self._lazy_sanitize(response)
+                    if self.log_response_body
+                    else None,
+                )
+
+                # 느린 요청 로깅
+                if slow:
+                    self._emit(
+                        "warning",
+                        "느린 요청 감지",
+                        {
+                            **final_context,
+                            "threshold_ms": self.slow_request_threshold_ms,
+                        },
+                    )
+            else:
+                self._sampled_out += 1
+
+    def _sampled_in(self) -> bool:
+        """성공한 빠른 요청의 로그 샘플링 여부"""
+        rate = self.success_sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def _lazy_sanitize(self, data: Any) -> Callable[[], Any]:
+        """
+        지연 정리 함수 생성
 
-            # 최종 로그 컨텍스트 준비
-            final_context = {
-                **log_context,
-                "duration_ms": duration_ms,
-                "error_occurred": error_occurred,
-            }
+        writer 스레드가 나중에 읽으므로 최상위 구조를 지금 얕게 복사해
+        이후 요청/응답 수정과 경합하지 않게 합니다.
+        """
+        if isinstance(data, dict):
+            data = dict(data)
+        elif isinstance(data, list):
+            data = list(data)
+        return lambda: self._sanitize_data(data)
 
-            if error_occurred and error_details:
-                final_context["error_details"] = error_details
-
-            # 응답 로깅
-            log_level = "error" if error_occurred else "info"
-            getattr(logger, log_level)(
-                "MCP 요청 완료",
-                **final_context,
-                response_body=self._sanitize_data(response)
-                if self.log_response_body and "response" in locals()
-                else None,
-            )
+    def _emit(
+        self,
+        level: str,
+        event: str,
+        fields: Dict[str, Any],
+        **lazy: Callable[[], Any] | None,
+    ) -> None:
+        """
+        로그 레코드 출력
 
-            # 느린 요청 로깅
-            if duration_ms > 1000:  # 1초 이상 소요되는 요청
-                logger.warning("느린 요청 감지", **final_context, threshold_ms=1000)
+        싱크가 있으면 큐에 넣고 지연 필드는 writer 스레드에서 계산하며,
+        없으면 기존처럼 즉시 출력합니다.
+        """
+        if self.sink is None:
+            resolved = {
+                name: compute() if compute is not None else None
+                for name, compute in lazy.items()
+            }
+            getattr(logger, level)(event, **fields, **resolved)
+            return
+
+        deferred = {}
+        for name, compute in lazy.items():
+            if compute is None:
+                fields = {**fields, name: None}
+            else:
+                deferred[name] = compute
+        self.sink.emit(level, event, fields, deferred or None)
+
+    def get_logging_stats(self) -> Dict[str, Any]:
+        """로그 샘플링 및 싱크 통계 조회"""
+        stats: Dict[str, Any] = {
+            "success_sample_rate": self.success_sample_rate,
+            "sampled_out": self._sampled_out,
+        }
+        if self.sink is not None:
+            stats["sink"] = self.sink.get_stats()
+        return stats
 
     def _sanitize_data(self, data: Any) -> Any:
         """
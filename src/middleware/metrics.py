@@ -2,28 +2,39 @@
 
 from typing import Any, Callable, Dict, Optional
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from collections import defaultdict
 import asyncio
 import structlog
 
+from .pipeline import RequestEnvelope
+
 logger = structlog.get_logger(__name__)
 
 
 class MetricsMiddleware:
     """Middleware for collecting performance metrics and usage statistics."""
 
+    # Metrics cover every method (see MiddlewarePipeline)
+    applies_to: Optional[frozenset[str]] = None
+
     def __init__(
-        self, enable_detailed_metrics: bool = True, metrics_window_seconds: int = 3600
+        self,
+        enable_detailed_metrics: bool = True,
+        metrics_window_seconds: int = 3600,
+        timeseries: Optional[Any] = None,
     ):
         """Initialize metrics middleware.
 
         Args:
             enable_detailed_metrics: Whether to collect detailed per-tool metrics
             metrics_window_seconds: Time window for metrics aggregation
+            timeseries: Optional ``MetricsTimeSeries`` that persists one-minute
+                rollups for the admin analytics dashboard
         """
         self.enable_detailed_metrics = enable_detailed_metrics
         self.metrics_window_seconds = metrics_window_seconds
+        self.timeseries = timeseries
 
         # Metrics storage
         self._request_count = 0
@@ -65,14 +76,10 @@ class MetricsMiddleware:
         start_time = time.time()
 
         # Extract request information
-        method = request.get("method", "unknown")
-        user = request.get("user", {})
-        user_id = self._get_user_identifier(user)
-        tool_name = None
-
-        if method == "tools/call":
-            params = request.get("params", {})
-            tool_name = params.get("name") if isinstance(params, dict) else None
+        envelope = RequestEnvelope.of(request)
+        method = envelope.method
+        user_id = self._get_user_identifier(envelope.user)
+        tool_name = envelope.tool_name
 
         # Process request
         error_occurred = False
@@ -119,6 +126,16 @@ class MetricsMiddleware:
             # Calculate duration
             duration_ms = (time.time() - start_time) * 1000
 
+            if self.timeseries is not None:
+                self.timeseries.record(
+                    method,
+                    tool_name,
+                    duration_ms,
+                    error_occurred,
+                    user_id=user_id,
+                    role=self._get_user_role(envelope.user),
+                )
+
             # Update metrics
             await self._update_metrics(
                 method=method,
@@ -127,6 +144,7 @@ class MetricsMiddleware:
                 duration_ms=duration_ms,
                 error_occurred=error_occurred,
                 error_details=error_details,
+                timestamp=envelope.timestamp,
             )
 
     def _get_user_identifier(self, user: Any) -> str:
@@ -137,6 +155,17 @@ class MetricsMiddleware:
             return str(user.get("id") or user.get("email", "anonymous"))
         return "anonymous"
 
+    def _get_user_role(self, user: Any) -> str:
+        """Role bucket used by the dashboard's per-role activity chart."""
+        if not isinstance(user, dict) or not user:
+            return "anonymous"
+        if user.get("type") == "service":
+            return "service"
+        roles = user.get("roles") or []
+        if "admin" in roles:
+            return "admin"
+        return roles[0] if roles else "user"
+
     async def _update_metrics(
         self,
         method: str,
@@ -145,66 +174,72 @@ class MetricsMiddleware:
         duration_ms: float,
         error_occurred: bool,
         error_details: Any,
+        timestamp: Optional[str] = None,
     ):
-        """Update metrics with request information."""
-        async with self._lock:
-            # Update global counters
-            self._request_count += 1
-            if error_occurred:
-                self._error_count += 1
-
-            # Update response time histogram
-            for bucket in self._response_time_buckets:
-                if duration_ms <= bucket:
-                    self._response_time_histogram[bucket] += 1
-                    break
-            else:
-                self._response_time_histogram["inf"] += 1
-
-            # Update tool metrics if applicable
-            if tool_name and self.enable_detailed_metrics:
-                tool_stats = self._tool_metrics[tool_name]
-                tool_stats["count"] += 1
-                if error_occurred:
-                    tool_stats["errors"] += 1
-
-                tool_stats["total_duration_ms"] += duration_ms
-                tool_stats["min_duration_ms"] = min(
-                    tool_stats["min_duration_ms"], duration_ms
-                )
-                tool_stats["max_duration_ms"] = max(
-                    tool_stats["max_duration_ms"], duration_ms
-                )
-                tool_stats["avg_duration_ms"] = (
-                    tool_stats["total_duration_ms"] / tool_stats["count"]
-                )
+        """Update metrics with request information.
 
-            # Update user metrics
-            user_stats = self._user_metrics[user_id]
-            user_stats["request_count"] += 1
+        The update never awaits, so it already runs atomically on the event
+        loop; taking ``self._lock`` here only added per-request overhead.
+        """
+        # Update global counters
+        self._request_count += 1
+        if error_occurred:
+            self._error_count += 1
+
+        # Update response time histogram
+        for bucket in self._response_time_buckets:
+            if duration_ms <= bucket:
+                self._response_time_histogram[bucket] += 1
+                break
+        else:
+            self._response_time_histogram["inf"] += 1
+
+        # Update tool metrics if applicable
+        if tool_name and self.enable_detailed_metrics:
+            tool_stats = self._tool_metrics[tool_name]
+            tool_stats["count"] += 1
             if error_occurred:
-                user_stats["error_count"] += 1
-            if tool_name:
-                user_stats["tool_usage"][tool_name] += 1
-            user_stats["last_request_at"] = datetime.utcnow().isoformat()
-
-            # Track recent errors
-            if error_occurred and error_details:
-                error_record = {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "method": method,
-                    "tool_name": tool_name,
-                    "user_id": user_id,
-                    "duration_ms": duration_ms,
-                    "error": error_details,
-                }
-                self._recent_errors.append(error_record)
-
-                # Keep only recent errors
-                if len(self._recent_errors) > self._max_recent_errors:
-                    self._recent_errors = self._recent_errors[
-                        -self._max_recent_errors :
-                    ]
+                tool_stats["errors"] += 1
+
+            tool_stats["total_duration_ms"] += duration_ms
+            tool_stats["min_duration_ms"] = min(
+                tool_stats["min_duration_ms"], duration_ms
+            )
+            tool_stats["max_duration_ms"] = max(
+                tool_stats["max_duration_ms"], duration_ms
+            )
+            tool_stats["avg_duration_ms"] = (
+                tool_stats["total_duration_ms"] / tool_stats["count"]
+            )
+
+        # Update user metrics
+        user_stats = self._user_metrics[user_id]
+        user_stats["request_count"] += 1
+        if error_occurred:
+            user_stats["error_count"] += 1
+        if tool_name:
+            user_stats["tool_usage"][tool_name] += 1
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc).isoformat()
+        user_stats["last_request_at"] = timestamp
+
+        # Track recent errors
+        if error_occurred and error_details:
+            error_record = {
+                "timestamp": timestamp,
+                "method": method,
+                "tool_name": tool_name,
+                "user_id": user_id,
+                "duration_ms": duration_ms,
+                "error": error_details,
+            }
+            self._recent_errors.append(error_record)
+
+            # Keep only recent errors
+            if len(self._recent_errors) > self._max_recent_errors:
+                self._recent_errors = self._recent_errors[
+                    -self._max_recent_errors :
+                ]
 
     async def get_metrics_summary(self) -> Dict[str, Any]:
         """Get current metrics summary."""
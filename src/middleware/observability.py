@@ -7,6 +7,7 @@ from opentelemetry import trace, baggage
 from opentelemetry.trace import Status, StatusCode
 
 from src.observability import get_tracer, get_sentry
+from .pipeline import RequestEnvelope
 
 logger = structlog.get_logger(__name__)
 
@@ -14,6 +15,10 @@ logger = structlog.get_logger(__name__)
 class ObservabilityMiddleware:
     """Middleware for distributed tracing and error tracking."""
 
+    # Trace tool calls only; list requests and health checks add span noise
+    applies_to: Optional[frozenset[str]] = frozenset({"tools/call"})
+    exempt_tools: frozenset[str] = frozenset({"health_check"})
+
     def __init__(
         self,
         service_name: str = "mcp-retriever",
@@ -45,16 +50,11 @@ class ObservabilityMiddleware:
     ) -> Dict[str, Any]:
         """Add observability to request processing."""
         # Extract request information
-        request_id = request.get("request_id", "unknown")
-        method = request.get("method", "unknown")
-        user = request.get("user", {})
-
-        # Extract tool name if applicable
-        tool_name = None
-        if method == "tools/call":
-            params = request.get("params", {})
-            if isinstance(params, dict):
-                tool_name = params.get("name")
+        envelope = RequestEnvelope.of(request)
+        request_id = request.get("request_id") or envelope.request_id
+        method = envelope.method
+        user = envelope.user
+        tool_name = envelope.tool_name
 
         # Set up tracing context
         span_name = f"{method}"
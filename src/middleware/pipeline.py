@@ -0,0 +1,374 @@
+"""
+컴파일된 MCP 미들웨어 파이프라인
+
+딕셔너리 기반 미들웨어(Logging, Validation, RateLimit, Metrics 등)를 하나의
+FastMCP 미들웨어로 묶어 실행합니다. 기존에는 각 미들웨어가 매 요청마다
+method/params/user/tool_name을 다시 추출하고, 요청 종류와 무관하게 모든
+계층을 통과했습니다.
+
+주요 기능:
+    요청 봉투 (RequestEnvelope):
+        - 요청을 한 번만 파싱한 불변 객체
+        - 파이프라인 실행 중에는 ContextVar로 공유되어 각 미들웨어가 재사용
+
+    메서드별 사전 컴파일 체인:
+        - 미들웨어는 `applies_to`(적용 메서드)와 `exempt_tools`(제외 도구)를 선언
+        - 생성 시점에 메서드/도구별 체인을 미리 계산
+        - tools/list, health_check 같은 경량 요청은 불필요한 계층을 건너뜀
+
+    계층별 타이밍:
+        - 각 미들웨어의 누적 시간과 자체 시간(하위 계층 제외)을 기록
+        - get_layer_timings()로 조회
+
+사용 예시:
+    ```python
+    pipeline = MiddlewarePipeline(
+        [LoggingMiddleware(), ValidationMiddleware(), RateLimitMiddleware()],
+        user_resolver=resolve_user,
+    )
+    server.add_middleware(pipeline)
+    ```
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cached_property
+from datetime import datetime, timezone
+from time import perf_counter, time
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence
+import uuid
+
+import structlog
+from fastmcp.server.middleware import Middleware, MiddlewareContext, CallNext
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+
+logger = structlog.get_logger(__name__)
+
+
+_current_envelope: ContextVar[Optional["RequestEnvelope"]] = ContextVar(
+    "mcp_request_envelope", default=None
+)
+
+
+@dataclass(frozen=True)
+class RequestEnvelope:
+    """
+    한 번만 파싱되는 불변 요청 봉투
+
+    Attributes:
+        method: MCP 메서드명
+        params: 요청 매개변수 (원본 참조)
+        user: 인증된 사용자 정보
+        tool_name: tools/call 요청의 도구 이름
+        tool_args: tools/call 요청의 인자 (없으면 빈 딕셔너리)
+        request_id: 요청 고유 ID
+        received_at: 수신 시각 (epoch 초)
+    """
+
+    method: str
+    params: Any
+    user: Any
+    tool_name: Optional[str]
+    tool_args: Mapping[str, Any]
+    request_id: str
+    received_at: float
+    source: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def parse(cls, request: Dict[str, Any]) -> "RequestEnvelope":
+        """요청 딕셔너리에서 봉투 생성"""
+        method = request.get("method", "unknown")
+        params = request.get("params", {})
+        tool_name = None
+        tool_args: Mapping[str, Any] = {}
+
+        if method == "tools/call" and isinstance(params, dict):
+            tool_name = params.get("name")
+            arguments = params.get("arguments")
+            if isinstance(arguments, dict):
+                tool_args = arguments
+
+        return cls(
+            method=method,
+            params=params,
+            user=request.get("user", {}),
+            tool_name=tool_name,
+            tool_args=tool_args,
+            request_id=request.get("request_id") or str(uuid.uuid4()),
+            received_at=time(),
+            source=request,
+        )
+
+    @classmethod
+    def of(cls, request: Dict[str, Any]) -> "RequestEnvelope":
+        """
+        현재 요청의 봉투 반환
+
+        파이프라인 안에서는 이미 파싱된 봉투를 재사용하고,
+        미들웨어가 단독으로 호출된 경우에는 새로 파싱합니다.
+        """
+        envelope = _current_envelope.get()
+        if envelope is not None and envelope.source is request:
+            return envelope
+        return cls.parse(request)
+
+    @property
+    def user_info(self) -> Dict[str, Any]:
+        """사용자 정보 (딕셔너리가 아니면 빈 딕셔너리)"""
+        return self.user if isinstance(self.user, dict) else {}
+
+    @property
+    def route(self) -> str:
+        """체인 선택에 사용하는 라우트 키"""
+        if self.tool_name:
+            return f"{self.method}:{self.tool_name}"
+        return self.method
+
+    @cached_property
+    def timestamp(self) -> str:
+        """ISO 8601 형식 수신 시각 (필요할 때만 계산)"""
+        return datetime.fromtimestamp(self.received_at, timezone.utc).isoformat()
+
+
+@dataclass
+class LayerTiming:
+    """미들웨어 계층별 실행 시간 통계"""
+
+    name: str
+    calls: int = 0
+    total_ms: float = 0.0
+    self_ms: float = 0.0
+    max_self_ms: float = 0.0
+
+    def record(self, total_seconds: float, self_seconds: float) -> None:
+        self_ms = self_seconds * 1000
+        self.calls += 1
+        self.total_ms += total_seconds * 1000
+        self.self_ms += self_ms
+        if self_ms > self.max_self_ms:
+            self.max_self_ms = self_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "avg_total_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "avg_self_ms": self.self_ms / self.calls if self.calls else 0.0,
+            "max_self_ms": self.max_self_ms,
+        }
+
+
+@dataclass(frozen=True)
+class _Layer:
+    middleware: Callable
+    timing: LayerTiming
+    applies_to: Optional[frozenset]
+    exempt_tools: frozenset
+
+    def applies(self, method: str, tool_name: Optional[str] = None) -> bool:
+        if self.applies_to is not None and method not in self.applies_to:
+            return False
+        return tool_name is None or tool_name not in self.exempt_tools
+
+
+class MiddlewarePipeline(Middleware):
+    """
+    메서드별 체인을 사전 컴파일한 미들웨어 파이프라인
+
+    딕셔너리 기반 미들웨어를 `(request, call_next)` 규약 그대로 실행하며,
+    FastMCP에는 단일 미들웨어로 등록됩니다.
+    """
+
+    def __init__(
+        self,
+        middlewares: Sequence[Callable],
+        user_resolver: Optional[Callable[[], Dict[str, Any]]] = None,
+    ):
+        """
+        파이프라인 초기화
+
+        Args:
+            middlewares: 바깥층부터 순서대로 나열한 딕셔너리 기반 미들웨어
+            user_resolver: 현재 요청의 사용자 정보를 반환하는 함수
+        """
+        self.user_resolver = user_resolver
+
+        names: Dict[str, int] = {}
+        layers = []
+        for middleware in middlewares:
+            name = type(middleware).__name__
+            names[name] = names.get(name, 0) + 1
+            if names[name] > 1:
+                name = f"{name}#{names[name]}"
+
+            applies_to = getattr(middleware, "applies_to", None)
+            layers.append(
+                _Layer(
+                    middleware=middleware,
+                    timing=LayerTiming(name=name),
+                    applies_to=frozenset(applies_to) if applies_to is not None else None,
+                    exempt_tools=frozenset(getattr(middleware, "exempt_tools", ())),
+                )
+            )
+        self._layers = tuple(layers)
+        self._fast_path_hits = 0
+        self._compile()
+
+    def _compile(self) -> None:
+        """메서드/도구별 체인 사전 계산"""
+        methods: set[str] = set()
+        tools: set[str] = set()
+        for layer in self._layers:
+            if layer.applies_to is not None:
+                methods.update(layer.applies_to)
+            tools.update(layer.exempt_tools)
+
+        self._default_chain = tuple(
+            layer for layer in self._layers if layer.applies_to is None
+        )
+        self._chains: Dict[str, tuple[_Layer, ...]] = {}
+        for method in methods:
+            self._chains[method] = tuple(
+                layer for layer in self._layers if layer.applies(method)
+            )
+        for tool_name in tools:
+            self._chains[f"tools/call:{tool_name}"] = tuple(
+                layer
+                for layer in self._layers
+                if layer.applies("tools/call", tool_name)
+            )
+
+    def _chain_for(self, envelope: RequestEnvelope) -> tuple[_Layer, ...]:
+        chain = self._chains.get(envelope.route)
+        if chain is None:
+            chain = self._chains.get(envelope.method, self._default_chain)
+        return chain
+
+    def layer_names(self, method: str, tool_name: Optional[str] = None) -> list[str]:
+        """주어진 메서드/도구 요청이 통과하는 계층 이름 목록"""
+        envelope = RequestEnvelope(
+            method=method,
+            params={},
+            user={},
+            tool_name=tool_name,
+            tool_args={},
+            request_id="",
+            received_at=0.0,
+        )
+        return [layer.timing.name for layer in self._chain_for(envelope)]
+
+    async def dispatch(self, request: Dict[str, Any], handler: Callable) -> Any:
+        """
+        딕셔너리 요청을 컴파일된 체인으로 실행
+
+        Args:
+            request: MCP 요청 딕셔너리
+            handler: 체인 끝에서 호출할 최종 핸들러
+
+        Returns:
+            핸들러 또는 미들웨어가 반환한 응답
+        """
+        envelope = RequestEnvelope.parse(request)
+        chain = self._chain_for(envelope)
+        if not chain:
+            self._fast_path_hits += 1
+            return await handler(request)
+
+        token = _current_envelope.set(envelope)
+        try:
+            return await self._invoke(chain, 0, request, handler)
+        finally:
+            _current_envelope.reset(token)
+
+    async def _invoke(
+        self,
+        chain: tuple[_Layer, ...],
+        index: int,
+        request: Dict[str, Any],
+        handler: Callable,
+    ) -> Any:
+        if index == len(chain):
+            return await handler(request)
+
+        layer = chain[index]
+        downstream = 0.0
+
+        async def call_next(next_request: Dict[str, Any]) -> Any:
+            nonlocal downstream
+            started = perf_counter()
+            try:
+                return await self._invoke(chain, index + 1, next_request, handler)
+            finally:
+                downstream += perf_counter() - started
+
+        started = perf_counter()
+        try:
+            return await layer.middleware(request, call_next)
+        finally:
+            elapsed = perf_counter() - started
+            layer.timing.record(elapsed, elapsed - downstream)
+
+    async def on_message(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        """FastMCP 요청을 딕셔너리로 변환해 파이프라인 실행"""
+        request = self._build_request(context)
+
+        async def handler(_request: Dict[str, Any]) -> Any:
+            return await call_next(context)
+
+        response = await self.dispatch(request, handler)
+
+        # 미들웨어가 JSON-RPC 에러 딕셔너리로 요청을 차단한 경우
+        if isinstance(response, dict) and "error" in response:
+            error = response["error"]
+            raise McpError(
+                ErrorData(
+                    code=error.get("code", -32603),
+                    message=error.get("message", "Request rejected"),
+                    data=error.get("data"),
+                )
+            )
+        return response
+
+    def _build_request(self, context: MiddlewareContext) -> Dict[str, Any]:
+        method = context.method or "unknown"
+        params: Dict[str, Any] = {}
+        if method == "tools/call":
+            message = context.message
+            params = {
+                "name": getattr(message, "name", None),
+                "arguments": getattr(message, "arguments", None) or {},
+            }
+
+        user: Dict[str, Any] = {}
+        if self.user_resolver:
+            try:
+                user = self.user_resolver() or {}
+            except Exception as e:
+                logger.warning("요청 사용자 정보 확인 실패", error=str(e))
+
+        request_id = str(uuid.uuid4())
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "request_id": request_id,
+            "method": method,
+            "params": params,
+            "user": user,
+        }
+
+    def get_layer_timings(self) -> Dict[str, Any]:
+        """계층별 실행 시간 통계 조회"""
+        return {
+            "layers": {
+                layer.timing.name: layer.timing.to_dict() for layer in self._layers
+            },
+            "fast_path_hits": self._fast_path_hits,
+        }
+
+    def reset_layer_timings(self) -> None:
+        """계층별 실행 시간 통계 초기화"""
+        for layer in self._layers:
+            timing = layer.timing
+            timing.calls = 0
+            timing.total_ms = timing.self_ms = timing.max_self_ms = 0.0
+        self._fast_path_hits = 0
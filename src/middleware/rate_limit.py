@@ -1,6 +1,17 @@
-"""Rate limiting middleware for MCP server."""
+"""Rate limiting middleware for MCP server.
 
-from typing import Any, Callable, Dict, Optional
+Tool calls are charged by cost rather than counted: a ``search_all`` fan-out
+consumes three units of the per-user limit and a ``search_web`` call two, so
+heavy tools exhaust the quota proportionally faster than cheap ones.
+
+Paid or slow backends can additionally have a per-user budget (calls per
+minute, e.g. ``{"tavily": 20}``). Exceeding a backend budget does not reject
+the call; the backend is marked cache-only for the duration of the request
+(see :func:`cache_only_backends`) and the tools answer from cached results.
+"""
+
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Mapping, Optional
 import time
 import asyncio
 from collections import defaultdict
@@ -8,13 +19,38 @@ import structlog
 import redis.asyncio as redis
 
 from ..utils.redis_rate_limiter import RedisRateLimiter
+from .pipeline import RequestEnvelope
 
 logger = structlog.get_logger(__name__)
 
+# Units of the per-user limit charged per call (unlisted tools cost 1)
+DEFAULT_TOOL_COSTS: Dict[str, int] = {"search_all": 3, "search_web": 2}
+
+# Backends each tool calls, for per-backend budgets
+DEFAULT_TOOL_BACKENDS: Dict[str, tuple[str, ...]] = {
+    "search_web": ("tavily",),
+    "search_vectors": ("qdrant",),
+    "search_database": ("postgres",),
+    "search_all": ("tavily", "qdrant", "postgres"),
+}
+
+_cache_only_backends: ContextVar[frozenset[str]] = ContextVar(
+    "rate_limit_cache_only_backends", default=frozenset()
+)
+
+
+def cache_only_backends() -> frozenset[str]:
+    """Backends whose budget the current request exceeded (serve from cache only)."""
+    return _cache_only_backends.get()
+
 
 class RateLimitMiddleware:
     """Rate limiting middleware to prevent abuse and ensure fair usage."""
 
+    # Only tool calls consume quota; listing tools and health checks are free
+    applies_to: Optional[frozenset[str]] = frozenset({"tools/call"})
+    exempt_tools: frozenset[str] = frozenset({"health_check"})
+
     def __init__(
         self,
         requests_per_minute: int = 60,
@@ -22,6 +58,9 @@ class RateLimitMiddleware:
         burst_size: int = 10,
         redis_client: Optional[redis.Redis] = None,
         use_sliding_window: bool = True,
+        tool_costs: Optional[Mapping[str, int]] = None,
+        backend_budgets: Optional[Mapping[str, int]] = None,
+        tool_backends: Optional[Mapping[str, tuple[str, ...]]] = None,
     ):
         """Initialize rate limiting middleware.
 
@@ -31,12 +70,27 @@ class RateLimitMiddleware:
             burst_size: Maximum burst size for token bucket
             redis_client: Optional Redis client for distributed rate limiting
             use_sliding_window: Use Redis sliding window if available
+            tool_costs: Units charged per call by tool name
+                (default: DEFAULT_TOOL_COSTS, unlisted tools cost 1)
+            backend_budgets: Maximum backend calls per minute per user
+                (e.g. {"tavily": 20}); over budget the backend is cache-only
+            tool_backends: Backends each tool calls (default: DEFAULT_TOOL_BACKENDS)
         """
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
         self.burst_size = burst_size
         self.redis_client = redis_client
         self.use_sliding_window = use_sliding_window
+        self.tool_costs = dict(
+            DEFAULT_TOOL_COSTS if tool_costs is None else tool_costs
+        )
+        for tool, cost in self.tool_costs.items():
+            if cost < 1:
+                raise ValueError(f"Tool cost for {tool} must be >= 1, got {cost}")
+        self.backend_budgets = dict(backend_budgets or {})
+        self.tool_backends = dict(
+            DEFAULT_TOOL_BACKENDS if tool_backends is None else tool_backends
+        )
 
         # Redis rate limiter for distributed rate limiting
         self._redis_limiter: Optional[RedisRateLimiter] = None
@@ -50,6 +104,7 @@ class RateLimitMiddleware:
         # In-memory storage for fallback rate limiting
         self._request_counts: Dict[str, list[float]] = defaultdict(list)
         self._token_buckets: Dict[str, Dict[str, Any]] = {}
+        self._backend_calls: Dict[tuple[str, str], list[float]] = defaultdict(list)
 
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
@@ -59,27 +114,50 @@ class RateLimitMiddleware:
     ) -> Dict[str, Any]:
         """Apply rate limiting to incoming requests."""
         # Extract user identifier
-        user = request.get("user", {})
+        envelope = RequestEnvelope.of(request)
+        user = envelope.user
         user_id = self._get_user_identifier(user)
 
         # Skip rate limiting for internal services
         if isinstance(user, dict) and user.get("type") == "service":
             return await call_next(request)
 
-        # Check rate limits
-        allowed, retry_after = await self._check_rate_limit(user_id)
+        # Check rate limits, charging the tool's cost
+        cost = self.get_tool_cost(envelope.tool_name)
+        allowed, retry_after = await self._check_rate_limit(user_id, cost)
 
         if not allowed:
             logger.warning(
                 "Rate limit exceeded",
                 user_id=user_id,
-                method=request.get("method"),
+                method=envelope.method,
+                tool=envelope.tool_name,
+                cost=cost,
                 retry_after=retry_after,
             )
             return self._rate_limit_exceeded_response(retry_after)
 
-        # Process request
-        return await call_next(request)
+        over_budget = await self._check_backend_budgets(user_id, envelope.tool_name)
+        if not over_budget:
+            return await call_next(request)
+
+        logger.info(
+            "Backend budget exceeded, serving cached results",
+            user_id=user_id,
+            tool=envelope.tool_name,
+            backends=sorted(over_budget),
+        )
+        token = _cache_only_backends.set(over_budget)
+        try:
+            return await call_next(request)
+        finally:
+            _cache_only_backends.reset(token)
+
+    def get_tool_cost(self, tool_name: Optional[str]) -> int:
+        """Units of the per-user limit charged for one call of ``tool_name``."""
+        if tool_name is None:
+            return 1
+        return self.tool_costs.get(tool_name, 1)
 
     def _get_user_identifier(self, user: Any) -> str:
         """Extract user identifier for rate limiting."""
@@ -90,28 +168,78 @@ class RateLimitMiddleware:
             )
         return "anonymous"
 
-    async def _check_rate_limit(self, user_id: str) -> tuple[bool, Optional[int]]:
+    async def _check_rate_limit(
+        self, user_id: str, cost: int = 1
+    ) -> tuple[bool, Optional[int]]:
         """Check if user has exceeded rate limits.
 
+        Args:
+            user_id: User identifier
+            cost: Units this request consumes
+
         Returns:
             Tuple of (allowed, retry_after_seconds)
         """
         if self._redis_limiter:
             # Use Redis sliding window rate limiter
             allowed, info = await self._redis_limiter.check_rate_limit(
-                identifier=user_id, limit=self.requests_per_minute, weight=1
+                identifier=user_id, limit=self.requests_per_minute, weight=cost
             )
             retry_after = info.get("retry_after", None) if not allowed else None
             return allowed, retry_after
         elif self.redis_client:
-            return await self._check_redis_rate_limit(user_id)
+            return await self._check_redis_rate_limit(user_id, cost)
         else:
-            return await self._check_memory_rate_limit(user_id)
+            return await self._check_memory_rate_limit(user_id, cost)
+
+    async def _check_backend_budgets(
+        self, user_id: str, tool_name: Optional[str]
+    ) -> frozenset[str]:
+        """Charge one call against each budgeted backend the tool uses.
+
+        Returns:
+            Backends over budget for this request (empty if all are within budget)
+        """
+        over_budget = set()
+        for backend in self.tool_backends.get(tool_name, ()):
+            budget = self.backend_budgets.get(backend)
+            if budget is None:
+                continue
+            if self._redis_limiter:
+                allowed, _ = await self._redis_limiter.check_rate_limit(
+                    identifier=user_id,
+                    limit=budget,
+                    weight=1,
+                    endpoint=f"backend:{backend}",
+                )
+            else:
+                allowed = await self._check_memory_backend_budget(
+                    user_id, backend, budget
+                )
+            if not allowed:
+                over_budget.add(backend)
+        return frozenset(over_budget)
+
+    async def _check_memory_backend_budget(
+        self, user_id: str, backend: str, budget: int
+    ) -> bool:
+        """Sliding one-minute window of backend calls using in-memory storage."""
+        async with self._lock:
+            now = time.time()
+            calls = self._backend_calls[(user_id, backend)]
+            calls[:] = [ts for ts in calls if ts > now - 60]
+            if len(calls) >= budget:
+                return False
+            calls.append(now)
+            return True
 
     async def _check_memory_rate_limit(
-        self, user_id: str
+        self, user_id: str, cost: int = 1
     ) -> tuple[bool, Optional[int]]:
-        """Check rate limit using in-memory storage."""
+        """Check rate limit using in-memory storage.
+
+        A request costing N units is recorded as N timestamps.
+        """
         async with self._lock:
             now = time.time()
 
@@ -130,30 +258,34 @@ class RateLimitMiddleware:
             hour_requests = len(requests)
 
             # Check minute limit
-            if minute_requests >= self.requests_per_minute:
+            if minute_requests + cost > self.requests_per_minute:
                 # Calculate retry after
-                oldest_minute_request = min(ts for ts in requests if ts > minute_ago)
+                oldest_minute_request = min(
+                    (ts for ts in requests if ts > minute_ago), default=now
+                )
                 retry_after = int(oldest_minute_request + 60 - now) + 1
                 return False, retry_after
 
             # Check hour limit
-            if hour_requests >= self.requests_per_hour:
+            if hour_requests + cost > self.requests_per_hour:
                 # Calculate retry after
-                oldest_hour_request = min(requests)
+                oldest_hour_request = min(requests, default=now)
                 retry_after = int(oldest_hour_request + 3600 - now) + 1
                 return False, retry_after
 
             # Check token bucket for burst control
+            # (a cost above the burst size only needs a full bucket)
             bucket = self._get_token_bucket(user_id)
-            if bucket["tokens"] < 1:
-                # Calculate when next token will be available
+            needed = min(cost, self.burst_size)
+            if bucket["tokens"] < needed:
+                # Calculate when enough tokens will be available
                 time_per_token = 60 / self.requests_per_minute
-                retry_after = int(time_per_token - (now - bucket["last_refill"]))
+                retry_after = int((needed - bucket["tokens"]) * time_per_token)
                 return False, max(1, retry_after)
 
             # Request allowed - update counts and bucket
-            requests.append(now)
-            bucket["tokens"] -= 1
+            requests.extend([now] * cost)
+            bucket["tokens"] -= cost
 
             return True, None
 
@@ -179,11 +311,13 @@ class RateLimitMiddleware:
 
         return bucket
 
-    async def _check_redis_rate_limit(self, user_id: str) -> tuple[bool, Optional[int]]:
+    async def _check_redis_rate_limit(
+        self, user_id: str, cost: int = 1
+    ) -> tuple[bool, Optional[int]]:
         """Check rate limit using Redis (for distributed systems)."""
         # This would implement Redis-based rate limiting
         # For now, fall back to memory-based
-        return await self._check_memory_rate_limit(user_id)
+        return await self._check_memory_rate_limit(user_id, cost)
 
     def _rate_limit_exceeded_response(self, retry_after: int) -> Dict[str, Any]:
         """Create rate limit exceeded response."""
@@ -1,28 +1,22 @@
 """Request validation middleware for MCP server."""
 
-from typing import Any, Callable, Dict, Optional, Set
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set
 import structlog
 
+from .pipeline import RequestEnvelope
+
 logger = structlog.get_logger(__name__)
 
 
 class ValidationMiddleware:
     """Middleware for validating MCP requests and enforcing permissions."""
 
-    def __init__(
-        self,
-        allowed_methods: Optional[Set[str]] = None,
-        tool_permissions: Optional[Dict[str, Set[str]]] = None,
-        validate_params: bool = True,
-    ):
-        """Initialize validation middleware.
+    # Structural checks apply to every method (see MiddlewarePipeline)
+    applies_to: Optional[frozenset[str]] = None
 
-        Args:
-            allowed_methods: Set of allowed MCP methods
-            tool_permissions: Mapping of role to allowed tools
-            validate_params: Whether to validate request parameters
-        """
-        self.allowed_methods = allowed_methods or {
+    # Defaults for standalone use; the server passes its own configuration
+    DEFAULT_ALLOWED_METHODS = frozenset(
+        {
             "tools/list",
             "tools/call",
             "health_check",
@@ -31,25 +25,44 @@ class ValidationMiddleware:
             "search_database",
             "search_all",
         }
+    )
+    DEFAULT_TOOL_PERMISSIONS: Mapping[str, frozenset[str]] = {
+        "admin": frozenset(
+            {"search_web", "search_vectors", "search_database", "search_all", "health_check"}
+        ),
+        "user": frozenset(
+            {"search_web", "search_vectors", "search_database", "search_all", "health_check"}
+        ),
+        "guest": frozenset({"search_web", "health_check"}),
+    }
 
-        self.tool_permissions = tool_permissions or {
-            "admin": {
-                "search_web",
-                "search_vectors",
-                "search_database",
-                "search_all",
-                "health_check",
-            },
-            "user": {
-                "search_web",
-                "search_vectors",
-                "search_database",
-                "search_all",
-                "health_check",
-            },
-            "guest": {"search_web", "health_check"},
-        }
+    def __init__(
+        self,
+        allowed_methods: Optional[Set[str]] = DEFAULT_ALLOWED_METHODS,
+        tool_permissions: Optional[Mapping[str, Set[str]]] = DEFAULT_TOOL_PERMISSIONS,
+        validate_params: bool = True,
+        permission_checker: Optional[Callable[[List[str], str], bool]] = None,
+    ):
+        """Initialize validation middleware.
 
+        Args:
+            allowed_methods: Set of allowed MCP methods (None allows any method
+                and leaves unknown ones to the server)
+            tool_permissions: Mapping of role to allowed tools (None allows any
+                tool unless permission_checker is given)
+            validate_params: Whether to validate request parameters
+            permission_checker: ``(roles, tool_name) -> bool`` used instead of
+                tool_permissions, e.g. ``RBACService.check_tool_permission``
+        """
+        self.allowed_methods = (
+            set(allowed_methods) if allowed_methods is not None else None
+        )
+        self.tool_permissions = (
+            {role: set(tools) for role, tools in tool_permissions.items()}
+            if tool_permissions is not None
+            else None
+        )
+        self.permission_checker = permission_checker
         self.validate_params = validate_params
 
     async def __call__(
@@ -78,7 +91,7 @@ class ValidationMiddleware:
         method = request["method"]
 
         # Validate method is allowed
-        if method not in self.allowed_methods:
+        if self.allowed_methods is not None and method not in self.allowed_methods:
             logger.warning(
                 "Method not allowed",
                 method=method,
@@ -105,19 +118,19 @@ class ValidationMiddleware:
         self, request: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Validate tool call permissions."""
-        params = request.get("params", {})
+        envelope = RequestEnvelope.of(request)
 
-        if not isinstance(params, dict):
+        if not isinstance(envelope.params, dict):
             return self._invalid_params_response(
                 "Params must be an object for tools/call"
             )
 
-        tool_name = params.get("name")
+        tool_name = envelope.tool_name
         if not tool_name:
             return self._invalid_params_response("Missing tool name in params")
 
         # Check user permissions
-        user = request.get("user", {})
+        user = envelope.user
         user_roles = (
             user.get("roles", ["guest"]) if isinstance(user, dict) else ["guest"]
         )
@@ -126,23 +139,28 @@ class ValidationMiddleware:
         if isinstance(user, dict) and user.get("type") == "service":
             return None
 
-        # Check if user has permission for this tool
-        allowed_tools = set()
-        for role in user_roles:
-            allowed_tools.update(self.tool_permissions.get(role, set()))
+        if self._tool_allowed(user_roles, tool_name):
+            return None
 
-        if tool_name not in allowed_tools:
-            logger.warning(
-                "Tool access denied",
-                tool_name=tool_name,
-                user_roles=user_roles,
-                user_id=user.get("id") if isinstance(user, dict) else None,
-            )
-            return self._permission_denied_response(
-                f"Access denied for tool: {tool_name}"
-            )
+        logger.warning(
+            "Tool access denied",
+            tool_name=tool_name,
+            user_roles=user_roles,
+            user_id=user.get("id") if isinstance(user, dict) else None,
+        )
+        return self._permission_denied_response(
+            f"Access denied for tool: {tool_name}"
+        )
 
-        return None
+    def _tool_allowed(self, user_roles: List[str], tool_name: str) -> bool:
+        """Check a tool against the permission checker or role mapping."""
+        if self.permission_checker is not None:
+            return self.permission_checker(list(user_roles), tool_name)
+        if self.tool_permissions is None:
+            return True
+        return any(
+            tool_name in self.tool_permissions.get(role, ()) for role in user_roles
+        )
 
     def _validate_params(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Validate request parameters based on method."""
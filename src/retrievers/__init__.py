@@ -91,8 +91,11 @@ MCP 서버용 다양한 데이터 소스 리트리버 구현체 모듈
     - 비동기 처리로 높은 동시성
     - 스트리밍으로 메모리 사용량 최적화
     - 캐싱 레이어 통합 지원
+    - 지연 임포트: 구현체는 처음 사용할 때 로드되어 서버 시작이 빠름
 """
 
+import importlib
+
 # 기본 인터페이스와 타입 정의
 from src.retrievers.base import (
     Retriever,  # 리트리버 추상 기반 클래스
@@ -104,13 +107,25 @@ from src.retrievers.base import (
     RetrieverConfig,  # 리트리버 설정 타입 힌트
 )
 
-# 구체적인 리트리버 구현체들
-from src.retrievers.tavily import TavilyRetriever  # Tavily 웹 검색 API
-from src.retrievers.postgres import PostgresRetriever  # PostgreSQL 데이터베이스
-from src.retrievers.qdrant import QdrantRetriever  # Qdrant 벡터 데이터베이스
+# 구체적인 리트리버 구현체와 팩토리는 처음 접근할 때 임포트
+# (qdrant_client, asyncpg, httpx 등 백엔드 라이브러리를 사용하는 리트리버만 로드)
+_LAZY_EXPORTS = {
+    "TavilyRetriever": "src.retrievers.tavily",  # Tavily 웹 검색 API
+    "PostgresRetriever": "src.retrievers.postgres",  # PostgreSQL 데이터베이스
+    "QdrantRetriever": "src.retrievers.qdrant",  # Qdrant 벡터 데이터베이스
+    "RetrieverFactory": "src.retrievers.factory",  # 팩토리 패턴 구현체
+    "RetrieverFactoryError": "src.retrievers.factory",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
-# 팩토리 패턴 구현체
-from src.retrievers.factory import RetrieverFactory, RetrieverFactoryError
 
 # 외부에서 사용 가능한 공개 API 정의
 __all__ = [
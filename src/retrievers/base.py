@@ -291,6 +291,34 @@ class Retriever(ABC):
         """
         pass
 
+    async def warm_up(self) -> dict[str, Any]:
+        """
+        첫 요청 전 지연 비용을 미리 지불하는 워밍업
+
+        연결 이후, 서버가 준비 완료를 보고하기 전에 호출됩니다.
+        연결 풀의 연결을 미리 열거나 모델을 로드하는 등의 작업을 구현체가
+        재정의합니다. 기본 구현은 아무 작업도 하지 않습니다.
+
+        Returns:
+            dict[str, Any]: 워밍업 결과 요약 (로깅용)
+        """
+        return {}
+
+    def is_read_only(self, query: str) -> bool:
+        """
+        쿼리가 데이터를 바꾸지 않는지 확인
+
+        캐싱 계층은 읽기 전용 쿼리의 결과만 저장합니다. 쓰기를 실행할 수
+        있는 리트리버(PostgreSQL 등)가 재정의합니다. 기본값은 True입니다.
+
+        Args:
+            query (str): 검사할 쿼리
+
+        Returns:
+            bool: 데이터를 바꾸지 않으면 True
+        """
+        return True
+
     async def __aenter__(self) -> Self:
         """
         비동기 컨텍스트 매니저 진입
@@ -163,6 +163,7 @@ class CachedRetriever(Retriever):
             limit (int): 최대 결과 수 (기본값: 10)
             **kwargs: 추가 검색 매개변수
                 - cache_ttl (int): 개별 요청의 캐시 TTL (선택사항)
+                - use_cache (bool): False면 이 요청만 캐시를 건너뜀 (선택사항)
                 - 기타 하위 클래스별 매개변수
 
         Yields:
@@ -173,11 +174,14 @@ class CachedRetriever(Retriever):
             스트리밍 방식으로 결과를 반환하므로 메모리 효율적입니다.
             캐시 미스 시에도 결과가 나오는 즉시 yield됩니다.
         """
+        # 요청별 캐시 우회 (인스턴스 설정은 바꾸지 않음)
+        use_cache = kwargs.pop("use_cache", True) and self._use_cache
+
         # 쿼리와 매개변수를 조합하여 고유한 캐시 키 생성
         cache_key = self._cache.cache_key_for_query(query, limit, **kwargs)
 
         # 캐시 조회 시도 (캐시가 활성화된 경우)
-        if self._use_cache:
+        if use_cache:
             cached_results = await self._cache.get(
                 self._get_cache_namespace(), cache_key
             )
@@ -201,7 +205,7 @@ class CachedRetriever(Retriever):
             yield result  # 즉시 스트리밍 반환
 
         # 검색 결과를 캐시에 저장 (결과가 있고 캐시가 활성화된 경우)
-        if self._use_cache and results:
+        if use_cache and results:
             # 개별 요청별 TTL 설정 (없으면 기본값 사용)
             ttl = kwargs.get("cache_ttl", None)
 
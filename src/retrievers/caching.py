@@ -0,0 +1,292 @@
+"""
+리트리버 캐싱 데코레이터
+
+어떤 리트리버든 감싸서 Redis 캐싱을 적용하는 데코레이터입니다.
+RetrieverFactory.create가 설정에 use_cache가 있으면 자동으로 적용합니다.
+
+CachedRetriever(상속 방식)와 같은 인터페이스(_use_cache, _cache,
+_get_cache_namespace, invalidate_cache)를 제공하므로 서버의 캐시 도구가
+그대로 동작합니다.
+
+백엔드별 정책 (CachePolicy):
+    - TTL: tavily 5분, qdrant 15분, postgres 10분 (cache_ttl 설정이 우선)
+    - 키 정규화: 웹/벡터 검색은 유니코드 정규화, 대소문자 통일, 공백 축약
+      PostgreSQL은 SQL 문자열 리터럴이 바뀌지 않도록 앞뒤 공백만 제거
+
+캐시 키:
+    {namespace}:{정규화된 쿼리 앞 64자}:{blake2b(정규화된 쿼리, limit, 정렬된 kwargs)}
+
+사용 예시:
+    ```python
+    retriever = CachingRetriever(TavilyRetriever(config), name="tavily")
+    await retriever.connect()
+    async for result in retriever.retrieve("Python  Tutorial"):
+        ...
+    retriever.get_cache_stats()  # {"hits": 0, "misses": 1, ...}
+    ```
+"""
+
+import hashlib
+import json
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+from src.cache import CacheConfig, RedisCache
+from src.retrievers.base import QueryResult, Retriever, RetrieverHealth
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """백엔드별 캐시 정책"""
+
+    ttl: int = 300
+    # 대소문자 통일 (casefold) 여부
+    casefold: bool = True
+    # 연속 공백을 하나로 축약할지 여부
+    collapse_whitespace: bool = True
+
+
+DEFAULT_CACHE_POLICIES: dict[str, CachePolicy] = {
+    "tavily": CachePolicy(ttl=300),
+    "qdrant": CachePolicy(ttl=900),
+    # SQL 문자열 리터럴의 대소문자·공백은 의미가 있으므로 정규화하지 않음
+    "postgres": CachePolicy(ttl=600, casefold=False, collapse_whitespace=False),
+}
+
+
+def normalize_query(query: str, policy: CachePolicy) -> str:
+    """캐시 키용 쿼리 정규화"""
+    normalized = unicodedata.normalize("NFKC", query).strip()
+    if policy.collapse_whitespace:
+        normalized = " ".join(normalized.split())
+    if policy.casefold:
+        normalized = normalized.casefold()
+    return normalized
+
+
+def _normalize_param(value: Any) -> Any:
+    # 도메인 목록 등 순서가 의미 없는 문자열 목록은 정렬
+    if isinstance(value, (list, tuple, set)) and all(
+        isinstance(v, str) for v in value
+    ):
+        return sorted(value)
+    return value
+
+
+class CachingRetriever(Retriever):
+    """
+    Redis 캐싱을 적용하는 리트리버 데코레이터
+
+    캐시 히트 시 내부 리트리버를 호출하지 않습니다.
+    Redis 연결에 실패하면 캐시를 끄고 내부 리트리버만 사용합니다.
+    """
+
+    def __init__(
+        self,
+        inner: Retriever,
+        name: str,
+        redis_url: str = "redis://localhost:6379/0",
+        cache_ttl: Optional[int] = None,
+        policy: Optional[CachePolicy] = None,
+        cache: Optional[RedisCache] = None,
+        use_cache: bool = True,
+    ):
+        """
+        캐싱 데코레이터 초기화
+
+        Args:
+            inner: 감쌀 리트리버
+            name: 백엔드 이름 (캐시 네임스페이스와 기본 정책 선택에 사용)
+            redis_url: Redis 연결 URL
+            cache_ttl: TTL (초, 지정 시 정책의 TTL보다 우선)
+            policy: 캐시 정책 (기본값: DEFAULT_CACHE_POLICIES[name])
+            cache: 직접 지정할 RedisCache (테스트·공유용)
+            use_cache: 캐시 사용 여부
+        """
+        super().__init__(inner.config)
+        self.inner = inner
+        self.name = name
+
+        policy = policy or DEFAULT_CACHE_POLICIES.get(name, CachePolicy())
+        if cache_ttl is not None:
+            policy = CachePolicy(
+                ttl=cache_ttl,
+                casefold=policy.casefold,
+                collapse_whitespace=policy.collapse_whitespace,
+            )
+        self.policy = policy
+
+        self._cache = cache or RedisCache(
+            CacheConfig(
+                redis_url=redis_url,
+                default_ttl=policy.ttl,
+                key_prefix="mcp_retriever",
+            )
+        )
+        self._use_cache = use_cache
+
+        self._hits = 0
+        self._misses = 0
+        self._sets = 0
+
+    def __getattr__(self, item: str) -> Any:
+        # 백엔드 전용 메서드는 내부 리트리버로 위임
+        if item == "inner":
+            raise AttributeError(item)
+        return getattr(self.inner, item)
+
+    @property
+    def connected(self) -> bool:
+        return self.inner.connected
+
+    async def connect(self) -> None:
+        """
+        내부 리트리버와 캐시 연결
+
+        Raises:
+            ConnectionError: 내부 리트리버 연결 실패 시 (캐시 연결 실패는 무시)
+        """
+        await self.inner.connect()
+
+        if self._use_cache:
+            try:
+                await self._cache.connect()
+                self._log_operation("cache_connect", status="success", cache=self.name)
+            except Exception as e:
+                # 캐시 없이도 검색은 가능해야 함 (Graceful Degradation)
+                self._log_operation(
+                    "cache_connect", status="failed", cache=self.name, error=str(e)
+                )
+                self._use_cache = False
+
+    async def disconnect(self) -> None:
+        await self.inner.disconnect()
+        if self._cache._connected:
+            await self._cache.disconnect()
+
+    def is_read_only(self, query: str) -> bool:
+        return self.inner.is_read_only(query)
+
+    def cache_key(self, query: str, limit: int, **kwargs: Any) -> str:
+        """
+        정규화된 쿼리와 매개변수로 캐시 키 생성
+
+        패턴 무효화(invalidate_cache("*python*"))가 가능하도록
+        정규화된 쿼리 앞부분을 키에 남기고 나머지는 해시로 구분합니다.
+        """
+        normalized = normalize_query(query, self.policy)
+        params = {k: _normalize_param(v) for k, v in kwargs.items() if v is not None}
+        payload = json.dumps(
+            [normalized, limit, params],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return f"{normalized[:64]}:{digest}"
+
+    async def retrieve(
+        self, query: str, limit: int = 10, **kwargs: Any
+    ) -> AsyncIterator[QueryResult]:
+        """
+        캐시를 먼저 조회하고, 미스면 내부 리트리버 결과를 스트리밍하며 저장
+
+        쓰기 쿼리(INSERT/UPDATE/DELETE ... RETURNING 등)는 캐시를 조회하지도
+        저장하지도 않습니다. 반복 호출이 쓰기를 건너뛰면 안 되기 때문입니다.
+
+        Args:
+            **kwargs: 내부 리트리버 매개변수
+                - cache_ttl (int): 이 요청의 TTL (내부 리트리버에는 전달하지 않음)
+                - use_cache (bool): False면 이 요청만 캐시를 건너뜀 (공유 인스턴스의
+                  _use_cache를 바꾸지 않으므로 동시 요청에 영향 없음)
+        """
+        ttl = kwargs.pop("cache_ttl", None) or self.policy.ttl
+        use_cache = kwargs.pop("use_cache", True)
+        namespace = self._get_cache_namespace()
+        key = self.cache_key(query, limit, **kwargs)
+        use_cache = use_cache and self._use_cache and self.inner.is_read_only(query)
+
+        if use_cache:
+            cached = await self._cache.get(namespace, key)
+            if cached is not None:
+                self._hits += 1
+                for result in cached:
+                    yield result
+                return
+            self._misses += 1
+
+        results = []
+        async for result in self.inner.retrieve(query, limit=limit, **kwargs):
+            results.append(result)
+            yield result
+
+        if use_cache and results:
+            if await self._cache.set(namespace, key, results, ttl):
+                self._sets += 1
+
+    async def get_cached(
+        self, query: str, limit: int = 10, **kwargs: Any
+    ) -> Optional[list[QueryResult]]:
+        """
+        내부 리트리버를 호출하지 않고 캐시만 조회
+
+        백엔드 호출 예산을 넘은 요청을 캐시된 결과로만 처리할 때 사용합니다.
+
+        Returns:
+            캐시된 결과 (캐시를 쓰지 않거나 미스면 None)
+        """
+        kwargs.pop("cache_ttl", None)
+        if not self._use_cache or not self.inner.is_read_only(query):
+            return None
+        cached = await self._cache.get(
+            self._get_cache_namespace(), self.cache_key(query, limit, **kwargs)
+        )
+        if cached is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return list(cached)
+
+    async def invalidate_cache(self, pattern: Optional[str] = None) -> int:
+        """
+        캐시 무효화
+
+        Args:
+            pattern: 키 패턴 (None이면 이 백엔드의 캐시 전체)
+
+        Returns:
+            int: 삭제된 키 수
+        """
+        if not self._use_cache:
+            return 0
+        if pattern:
+            return await self._cache.invalidate_pattern(
+                f"{self._get_cache_namespace()}:{pattern}"
+            )
+        return await self._cache.clear_namespace(self._get_cache_namespace())
+
+    def _get_cache_namespace(self) -> str:
+        return self.name
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """캐시 히트/미스 통계"""
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self._use_cache,
+            "ttl": self.policy.ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "sets": self._sets,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
+
+    async def warm_up(self) -> dict[str, Any]:
+        return await self.inner.warm_up()
+
+    async def health_check(self) -> RetrieverHealth:
+        """내부 리트리버 상태에 캐시 통계를 더해 반환"""
+        health = await self.inner.health_check()
+        details = dict(health.details or {})
+        details["cache"] = self.get_cache_stats()
+        return health.model_copy(update={"details": details})
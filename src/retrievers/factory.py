@@ -10,12 +10,14 @@
     - 기본 제공 리트리버 자동 등록
     - 설정 기반 객체 생성
     - 타입 안전성 보장
+    - 임포트 경로 등록: 백엔드 라이브러리는 해당 리트리버를 처음 생성할 때 로드
 
 디자인 패턴:
     Factory Method Pattern - 구체적인 클래스를 지정하지 않고 객체 생성
     Singleton Pattern - 기본 팩토리 인스턴스는 싱글톤으로 관리
 """
 
+import importlib
 from typing import Type, Any
 import structlog
 
@@ -50,10 +52,14 @@ class RetrieverFactory:
 
         # 커스텀 리트리버 등록
         factory.register("custom", CustomRetriever)
+
+        # 임포트 경로로 등록 (처음 생성할 때 임포트)
+        factory.register_lazy("custom", "my_package.retrievers:CustomRetriever")
         ```
 
     Attributes:
         _retrievers (dict[str, Type[Retriever]]): 등록된 리트리버 클래스들
+        _lazy (dict[str, str]): 아직 임포트하지 않은 리트리버의 임포트 경로
         logger: 구조화된 로거 인스턴스
         _default_instance: 싱글톤 기본 인스턴스
     """
@@ -74,6 +80,8 @@ class RetrieverFactory:
         """
         # 리트리버 클래스를 저장하는 레지스트리
         self._retrievers: dict[str, Type[Retriever]] = {}
+        # 'module:Class' 형식의 지연 등록 경로
+        self._lazy: dict[str, str] = {}
 
         # 구조화된 로깅을 위한 로거 설정
         self.logger = structlog.get_logger(self.__class__.__name__)
@@ -116,12 +124,50 @@ class RetrieverFactory:
 
         # 레지스트리에 클래스 등록
         self._retrievers[name] = retriever_class
+        self._lazy.pop(name, None)
 
         # 등록 성공 로깅 (구조화된 로그)
         self.logger.info(
             "Registered retriever", name=name, class_name=retriever_class.__name__
         )
 
+    def register_lazy(self, name: str, import_path: str) -> None:
+        """
+        임포트 경로로 리트리버 등록
+
+        클래스는 create()나 get_retriever_class()에서 처음 필요할 때
+        임포트하고 register()와 같은 검증을 거칩니다. 사용하지 않는 백엔드의
+        라이브러리(qdrant_client, asyncpg 등)를 서버 시작 시 로드하지 않습니다.
+
+        Args:
+            name (str): 리트리버를 식별하는 고유한 이름
+            import_path (str): "패키지.모듈:클래스명" 형식의 경로
+
+        Raises:
+            ValueError: import_path 형식이 잘못된 경우
+        """
+        module, sep, attr = import_path.partition(":")
+        if not (module and sep and attr):
+            raise ValueError(
+                f"Import path must look like 'package.module:ClassName', got {import_path!r}"
+            )
+
+        self._lazy[name] = import_path
+        self._retrievers.pop(name, None)
+
+    def _resolve(self, name: str) -> Type[Retriever] | None:
+        """등록된 클래스 조회 (지연 등록이면 임포트 후 등록)"""
+        if name in self._retrievers:
+            return self._retrievers[name]
+
+        import_path = self._lazy.get(name)
+        if import_path is None:
+            return None
+
+        module, _, attr = import_path.partition(":")
+        self.register(name, getattr(importlib.import_module(module), attr))
+        return self._retrievers[name]
+
     def create(self, config: RetrieverConfig) -> Retriever:
         """
         설정을 기반으로 리트리버 인스턴스 생성
@@ -133,6 +179,10 @@ class RetrieverFactory:
             config (RetrieverConfig): 리트리버 설정 딕셔너리
                 반드시 'type' 필드를 포함해야 함
                 예: {"type": "tavily", "api_key": "your-key", "timeout": 30}
+                'resilience' 필드(dict)가 있으면 ResilientRetriever로 감싸며
+                해당 값은 ResilientRetriever의 인자로 전달됨
+                'use_cache'가 True이면 CachingRetriever로 감쌈
+                ('cache_ttl', 'redis_url' 사용, CachedRetriever 하위 클래스 제외)
 
         Returns:
             Retriever: 설정에 따라 생성된 리트리버 인스턴스
@@ -167,26 +217,55 @@ class RetrieverFactory:
         retriever_type = config["type"]
 
         # 등록된 리트리버 타입인지 확인
-        if retriever_type not in self._retrievers:
-            available = ", ".join(self._retrievers.keys())
+        if retriever_type not in self._retrievers and retriever_type not in self._lazy:
+            available = ", ".join(self.list_available())
             raise RetrieverFactoryError(
                 f"Unknown retriever type: {retriever_type}. Available: {available}"
             )
 
-        # 'type' 필드를 제외한 설정으로 리트리버별 설정 생성
-        # 리트리버 생성자는 'type' 필드를 받지 않으므로 제거
-        retriever_config = {k: v for k, v in config.items() if k != "type"}
+        # 'type', 'resilience' 필드를 제외한 설정으로 리트리버별 설정 생성
+        # 리트리버 생성자는 이 필드들을 받지 않으므로 제거
+        resilience = config.get("resilience")
+        retriever_config = {
+            k: v for k, v in config.items() if k not in ("type", "resilience")
+        }
 
         try:
-            # 등록된 클래스로 인스턴스 생성
-            retriever_class = self._retrievers[retriever_type]
+            # 등록된 클래스로 인스턴스 생성 (지연 등록이면 여기서 임포트)
+            retriever_class = self._resolve(retriever_type)
             retriever = retriever_class(retriever_config)
 
+            # 복원력 계층 적용 (타임아웃, 헤지, 서킷 브레이커, 재시도 예산)
+            if resilience:
+                from src.retrievers.resilience import ResilientRetriever
+
+                retriever = ResilientRetriever(
+                    retriever, name=retriever_type, **resilience
+                )
+
+            # 캐싱 계층 적용 (가장 바깥: 캐시 히트 시 타임아웃·헤지도 건너뜀)
+            # CachedRetriever 하위 클래스는 자체적으로 캐싱하므로 제외
+            cached = False
+            if config.get("use_cache"):
+                from src.retrievers.cached_base import CachedRetriever
+                from src.retrievers.caching import CachingRetriever
+
+                cached = not issubclass(retriever_class, CachedRetriever)
+            if cached:
+                retriever = CachingRetriever(
+                    retriever,
+                    name=retriever_type,
+                    redis_url=config.get("redis_url", "redis://localhost:6379/0"),
+                    cache_ttl=config.get("cache_ttl"),
+                )
+
             # 생성 성공 로깅
             self.logger.info(
                 "Created retriever",
                 type=retriever_type,
                 class_name=retriever_class.__name__,
+                resilient=bool(resilience),
+                cached=cached,
             )
 
             return retriever
@@ -208,7 +287,7 @@ class RetrieverFactory:
             list[str]: 등록된 리트리버 타입 이름 목록
                 예: ["tavily", "postgres", "qdrant"]
         """
-        return list(self._retrievers.keys())
+        return [*self._retrievers, *(n for n in self._lazy if n not in self._retrievers)]
 
     def get_retriever_class(self, name: str) -> Type[Retriever] | None:
         """
@@ -224,29 +303,23 @@ class RetrieverFactory:
             Type[Retriever] | None: 리트리버 클래스 또는 None (미등록 시)
                 클래스 자체를 반환하므로 직접 인스턴스 생성 가능
         """
-        return self._retrievers.get(name)
+        return self._resolve(name)
 
     def _register_default_retrievers(self) -> None:
         """
         기본 제공 리트리버들 등록
 
-        프로젝트에서 기본으로 제공하는 리트리버들을 자동 등록합니다.
-        순환 임포트를 방지하기 위해 필요할 때만 임포트합니다.
+        프로젝트에서 기본으로 제공하는 리트리버들을 임포트 경로로 등록합니다.
+        각 백엔드 모듈은 해당 리트리버를 처음 생성할 때 임포트됩니다.
 
         등록되는 리트리버들:
             - tavily: Tavily 웹 검색 API
             - postgres: PostgreSQL 데이터베이스
             - qdrant: Qdrant 벡터 데이터베이스
         """
-        # 순환 임포트 방지를 위해 지연 임포트 사용
-        from src.retrievers.tavily import TavilyRetriever
-        from src.retrievers.postgres import PostgresRetriever
-        from src.retrievers.qdrant import QdrantRetriever
-
-        # 각 리트리버를 고유한 이름으로 등록
-        self.register("tavily", TavilyRetriever)
-        self.register("postgres", PostgresRetriever)
-        self.register("qdrant", QdrantRetriever)
+        self.register_lazy("tavily", "src.retrievers.tavily:TavilyRetriever")
+        self.register_lazy("postgres", "src.retrievers.postgres:PostgresRetriever")
+        self.register_lazy("qdrant", "src.retrievers.qdrant:QdrantRetriever")
 
     @classmethod
     def get_default(cls) -> "RetrieverFactory":
@@ -0,0 +1,220 @@
+"""
+검색 결과 융합 (Result Fusion)
+
+search_all이 여러 리트리버에서 받은 결과를 하나의 순위 목록으로 병합합니다.
+소스마다 점수 체계가 다르기 때문에(Tavily 관련성, Qdrant 코사인 유사도,
+PostgreSQL은 점수 없음) 점수를 그대로 비교할 수 없습니다.
+
+융합 방식:
+    rrf (Reciprocal Rank Fusion):
+        점수 대신 순위만 사용합니다. score = Σ weight / (k + rank)
+        점수 체계가 달라도 안정적으로 동작합니다.
+
+    score (정규화 점수 결합, CombSUM):
+        소스별로 점수를 min-max 정규화한 뒤 가중 합산합니다.
+        점수가 없는 소스는 순위 기반 점수(1 - (rank-1)/n)를 사용합니다.
+
+중복 제거:
+    - URL이 있으면 정규화된 URL (스킴/호스트 소문자, 프래그먼트·utm 파라미터·끝 슬래시 제거)
+    - 없으면 본문(content/text/title) 해시
+    - 둘 다 없으면 소스와 id 조합
+
+스트리밍:
+    소스가 끝날 때마다 add()로 누적하고, 최종적으로 힙(heapq.nlargest)으로
+    상위 k개만 골라 복사합니다. 전체 결과를 정렬하거나 복사하지 않습니다.
+
+사용 예시:
+    ```python
+    fusion = ResultFusion(method="rrf")
+    fusion.add("tavily", tavily_results)
+    fusion.add("qdrant", qdrant_results)
+    top = fusion.top_k(10)
+    ```
+"""
+
+import hashlib
+import heapq
+import json
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.retrievers.base import QueryResult
+
+FUSION_METHODS = ("rrf", "score")
+
+# 본문 해시에 사용할 필드 (우선순위 순)
+_TEXT_FIELDS = ("content", "text", "title")
+
+
+def normalize_url(url: str) -> str:
+    """중복 판별용 URL 정규화"""
+    parts = urlsplit(url.strip())
+    query = parts.query
+    if query:
+        query = urlencode(
+            sorted(
+                (k, v)
+                for k, v in parse_qsl(query, keep_blank_values=True)
+                if not k.lower().startswith("utm_")
+            )
+        )
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            query,
+            "",
+        )
+    )
+
+
+def result_key(result: QueryResult) -> str:
+    """
+    결과의 중복 판별 키
+
+    Args:
+        result: 리트리버 결과
+
+    Returns:
+        str: URL, 본문 해시, 또는 소스+id 기반 키
+    """
+    url = result.get("url")
+    if isinstance(url, str) and url:
+        return "url:" + normalize_url(url)
+
+    for field in _TEXT_FIELDS:
+        text = result.get(field)
+        if isinstance(text, str) and text.strip():
+            normalized = " ".join(text.lower().split())
+            digest = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+            return "text:" + digest
+
+    if result.get("id") is not None:
+        return f"id:{result.get('source', '')}:{result['id']}"
+
+    payload = json.dumps(result, sort_keys=True, default=str)
+    return "row:" + hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class _Candidate:
+    __slots__ = ("result", "score", "sources", "order")
+
+    def __init__(self, result: QueryResult, order: int):
+        self.result = result
+        self.score = 0.0
+        self.sources: dict[str, int] = {}
+        self.order = order
+
+
+class ResultFusion:
+    """여러 소스의 결과를 점진적으로 누적하는 융합기"""
+
+    def __init__(
+        self,
+        method: str = "rrf",
+        rrf_k: int = 60,
+        weights: Optional[dict[str, float]] = None,
+        depth: Optional[int] = None,
+    ):
+        """
+        융합기 초기화
+
+        Args:
+            method: "rrf" 또는 "score"
+            rrf_k: RRF 상수 (클수록 하위 순위의 영향이 커짐)
+            weights: 소스별 가중치 (기본값 1.0)
+            depth: 소스당 융합에 참여할 최대 순위 (None이면 전체)
+        """
+        if method not in FUSION_METHODS:
+            raise ValueError(
+                f"지원하지 않는 융합 방식: {method} (가능: {', '.join(FUSION_METHODS)})"
+            )
+        self.method = method
+        self.rrf_k = rrf_k
+        self.weights = weights or {}
+        self.depth = depth
+
+        self._candidates: dict[str, _Candidate] = {}
+        self._seen = 0
+
+    def add(self, source: str, results: list[QueryResult]) -> None:
+        """
+        한 소스의 결과를 순위 순서대로 누적
+
+        Args:
+            source: 소스 이름
+            results: 해당 소스의 결과 (관련도 내림차순)
+        """
+        if self.depth is not None:
+            results = results[: self.depth]
+        if not results:
+            return
+
+        weight = self.weights.get(source, 1.0)
+        contributions = (
+            self._rrf_scores(results)
+            if self.method == "rrf"
+            else self._normalized_scores(results)
+        )
+
+        for rank, (result, contribution) in enumerate(
+            zip(results, contributions), start=1
+        ):
+            self._seen += 1
+            key = result_key(result)
+            candidate = self._candidates.get(key)
+            if candidate is None:
+                candidate = _Candidate(result, len(self._candidates))
+                self._candidates[key] = candidate
+            elif source in candidate.sources:
+                # 같은 소스 안의 중복은 가장 높은 순위만 반영
+                continue
+
+            candidate.sources[source] = rank
+            candidate.score += weight * contribution
+
+    def _rrf_scores(self, results: list[QueryResult]) -> list[float]:
+        return [1.0 / (self.rrf_k + rank) for rank in range(1, len(results) + 1)]
+
+    def _normalized_scores(self, results: list[QueryResult]) -> list[float]:
+        scores = [result.get("score") for result in results]
+        if not all(isinstance(s, (int, float)) for s in scores):
+            # 점수가 없는 소스는 순위 기반 점수 사용
+            n = len(results)
+            return [1.0 - rank / n for rank in range(n)]
+
+        low, high = min(scores), max(scores)
+        if high == low:
+            return [1.0] * len(scores)
+        return [(s - low) / (high - low) for s in scores]
+
+    def top_k(self, k: int) -> list[QueryResult]:
+        """
+        융합 점수 상위 k개 결과
+
+        Returns:
+            list[QueryResult]: 원본 결과에 fused_score, fused_sources가 추가된 복사본
+        """
+        best = heapq.nlargest(
+            k,
+            self._candidates.values(),
+            key=lambda c: (c.score, -c.order),
+        )
+        return [
+            {
+                **candidate.result,
+                "fused_score": round(candidate.score, 6),
+                "fused_sources": candidate.sources,
+            }
+            for candidate in best
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """융합 통계 (입력 결과 수, 고유 후보 수, 제거된 중복 수)"""
+        return {
+            "method": self.method,
+            "results_seen": self._seen,
+            "candidates": len(self._candidates),
+            "duplicates": self._seen - len(self._candidates),
+        }
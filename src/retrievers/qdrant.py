@@ -265,6 +265,20 @@ class QdrantRetriever(Retriever):
                 error=str(e),
             )
 
+    async def warm_up(self) -> dict[str, Any]:
+        """
+        클라이언트 연결과 임베딩 모델을 미리 로드
+
+        임베딩 모델은 첫 호출 시 로드되므로 더미 텍스트를 한 번 임베딩합니다.
+        """
+        client = await self._client_manager.get_client()
+        collections = client.get_collections().collections
+        await self._embed_text("warm-up")
+        self._log_operation(
+            "warm_up", collections=len(collections), model=self.embedding_model
+        )
+        return {"collections": len(collections), "embedding_model": self.embedding_model}
+
     async def create_collection(
         self,
         collection_name: str,
@@ -0,0 +1,598 @@
+"""
+리트리버 복원력 계층 (Resilience Layer)
+
+Retriever.retrieve 호출을 감싸서 느리거나 장애가 난 백엔드가
+전체 요청 지연을 끌어올리지 않도록 합니다.
+
+구성 요소:
+    LatencyTracker: 최근 호출 지연의 롤링 윈도우와 백분위수
+    CircuitBreaker: 연속 실패 시 일정 시간 즉시 실패 (closed → open → half_open)
+    RetryBudget: 재시도·헤지 요청에 쓰는 공유 토큰 버킷 (재시도 폭주 방지)
+    ResilientRetriever: 위 구성 요소를 적용하는 리트리버 데코레이터
+
+동작:
+    - 적응형 타임아웃: p99 × 배수를 [min_timeout, max_timeout] 범위로 제한
+    - 헤지 요청: p95가 지나도 응답이 없으면 같은 요청을 한 번 더 보내고
+      먼저 끝난 쪽을 사용
+    - 재시도: 일시적 오류(연결, 전송, 타임아웃, 429/5xx)만, 재시도 예산이
+      남아 있을 때만 수행. Retry-After가 max_retry_wait보다 길면 재시도하지 않음
+    - 쓰기일 수 있는 쿼리(Retriever.is_read_only가 False)는 두 번 실행될 수
+      있으므로 헤지도 재시도도 하지 않음
+    - 서킷 브레이커는 일시적 오류만 실패로 셉니다. 구문 오류나 권한 오류처럼
+      요청 자체가 잘못된 경우는 백엔드가 응답한 것이므로 성공으로 기록해
+      한 클라이언트의 잘못된 요청이 다른 사용자의 호출을 막지 않게 합니다
+
+타임아웃과 헤지는 첫 결과가 나올 때까지 적용됩니다. 첫 결과를 먼저 낸 쪽의
+스트림을 그대로 이어서 yield 하므로 서버 측 커서 스트리밍이 유지됩니다.
+
+사용 예시:
+    ```python
+    retriever = ResilientRetriever(TavilyRetriever(config), name="tavily")
+    async for result in retriever.retrieve("query"):
+        ...
+    retriever.get_stats()["breaker"]["state"]  # "closed"
+    ```
+"""
+
+import asyncio
+import sys
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Optional
+
+from src.retrievers.base import (
+    ConnectionError as RetrieverConnectionError,
+    QueryError,
+    QueryResult,
+    Retriever,
+    RetrieverError,
+    RetrieverHealth,
+)
+
+# 연결 예외(08), 자원 부족(53), 운영자 개입(57P: 종료, 연결 불가)
+_TRANSIENT_SQLSTATES = ("08", "53", "57P")
+
+# 결과 없이 끝난 스트림
+_END = object()
+
+
+class CircuitOpenError(RetrieverError):
+    """
+    서킷 브레이커가 열려 있어 호출하지 않고 즉시 실패한 경우 발생합니다.
+    """
+
+    pass
+
+
+def _is_transport_error(error: BaseException) -> bool:
+    if isinstance(error, (OSError, TimeoutError, RetrieverConnectionError)):
+        return True
+    sqlstate = getattr(error, "sqlstate", None)
+    if isinstance(sqlstate, str) and sqlstate.startswith(_TRANSIENT_SQLSTATES):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int) and (status_code == 429 or status_code >= 500):
+        return True
+    # 백엔드 클라이언트 라이브러리는 이미 로드된 경우에만 확인 (임포트 비용 없음)
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        return True
+    asyncpg = sys.modules.get("asyncpg")
+    return asyncpg is not None and isinstance(
+        error, asyncpg.exceptions.ConnectionDoesNotExistError
+    )
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    재시도와 서킷 브레이커 대상인 일시적 백엔드/전송 오류인지 확인
+
+    리트리버가 감싼 원래 예외(__cause__, __context__)까지 확인합니다.
+    구문 오류, 권한 오류, 잘못된 매개변수 같은 요청 오류는 False입니다.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, RetrieverError):
+        details = error.details
+        if "timeout" in details or "retry_after" in details:
+            return True
+        status_code = details.get("status_code")
+        if isinstance(status_code, int) and status_code >= 500:
+            return True
+
+    seen: set[int] = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        if _is_transport_error(current):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class LatencyTracker:
+    """최근 호출 지연(초)의 롤링 윈도우"""
+
+    def __init__(self, window: int = 256, min_samples: int = 20):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        q 백분위수 (0.0 ~ 1.0)
+
+        Returns:
+            샘플이 min_samples보다 적으면 None
+        """
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+
+class CircuitState(str, Enum):
+    """서킷 브레이커 상태"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커
+
+    failure_threshold번 연속 실패하면 열리고, recovery_timeout이 지나면
+    half_open 상태에서 탐색 요청 하나만 통과시킵니다. 탐색 요청이 성공하면
+    닫히고, 실패하면 다시 열립니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+        self._open_count = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_started_at = None
+        return self._state
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인 (half_open이면 탐색 요청 하나만 허용)"""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.OPEN:
+            return False
+
+        now = self._clock()
+        # 탐색 요청이 취소되어 결과가 기록되지 않은 경우에도 다시 탐색할 수 있도록
+        if (
+            self._probe_started_at is None
+            or now - self._probe_started_at >= self.recovery_timeout
+        ):
+            self._probe_started_at = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            if self._state is not CircuitState.OPEN:
+                self._open_count += 1
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+            self._probe_started_at = None
+
+    def snapshot(self) -> dict[str, Any]:
+        state = self.state
+        snapshot: dict[str, Any] = {
+            "state": state.value,
+            "consecutive_failures": self._failures,
+            "open_count": self._open_count,
+        }
+        if state is CircuitState.OPEN:
+            snapshot["retry_in"] = round(
+                max(0.0, self.recovery_timeout - (self._clock() - self._opened_at)), 3
+            )
+        return snapshot
+
+
+class RetryBudget:
+    """
+    재시도 예산 (토큰 버킷)
+
+    요청마다 ratio만큼 토큰이 쌓이고 재시도·헤지 요청 하나가 토큰 하나를 씁니다.
+    트래픽이 적을 때를 위해 초당 min_per_second만큼은 항상 보충됩니다.
+    프로세스 안의 모든 리트리버가 하나의 예산을 공유하므로 장애 시에도
+    추가 부하가 전체 요청의 ratio 비율을 넘지 않습니다.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_per_second: float = 1.0,
+        max_tokens: float = 100.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._clock = clock
+
+        self._tokens = min_per_second
+        self._last_refill = clock()
+        self._acquired = 0
+        self._denied = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_per_second)
+
+    def record_request(self) -> None:
+        """최초 요청 하나를 기록하고 예산을 적립"""
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """재시도 토큰 획득 (예산이 없으면 False)"""
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self._acquired += 1
+            return True
+        self._denied += 1
+        return False
+
+    def snapshot(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "tokens": round(self._tokens, 3),
+            "acquired": self._acquired,
+            "denied": self._denied,
+        }
+
+
+# 별도로 지정하지 않은 리트리버가 공유하는 기본 재시도 예산
+_default_retry_budget = RetryBudget()
+
+
+async def _aclose(stream: AsyncIterator[Any]) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception:
+            pass
+
+
+class ResilientRetriever(Retriever):
+    """
+    적응형 타임아웃, 헤지 요청, 서킷 브레이커, 재시도 예산을 적용하는 데코레이터
+
+    연결·해제는 내부 리트리버에 위임하고, 백엔드 전용 메서드
+    (upsert, transaction 등)도 그대로 위임합니다.
+    """
+
+    def __init__(
+        self,
+        inner: Retriever,
+        name: Optional[str] = None,
+        min_timeout: float = 0.5,
+        max_timeout: float = 30.0,
+        timeout_multiplier: float = 2.0,
+        hedge: bool = True,
+        hedge_quantile: float = 0.95,
+        max_retries: int = 1,
+        max_retry_wait: float = 2.0,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        latency_window: int = 256,
+        min_samples: int = 20,
+    ):
+        """
+        복원력 데코레이터 초기화
+
+        Args:
+            inner: 감쌀 리트리버
+            name: 로그·통계에 사용할 이름 (기본값: 내부 클래스 이름)
+            min_timeout, max_timeout: 적응형 타임아웃 범위 (초)
+            timeout_multiplier: p99에 곱할 배수
+            hedge: p95 이후 헤지 요청 사용 여부
+            hedge_quantile: 헤지 요청을 보낼 지연 백분위수
+            max_retries: 실패 시 최대 재시도 횟수
+            max_retry_wait: 이보다 긴 Retry-After는 재시도하지 않음 (초)
+            failure_threshold, recovery_timeout: 서킷 브레이커 설정
+            breaker: 직접 지정할 서킷 브레이커
+            retry_budget: 공유 재시도 예산 (기본값: 프로세스 공용 예산)
+            latency_window, min_samples: 지연 통계 윈도우 크기와 최소 샘플 수
+        """
+        super().__init__(inner.config)
+        self.inner = inner
+        self.name = name or inner.__class__.__name__
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.max_retries = max_retries
+        self.max_retry_wait = max_retry_wait
+
+        self.breaker = breaker or CircuitBreaker(failure_threshold, recovery_timeout)
+        self.retry_budget = retry_budget or _default_retry_budget
+        self.latency = LatencyTracker(latency_window, min_samples)
+
+        self._stats = {
+            "calls": 0,
+            "failures": 0,
+            "timeouts": 0,
+            "retries": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "short_circuited": 0,
+            "client_errors": 0,
+        }
+
+    def __getattr__(self, item: str) -> Any:
+        # 백엔드 전용 메서드는 내부 리트리버로 위임
+        if item == "inner":
+            raise AttributeError(item)
+        return getattr(self.inner, item)
+
+    @property
+    def connected(self) -> bool:
+        return self.inner.connected
+
+    async def connect(self) -> None:
+        await self.inner.connect()
+
+    async def disconnect(self) -> None:
+        await self.inner.disconnect()
+
+    def is_read_only(self, query: str) -> bool:
+        return self.inner.is_read_only(query)
+
+    def current_timeout(self) -> float:
+        """p99 기반 적응형 타임아웃 (샘플이 부족하면 max_timeout)"""
+        p99 = self.latency.percentile(0.99)
+        if p99 is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, p99 * self.timeout_multiplier))
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤지 요청 전 대기 시간 (헤지를 쓰지 않거나 샘플이 부족하면 None)"""
+        if not self.hedge:
+            return None
+        return self.latency.percentile(self.hedge_quantile)
+
+    async def retrieve(
+        self, query: str, limit: int = 10, **kwargs: Any
+    ) -> AsyncIterator[QueryResult]:
+        """
+        복원력 정책을 적용해 검색
+
+        첫 결과까지는 타임아웃, 헤지, 재시도를 적용하고, 이후 결과는
+        첫 결과를 낸 스트림에서 그대로 이어서 yield 합니다.
+
+        Raises:
+            CircuitOpenError: 서킷 브레이커가 열려 있는 경우
+            QueryError: 타임아웃 또는 재시도 후에도 실패한 경우
+        """
+        if not self.breaker.allow_request():
+            self._stats["short_circuited"] += 1
+            raise CircuitOpenError(
+                f"{self.name} circuit breaker is open",
+                self.name,
+                self.breaker.snapshot(),
+            )
+
+        self._stats["calls"] += 1
+        self.retry_budget.record_request()
+        # 쓰기일 수 있는 쿼리는 두 번 실행되지 않도록 헤지·재시도하지 않음
+        idempotent = self.inner.is_read_only(query)
+
+        attempt = 0
+        while True:
+            try:
+                stream, first = await self._start(query, limit, kwargs, idempotent)
+                break
+            except Exception as e:
+                self._record_failure(e)
+                wait = self._retry_wait(e) if idempotent else None
+                if (
+                    attempt < self.max_retries
+                    and wait is not None
+                    and self.breaker.allow_request()
+                    and self.retry_budget.try_acquire()
+                ):
+                    attempt += 1
+                    self._stats["retries"] += 1
+                    self._log_operation(
+                        "retry", retriever=self.name, attempt=attempt, error=str(e)
+                    )
+                    if wait:
+                        await asyncio.sleep(wait)
+                    continue
+                raise
+
+        self.breaker.record_success()
+        try:
+            if first is not _END:
+                yield first
+                async for result in stream:
+                    yield result
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        finally:
+            await _aclose(stream)
+
+    def _record_failure(self, error: Exception) -> None:
+        """일시적 오류만 서킷 브레이커 실패로 기록"""
+        self._stats["failures"] += 1
+        if is_transient_error(error):
+            self.breaker.record_failure()
+        else:
+            # 요청 오류: 백엔드는 응답했으므로 다른 사용자의 호출을 막지 않음
+            self._stats["client_errors"] += 1
+            self.breaker.record_success()
+
+    def _retry_wait(self, error: Exception) -> Optional[float]:
+        """재시도 전 대기 시간 (재시도하지 않을 오류면 None)"""
+        if not is_transient_error(error):
+            return None
+        retry_after = (
+            error.details.get("retry_after") if isinstance(error, RetrieverError) else None
+        )
+        if retry_after is None:
+            return 0.0
+        if retry_after > self.max_retry_wait:
+            return None
+        return float(retry_after)
+
+    @staticmethod
+    async def _first(stream: AsyncIterator[QueryResult]) -> Any:
+        """스트림의 첫 결과 (결과가 없으면 _END)"""
+        try:
+            return await anext(stream)
+        except StopAsyncIteration:
+            return _END
+
+    async def _start(
+        self, query: str, limit: int, kwargs: dict[str, Any], hedge: bool
+    ) -> tuple[AsyncIterator[QueryResult], Any]:
+        """
+        타임아웃과 헤지 요청을 적용해 첫 결과까지 기다린 한 번의 시도
+
+        Returns:
+            첫 결과를 먼저 낸 스트림과 그 첫 결과 (결과가 없으면 _END)
+        """
+        loop = asyncio.get_running_loop()
+        timeout = self.current_timeout()
+        hedge_delay = self.hedge_delay() if hedge else None
+        started = loop.time()
+
+        streams: dict[asyncio.Task, AsyncIterator[QueryResult]] = {}
+
+        def launch() -> asyncio.Task:
+            stream = aiter(self.inner.retrieve(query, limit=limit, **kwargs))
+            task = asyncio.create_task(self._first(stream))
+            streams[task] = stream
+            return task
+
+        primary = launch()
+        pending = {primary}
+        winner: Optional[asyncio.Task] = None
+        error: Optional[BaseException] = None
+        try:
+            async with asyncio.timeout(timeout):
+                if hedge_delay is not None and hedge_delay < timeout:
+                    done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+                    if not done and self.retry_budget.try_acquire():
+                        self._stats["hedged"] += 1
+                        pending.add(launch())
+
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        error = task.exception()
+                        if error is None:
+                            if task is not primary:
+                                self._stats["hedge_wins"] += 1
+                            self.latency.record(loop.time() - started)
+                            winner = task
+                            return streams[task], task.result()
+        except TimeoutError:
+            self._stats["timeouts"] += 1
+            # 느려진 백엔드에 맞춰 타임아웃이 늘어날 수 있도록 제한 시간을 샘플로 기록
+            self.latency.record(timeout)
+            raise QueryError(
+                f"{self.name} timed out after {timeout:.2f}s",
+                self.name,
+                {"timeout": timeout},
+            ) from None
+        finally:
+            # 진 쪽(또는 제한 시간을 넘긴) 시도를 취소하고 스트림 정리
+            losers = [task for task in streams if task is not winner]
+            for task in losers:
+                task.cancel()
+            await asyncio.gather(*losers, return_exceptions=True)
+            for task in losers:
+                await _aclose(streams[task])
+
+        # 모든 시도가 실패한 경우 마지막 오류 전파
+        raise error  # type: ignore[misc]
+
+    async def warm_up(self) -> dict[str, Any]:
+        return await self.inner.warm_up()
+
+    async def health_check(self) -> RetrieverHealth:
+        """내부 리트리버 상태에 서킷 브레이커 상태를 더해 반환"""
+        health = await self.inner.health_check()
+        details = dict(health.details or {})
+        details["resilience"] = self.get_stats()
+
+        if self.breaker.state is CircuitState.OPEN:
+            return health.model_copy(
+                update={
+                    "healthy": False,
+                    "details": details,
+                    "error": health.error or "circuit breaker open",
+                }
+            )
+        return health.model_copy(update={"details": details})
+
+    def get_stats(self) -> dict[str, Any]:
+        """복원력 통계 (브레이커 상태, 현재 타임아웃, 지연 백분위수, 카운터)"""
+        percentiles = {
+            f"p{int(q * 100)}_ms": (
+                round(value * 1000, 2)
+                if (value := self.latency.percentile(q)) is not None
+                else None
+            )
+            for q in (0.5, 0.95, 0.99)
+        }
+        return {
+            "breaker": self.breaker.snapshot(),
+            "timeout": round(self.current_timeout(), 3),
+            "latency": {"samples": len(self.latency), **percentiles},
+            **self._stats,
+            "retry_budget": self.retry_budget.snapshot(),
+        }
@@ -0,0 +1,228 @@
+"""
+PostgreSQL 준비된 문 레지스트리
+
+asyncpg는 연결마다 SQL 문자열을 키로 하는 준비된 문 캐시(LRU,
+statement_cache_size)를 둡니다. 공백만 다른 같은 쿼리도 다른 키가 되어
+매번 파싱과 실행 계획 수립을 다시 하므로, 이 레지스트리는 SQL을
+정규화된 형태(shape)로 바꿔 같은 형태의 쿼리가 항상 같은 문자열로
+실행되게 합니다.
+
+    1. 정규화: 리터럴, 따옴표 식별자, 달러 인용, 주석 밖의 공백을 하나로
+       합치고 끝의 세미콜론 제거
+    2. LRU: 연결의 statement_cache_size와 같은 크기로 최근 형태만 유지
+    3. 통계: 형태별 호출 수, 오류 수, 행 수, 평균/최대 지연
+    4. 무효화: 스키마 변경(캐시된 계획의 결과 형식 변경) 시 전체 초기화
+
+값(검색어, 필터 값, LIMIT)은 항상 바인드 매개변수로 전달해야
+형태가 값에 따라 달라지지 않습니다.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# 공백을 합쳐도 되는 일반 토큰 (따옴표, 달러 인용, 주석 시작 문자 제외)
+_PLAIN = re.compile(r"[^\s'\"$/-]+|[$/-]")
+_DOLLAR_TAG = re.compile(r"\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$")
+_IDENT_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$"
+)
+
+
+def _quoted_end(sql: str, start: int, quote: str, backslash: bool = False) -> int:
+    """start의 따옴표로 시작한 리터럴/식별자의 끝 위치 (겹친 따옴표 이스케이프 포함)"""
+    i = start + 1
+    while i < len(sql):
+        char = sql[i]
+        if backslash and char == "\\":
+            i += 2
+        elif char == quote:
+            if sql.startswith(quote, i + 1):
+                i += 2
+            else:
+                return i + 1
+        else:
+            i += 1
+    return len(sql)
+
+
+def _block_comment_end(sql: str, start: int) -> int:
+    """/* */ 주석의 끝 위치 (PostgreSQL처럼 중첩 허용)"""
+    depth, i = 0, start
+    while i < len(sql):
+        if sql.startswith("/*", i):
+            depth += 1
+            i += 2
+        elif sql.startswith("*/", i):
+            depth -= 1
+            i += 2
+            if depth == 0:
+                return i
+        else:
+            i += 1
+    return len(sql)
+
+
+def _verbatim_end(sql: str, i: int) -> int:
+    """i에서 시작하는 보존 구간(리터럴, 식별자, 달러 인용, 주석)의 끝, 없으면 -1"""
+    char = sql[i]
+    prev = sql[i - 1] if i else ""
+    if char == "'":
+        # E'...'는 백슬래시 이스케이프 허용
+        escape = prev in "eE" and (i < 2 or sql[i - 2] not in _IDENT_CHARS)
+        return _quoted_end(sql, i, "'", backslash=escape)
+    if char == '"':
+        return _quoted_end(sql, i, '"')
+    if sql.startswith("--", i):
+        # 줄 주석은 끝의 줄바꿈까지 보존 (합치면 다음 줄이 주석이 됨)
+        newline = sql.find("\n", i)
+        return len(sql) if newline < 0 else newline + 1
+    if sql.startswith("/*", i):
+        return _block_comment_end(sql, i)
+    if char == "$" and prev not in _IDENT_CHARS:
+        tag = _DOLLAR_TAG.match(sql, i)
+        if tag:
+            close = sql.find(tag.group(0), tag.end())
+            return len(sql) if close < 0 else close + len(tag.group(0))
+    return -1
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    SQL을 정규화된 형태로 변환
+
+    문자열 리터럴, 따옴표 식별자, 달러 인용 본문, 주석은 그대로 두고
+    그 밖의 공백만 하나로 합칩니다.
+    """
+    parts = []
+    i = 0
+    while i < len(sql):
+        if sql[i].isspace():
+            while i < len(sql) and sql[i].isspace():
+                i += 1
+            parts.append(" ")
+            continue
+        end = _verbatim_end(sql, i)
+        if end < 0:
+            end = _PLAIN.match(sql, i).end()
+        parts.append(sql[i:end])
+        i = end
+    return "".join(parts).strip().rstrip(";").rstrip()
+
+
+@dataclass
+class StatementStats:
+    """준비된 문 하나의 실행 통계"""
+
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_used: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "avg_ms": round(self.avg_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class PreparedStatementRegistry:
+    """
+    정규화된 SQL 형태별 준비된 문 레지스트리
+
+    register()가 돌려준 문자열로 쿼리를 실행하면 asyncpg의 연결별
+    문 캐시에 적중합니다. max_size를 연결의 statement_cache_size와
+    맞춰 레지스트리에 남은 형태가 곧 캐시에 남은 문이 되도록 합니다.
+
+    Example:
+        ```python
+        registry = PreparedStatementRegistry(max_size=100)
+        sql = registry.register("SELECT *  FROM docs WHERE id = $1")
+        rows = await conn.fetch(sql, 42)
+        registry.record(sql, elapsed_ms=1.2, rows=len(rows))
+        ```
+    """
+
+    def __init__(self, max_size: int = 100):
+        self.max_size = max(1, max_size)
+        self._statements: OrderedDict[str, StatementStats] = OrderedDict()
+        self._raw: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def register(self, sql: str) -> str:
+        """SQL의 정규화된 형태를 등록하고 실행할 문자열 반환"""
+        shape = self._raw.get(sql)
+        if shape is None:
+            shape = normalize_sql(sql)
+            if len(self._raw) >= self.max_size * 4:
+                self._raw.clear()
+            self._raw[sql] = shape
+
+        if shape in self._statements:
+            self.hits += 1
+            self._statements.move_to_end(shape)
+        else:
+            self.misses += 1
+            self._statements[shape] = StatementStats()
+            if len(self._statements) > self.max_size:
+                self._statements.popitem(last=False)
+                self.evictions += 1
+        return shape
+
+    def record(
+        self, shape: str, elapsed_ms: float, rows: int = 0, error: bool = False
+    ) -> None:
+        """실행 결과 기록 (제거된 형태는 무시)"""
+        stats = self._statements.get(shape)
+        if stats is None:
+            return
+        stats.calls += 1
+        stats.errors += int(error)
+        stats.rows += rows
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        stats.last_used = time.time()
+
+    def invalidate(self) -> int:
+        """
+        스키마 변경 시 전체 초기화
+
+        Returns:
+            int: 제거된 형태 수
+        """
+        removed = len(self._statements)
+        self._statements.clear()
+        self._raw.clear()
+        self.invalidations += 1
+        return removed
+
+    def get_stats(self, top: int = 20) -> dict[str, Any]:
+        """레지스트리 통계와 총 지연이 큰 순서의 형태별 통계"""
+        lookups = self.hits + self.misses
+        slowest = sorted(
+            self._statements.items(), key=lambda item: item[1].total_ms, reverse=True
+        )[:top]
+        return {
+            "size": len(self._statements),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "statements": {shape: stats.to_dict() for shape, stats in slowest},
+        }
@@ -6,7 +6,7 @@ Tavily는 AI 최적화 검색 결과를 제공하는 전문 검색 API입니다.
 
 주요 기능:
     - 비동기 웹 검색
-    - 속도 제한 처리 및 자동 재시도
+    - 속도 제한 감지 (Retry-After를 QueryError.details로 전달)
     - 도메인 포함/제외 필터링
     - 검색 깊이 설정 (basic/advanced)
     - 결과 점수 기반 정렬
@@ -17,7 +17,6 @@ Tavily는 AI 최적화 검색 결과를 제공하는 전문 검색 API입니다.
 
 from typing import AsyncIterator, Any
 import httpx
-import asyncio
 
 from src.retrievers.base import (
     Retriever,
@@ -185,6 +184,19 @@ class TavilyRetriever(Retriever):
 
                 yield self._format_result(result)
 
+        except httpx.HTTPStatusError as e:
+            details: dict[str, Any] = {"status_code": e.response.status_code}
+            if e.response.status_code == 429:
+                # Retry-After 헤더에서 대기 시간 추출 (기본값: 1초)
+                try:
+                    details["retry_after"] = float(
+                        e.response.headers.get("Retry-After", "1")
+                    )
+                except ValueError:
+                    details["retry_after"] = 1.0
+            self._log_operation("retrieve", status="failed", error=str(e), **details)
+            raise QueryError(f"Search failed: {e}", "TavilyRetriever", details)
+
         except httpx.HTTPError as e:
             self._log_operation("retrieve", status="failed", error=str(e))
             raise QueryError(f"Search failed: {e}", "TavilyRetriever")
@@ -261,8 +273,7 @@ class TavilyRetriever(Retriever):
         """
         실제 API 검색 요청 수행
 
-        Tavily API에 POST 요청을 보내고 결과를 받아옵니다.
-        속도 제한(429) 에러에 대해 자동 재시도를 수행합니다.
+        Tavily API에 POST 요청을 한 번 보내고 결과를 받아옵니다.
 
         Args:
             query (str): 검색 쿼리
@@ -276,8 +287,7 @@ class TavilyRetriever(Retriever):
                 - query: 원본 쿼리
 
         Raises:
-            httpx.HTTPError: API 요청 실패 시
-            RuntimeError: 클라이언트 초기화 오류
+            httpx.HTTPError: API 요청 실패 시 (429 포함)
         """
         # 검색 매개변수 준비
         search_params = {
@@ -288,35 +298,12 @@ class TavilyRetriever(Retriever):
             **kwargs,
         }
 
-        # 속도 제한 처리를 위한 재시도 로직
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                async with self._session_manager.session() as session:
-                    response = await session.post(
-                        f"{self.BASE_URL}/search", json=search_params
-                    )
-                    response.raise_for_status()
-                    return response.json()
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:  # 속도 제한
-                    if attempt < max_retries - 1:
-                        # Retry-After 헤더에서 대기 시간 추출 (기본값: 1초)
-                        retry_after = int(e.response.headers.get("Retry-After", "1"))
-                        self._log_operation(
-                            "search",
-                            status="rate_limited",
-                            retry_after=retry_after,
-                            attempt=attempt + 1,
-                        )
-                        # 지정된 시간만큼 대기 후 재시도
-                        await asyncio.sleep(retry_after)
-                        continue
-                raise
-
-        # 여기에 도달할 수 없지만 타입 체커를 위해 포함
-        raise RuntimeError("Failed to get response from API")
+        # 속도 제한(429)은 요청 경로에서 대기하지 않고 바로 전파합니다.
+        # 재시도 여부와 대기는 호출 측(ResilientRetriever)의 재시도 예산이 결정합니다.
+        async with self._session_manager.session() as session:
+            response = await session.post(f"{self.BASE_URL}/search", json=search_params)
+            response.raise_for_status()
+            return response.json()
 
     def _format_result(self, result: dict[str, Any]) -> QueryResult:
         """
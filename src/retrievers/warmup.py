@@ -0,0 +1,108 @@
+"""
+리트리버 워밍업
+
+서버가 준비 완료를 보고하기 전에 첫 요청의 지연 비용을 미리 지불합니다.
+
+    1. 각 리트리버의 warm_up() (풀 연결 열기, 임베딩 모델 로드)
+    2. 인기 쿼리 파일의 상위 N개로 캐시 적재
+
+쿼리 파일 형식 (JSON Lines, 인기순 정렬):
+    {"source": "tavily", "query": "python asyncio", "limit": 10}
+    {"source": "qdrant", "query": "vector search", "collection": "docs"}
+
+source, query 외의 키는 retrieve()의 매개변수로 전달됩니다.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.retrievers.base import Retriever
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class WarmupQuery:
+    """캐시 적재용 쿼리 한 건"""
+
+    source: str
+    query: str
+    limit: int = 10
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def load_warmup_queries(path: str | Path, top_n: int = 50) -> list[WarmupQuery]:
+    """
+    쿼리 파일에서 상위 top_n개 쿼리 로드
+
+    잘못된 줄은 경고 후 건너뜁니다.
+    """
+    queries: list[WarmupQuery] = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if len(queries) >= top_n:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+                queries.append(
+                    WarmupQuery(
+                        source=entry.pop("source"),
+                        query=entry.pop("query"),
+                        limit=int(entry.pop("limit", 10)),
+                        params=entry,
+                    )
+                )
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.warning(
+                    "워밍업 쿼리 무시", path=str(path), line=line_no, error=str(e)
+                )
+    return queries
+
+
+async def prime_cache(
+    retrievers: dict[str, Retriever],
+    queries: list[WarmupQuery],
+    concurrency: int = 4,
+) -> dict[str, int]:
+    """
+    쿼리를 실행해 캐시 적재
+
+    대상 리트리버가 없는 쿼리는 건너뛰고, 실패한 쿼리는 집계만 합니다.
+
+    Returns:
+        dict[str, int]: primed, failed, skipped 건수
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    stats = {"primed": 0, "failed": 0, "skipped": 0}
+
+    async def run(item: WarmupQuery) -> None:
+        retriever = retrievers.get(item.source)
+        if retriever is None:
+            stats["skipped"] += 1
+            return
+        async with semaphore:
+            try:
+                async for _ in retriever.retrieve(
+                    item.query, limit=item.limit, **item.params
+                ):
+                    pass
+                stats["primed"] += 1
+            except Exception as e:
+                stats["failed"] += 1
+                logger.warning(
+                    "워밍업 쿼리 실패",
+                    source=item.source,
+                    query=item.query[:50],
+                    error=str(e),
+                )
+
+    await asyncio.gather(*(run(item) for item in queries))
+    return stats
@@ -26,7 +26,8 @@
 """
 
 import asyncio
-from typing import Any, Optional, Dict, List
+import json
+from typing import TYPE_CHECKING, Any, Optional, Dict, List
 from contextlib import asynccontextmanager
 import structlog
 import uuid
@@ -35,6 +36,7 @@ from datetime import datetime, timezone
 
 from fastmcp import FastMCP, Context
 from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware
 
 # FastMCP auth imports
 # from fastmcp.server.auth import BearerAuthProvider  # OAuth 2.0용이므로 커스텀 JWT에는 부적합
@@ -49,24 +51,27 @@ from src.config import ServerConfig
 
 # 리트리버 관련 임포트
 from src.retrievers.factory import RetrieverFactory
-from src.retrievers.base import Retriever, RetrieverConfig, QueryError
-
-# 미들웨어 임포트
-from src.middleware import (
-    LoggingMiddleware,
-    RateLimitMiddleware,
-    ValidationMiddleware,
-    MetricsMiddleware,
-    ErrorHandlerMiddleware,
+from src.retrievers.base import (
+    ConnectionError,
+    QueryError,
+    Retriever,
+    RetrieverConfig,
 )
-# from src.middleware.jwt_auth import JWTAuthMiddleware  # FastMCP BearerAuthProvider로 대체됨
+from src.retrievers.fusion import FUSION_METHODS, ResultFusion
+from src.retrievers.resilience import CircuitState, ResilientRetriever, RetryBudget
+from src.retrievers.warmup import load_warmup_queries, prime_cache
 
-# 인증 서비스 임포트
-from src.auth.services.jwt_service import JWTService
-from src.auth.services.rbac_service import RBACService
-from src.auth.verifiers import JWTBearerVerifier
+# 미들웨어 임포트 (기능별 미들웨어는 _init_components에서 활성화된 것만 임포트)
+from src.middleware import MiddlewarePipeline
+# from src.middleware.jwt_auth import JWTAuthMiddleware  # FastMCP BearerAuthProvider로 대체됨
 
-# 캐시 관련 임포트
+# 인증·캐시·로깅 모듈은 프로파일에서 켠 경우에만 로드 (stdio 서버 시작 시간 단축)
+if TYPE_CHECKING:
+    from src.middleware import LoggingMiddleware, MetricsMiddleware
+    from src.utils.log_sink import AsyncLogSink
+    from src.auth.services.jwt_service import JWTService
+    from src.auth.services.rbac_service import RBACService
+    from src.auth.verifiers import JWTBearerVerifier
 
 # 구조화된 로깅 설정
 logger = structlog.get_logger(__name__)
@@ -120,6 +125,19 @@ class UnifiedMCPServer:
     모든 기존 서버 파일의 기능을 하나로 통합합니다.
     """
 
+    _RETRIEVER_LABELS = {"tavily": "Tavily", "postgres": "PostgreSQL", "qdrant": "Qdrant"}
+
+    # 데이터베이스 레코드 도구로 쓸 수 있는 테이블
+    _WRITABLE_TABLES = (
+        "users",
+        "documents",
+        "metadata",
+        "content",
+        "search_history",
+        "configurations",
+        "logs",
+    )
+
     def __init__(self, config: ServerConfig):
         """
         서버 초기화
@@ -130,21 +148,35 @@ class UnifiedMCPServer:
         self.config = config
         self.retrievers: Dict[str, Retriever] = {}
         self.factory = RetrieverFactory.get_default()
+        # 모든 리트리버가 공유하는 재시도 예산
+        self.retry_budget = RetryBudget(
+            ratio=config.retriever_config.retry_budget_ratio
+            if config.retriever_config
+            else 0.1
+        )
+        # 지연 연결 진행 중인 작업 (리트리버 이름별 단일 연결 시도)
+        self._connect_tasks: Dict[str, asyncio.Task] = {}
+        # 준비 상태: starting → (warming) → ready
+        self.readiness = "starting"
+        self._startup_task: Optional[asyncio.Task] = None
         self.middlewares: List[Any] = []
         self.context_store: Optional[Dict[str, UserContext]] = None
 
         # 미들웨어 인스턴스 저장 (라이프사이클 관리용)
-        self.metrics_middleware: Optional[MetricsMiddleware] = None
+        self.metrics_middleware: Optional["MetricsMiddleware"] = None
+        self.middleware_pipeline: Optional[MiddlewarePipeline] = None
+        self.logging_middleware: Optional["LoggingMiddleware"] = None
+        self.log_sink: Optional["AsyncLogSink"] = None
         self.jwt_auth_middleware = (
             None  # Removed - using FastMCP BearerAuthProvider instead
         )
 
         # Bearer 인증 검증기 (현재 미사용)
-        self.bearer_verifier: Optional[JWTBearerVerifier] = None
+        self.bearer_verifier: Optional["JWTBearerVerifier"] = None
 
         # 인증 서비스 인스턴스
-        self.jwt_service: Optional[JWTService] = None
-        self.rbac_service: Optional[RBACService] = None
+        self.jwt_service: Optional["JWTService"] = None
+        self.rbac_service: Optional["RBACService"] = None
 
         # 설정 검증 (Docker 배포용 임시 우회)
         # is_valid, errors = validate_config(config)
@@ -172,6 +204,8 @@ class UnifiedMCPServer:
         # 미들웨어 초기화 (순서 중요!)
         # 1. 에러 핸들러 (가장 바깥층)
         if self.config.features["error_handler"]:
+            from src.middleware import ErrorHandlerMiddleware
+
             include_details = (
                 self.config.logging_config
                 and self.config.logging_config.log_level == "DEBUG"
@@ -192,6 +226,10 @@ class UnifiedMCPServer:
                 logger.error("JWT_SECRET_KEY가 설정되지 않았습니다")
                 raise ValueError("JWT_SECRET_KEY는 필수 설정입니다")
 
+            from src.auth.services.jwt_service import JWTService
+            from src.auth.services.rbac_service import RBACService
+            from src.auth.verifiers import JWTBearerVerifier
+
             self.jwt_service = JWTService(
                 secret_key=self.config.auth_config.jwt_secret_key,
                 algorithm=self.config.auth_config.jwt_algorithm,
@@ -220,22 +258,50 @@ class UnifiedMCPServer:
 
         # 3. 로깅
         if self.config.features["enhanced_logging"] and self.config.logging_config:
-            self.middlewares.append(
-                LoggingMiddleware(
-                    log_request_body=self.config.logging_config.log_request_body,
-                    log_response_body=self.config.logging_config.log_response_body,
-                    sensitive_fields=self.config.logging_config.sensitive_fields,
+            from src.middleware import LoggingMiddleware
+            from src.utils.log_sink import AsyncLogSink
+
+            logging_config = self.config.logging_config
+            if logging_config.async_sink:
+                self.log_sink = AsyncLogSink(
+                    max_queue_size=logging_config.log_queue_size,
+                    batch_size=logging_config.log_batch_size,
+                    flush_interval=logging_config.log_flush_interval,
                 )
+            self.logging_middleware = LoggingMiddleware(
+                log_request_body=logging_config.log_request_body,
+                log_response_body=logging_config.log_response_body,
+                sensitive_fields=logging_config.sensitive_fields,
+                sink=self.log_sink,
+                success_sample_rate=logging_config.success_sample_rate,
             )
-            logger.debug("로깅 미들웨어 초기화")
+            self.middlewares.append(self.logging_middleware)
+            logger.debug("로깅 미들웨어 초기화", async_sink=logging_config.async_sink)
 
         # 4. 유효성 검사
         if self.config.features["validation"]:
-            self.middlewares.append(ValidationMiddleware(validate_params=True))
+            from src.middleware import ValidationMiddleware
+
+            # 메서드 허용 목록 대신 FastMCP에 맡기고(resources/list 등),
+            # 도구 권한은 RBAC 서비스 기준으로 검사 (인증 비활성 시 검사 생략)
+            self.middlewares.append(
+                ValidationMiddleware(
+                    allowed_methods=None,
+                    tool_permissions=None,
+                    validate_params=True,
+                    permission_checker=(
+                        self.rbac_service.check_tool_permission
+                        if self.rbac_service
+                        else None
+                    ),
+                )
+            )
             logger.debug("유효성 검사 미들웨어 초기화")
 
         # 5. 속도 제한
         if self.config.features["rate_limit"] and self.config.rate_limit_config:
+            from src.middleware import RateLimitMiddleware
+
             # Redis 클라이언트 가져오기 (캐시가 활성화된 경우)
             redis_client = None
             if self.config.features["cache"] and self.config.cache_config:
@@ -248,11 +314,10 @@ class UnifiedMCPServer:
                         max_ttl=3600,
                         key_prefix="mcp_rate_limit",
                     )
-                    # Redis 연결은 async lifecycle에서 처리됨
-                    # 여기서는 Redis URL에서 직접 redis 클라이언트 생성
-                    import redis.asyncio as redis
+                    # 캐시·토큰 저장소와 같은 URL별 공유 연결 풀 사용
+                    from src.utils.redis_pool import get_redis_registry
 
-                    redis_client = redis.from_url(
+                    redis_client = get_redis_registry().get_client(
                         self.config.cache_config.redis_url, decode_responses=True
                     )
                     logger.info("Rate limiter에 Redis 클라이언트 설정")
@@ -266,117 +331,323 @@ class UnifiedMCPServer:
                     burst_size=self.config.rate_limit_config.burst_size,
                     redis_client=redis_client,
                     use_sliding_window=True,
+                    tool_costs=self.config.rate_limit_config.tool_costs,
+                    backend_budgets=self.config.rate_limit_config.backend_budgets,
                 )
             )
             logger.debug("속도 제한 미들웨어 초기화")
 
         # 6. 메트릭
         if self.config.features["metrics"]:
+            from src.middleware import MetricsMiddleware
+
+            # 관리자 분석 대시보드용 시계열 저장소 (Redis URL이 없으면 사용 안 함)
+            timeseries = None
+            try:
+                from src.utils.metrics_store import get_metrics_store
+
+                timeseries = get_metrics_store()
+            except Exception as e:
+                logger.warning(f"메트릭 시계열 저장소 생성 실패: {e}")
+
             self.metrics_middleware = MetricsMiddleware(
-                enable_detailed_metrics=True, metrics_window_seconds=3600
+                enable_detailed_metrics=True,
+                metrics_window_seconds=3600,
+                timeseries=timeseries,
             )
             self.middlewares.append(self.metrics_middleware)
             logger.debug("메트릭 미들웨어 초기화")
 
-    async def init_retrievers(self) -> List[str]:
-        """
-        리트리버 초기화
+        # 딕셔너리 기반 미들웨어는 하나의 컴파일된 파이프라인으로 묶음
+        # (FastMCP 네이티브 미들웨어인 에러 핸들러는 별도로 등록)
+        dict_middlewares = [
+            mw for mw in self.middlewares if not isinstance(mw, Middleware)
+        ]
+        if dict_middlewares:
+            self.middleware_pipeline = MiddlewarePipeline(
+                dict_middlewares, user_resolver=self._resolve_request_user
+            )
+            logger.debug(
+                "미들웨어 파이프라인 컴파일",
+                layers=[type(mw).__name__ for mw in dict_middlewares],
+            )
 
-        Returns:
-            시작 오류 목록
-        """
-        startup_errors = []
+    @staticmethod
+    def _retriever_layer(retriever: Retriever, layer_type: type) -> Optional[Any]:
+        """팩토리가 씌운 데코레이터(캐싱, 복원력) 중 layer_type 계층 찾기"""
+        # 데코레이터는 감싼 리트리버를 inner 속성에 보관 (__getattr__ 위임을 피해 직접 조회)
+        while retriever is not None:
+            if isinstance(retriever, layer_type):
+                return retriever
+            retriever = vars(retriever).get("inner")
+        return None
+
+    def _cache_only_sources(self) -> frozenset[str]:
+        """이 요청에서 백엔드 호출 예산을 넘어 캐시로만 응답할 리트리버 이름"""
+        if not self.config.features["rate_limit"]:
+            return frozenset()
+        from src.middleware.rate_limit import cache_only_backends
+
+        return cache_only_backends()
+
+    def _cache_options(self, retriever: Retriever, use_cache: bool) -> Dict[str, Any]:
+        """요청별 캐시 우회 옵션 (캐싱 계층이 있을 때만 retrieve에 use_cache 전달)"""
+        if use_cache or not self.config.features["cache"]:
+            return {}
+        if not hasattr(retriever, "_use_cache"):
+            return {}
+        return {"use_cache": False}
 
-        if not self.config.retriever_config:
-            logger.error("리트리버 설정이 없음")
-            return ["리트리버 설정이 없음"]
+    async def _retrieve_cached(
+        self, retriever: Retriever, query: str, limit: int, **kwargs: Any
+    ) -> Optional[List[Any]]:
+        """백엔드를 호출하지 않고 캐시된 결과만 조회 (캐싱 계층이 없거나 미스면 None)"""
+        from src.retrievers.caching import CachingRetriever
 
-        # Tavily 초기화
-        try:
-            config: RetrieverConfig = {
+        caching = self._retriever_layer(retriever, CachingRetriever)
+        if caching is None:
+            return None
+        return await caching.get_cached(query, limit=limit, **kwargs)
+
+    async def _invalidate_after_bulk_write(self, retriever: Retriever) -> None:
+        """대량 쓰기 후 결과 캐시, 준비된 문 레지스트리와 컬럼 타입 캐시 무효화"""
+        from src.retrievers.caching import CachingRetriever
+        from src.retrievers.postgres import PostgresRetriever
+
+        caching = self._retriever_layer(retriever, CachingRetriever)
+        if caching is not None:
+            await caching.invalidate_cache()
+        postgres = self._retriever_layer(retriever, PostgresRetriever)
+        if postgres is not None:
+            # 스키마는 그대로이므로 풀 연결은 유지
+            await postgres.invalidate_statements(expire_connections=False)
+
+    def _resilience_options(self) -> Optional[Dict[str, Any]]:
+        """리트리버 팩토리에 전달할 복원력 계층 설정 (비활성화 시 None)"""
+        retriever_config = self.config.retriever_config
+        if not retriever_config or not retriever_config.resilience_enabled:
+            return None
+        return {
+            "hedge": retriever_config.hedge_requests,
+            "max_timeout": retriever_config.retriever_max_timeout,
+            "failure_threshold": retriever_config.breaker_failure_threshold,
+            "recovery_timeout": retriever_config.breaker_recovery_timeout,
+            "retry_budget": self.retry_budget,
+        }
+
+    def _retriever_configs(self) -> Dict[str, RetrieverConfig]:
+        """활성화할 리트리버별 팩토리 설정 (캐싱·복원력 계층 포함)"""
+        retriever_config = self.config.retriever_config
+        configs: Dict[str, RetrieverConfig] = {}
+
+        if retriever_config.tavily_api_key:
+            configs["tavily"] = {
                 "type": "tavily",
-                "api_key": self.config.retriever_config.tavily_api_key or "",
+                "api_key": retriever_config.tavily_api_key,
             }
+        elif "tavily" in retriever_config.enabled_retrievers:
+            logger.warning("Tavily API 키가 제공되지 않아 초기화를 건너뜁니다")
+
+        configs["postgres"] = {
+            "type": "postgres",
+            "dsn": retriever_config.postgres_dsn,
+            "statement_cache_size": retriever_config.postgres_statement_cache_size,
+            "replica_dsns": retriever_config.postgres_replica_dsns,
+            "read_max_connections": retriever_config.postgres_read_pool_size,
+            "max_replica_lag": retriever_config.postgres_max_replica_lag,
+            "pool_autoscale": retriever_config.postgres_pool_autoscale,
+            "pool_target_wait_ms": retriever_config.postgres_pool_target_wait_ms,
+        }
+        configs["qdrant"] = {
+            "type": "qdrant",
+            "host": retriever_config.qdrant_host,
+            "port": retriever_config.qdrant_port,
+        }
 
-            # 캐싱 설정 추가
-            if self.config.features["cache"] and self.config.cache_config:
+        # 설정에서 끈 백엔드는 생성하지 않음 (팩토리가 모듈을 임포트하지 않음)
+        configs = {
+            name: config
+            for name, config in configs.items()
+            if name in retriever_config.enabled_retrievers
+        }
+
+        # 캐싱 설정 추가
+        cache_config = self.config.cache_config
+        if self.config.features["cache"] and cache_config:
+            cache_ttls = {
+                "tavily": cache_config.cache_ttl_web,
+                "postgres": cache_config.cache_ttl_db,
+                "qdrant": cache_config.cache_ttl_vector,
+            }
+            for name, config in configs.items():
                 config.update(
                     {
                         "use_cache": True,
-                        "cache_ttl": self.config.cache_config.cache_ttl_web,
-                        "redis_url": self.config.cache_config.redis_url,
+                        "cache_ttl": cache_ttls[name],
+                        "redis_url": cache_config.redis_url,
                     }
                 )
 
-            if config["api_key"]:
-                retriever = self.factory.create(config)
+        resilience = self._resilience_options()
+        if resilience:
+            for config in configs.values():
+                config["resilience"] = resilience
+
+        return configs
+
+    async def _connect_retriever(self, name: str, retriever: Retriever) -> None:
+        """
+        백엔드별 제한 시간 안에 리트리버 연결
+
+        Raises:
+            ConnectionError: 제한 시간 초과 시
+        """
+        timeout = self.config.retriever_config.connect_timeout
+        try:
+            async with asyncio.timeout(timeout):
                 await retriever.connect()
-                self.retrievers["tavily"] = retriever
+        except TimeoutError:
+            raise ConnectionError(f"{timeout}초 안에 연결되지 않음", name) from None
+
+    async def init_retrievers(self) -> List[str]:
+        """
+        리트리버 초기화
+
+        모든 리트리버를 동시에 연결하므로 시작 시간은 가장 느린 백엔드
+        (최대 connect_timeout)에 맞춰집니다. 연결에 실패한 리트리버는
+        등록하지 않습니다.
+
+        lazy_connect 설정 시에는 리트리버를 생성만 하고 첫 사용 시
+        연결합니다 (_ensure_connected).
+
+        Returns:
+            시작 오류 목록
+        """
+        startup_errors = []
+
+        if not self.config.retriever_config:
+            logger.error("리트리버 설정이 없음")
+            return ["리트리버 설정이 없음"]
+
+        created: Dict[str, Retriever] = {}
+        for name, config in self._retriever_configs().items():
+            try:
+                created[name] = self.factory.create(config)
+            except Exception as e:
+                label = self._RETRIEVER_LABELS[name]
+                logger.error(f"{label} 리트리버 초기화 실패", error=str(e))
+                startup_errors.append(f"{label}: {str(e)}")
+
+        if self.config.retriever_config.lazy_connect:
+            self.retrievers.update(created)
+            logger.info("리트리버 지연 연결 모드 - 첫 사용 시 연결", retrievers=list(created))
+            return startup_errors
+
+        results = await asyncio.gather(
+            *(self._connect_retriever(name, r) for name, r in created.items()),
+            return_exceptions=True,
+        )
+        for (name, retriever), result in zip(created.items(), results):
+            label = self._RETRIEVER_LABELS[name]
+            if isinstance(result, Exception):
+                logger.error(f"{label} 리트리버 초기화 실패", error=str(result))
+                startup_errors.append(f"{label}: {str(result)}")
+            else:
+                self.retrievers[name] = retriever
                 logger.info(
-                    "Tavily 리트리버 초기화 완료", cached=self.config.features["cache"]
+                    f"{label} 리트리버 초기화 완료", cached=self.config.features["cache"]
                 )
-            else:
-                logger.warning("Tavily API 키가 제공되지 않아 초기화를 건너뜁니다")
-        except Exception as e:
-            logger.error("Tavily 리트리버 초기화 실패", error=str(e))
-            startup_errors.append(f"Tavily: {str(e)}")
 
-        # PostgreSQL 초기화
+        return startup_errors
+
+    async def _lazy_connect(self, name: str, retriever: Retriever) -> None:
         try:
-            config: RetrieverConfig = {
-                "type": "postgres",
-                "dsn": self.config.retriever_config.postgres_dsn,
-            }
+            await self._connect_retriever(name, retriever)
+            logger.info("리트리버 지연 연결 완료", retriever=name)
+        except Exception as e:
+            logger.error("리트리버 지연 연결 실패", retriever=name, error=str(e))
+        finally:
+            self._connect_tasks.pop(name, None)
 
-            # 캐싱 설정 추가
-            if self.config.features["cache"] and self.config.cache_config:
-                config.update(
-                    {
-                        "use_cache": True,
-                        "cache_ttl": self.config.cache_config.cache_ttl_db,
-                        "redis_url": self.config.cache_config.redis_url,
-                    }
-                )
+    async def _ensure_connected(self, name: str) -> Optional[Retriever]:
+        """
+        리트리버 반환 (연결되지 않았으면 첫 사용 시 연결)
 
-            retriever = self.factory.create(config)
-            await retriever.connect()
-            self.retrievers["postgres"] = retriever
-            logger.info(
-                "PostgreSQL 리트리버 초기화 완료", cached=self.config.features["cache"]
-            )
-        except Exception as e:
-            logger.error("PostgreSQL 리트리버 초기화 실패", error=str(e))
-            startup_errors.append(f"PostgreSQL: {str(e)}")
+        동시에 들어온 요청은 하나의 연결 시도를 함께 기다립니다.
+        연결에 실패해도 리트리버를 반환하므로 호출자는 connected로 확인합니다.
+        """
+        retriever = self.retrievers.get(name)
+        if retriever is None or retriever.connected:
+            return retriever
+
+        task = self._connect_tasks.get(name)
+        if task is None:
+            task = asyncio.create_task(self._lazy_connect(name, retriever))
+            self._connect_tasks[name] = task
+        # 요청이 취소되어도 다른 대기자를 위해 연결 시도는 계속
+        await asyncio.shield(task)
+        return retriever
+
+    async def warm_up(self) -> Dict[str, Any]:
+        """
+        준비 완료 보고 전 워밍업
 
-        # Qdrant 초기화
-        try:
-            config: RetrieverConfig = {
-                "type": "qdrant",
-                "host": self.config.retriever_config.qdrant_host,
-                "port": self.config.retriever_config.qdrant_port,
-            }
+        1. 아직 연결되지 않은 리트리버 연결 (지연 연결 모드)
+        2. 리트리버별 warm_up (풀 연결 열기, 임베딩 모델 로드)
+        3. 쿼리 파일의 상위 N개 쿼리로 캐시 적재 (캐싱 계층이 있는 리트리버만)
 
-            # 캐싱 설정 추가
-            if self.config.features["cache"] and self.config.cache_config:
-                config.update(
-                    {
-                        "use_cache": True,
-                        "cache_ttl": self.config.cache_config.cache_ttl_vector,
-                        "redis_url": self.config.cache_config.redis_url,
-                    }
+        Returns:
+            리트리버별 워밍업 결과
+        """
+        retriever_config = self.config.retriever_config
+        summary: Dict[str, Any] = {}
+
+        await asyncio.gather(*(self._ensure_connected(name) for name in self.retrievers))
+        connected = {n: r for n, r in self.retrievers.items() if r.connected}
+
+        async def warm(name: str, retriever: Retriever) -> None:
+            try:
+                async with asyncio.timeout(retriever_config.connect_timeout):
+                    summary[name] = await retriever.warm_up()
+            except Exception as e:
+                logger.warning("리트리버 워밍업 실패", retriever=name, error=str(e))
+                summary[name] = {"error": str(e) or type(e).__name__}
+
+        await asyncio.gather(*(warm(n, r) for n, r in connected.items()))
+
+        if retriever_config.warmup_queries_file:
+            from src.retrievers.caching import CachingRetriever
+
+            cached = {
+                n: r
+                for n, r in connected.items()
+                if self._retriever_layer(r, CachingRetriever)
+            }
+            try:
+                queries = load_warmup_queries(
+                    retriever_config.warmup_queries_file, retriever_config.warmup_top_n
+                )
+                summary["cache"] = await prime_cache(cached, queries)
+            except OSError as e:
+                logger.warning(
+                    "워밍업 쿼리 파일을 읽을 수 없음",
+                    path=retriever_config.warmup_queries_file,
+                    error=str(e),
                 )
 
-            retriever = self.factory.create(config)
-            await retriever.connect()
-            self.retrievers["qdrant"] = retriever
-            logger.info(
-                "Qdrant 리트리버 초기화 완료", cached=self.config.features["cache"]
-            )
-        except Exception as e:
-            logger.error("Qdrant 리트리버 초기화 실패", error=str(e))
-            startup_errors.append(f"Qdrant: {str(e)}")
+        return summary
 
-        return startup_errors
+    async def _start_up(self) -> None:
+        """워밍업을 마친 뒤 준비 완료로 전환 (/health 준비 상태 게이트)"""
+        try:
+            if self.config.retriever_config and self.config.retriever_config.warmup_enabled:
+                self.readiness = "warming"
+                summary = await self.warm_up()
+                logger.info("워밍업 완료", summary=summary)
+        except Exception as e:
+            logger.error("워밍업 실패", error=str(e))
+        finally:
+            self.readiness = "ready"
 
     async def cleanup(self):
         """종료 시 정리 작업"""
@@ -388,9 +659,22 @@ class UnifiedMCPServer:
         if self.metrics_middleware:
             final_metrics = await self.metrics_middleware.get_metrics_summary()
             logger.info("최종 서버 메트릭", metrics=final_metrics)
+            # 버퍼에 남은 롤업 기록
+            if self.metrics_middleware.timeseries is not None:
+                await self.metrics_middleware.timeseries.close()
+
+        # 진행 중인 워밍업·지연 연결 취소
+        pending = [*self._connect_tasks.values()]
+        if self._startup_task:
+            pending.append(self._startup_task)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
         # 리트리버 연결 해제
         for name, retriever in self.retrievers.items():
+            if not retriever.connected:
+                continue
             try:
                 await retriever.disconnect()
                 logger.info(f"{name} 리트리버 연결 해제 완료")
@@ -403,6 +687,11 @@ class UnifiedMCPServer:
             logger.debug("컨텍스트 저장소 정리 완료")
 
         self.retrievers.clear()
+
+        # 남은 요청 로그 flush
+        if self.log_sink:
+            self.log_sink.close()
+
         logger.info("통합 MCP 서버 종료 완료")
 
     def create_server(self) -> FastMCP:
@@ -421,7 +710,7 @@ class UnifiedMCPServer:
                 features=self.config.get_enabled_features(),
             )
 
-            # 리트리버 초기화
+            # 리트리버 초기화 (동시 연결, 백엔드별 제한 시간)
             startup_errors = await self.init_retrievers()
 
             logger.info(
@@ -431,6 +720,9 @@ class UnifiedMCPServer:
                 features=self.config.get_enabled_features(),
             )
 
+            # 워밍업은 요청 수신과 병행하고, 끝날 때까지 /health는 준비 전 상태
+            self._startup_task = asyncio.create_task(self._start_up())
+
             try:
                 yield
             finally:
@@ -452,9 +744,12 @@ class UnifiedMCPServer:
 
         server = FastMCP(**server_kwargs)
 
-        # 미들웨어 적용
+        # 미들웨어 적용 (네이티브 미들웨어 → 컴파일된 파이프라인 순)
         for middleware in self.middlewares:
-            server.add_middleware(middleware)
+            if isinstance(middleware, Middleware):
+                server.add_middleware(middleware)
+        if self.middleware_pipeline:
+            server.add_middleware(self.middleware_pipeline)
 
         # 컨텍스트 미들웨어 (별도 처리)
         # if self.config.features["context"]:
@@ -466,14 +761,17 @@ class UnifiedMCPServer:
         # 헬스체크 엔드포인트 추가
         @server.custom_route("/health", methods=["GET"])
         async def health_check_endpoint(request: Request):
+            # 워밍업이 끝나기 전에는 로드밸런서가 트래픽을 보내지 않도록 503
+            ready = self.readiness == "ready"
             return JSONResponse(
                 {
-                    "status": "healthy",
+                    "status": "healthy" if ready else self.readiness,
                     "service": "mcp-server",
                     "profile": self.config.profile.value,
                     "features": self.config.get_enabled_features(),
                     "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
+                },
+                status_code=200 if ready else 503,
             )
 
         return server
@@ -583,6 +881,34 @@ class UnifiedMCPServer:
         # 이모지 사용 여부
         use_emoji = self.config.logging_config and self.config.logging_config.use_emoji
 
+        async def _serve_cache_only(
+            ctx: Context,
+            tool_name: str,
+            start_time: datetime,
+            label: str,
+            retriever: Retriever,
+            query: str,
+            limit: int,
+            **kwargs: Any,
+        ) -> List[Dict[str, Any]]:
+            """백엔드 호출 예산 초과: 거부하지 않고 캐시된 결과만 반환 (use_cache 무시)"""
+            cached = await self._retrieve_cached(retriever, query, limit, **kwargs)
+            if cached is None:
+                await self._record_tool_usage(
+                    ctx, tool_name, start_time, False, f"{label} budget exceeded"
+                )
+                raise ToolError(
+                    f"{label} 호출 한도를 초과했고 캐시된 결과가 없습니다. "
+                    "잠시 후 다시 시도하세요"
+                )
+            logger.info(
+                f"{label} 호출 한도 초과, 캐시된 결과 반환",
+                extra={"tool_name": tool_name, "results_count": len(cached)},
+            )
+            await ctx.info(f"{label} 호출 한도 초과: 캐시된 결과 {len(cached)}개")
+            await self._record_tool_usage(ctx, tool_name, start_time, True)
+            return cached
+
         # 기본 검색 도구들
         @server.tool
         async def search_web(
@@ -642,29 +968,39 @@ class UnifiedMCPServer:
                 )
                 raise ToolError("웹 검색을 사용할 수 없습니다")
 
-            retriever = self.retrievers["tavily"]
+            retriever = await self._ensure_connected("tavily")
             if not retriever.connected:
                 await self._record_tool_usage(
                     ctx, tool_name, start_time, False, "Tavily retriever not connected"
                 )
                 raise ToolError("웹 검색을 사용할 수 없습니다 - 연결되지 않음")
 
-            # 캐싱이 활성화된 경우 캐시 제어
-            if self.config.features["cache"] and hasattr(retriever, "_use_cache"):
-                original_use_cache = retriever._use_cache
-                if not use_cache:
-                    retriever._use_cache = False
+            search_params = {}
+            if include_domains:
+                search_params["include_domains"] = include_domains
+            if exclude_domains:
+                search_params["exclude_domains"] = exclude_domains
 
-            try:
-                search_params = {}
-                if include_domains:
-                    search_params["include_domains"] = include_domains
-                if exclude_domains:
-                    search_params["exclude_domains"] = exclude_domains
+            # Tavily 호출 예산 초과: 캐시된 결과만 반환
+            if "tavily" in self._cache_only_sources():
+                return await _serve_cache_only(
+                    ctx,
+                    tool_name,
+                    start_time,
+                    "웹 검색",
+                    retriever,
+                    query,
+                    limit,
+                    **search_params,
+                )
 
+            # 캐시 우회는 요청별 인자로 전달 (공유 리트리버 상태를 바꾸지 않음)
+            cache_options = self._cache_options(retriever, use_cache)
+
+            try:
                 results = []
                 async for result in retriever.retrieve(
-                    query, limit=limit, **search_params
+                    query, limit=limit, **search_params, **cache_options
                 ):
                     results.append(result)
 
@@ -696,10 +1032,6 @@ class UnifiedMCPServer:
                 await self._record_tool_usage(ctx, tool_name, start_time, False, str(e))
 
                 raise ToolError(f"웹 검색 실패: {str(e)}")
-            finally:
-                # 캐시 설정 복원
-                if self.config.features["cache"] and hasattr(retriever, "_use_cache"):
-                    retriever._use_cache = original_use_cache
 
         @server.tool
         async def search_vectors(
@@ -758,18 +1090,29 @@ class UnifiedMCPServer:
                 )
                 raise ToolError("벡터 검색을 사용할 수 없습니다")
 
-            retriever = self.retrievers["qdrant"]
+            retriever = await self._ensure_connected("qdrant")
             if not retriever.connected:
                 await self._record_tool_usage(
                     ctx, tool_name, start_time, False, "Qdrant retriever not connected"
                 )
                 raise ToolError("벡터 검색을 사용할 수 없습니다 - 연결되지 않음")
 
-            # 캐싱이 활성화된 경우 캐시 제어
-            if self.config.features["cache"] and hasattr(retriever, "_use_cache"):
-                original_use_cache = retriever._use_cache
-                if not use_cache:
-                    retriever._use_cache = False
+            # Qdrant 호출 예산 초과: 캐시된 결과만 반환
+            if "qdrant" in self._cache_only_sources():
+                return await _serve_cache_only(
+                    ctx,
+                    tool_name,
+                    start_time,
+                    "벡터 검색",
+                    retriever,
+                    query,
+                    limit,
+                    collection=collection,
+                    score_threshold=score_threshold,
+                )
+
+            # 캐시 우회는 요청별 인자로 전달 (공유 리트리버 상태를 바꾸지 않음)
+            cache_options = self._cache_options(retriever, use_cache)
 
             try:
                 results = []
@@ -778,6 +1121,7 @@ class UnifiedMCPServer:
                     limit=limit,
                     collection=collection,
                     score_threshold=score_threshold,
+                    **cache_options,
                 ):
                     results.append(result)
 
@@ -809,10 +1153,6 @@ class UnifiedMCPServer:
                 await self._record_tool_usage(ctx, tool_name, start_time, False, str(e))
 
                 raise ToolError(str(e))
-            finally:
-                # 캐시 설정 복원
-                if self.config.features["cache"] and hasattr(retriever, "_use_cache"):
-                    retriever._use_cache = original_use_cache
 
         @server.tool
         async def create_vector_collection(
@@ -838,7 +1178,7 @@ class UnifiedMCPServer:
             if "qdrant" not in self.retrievers:
                 raise ToolError("벡터 데이터베이스를 사용할 수 없습니다")
 
-            retriever = self.retrievers["qdrant"]
+            retriever = await self._ensure_connected("qdrant")
             if not retriever.connected:
                 raise ToolError(
                     "벡터 데이터베이스를 사용할 수 없습니다 - 연결되지 않음"
@@ -902,7 +1242,7 @@ class UnifiedMCPServer:
             if "qdrant" not in self.retrievers:
                 raise ToolError("벡터 데이터베이스를 사용할 수 없습니다")
 
-            retriever = self.retrievers["qdrant"]
+            retriever = await self._ensure_connected("qdrant")
             if not retriever.connected:
                 raise ToolError(
                     "벡터 데이터베이스를 사용할 수 없습니다 - 연결되지 않음"
@@ -978,7 +1318,7 @@ class UnifiedMCPServer:
             if "qdrant" not in self.retrievers:
                 raise ToolError("벡터 데이터베이스를 사용할 수 없습니다")
 
-            retriever = self.retrievers["qdrant"]
+            retriever = await self._ensure_connected("qdrant")
             if not retriever.connected:
                 raise ToolError(
                     "벡터 데이터베이스를 사용할 수 없습니다 - 연결되지 않음"
@@ -1045,7 +1385,7 @@ class UnifiedMCPServer:
             if "qdrant" not in self.retrievers:
                 raise ToolError("벡터 데이터베이스를 사용할 수 없습니다")
 
-            retriever = self.retrievers["qdrant"]
+            retriever = await self._ensure_connected("qdrant")
             if not retriever.connected:
                 raise ToolError(
                     "벡터 데이터베이스를 사용할 수 없습니다 - 연결되지 않음"
@@ -1104,20 +1444,12 @@ class UnifiedMCPServer:
             if "postgres" not in self.retrievers:
                 raise ToolError("데이터베이스를 사용할 수 없습니다")
 
-            retriever = self.retrievers["postgres"]
+            retriever = await self._ensure_connected("postgres")
             if not retriever.connected:
                 raise ToolError("데이터베이스를 사용할 수 없습니다 - 연결되지 않음")
 
             # 허용된 테이블 목록 검증
-            allowed_tables = [
-                "users",
-                "documents",
-                "metadata",
-                "content",
-                "search_history",
-                "configurations",
-                "logs",
-            ]
+            allowed_tables = self._WRITABLE_TABLES
 
             if table not in allowed_tables:
                 emoji = "🚫" if use_emoji else ""
@@ -1174,20 +1506,12 @@ class UnifiedMCPServer:
             if "postgres" not in self.retrievers:
                 raise ToolError("데이터베이스를 사용할 수 없습니다")
 
-            retriever = self.retrievers["postgres"]
+            retriever = await self._ensure_connected("postgres")
             if not retriever.connected:
                 raise ToolError("데이터베이스를 사용할 수 없습니다 - 연결되지 않음")
 
             # 허용된 테이블 목록 검증
-            allowed_tables = [
-                "users",
-                "documents",
-                "metadata",
-                "content",
-                "search_history",
-                "configurations",
-                "logs",
-            ]
+            allowed_tables = self._WRITABLE_TABLES
 
             if table not in allowed_tables:
                 emoji = "🚫" if use_emoji else ""
@@ -1210,8 +1534,9 @@ class UnifiedMCPServer:
                 # retriever의 transaction 컨텍스트 사용
                 async with retriever.transaction() as conn:
                     # 먼저 레코드 존재 확인 - 안전한 방식으로 쿼리
-                    # connection의 quote_ident 사용
-                    quoted_table = conn._protocol.get_settings().quote_ident(table)
+                    from src.retrievers.postgres import quote_ident
+
+                    quoted_table = quote_ident(table)
                     check_query = f"SELECT id FROM {quoted_table} WHERE id = $1"
                     exists = await conn.fetchval(check_query, record_id_int)
 
@@ -1262,20 +1587,12 @@ class UnifiedMCPServer:
             if "postgres" not in self.retrievers:
                 raise ToolError("데이터베이스를 사용할 수 없습니다")
 
-            retriever = self.retrievers["postgres"]
+            retriever = await self._ensure_connected("postgres")
             if not retriever.connected:
                 raise ToolError("데이터베이스를 사용할 수 없습니다 - 연결되지 않음")
 
             # 허용된 테이블 목록 검증
-            allowed_tables = [
-                "users",
-                "documents",
-                "metadata",
-                "content",
-                "search_history",
-                "configurations",
-                "logs",
-            ]
+            allowed_tables = self._WRITABLE_TABLES
 
             if table not in allowed_tables:
                 emoji = "🚫" if use_emoji else ""
@@ -1322,6 +1639,145 @@ class UnifiedMCPServer:
                 await ctx.error(f"{emoji} 레코드 삭제 실패: {str(e)}")
                 raise ToolError(f"레코드 삭제 실패: {str(e)}")
 
+        async def _bulk_target(ctx: Context, table: str) -> Any:
+            """대량 쓰기 도구 공통 검증: 연결된 PostgreSQL 리트리버 반환"""
+            if "postgres" not in self.retrievers:
+                raise ToolError("데이터베이스를 사용할 수 없습니다")
+
+            retriever = await self._ensure_connected("postgres")
+            if not retriever.connected:
+                raise ToolError("데이터베이스를 사용할 수 없습니다 - 연결되지 않음")
+
+            if table not in self._WRITABLE_TABLES:
+                emoji = "🚫" if use_emoji else ""
+                await ctx.error(f"{emoji} 허용되지 않은 테이블: {table}")
+                raise ToolError(f"허용되지 않은 테이블: {table}")
+
+            return retriever
+
+        @server.tool
+        async def bulk_create_database_records(
+            ctx: Context, table: str, records: List[Dict[str, Any]]
+        ) -> Dict[str, Any]:
+            """
+            PostgreSQL 데이터베이스에 레코드 대량 생성 (COPY)
+
+            Args:
+                table: 테이블 이름 (허용된 테이블만 가능)
+                records: 생성할 레코드 목록
+
+            Returns:
+                요청 수와 삽입된 행 수
+            """
+            emoji = "➕" if use_emoji else ""
+            await ctx.info(f"{emoji} '{table}' 테이블에 레코드 {len(records)}개 생성 중...")
+
+            retriever = await _bulk_target(ctx, table)
+
+            try:
+                inserted = await retriever.bulk_insert(table, records)
+            except QueryError as e:
+                emoji = "❌" if use_emoji else ""
+                await ctx.error(f"{emoji} 대량 생성 실패: {str(e)}")
+                raise ToolError(f"대량 생성 실패: {str(e)}")
+
+            await self._invalidate_after_bulk_write(retriever)
+
+            emoji = "✅" if use_emoji else ""
+            await ctx.info(f"{emoji} 레코드 {inserted}개 생성 완료")
+            return {
+                "status": "success",
+                "table": table,
+                "requested": len(records),
+                "inserted": inserted,
+            }
+
+        @server.tool
+        async def bulk_update_database_records(
+            ctx: Context, table: str, records: List[Dict[str, Any]]
+        ) -> Dict[str, Any]:
+            """
+            PostgreSQL 데이터베이스의 레코드 대량 수정 (UNNEST)
+
+            Args:
+                table: 테이블 이름 (허용된 테이블만 가능)
+                records: 수정할 레코드 목록 (각 레코드에 id와 바꿀 컬럼 값)
+
+            Returns:
+                요청 수, 수정된 행 수, 찾지 못한 레코드 수
+            """
+            emoji = "✏️" if use_emoji else ""
+            await ctx.info(f"{emoji} '{table}' 테이블의 레코드 {len(records)}개 수정 중...")
+
+            retriever = await _bulk_target(ctx, table)
+
+            try:
+                # ID를 정수로 변환
+                records = [{**record, "id": int(record["id"])} for record in records]
+                updated = await retriever.bulk_update(table, records, key="id")
+            except (KeyError, TypeError, ValueError) as e:
+                raise ToolError(f"잘못된 레코드 ID: {str(e)}")
+            except QueryError as e:
+                emoji = "❌" if use_emoji else ""
+                await ctx.error(f"{emoji} 대량 수정 실패: {str(e)}")
+                raise ToolError(f"대량 수정 실패: {str(e)}")
+
+            await self._invalidate_after_bulk_write(retriever)
+
+            emoji = "✅" if use_emoji else ""
+            await ctx.info(f"{emoji} 레코드 {updated}개 수정 완료")
+            return {
+                "status": "success",
+                "table": table,
+                "requested": len(records),
+                "updated": updated,
+                "not_found": max(0, len(records) - updated),
+            }
+
+        @server.tool
+        async def bulk_delete_database_records(
+            ctx: Context, table: str, record_ids: List[str]
+        ) -> Dict[str, Any]:
+            """
+            PostgreSQL 데이터베이스에서 레코드 대량 삭제
+
+            Args:
+                table: 테이블 이름 (허용된 테이블만 가능)
+                record_ids: 삭제할 레코드 ID 목록
+
+            Returns:
+                요청 수, 삭제된 행 수, 찾지 못한 레코드 수
+            """
+            emoji = "🗑️" if use_emoji else ""
+            await ctx.info(
+                f"{emoji} '{table}' 테이블에서 레코드 {len(record_ids)}개 삭제 중..."
+            )
+
+            retriever = await _bulk_target(ctx, table)
+
+            try:
+                # ID를 정수로 변환
+                ids = [int(record_id) for record_id in record_ids]
+                deleted = await retriever.bulk_delete(table, ids, key="id")
+            except ValueError as e:
+                raise ToolError(f"잘못된 레코드 ID: {str(e)}")
+            except QueryError as e:
+                emoji = "❌" if use_emoji else ""
+                await ctx.error(f"{emoji} 대량 삭제 실패: {str(e)}")
+                raise ToolError(f"대량 삭제 실패: {str(e)}")
+
+            await self._invalidate_after_bulk_write(retriever)
+
+            emoji = "✅" if use_emoji else ""
+            await ctx.info(f"{emoji} 레코드 {deleted}개 삭제 완료")
+            return {
+                "status": "success",
+                "table": table,
+                "requested": len(record_ids),
+                "deleted": deleted,
+                "not_found": max(0, len(set(record_ids)) - deleted),
+            }
+
         @server.tool
         async def search_database(
             ctx: Context,
@@ -1380,7 +1836,7 @@ class UnifiedMCPServer:
                 )
                 raise ToolError("데이터베이스 검색을 사용할 수 없습니다")
 
-            retriever = self.retrievers["postgres"]
+            retriever = await self._ensure_connected("postgres")
             if not retriever.connected:
                 await self._record_tool_usage(
                     ctx,
@@ -1393,6 +1849,19 @@ class UnifiedMCPServer:
                     "데이터베이스 검색을 사용할 수 없습니다 - 연결되지 않음"
                 )
 
+            # PostgreSQL 호출 예산 초과: 캐시된 결과만 반환
+            if "postgres" in self._cache_only_sources():
+                return await _serve_cache_only(
+                    ctx,
+                    tool_name,
+                    start_time,
+                    "데이터베이스 검색",
+                    retriever,
+                    query,
+                    limit,
+                    table=table,
+                )
+
             # 쿼리 유형 로깅
             if query.upper().startswith("SELECT"):
                 emoji = "🗂️" if use_emoji else ""
@@ -1403,15 +1872,14 @@ class UnifiedMCPServer:
                     f"{emoji} 텍스트 검색 수행 중 - 테이블: {table or '모든 테이블'}"
                 )
 
-            # 캐싱이 활성화된 경우 캐시 제어
-            if self.config.features["cache"] and hasattr(retriever, "_use_cache"):
-                original_use_cache = retriever._use_cache
-                if not use_cache:
-                    retriever._use_cache = False
+            # 캐시 우회는 요청별 인자로 전달 (공유 리트리버 상태를 바꾸지 않음)
+            cache_options = self._cache_options(retriever, use_cache)
 
             try:
                 results = []
-                async for result in retriever.retrieve(query, limit=limit, table=table):
+                async for result in retriever.retrieve(
+                    query, limit=limit, table=table, **cache_options
+                ):
                     results.append(result)
 
                 logger.info(
@@ -1442,16 +1910,19 @@ class UnifiedMCPServer:
                 await self._record_tool_usage(ctx, tool_name, start_time, False, str(e))
 
                 raise ToolError(str(e))
-            finally:
-                # 캐시 설정 복원
-                if self.config.features["cache"] and hasattr(retriever, "_use_cache"):
-                    retriever._use_cache = original_use_cache
 
         @server.tool
         async def search_all(
             ctx: Context,
             query: str,
             limit: int = 10,
+            stream: bool = False,
+            source_timeout: Optional[float] = None,
+            timeout: Optional[float] = None,
+            min_results: Optional[int] = None,
+            min_sources: Optional[int] = None,
+            fusion: Optional[str] = None,
+            top_k: int = 10,
             access_token: Optional[AccessToken] = Depends(get_access_token),
         ) -> Dict[str, Any]:
             """
@@ -1460,10 +1931,24 @@ class UnifiedMCPServer:
             Args:
                 query: 검색 쿼리 문자열
                 limit: 각 소스당 최대 결과 수 (기본값: 10)
+                stream: 소스별 결과를 도착하는 대로 진행 알림으로 전송
+                source_timeout: 소스별 제한 시간 (초, 기본값: 설정값)
+                timeout: 전체 지연 예산 (초, 기본값: 설정값)
+                min_results: 결과가 이 개수 이상 모이면 즉시 반환
+                min_sources: 이 개수의 소스가 성공하면 즉시 반환
+                fusion: 결과 융합 방식 ("rrf" 또는 "score"), 지정 시 소스별
+                    결과 대신 중복 제거된 단일 상위 목록(fused)을 반환
+                top_k: 융합 시 반환할 결과 수 (기본값: 10)
 
             Returns:
                 모든 소스의 결과와 발생한 오류들
+                (조기 반환 시 취소된 소스는 cancelled에 포함)
             """
+            if fusion is not None and fusion not in FUSION_METHODS:
+                raise ToolError(
+                    f"지원하지 않는 융합 방식: {fusion} "
+                    f"(가능: {', '.join(FUSION_METHODS)})"
+                )
             start_time = datetime.now(timezone.utc)
             tool_name = "search_all"
 
@@ -1480,6 +1965,9 @@ class UnifiedMCPServer:
                 extra={
                     "query": query,
                     "limit": limit,
+                    "stream": stream,
+                    "min_results": min_results,
+                    "min_sources": min_sources,
                     "user_id": user_id,
                     "user_email": user_email,
                     "user_type": user_type,
@@ -1489,23 +1977,17 @@ class UnifiedMCPServer:
             emoji = "🔍" if use_emoji else ""
             await ctx.info(f"{emoji} 모든 소스에서 동시 검색 시작...")
 
-            results = {}
-            errors = {}
-
-            # 연결된 모든 리트리버에 대한 작업 생성
-            tasks = []
-            for name, retriever in self.retrievers.items():
-                if retriever.connected:
-                    tasks.append(
-                        (
-                            name,
-                            self._search_single_source(
-                                name, retriever, query, limit, ctx, user_id, user_type
-                            ),
-                        )
-                    )
+            # 연결된 모든 리트리버 (지연 연결 모드면 여기서 연결)
+            await asyncio.gather(
+                *(self._ensure_connected(name) for name in self.retrievers)
+            )
+            sources = {
+                name: retriever
+                for name, retriever in self.retrievers.items()
+                if retriever.connected
+            }
 
-            if not tasks:
+            if not sources:
                 logger.warning(
                     "연결된 리트리버 없음",
                     extra={"user_id": user_id, "user_type": user_type},
@@ -1525,83 +2007,72 @@ class UnifiedMCPServer:
 
             # 모든 검색을 동시에 실행
             emoji = "🚀" if use_emoji else ""
-            await ctx.info(f"{emoji} {len(tasks)}개 소스에서 동시 검색 중...")
-
-            # 예외 처리를 위한 플래그
-            task_group_failed = False
-            combined_error = ""
-            task_refs = []
-
-            try:
-                # 동시 실행을 위해 TaskGroup 사용
-                async with asyncio.TaskGroup() as tg:
-                    for name, coro in tasks:
-                        task = tg.create_task(coro)
-                        task_refs.append((name, task))
-
-            except* Exception as eg:
-                # TaskGroup에서 발생한 예외 처리
-                task_group_failed = True
-                error_messages = []
-                for e in eg.exceptions:
-                    error_msg = f"TaskGroup 오류: {e}"
-                    logger.error(error_msg)
-                    error_messages.append(error_msg)
-                combined_error = "; ".join(error_messages)
-
-            # TaskGroup 실행 결과 처리
-            if task_group_failed:
-                # 실패한 도구 사용 기록
-                await self._record_tool_usage(
-                    ctx, tool_name, start_time, False, combined_error
-                )
-
-                emoji = "❌" if use_emoji else ""
-                await ctx.error(f"{emoji} 통합 검색 중 오류 발생: {combined_error}")
-
-                return {
-                    "results": {},
-                    "errors": {"taskgroup": combined_error},
-                    "sources_searched": 0,
-                }
-            else:
-                # 정상 실행 - 결과 수집
-                for name, task in task_refs:
-                    try:
-                        result = task.result()
-                        if "error" in result:
-                            errors[name] = result["error"]
-                        else:
-                            results[name] = result["results"]
-                    except Exception as e:
-                        errors[name] = str(e)
+            await ctx.info(f"{emoji} {len(sources)}개 소스에서 동시 검색 중...")
+
+            result_fusion = ResultFusion(method=fusion) if fusion else None
+            # 호출 예산을 넘은 백엔드는 캐시된 결과만 사용
+            cache_only = self._cache_only_sources() & sources.keys()
+
+            gathered = await self._gather_search_results(
+                sources,
+                query,
+                limit,
+                ctx,
+                user_id=user_id,
+                user_type=user_type,
+                stream=stream,
+                source_timeout=source_timeout,
+                timeout=timeout,
+                min_results=min_results,
+                min_sources=min_sources,
+                fusion=result_fusion,
+                cache_only=cache_only,
+            )
+            results = gathered["results"]
+            errors = gathered["errors"]
+            cancelled = gathered["cancelled"]
 
-                logger.info(
-                    "통합 검색 완료",
-                    extra={
-                        "results_count": sum(len(r) for r in results.values())
-                        if results
-                        else 0,
-                        "successful_sources": len(results),
-                        "failed_sources": len(errors),
-                        "user_id": user_id,
-                        "user_type": user_type,
-                    },
-                )
+            logger.info(
+                "통합 검색 완료",
+                extra={
+                    "results_count": sum(len(r) for r in results.values())
+                    if results
+                    else 0,
+                    "successful_sources": len(results),
+                    "failed_sources": len(errors),
+                    "cancelled_sources": cancelled,
+                    "early_return": gathered["early_return"],
+                    "user_id": user_id,
+                    "user_type": user_type,
+                },
+            )
 
-                emoji = "✅" if use_emoji else ""
-                await ctx.info(
-                    f"{emoji} 검색 완료: {len(results)}개 성공, {len(errors)}개 실패"
-                )
+            emoji = "✅" if use_emoji else ""
+            message = f"{emoji} 검색 완료: {len(results)}개 성공, {len(errors)}개 실패"
+            if cancelled:
+                message += f", {len(cancelled)}개 취소"
+            await ctx.info(message)
 
-                # 성공적인 도구 사용 기록 (부분적 성공도 성공으로 간주)
-                await self._record_tool_usage(ctx, tool_name, start_time, True)
+            # 성공적인 도구 사용 기록 (부분적 성공도 성공으로 간주)
+            await self._record_tool_usage(ctx, tool_name, start_time, True)
 
-                return {
-                    "results": results,
-                    "errors": errors,
-                    "sources_searched": len(results) + len(errors),
-                }
+            response = {
+                "results": results,
+                "errors": errors,
+                "sources_searched": len(results) + len(errors),
+            }
+            if result_fusion:
+                # 소스별 목록 대신 병합된 상위 k개만 반환해 응답 크기 축소
+                del response["results"]
+                response["fused"] = result_fusion.top_k(top_k)
+                response["fusion"] = result_fusion.stats()
+            if cancelled:
+                response["cancelled"] = cancelled
+            if gathered["partial"]:
+                response["partial"] = gathered["partial"]
+            if cache_only:
+                response["cache_only"] = sorted(cache_only)
+            return response
 
         @server.tool
         async def health_check(
@@ -1661,6 +2132,17 @@ class UnifiedMCPServer:
                             "connected": retriever.connected,
                             "status": status,
                         }
+                        # 서킷 브레이커 상태 (열려 있으면 해당 소스는 즉시 실패 중)
+                        resilient = self._retriever_layer(
+                            retriever, ResilientRetriever
+                        )
+                        if resilient:
+                            breaker = resilient.breaker.snapshot()
+                            health_status["retrievers"][name]["circuit_breaker"] = (
+                                breaker
+                            )
+                            if breaker["state"] != CircuitState.CLOSED.value:
+                                health_status["status"] = "degraded"
                     except Exception as e:
                         health_status["retrievers"][name] = {
                             "connected": False,
@@ -1717,6 +2199,7 @@ class UnifiedMCPServer:
 
         # 캐시 관련 도구 (캐싱 활성화 시에만)
         if self.config.features["cache"]:
+            from src.retrievers.caching import CachingRetriever
 
             @server.tool
             async def invalidate_cache(
@@ -1783,6 +2266,8 @@ class UnifiedMCPServer:
                                 "cache_ttl": retriever._cache.config.default_ttl,
                                 "cache_namespace": retriever._get_cache_namespace(),
                             }
+                            if isinstance(retriever, CachingRetriever):
+                                stats[name].update(retriever.get_cache_stats())
                     else:
                         stats[name] = {"cache_enabled": False}
 
@@ -1806,6 +2291,21 @@ class UnifiedMCPServer:
                     raise ToolError("메트릭을 사용할 수 없습니다")
 
                 metrics = await self.metrics_middleware.get_metrics_summary()
+                if self.middleware_pipeline:
+                    metrics["middleware_layers"] = (
+                        self.middleware_pipeline.get_layer_timings()
+                    )
+                if self.logging_middleware:
+                    metrics["logging"] = self.logging_middleware.get_logging_stats()
+                metrics["resilience"] = {
+                    name: resilient.get_stats()
+                    for name, retriever in self.retrievers.items()
+                    if (
+                        resilient := self._retriever_layer(
+                            retriever, ResilientRetriever
+                        )
+                    )
+                }
 
                 emoji = "✅" if use_emoji else ""
                 await ctx.info(f"{emoji} 메트릭 조회 성공")
@@ -1822,12 +2322,25 @@ class UnifiedMCPServer:
         ctx: Context,
         user_id: str = "anonymous",
         user_type: str = "anonymous",
+        timeout: Optional[float] = None,
+        cache_only: bool = False,
     ) -> Dict[str, Any]:
-        """단일 리트리버 검색을 위한 도우미 함수"""
+        """
+        단일 리트리버 검색을 위한 도우미 함수
+
+        timeout이 지정되면 제한 시간 안에 받은 결과만 반환합니다.
+        cache_only면 백엔드를 호출하지 않고 캐시된 결과만 반환합니다.
+        결과가 하나도 없으면 오류로 처리합니다.
+        """
+        if cache_only:
+            cached = await self._retrieve_cached(retriever, query, limit)
+            if cached is None:
+                return {"error": f"{name} 호출 한도 초과 (캐시된 결과 없음)"}
+            return {"results": cached, "cached": True}
+
+        use_emoji = self.config.logging_config and self.config.logging_config.use_emoji
+        results = []
         try:
-            use_emoji = (
-                self.config.logging_config and self.config.logging_config.use_emoji
-            )
             emoji = "🔸" if use_emoji else ""
             await ctx.info(f"  {emoji} {name} 검색 중...")
 
@@ -1842,9 +2355,9 @@ class UnifiedMCPServer:
                 },
             )
 
-            results = []
-            async for result in retriever.retrieve(query, limit=limit):
-                results.append(result)
+            async with asyncio.timeout(timeout):
+                async for result in retriever.retrieve(query, limit=limit):
+                    results.append(result)
 
             logger.info(
                 "단일 소스 검색 완료",
@@ -1857,6 +2370,19 @@ class UnifiedMCPServer:
             )
 
             return {"results": results}
+        except TimeoutError:
+            logger.warning(
+                "단일 소스 검색 제한 시간 초과",
+                extra={
+                    "source": name,
+                    "timeout": timeout,
+                    "results_count": len(results),
+                    "user_id": user_id,
+                },
+            )
+            if results:
+                return {"results": results, "partial": True}
+            return {"error": f"{name} 검색 제한 시간 초과 ({timeout}초)"}
         except Exception as e:
             logger.error(
                 "단일 소스 검색 실패",
@@ -1871,6 +2397,138 @@ class UnifiedMCPServer:
             await ctx.error(f"  {emoji} {name} 검색 오류: {str(e)}")
             return {"error": str(e)}
 
+    async def _gather_search_results(
+        self,
+        sources: Dict[str, Retriever],
+        query: str,
+        limit: int,
+        ctx: Context,
+        user_id: str = "anonymous",
+        user_type: str = "anonymous",
+        stream: bool = False,
+        source_timeout: Optional[float] = None,
+        timeout: Optional[float] = None,
+        min_results: Optional[int] = None,
+        min_sources: Optional[int] = None,
+        fusion: Optional[ResultFusion] = None,
+        cache_only: frozenset[str] = frozenset(),
+    ) -> Dict[str, Any]:
+        """
+        여러 소스를 동시에 검색하고 도착 순서대로 결과 수집
+
+        Args:
+            sources: 검색할 리트리버 (이름 → 리트리버)
+            stream: 소스가 끝날 때마다 진행 알림으로 결과 전송
+            source_timeout: 소스별 제한 시간 (초)
+            timeout: 전체 지연 예산 (초), 초과 시 남은 소스 취소
+            min_results: 누적 결과가 이 개수 이상이면 남은 소스 취소 후 반환
+            min_sources: 성공한 소스가 이 개수 이상이면 남은 소스 취소 후 반환
+            fusion: 소스가 끝날 때마다 결과를 누적할 융합기
+            cache_only: 백엔드 대신 캐시된 결과만 사용할 소스 이름
+
+        Returns:
+            results, errors, cancelled(취소된 소스 이름),
+            partial(제한 시간 전까지 받은 결과만 있는 소스 이름), early_return 여부
+        """
+        retriever_config = self.config.retriever_config
+        if source_timeout is None and retriever_config:
+            source_timeout = retriever_config.search_source_timeout
+        if timeout is None and retriever_config:
+            timeout = retriever_config.search_total_timeout
+
+        pending = {
+            asyncio.create_task(
+                self._search_single_source(
+                    name,
+                    retriever,
+                    query,
+                    limit,
+                    ctx,
+                    user_id,
+                    user_type,
+                    timeout=source_timeout,
+                    cache_only=name in cache_only,
+                ),
+                name=f"search_all:{name}",
+            ): name
+            for name, retriever in sources.items()
+        }
+
+        results: Dict[str, List[Any]] = {}
+        errors: Dict[str, str] = {}
+        partial: List[str] = []
+        total_results = 0
+        completed = 0
+        early_return = False
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+
+        try:
+            while pending:
+                remaining = deadline - loop.time() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    break
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+
+                for task in done:
+                    name = pending.pop(task)
+                    completed += 1
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        result = {"error": str(e)}
+
+                    if "error" in result:
+                        errors[name] = result["error"]
+                    else:
+                        results[name] = result["results"]
+                        total_results += len(result["results"])
+                        if result.get("partial"):
+                            partial.append(name)
+                        if fusion:
+                            fusion.add(name, result["results"])
+
+                    if stream:
+                        await ctx.report_progress(
+                            progress=completed,
+                            total=len(sources),
+                            message=json.dumps(
+                                {"source": name, **result},
+                                ensure_ascii=False,
+                                default=str,
+                            ),
+                        )
+
+                if (min_results and total_results >= min_results) or (
+                    min_sources and len(results) >= min_sources
+                ):
+                    early_return = bool(pending)
+                    break
+        finally:
+            # 남은 소스(지연 예산 초과 또는 조기 반환) 취소
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        cancelled = sorted(pending.values())
+        if cancelled and not early_return:
+            for name in cancelled:
+                errors[name] = f"{name} 검색이 전체 제한 시간({timeout}초) 내에 끝나지 않음"
+
+        return {
+            "results": results,
+            "errors": errors,
+            "cancelled": cancelled,
+            "partial": sorted(partial),
+            "early_return": early_return,
+        }
+
     async def _get_or_create_user_context(
         self, ctx: Context, access_token: Optional[AccessToken] = None
     ) -> Optional[UserContext]:
@@ -1966,8 +2624,6 @@ class UnifiedMCPServer:
             return {}
 
         try:
-            import json
-
             claims = json.loads(access_token.resource)
             return claims if isinstance(claims, dict) else {}
         except (json.JSONDecodeError, ValueError) as e:
@@ -1977,6 +2633,22 @@ class UnifiedMCPServer:
             )
             return {}
 
+    def _resolve_request_user(self) -> Dict[str, Any]:
+        """현재 요청의 AccessToken에서 미들웨어용 사용자 정보를 만듭니다."""
+        access_token = get_access_token()
+        if not access_token:
+            return {}
+
+        claims = self._extract_jwt_claims(access_token)
+        return {
+            "id": access_token.client_id,
+            "email": claims.get("email"),
+            "type": "service"
+            if access_token.client_id == "internal-service"
+            else "user",
+            "roles": claims.get("roles", []),
+        }
+
     def _get_user_info_from_token(
         self, access_token: Optional[AccessToken]
     ) -> tuple[str, Optional[str], str]:
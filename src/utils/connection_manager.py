@@ -6,32 +6,63 @@ vector database clients, and HTTP sessions to improve performance
 and resource efficiency.
 
 Key features:
-- PostgreSQL connection pool with dynamic sizing
+- PostgreSQL connection pool with dynamic sizing, plus optional read
+  replicas (least-outstanding routing, lag-aware, separate read budget)
 - Qdrant client singleton pattern
 - HTTP session pool with connection reuse
-- Comprehensive metrics and monitoring
-- Automatic pool adjustment based on load
+- Process-wide Redis pool registry (one tuned pool per URL) with optional
+  client-side caching (see ``src.utils.redis_pool``)
+- Comprehensive metrics and monitoring; wait-time percentiles come from a
+  fixed-memory, time-decayed quantile sketch (see ``src.utils.quantiles``)
+- Adaptive pool sizing: a background controller that grows or shrinks the
+  PostgreSQL checkout limit from acquire-wait percentiles and utilization
+
+Client libraries (asyncpg, qdrant_client, httpx, redis) are imported when a
+manager first needs them, so importing this module stays cheap for server
+profiles that only use some of the backends.
 """
 
 import asyncio
+import importlib
+import random
 import time
-from typing import Optional, Dict, Any, List
+from collections import deque
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 import statistics
 
-import asyncpg
-from asyncpg import Pool
-import httpx
-from qdrant_client import QdrantClient
 import structlog
 
+from src.utils.quantiles import DecayingQuantileSketch
+
+if TYPE_CHECKING:
+    from asyncpg import Pool
+    from qdrant_client import QdrantClient
+
 logger = structlog.get_logger(__name__)
 
+# Redis registry names re-exported from src.utils.redis_pool on first access
+_REDIS_POOL_EXPORTS = frozenset(
+    {"LocalKeyCache", "RedisPoolRegistry", "get_redis_registry"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _REDIS_POOL_EXPORTS:
+        return getattr(importlib.import_module("src.utils.redis_pool"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 @dataclass
 class ConnectionPoolMetrics:
-    """Metrics for monitoring connection pool performance."""
+    """Metrics for monitoring connection pool performance.
+
+    Wait times go into a fixed-memory quantile sketch whose observations
+    decay with a 5 minute half-life, so percentiles describe recent traffic
+    and reading them costs the same after days of uptime as after one
+    request.
+    """
 
     total_connections: int = 0
     active_connections: int = 0
@@ -39,16 +70,23 @@ class ConnectionPoolMetrics:
     connection_errors: int = 0
     total_requests: int = 0
     pool_exhausted_count: int = 0
-    connection_wait_time_ms: List[float] = field(default_factory=list)
+    wait_time_ms: DecayingQuantileSketch = field(
+        default_factory=DecayingQuantileSketch
+    )
     reuse_rate: float = 0.0
+    # Uniform sample of waits since the pool sizing controller last looked
+    wait_reservoir: "WaitReservoir" = field(default_factory=lambda: WaitReservoir())
 
     def record_connection_acquired(self, wait_time_ms: float) -> None:
         """Record a connection acquisition."""
         self.active_connections += 1
         self.total_requests += 1
-        self.connection_wait_time_ms.append(wait_time_ms)
-        if len(self.connection_wait_time_ms) > 1000:  # Keep last 1000 samples
-            self.connection_wait_time_ms = self.connection_wait_time_ms[-1000:]
+        self.record_wait(wait_time_ms)
+
+    def record_wait(self, wait_time_ms: float) -> None:
+        """Record time spent waiting for a connection or client."""
+        self.wait_reservoir.add(wait_time_ms)
+        self.wait_time_ms.add(wait_time_ms)
 
     def record_connection_released(self) -> None:
         """Record a connection release."""
@@ -71,20 +109,289 @@ class ConnectionPoolMetrics:
         return self.reuse_rate
 
     def get_avg_wait_time(self) -> float:
-        """Get average connection wait time in milliseconds."""
-        if not self.connection_wait_time_ms:
-            return 0.0
-        return statistics.mean(self.connection_wait_time_ms)
+        """Get average connection wait time in milliseconds (time-decayed)."""
+        return self.wait_time_ms.mean()
 
     def get_p95_wait_time(self) -> float:
-        """Get 95th percentile connection wait time."""
-        if not self.connection_wait_time_ms:
-            return 0.0
-        return statistics.quantiles(self.connection_wait_time_ms, n=20)[18]
+        """Get 95th percentile connection wait time (time-decayed)."""
+        return self.wait_time_ms.quantile(0.95)
+
+    def get_wait_percentiles(self) -> Dict[str, float]:
+        """Get p50/p95/p99/mean wait time in milliseconds."""
+        return self.wait_time_ms.snapshot()
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentile of a sample (0.0 when empty)."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+class WaitReservoir:
+    """Fixed-size uniform sample of acquire waits (reservoir sampling).
+
+    Memory stays at ``size`` samples however many acquisitions happen
+    between two ``drain()`` calls, and every acquisition is equally likely
+    to be kept, so percentiles are unbiased under bursts.
+    """
+
+    def __init__(self, size: int = 512, rng: Optional[random.Random] = None):
+        self.size = size
+        self.samples: List[float] = []
+        self.seen = 0
+        self._rng = rng or random.Random()
+
+    def add(self, value: float) -> None:
+        self.seen += 1
+        if len(self.samples) < self.size:
+            self.samples.append(value)
+            return
+        slot = self._rng.randrange(self.seen)
+        if slot < self.size:
+            self.samples[slot] = value
+
+    def drain(self) -> tuple[List[float], int]:
+        """Return (samples, observations) since the last drain and reset."""
+        samples, seen = self.samples, self.seen
+        self.samples, self.seen = [], 0
+        return samples, seen
+
+
+class CapacityLimiter:
+    """Adjustable cap on concurrently checked-out connections.
+
+    asyncpg pools cannot be resized after creation, so the pool is created
+    with ``max_size`` and this limiter is the effective size the sizing
+    controller moves. It also integrates checkouts over time so the
+    controller sees average utilization rather than a point sample.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self.waiting = 0
+        self._cond = asyncio.Condition()
+        self._area = 0.0
+        self._since = self._mark = time.monotonic()
+
+    def _account(self) -> None:
+        now = time.monotonic()
+        self._area += self.in_use * (now - self._mark)
+        self._mark = now
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            self.waiting += 1
+            try:
+                await self._cond.wait_for(lambda: self.in_use < self.limit)
+            finally:
+                self.waiting -= 1
+            self._account()
+            self.in_use += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._account()
+            self.in_use -= 1
+            self._cond.notify()
+
+    async def set_limit(self, limit: int) -> None:
+        async with self._cond:
+            self.limit = limit
+            self._cond.notify_all()
+
+    def drain_utilization(self) -> float:
+        """Average in_use / limit since the last drain."""
+        self._account()
+        elapsed = self._mark - self._since
+        utilization = self._area / (elapsed * self.limit) if elapsed > 0 else 0.0
+        self._area, self._since = 0.0, self._mark
+        return utilization
+
+
+@dataclass
+class PoolSizingPolicy:
+    """Tuning for PoolSizeController."""
+
+    interval: float = 10.0
+    # Grow when p95 acquire wait exceeds this (and the pool is in use)
+    target_wait_p95_ms: float = 50.0
+    scale_up_utilization: float = 0.8
+    scale_down_utilization: float = 0.3
+    step: int = 5
+    # Consecutive ticks that must agree before acting
+    hysteresis: int = 3
+    # Minimum seconds between two size changes
+    cooldown: float = 30.0
+
+
+class PoolSizeController:
+    """Background loop that sizes a PostgreSQL pool between min and max.
+
+    Each tick samples p95 acquire wait (from the metrics reservoir) and
+    time-averaged utilization (from the capacity limiter), then decides:
+
+    - grow when utilization >= scale_up_utilization, or p95 wait exceeds
+      the target while the pool is in real use;
+    - shrink when utilization <= scale_down_utilization and p95 wait is
+      under half the target;
+    - otherwise hold.
+
+    A grow/shrink only happens after ``hysteresis`` consecutive ticks agree
+    and ``cooldown`` seconds after the previous change. Every tick is kept
+    in ``decisions`` and counted, so the controller's behaviour is visible
+    in pool metrics.
+    """
+
+    def __init__(self, manager: "PostgreSQLPoolManager", policy: PoolSizingPolicy):
+        self.manager = manager
+        self.policy = policy
+        self.decisions: deque = deque(maxlen=50)
+        self.counts = {"grow": 0, "shrink": 0, "hold": 0}
+        self._streak: tuple[str, int] = ("hold", 0)
+        self._last_change = float("-inf")
+        self._task: Optional[asyncio.Task] = None
+
+    def sample(self) -> Dict[str, float]:
+        samples, seen = self.manager.metrics.wait_reservoir.drain()
+        return {
+            "wait_p95_ms": percentile(samples, 95),
+            "utilization": self.manager.capacity.drain_utilization(),
+            "acquisitions": seen,
+            "waiting": self.manager.capacity.waiting,
+        }
+
+    def decide(self, sample: Dict[str, float]) -> tuple[str, str]:
+        policy = self.policy
+        utilization, p95 = sample["utilization"], sample["wait_p95_ms"]
+        if utilization >= policy.scale_up_utilization:
+            return "grow", "utilization"
+        if (
+            p95 > policy.target_wait_p95_ms
+            and utilization > policy.scale_down_utilization
+        ):
+            return "grow", "wait_p95"
+        if (
+            utilization <= policy.scale_down_utilization
+            and p95 <= policy.target_wait_p95_ms / 2
+        ):
+            return "shrink", "idle"
+        return "hold", "within_band"
+
+    async def step(self) -> Dict[str, Any]:
+        """Run one control tick and return the recorded decision."""
+        sample = self.sample()
+        action, reason = self.decide(sample)
+
+        previous, count = self._streak
+        self._streak = (action, count + 1 if action == previous else 1)
+
+        current = self.manager.capacity.limit
+        target = current
+        if action != "hold":
+            if self._streak[1] < self.policy.hysteresis:
+                reason = "hysteresis"
+            elif time.monotonic() - self._last_change < self.policy.cooldown:
+                reason = "cooldown"
+            else:
+                delta = self.policy.step if action == "grow" else -self.policy.step
+                target = max(
+                    self.manager.min_size, min(self.manager.max_size, current + delta)
+                )
+                if target == current:
+                    reason = "at_limit"
+
+        if target != current:
+            await self.manager.resize(target)
+            self._last_change = time.monotonic()
+            self._streak = ("hold", 0)
+            logger.info(
+                "PostgreSQL pool resized",
+                action=action,
+                reason=reason,
+                size=target,
+                previous=current,
+                **sample,
+            )
+        else:
+            action = "hold"
+
+        decision = {
+            "time": time.time(),
+            "action": action,
+            "reason": reason,
+            "size": target,
+            **sample,
+        }
+        self.counts[action] += 1
+        self.decisions.append(decision)
+        return decision
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.policy.interval)
+            try:
+                await self.step()
+            except Exception as e:
+                logger.warning("Pool sizing tick failed", error=str(e))
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "size": self.manager.capacity.limit,
+            "decisions": dict(self.counts),
+            "last": self.decisions[-1] if self.decisions else None,
+        }
+
+
+# Seconds a replica is behind the primary; 0 when it has replayed all WAL it
+# received (pg_last_xact_replay_timestamp alone grows while the primary is idle)
+_REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+"""
+
+
+@dataclass
+class ReplicaPool:
+    """A read replica pool with its own metrics and routing state."""
+
+    name: str
+    dsn: str
+    pool: Optional["Pool"] = None
+    metrics: ConnectionPoolMetrics = field(default_factory=ConnectionPoolMetrics)
+    outstanding: int = 0
+    lag_seconds: float = 0.0
+    healthy: bool = False
 
 
 class PostgreSQLPoolManager:
-    """Manages PostgreSQL connection pool with dynamic sizing."""
+    """Manages PostgreSQL connection pools with dynamic sizing.
+
+    Writes always go to the primary pool. With ``replica_dsns`` configured,
+    read-only work (``acquire(readonly=True)``) is routed to the replica with
+    the fewest outstanding requests among those that are healthy and within
+    ``max_replica_lag`` seconds; otherwise it falls back to the primary, where
+    concurrent reads are capped at ``read_max_size`` so that they cannot take
+    every connection from writers.
+    """
 
     def __init__(self, config: Dict[str, Any]):
         """Initialize PostgreSQL pool manager."""
@@ -97,32 +404,76 @@ class PostgreSQLPoolManager:
         self.max_inactive_connection_lifetime = config.get(
             "max_inactive_connection_lifetime", 300
         )
+        # Per-connection LRU of prepared statements, keyed by SQL text
+        self.statement_cache_size = config.get("statement_cache_size", 100)
 
-        self._pool: Optional[Pool] = None
+        # Read budget: replica pool size and cap on reads served by the primary
+        # (by default 20% of the primary stays reserved for writes)
+        self.read_max_size = config.get("read_max_size") or max(
+            1, int(self.max_size * 0.8)
+        )
+        self.max_replica_lag = config.get("max_replica_lag", 5.0)
+        self.lag_check_interval = config.get("lag_check_interval", 5.0)
+        self.replicas = [
+            ReplicaPool(name=f"replica-{i}", dsn=dsn)
+            for i, dsn in enumerate(config.get("replica_dsns") or [])
+        ]
+
+        # Adaptive sizing: the pool is created at max_size and the controller
+        # moves the checkout limit between min_size and max_size
+        self.autoscale = config.get("autoscale", False)
+        self.capacity = CapacityLimiter(
+            max(1, self.min_size) if self.autoscale else self.max_size
+        )
+        self.sizer = PoolSizeController(
+            self,
+            PoolSizingPolicy(
+                interval=config.get("autoscale_interval", 10.0),
+                target_wait_p95_ms=config.get("autoscale_target_wait_ms", 50.0),
+                step=config.get("autoscale_step", 5),
+                hysteresis=config.get("autoscale_hysteresis", 3),
+                cooldown=config.get("autoscale_cooldown", 30.0),
+            ),
+        )
+
+        self._pool: Optional["Pool"] = None
         self._lock = asyncio.Lock()
+        self._read_budget = asyncio.Semaphore(self.read_max_size)
+        self._lag_task: Optional[asyncio.Task] = None
         self.metrics = ConnectionPoolMetrics()
+        self.primary_reads = 0
 
         logger.info(
             "PostgreSQL pool manager initialized",
             min_size=self.min_size,
             max_size=self.max_size,
+            read_max_size=self.read_max_size,
+            replicas=len(self.replicas),
+        )
+
+    async def _create_pool(self, dsn: str, min_size: int, max_size: int) -> "Pool":
+        import asyncpg
+
+        return await asyncpg.create_pool(
+            dsn,
+            min_size=min_size,
+            max_size=max_size,
+            timeout=self.timeout,
+            command_timeout=self.command_timeout,
+            max_queries=self.max_queries,
+            max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+            statement_cache_size=self.statement_cache_size,
         )
 
     async def initialize(self) -> None:
-        """Initialize the connection pool."""
+        """Initialize the primary pool and any replica pools."""
         async with self._lock:
             if self._pool is not None:
                 return
 
             try:
-                self._pool = await asyncpg.create_pool(
-                    self.dsn,
-                    min_size=self.min_size,
-                    max_size=self.max_size,
-                    timeout=self.timeout,
-                    command_timeout=self.command_timeout,
-                    max_queries=self.max_queries,
-                    max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+                self._pool = await self._create_pool(
+                    self.dsn, self.min_size, self.max_size
                 )
 
                 self.metrics.total_connections = self._pool.get_size()
@@ -137,14 +488,132 @@ class PostgreSQLPoolManager:
                 logger.error("Failed to create PostgreSQL pool", error=str(e))
                 raise
 
+            if self.replicas:
+                # A missing replica only costs read capacity; reads use the primary
+                await asyncio.gather(
+                    *(self._open_replica(replica) for replica in self.replicas)
+                )
+                await self.check_replicas()
+                self._lag_task = asyncio.create_task(self._monitor_replicas())
+
+            if self.autoscale:
+                self.sizer.start()
+
+    async def _open_replica(self, replica: ReplicaPool) -> None:
+        try:
+            replica.pool = await self._create_pool(
+                replica.dsn, min(self.min_size, self.read_max_size), self.read_max_size
+            )
+            replica.metrics.total_connections = replica.pool.get_size()
+            replica.healthy = True
+            logger.info("PostgreSQL replica pool created", replica=replica.name)
+        except Exception as e:
+            replica.healthy = False
+            logger.warning(
+                "Failed to create PostgreSQL replica pool",
+                replica=replica.name,
+                error=str(e),
+            )
+
+    async def check_replicas(self) -> None:
+        """Refresh health and replication lag of every replica."""
+
+        async def check(replica: ReplicaPool) -> None:
+            if replica.pool is None:
+                await self._open_replica(replica)
+                if replica.pool is None:
+                    return
+            try:
+                lag = await replica.pool.fetchval(_REPLICA_LAG_QUERY)
+                replica.lag_seconds = float(lag or 0)
+                replica.healthy = True
+            except Exception as e:
+                replica.healthy = False
+                replica.metrics.record_connection_error()
+                logger.warning(
+                    "PostgreSQL replica check failed", replica=replica.name, error=str(e)
+                )
+
+        await asyncio.gather(*(check(replica) for replica in self.replicas))
+
+    async def _monitor_replicas(self) -> None:
+        while True:
+            await asyncio.sleep(self.lag_check_interval)
+            await self.check_replicas()
+
+    def _pick_replica(self) -> Optional[ReplicaPool]:
+        """Least outstanding requests among healthy replicas within the lag bound."""
+        candidates = [
+            replica
+            for replica in self.replicas
+            if replica.pool is not None
+            and replica.healthy
+            and replica.lag_seconds <= self.max_replica_lag
+        ]
+        if not candidates:
+            return None
+        return min(
+            candidates, key=lambda r: (r.outstanding, r.metrics.total_requests)
+        )
+
     @asynccontextmanager
-    async def acquire(self):
-        """Acquire a connection from the pool with metrics tracking."""
+    async def acquire(self, readonly: bool = False):
+        """Acquire a connection with metrics tracking.
+
+        Args:
+            readonly: The caller only reads; route to a replica when possible.
+        """
+        if not readonly:
+            async with self._acquire_primary() as connection:
+                yield connection
+            return
+
+        replica = self._pick_replica()
+        connection = await self._acquire_replica(replica) if replica else None
+        if connection is not None:
+            try:
+                yield connection
+            finally:
+                replica.outstanding -= 1
+                await replica.pool.release(connection)
+                replica.metrics.record_connection_released()
+            return
+
+        async with self._read_budget:
+            self.primary_reads += 1
+            async with self._acquire_primary() as connection:
+                yield connection
+
+    async def _acquire_replica(self, replica: ReplicaPool) -> Optional[Any]:
+        """Acquire from a replica; None (caller falls back) on failure."""
+        replica.outstanding += 1
+        start_time = time.time()
+        try:
+            connection = await replica.pool.acquire()
+        except Exception as e:
+            replica.outstanding -= 1
+            replica.healthy = False
+            replica.metrics.record_connection_error()
+            logger.warning(
+                "PostgreSQL replica unavailable, reading from primary",
+                replica=replica.name,
+                error=str(e),
+            )
+            return None
+        replica.metrics.record_connection_acquired((time.time() - start_time) * 1000)
+        return connection
+
+    @asynccontextmanager
+    async def _acquire_primary(self):
+        """Acquire a primary connection with metrics tracking."""
+        import asyncpg
+
         if self._pool is None:
             await self.initialize()
 
         start_time = time.time()
         connection = None
+        await self.capacity.acquire()
 
         try:
             connection = await self._pool.acquire()
@@ -166,28 +635,22 @@ class PostgreSQLPoolManager:
             if connection:
                 await self._pool.release(connection)
                 self.metrics.record_connection_released()
+            await self.capacity.release()
 
-    async def adjust_pool_size(self) -> None:
-        """Dynamically adjust pool size based on load."""
-        if self._pool is None:
-            return
+    async def adjust_pool_size(self) -> Dict[str, Any]:
+        """Run one pool sizing step now (the controller does this on a timer)."""
+        return await self.sizer.step()
 
-        utilization = self.metrics.active_connections / self.metrics.total_connections
-        current_size = self._pool.get_size()
+    async def resize(self, size: int) -> None:
+        """Set the effective pool size (checkout limit), within min/max.
 
-        # High utilization (>80%): increase pool size
-        if utilization > 0.8 and current_size < self.max_size:
-            new_min = min(current_size + 5, self.max_size)
-            await self._pool.set_pool_size(min_size=new_min, max_size=self.max_size)
-            logger.info("Increased PostgreSQL pool size", new_size=new_min)
-
-        # Low utilization (<20%): decrease pool size
-        elif utilization < 0.2 and current_size > self.min_size:
-            new_max = max(current_size - 5, self.min_size)
-            await self._pool.set_pool_size(min_size=self.min_size, max_size=new_max)
-            logger.info("Decreased PostgreSQL pool size", new_size=new_max)
-
-        self.metrics.total_connections = self._pool.get_size()
+        Connections above a lowered limit go idle and are closed by
+        ``max_inactive_connection_lifetime``.
+        """
+        size = max(1, self.min_size, min(self.max_size, size))
+        await self.capacity.set_limit(size)
+        if self._pool is not None:
+            self.metrics.total_connections = self._pool.get_size()
 
     async def health_check(self) -> Dict[str, Any]:
         """Check pool health and return metrics."""
@@ -208,10 +671,14 @@ class PostgreSQLPoolManager:
                 "reuse_rate": self.metrics.calculate_reuse_rate(),
                 "avg_wait_time_ms": self.metrics.get_avg_wait_time(),
                 "p95_wait_time_ms": self.metrics.get_p95_wait_time(),
+                "wait_time_ms": self.metrics.get_wait_percentiles(),
                 "error_rate": (
                     self.metrics.connection_errors / max(1, self.metrics.total_requests)
                 )
                 * 100,
+                "size_limit": self.capacity.limit,
+                **({"sizing": self.sizer.get_metrics()} if self.autoscale else {}),
+                **({"pools": self.get_pool_metrics()} if self.replicas else {}),
             }
         except Exception as e:
             return {
@@ -220,8 +687,57 @@ class PostgreSQLPoolManager:
                 "error_count": self.metrics.connection_errors,
             }
 
+    def get_pool_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-pool metrics: the primary and each replica."""
+
+        def describe(pool: Optional["Pool"], metrics: ConnectionPoolMetrics):
+            return {
+                "pool_size": pool.get_size() if pool else 0,
+                "active_connections": metrics.active_connections,
+                "total_requests": metrics.total_requests,
+                "errors": metrics.connection_errors,
+                "avg_wait_time_ms": metrics.get_avg_wait_time(),
+                "wait_time_ms": metrics.get_wait_percentiles(),
+            }
+
+        pools = {
+            "primary": {
+                **describe(self._pool, self.metrics),
+                "reads": self.primary_reads,
+                "read_budget": self.read_max_size,
+                "size_limit": self.capacity.limit,
+                "sizing": self.sizer.get_metrics(),
+            }
+        }
+        for replica in self.replicas:
+            pools[replica.name] = {
+                **describe(replica.pool, replica.metrics),
+                "outstanding": replica.outstanding,
+                "lag_seconds": replica.lag_seconds,
+                "healthy": replica.healthy,
+            }
+        return pools
+
+    async def expire_connections(self) -> None:
+        """Replace pooled connections on next use (e.g. after a schema change).
+
+        Fresh connections start with empty statement and type caches.
+        """
+        pools = [self._pool, *(replica.pool for replica in self.replicas)]
+        await asyncio.gather(*(pool.expire_connections() for pool in pools if pool))
+        logger.info("PostgreSQL pool connections expired")
+
     async def close(self) -> None:
-        """Close the connection pool."""
+        """Close the primary and replica pools."""
+        self.sizer.stop()
+        if self._lag_task:
+            self._lag_task.cancel()
+            self._lag_task = None
+        for replica in self.replicas:
+            if replica.pool:
+                await replica.pool.close()
+                replica.pool = None
+                replica.healthy = False
         if self._pool:
             await self._pool.close()
             self._pool = None
@@ -240,7 +756,7 @@ class QdrantClientManager:
         self.timeout = config.get("timeout", 30)
         self.prefer_grpc = config.get("prefer_grpc", True)
 
-        self._client: Optional[QdrantClient] = None
+        self._client: Optional["QdrantClient"] = None
         self._lock = asyncio.Lock()
         self.metrics = ConnectionPoolMetrics()
 
@@ -250,10 +766,13 @@ class QdrantClientManager:
             prefer_grpc=self.prefer_grpc,
         )
 
-    async def get_client(self) -> QdrantClient:
+    async def get_client(self) -> "QdrantClient":
         """Get or create the singleton Qdrant client."""
+        start_time = time.time()
         async with self._lock:
             if self._client is None:
+                from qdrant_client import QdrantClient
+
                 try:
                     self._client = QdrantClient(
                         host=self.host,
@@ -276,6 +795,7 @@ class QdrantClientManager:
                     raise
 
         self.metrics.total_requests += 1
+        self.metrics.record_wait((time.time() - start_time) * 1000)
         return self._client
 
     async def health_check(self) -> Dict[str, Any]:
@@ -293,6 +813,7 @@ class QdrantClientManager:
                 "total_requests": self.metrics.total_requests,
                 "connection_errors": self.metrics.connection_errors,
                 "reuse_rate": self.metrics.calculate_reuse_rate(),
+                "wait_time_ms": self.metrics.get_wait_percentiles(),
             }
         except Exception:
             # Try to reconnect
@@ -328,13 +849,15 @@ class HTTPSessionManager:
 
     def __init__(self, config: Dict[str, Any]):
         """Initialize HTTP session manager."""
+        import httpx
+
         self.max_connections = config.get("max_connections", 100)
         self.max_keepalive_connections = config.get("max_keepalive_connections", 20)
         self.keepalive_expiry = config.get("keepalive_expiry", 30)
         self.timeout = config.get("timeout", 30)
         self.retries = config.get("retries", 3)
 
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional["httpx.AsyncClient"] = None
         self._limits = httpx.Limits(
             max_connections=self.max_connections,
             max_keepalive_connections=self.max_keepalive_connections,
@@ -353,6 +876,8 @@ class HTTPSessionManager:
             if self._client is not None:
                 return
 
+            import httpx
+
             self._client = httpx.AsyncClient(
                 limits=self._limits,
                 timeout=httpx.Timeout(self.timeout),
@@ -365,6 +890,8 @@ class HTTPSessionManager:
     @asynccontextmanager
     async def session(self):
         """Get HTTP session for making requests."""
+        import httpx
+
         if self._client is None:
             await self.initialize()
 
@@ -402,6 +929,7 @@ class HTTPSessionManager:
                 "connection_errors": self.metrics.connection_errors,
                 "reuse_rate": self.metrics.calculate_reuse_rate(),
                 "avg_wait_time_ms": self.metrics.get_avg_wait_time(),
+                "wait_time_ms": self.metrics.get_wait_percentiles(),
             }
         except Exception as e:
             return {
@@ -418,6 +946,7 @@ class HTTPSessionManager:
             logger.info("HTTP client closed")
 
 
+
 class ConnectionManager:
     """Unified connection manager for all external services."""
 
@@ -439,6 +968,11 @@ class ConnectionManager:
         if "http" in config:
             self.http = HTTPSessionManager(config["http"])
 
+        # Redis pools are shared process-wide (caches, rate limiter, token stores)
+        from src.utils.redis_pool import get_redis_registry
+
+        self.redis = get_redis_registry()
+
         logger.info("Connection manager initialized")
 
     async def initialize_all(self) -> None:
@@ -470,6 +1004,7 @@ class ConnectionManager:
                 "active_connections": self.postgresql.metrics.active_connections,
                 "reuse_rate": self.postgresql.metrics.calculate_reuse_rate(),
                 "errors": self.postgresql.metrics.connection_errors,
+                "pools": self.postgresql.get_pool_metrics(),
             }
             total_requests += self.postgresql.metrics.total_requests
             total_errors += self.postgresql.metrics.connection_errors
@@ -493,6 +1028,8 @@ class ConnectionManager:
             total_requests += self.http.metrics.total_requests
             total_errors += self.http.metrics.connection_errors
 
+        metrics["redis"] = self.redis.get_metrics()
+
         metrics["total_requests"] = total_requests
         metrics["total_errors"] = total_errors
         metrics["overall_error_rate"] = (total_errors / max(1, total_requests)) * 100
@@ -512,6 +1049,9 @@ class ConnectionManager:
         if self.http:
             health["http"] = await self.http.health_check()
 
+        if self.redis.get_metrics()["total_pools"]:
+            health["redis"] = await self.redis.health_check()
+
         # Overall health
         all_healthy = all(
             status.get("status") in ["healthy", "reconnected"]
@@ -535,6 +1075,8 @@ class ConnectionManager:
         if self.http:
             tasks.append(self.http.close())
 
+        tasks.append(self.redis.close_all())
+
         if tasks:
             await asyncio.gather(*tasks)
 
@@ -0,0 +1,205 @@
+"""
+비동기 배치 로그 싱크
+
+이벤트 루프에서 로그 레코드를 큐에 넣기만 하고, 실제 출력은 백그라운드
+스레드가 배치 단위로 처리합니다. 디스크나 stdout이 느려져도 MCP 응답이
+함께 지연되지 않도록 하는 것이 목적입니다.
+
+주요 기능:
+    - 비블로킹 enqueue (put_nowait)
+    - 백그라운드 writer 스레드의 배치 flush (batch_size / flush_interval)
+    - 큐가 가득 차면 레코드를 버리고 카운터 증가 (drop-on-overflow)
+    - 지연 필드: 실제로 출력되는 레코드에 대해서만 writer 스레드에서 계산
+
+사용 예시:
+    ```python
+    sink = AsyncLogSink(max_queue_size=10000, batch_size=100)
+    sink.emit(
+        "info",
+        "MCP 요청 완료",
+        {"request_id": "..."},
+        lazy={"request_body": lambda: sanitize(request)},
+    )
+    sink.close()  # 종료 시 남은 레코드 flush
+    ```
+"""
+
+import atexit
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# (level, event, fields)
+LogRecord = Tuple[str, str, Dict[str, Any]]
+
+_STOP = object()
+
+
+class AsyncLogSink:
+    """백그라운드 스레드로 로그를 배치 출력하는 싱크"""
+
+    def __init__(
+        self,
+        writer: Optional[Callable[[List[LogRecord]], None]] = None,
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        logger_name: str = "src.middleware.logging",
+    ):
+        """
+        싱크 초기화
+
+        Args:
+            writer: 배치를 출력하는 함수 (기본값: structlog 로거로 출력)
+            max_queue_size: 큐 최대 크기, 초과 시 레코드 폐기
+            batch_size: 한 번에 flush할 최대 레코드 수
+            flush_interval: 레코드가 없을 때 대기하는 최대 시간 (초)
+            logger_name: 기본 writer가 사용할 로거 이름
+        """
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._writer = writer or self._default_writer
+        self._output = structlog.get_logger(logger_name)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+        # 카운터 (각각 하나의 스레드에서만 증가)
+        self._enqueued = 0
+        self._dropped = 0
+        self._written = 0
+        self._batches = 0
+        self._write_errors = 0
+
+    def start(self) -> None:
+        """writer 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._start_lock:
+            if self._thread is not None or self._closed:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="async-log-sink", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.close)
+
+    def emit(
+        self,
+        level: str,
+        event: str,
+        fields: Dict[str, Any],
+        lazy: Optional[Dict[str, Callable[[], Any]]] = None,
+    ) -> bool:
+        """
+        로그 레코드 enqueue (블로킹하지 않음)
+
+        Args:
+            level: 로그 레벨 메서드명 (info, warning, error 등)
+            event: 로그 이벤트 메시지
+            fields: 구조화된 로그 필드
+            lazy: 출력 직전에 계산할 필드 (필드명 → 함수)
+
+        Returns:
+            bool: 큐에 들어갔으면 True, 폐기되었으면 False
+        """
+        if self._closed:
+            self._dropped += 1
+            return False
+        if self._thread is None:
+            self.start()
+
+        try:
+            self._queue.put_nowait((level, event, fields, lazy))
+        except queue.Full:
+            self._dropped += 1
+            return False
+
+        self._enqueued += 1
+        return True
+
+    def _run(self) -> None:
+        stopping = False
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if stopping:
+                    return
+                continue
+
+            batch = []
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._flush(batch)
+            if stopping and self._queue.empty():
+                return
+
+    def _flush(self, batch: list) -> None:
+        records: List[LogRecord] = []
+        for level, event, fields, lazy in batch:
+            if lazy:
+                fields = dict(fields)
+                for name, compute in lazy.items():
+                    try:
+                        fields[name] = compute()
+                    except Exception as e:
+                        fields[name] = f"<unavailable: {e}>"
+            records.append((level, event, fields))
+
+        try:
+            self._writer(records)
+            self._written += len(records)
+        except Exception:
+            self._write_errors += 1
+        self._batches += 1
+
+    def _default_writer(self, records: List[LogRecord]) -> None:
+        for level, event, fields in records:
+            getattr(self._output, level)(event, **fields)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 레코드를 flush하고 writer 스레드 종료"""
+        with self._start_lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+
+        if thread is None:
+            return
+
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("로그 싱크 종료 신호 전달 실패", pending=self._queue.qsize())
+            return
+        thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """싱크 통계 조회"""
+        return {
+            "enqueued": self._enqueued,
+            "written": self._written,
+            "dropped": self._dropped,
+            "batches": self._batches,
+            "write_errors": self._write_errors,
+            "pending": self._queue.qsize(),
+            "max_queue_size": self.max_queue_size,
+        }
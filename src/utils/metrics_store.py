@@ -0,0 +1,387 @@
+"""
+Redis-backed time-series store for MCP request metrics.
+
+MCP workers call :meth:`MetricsTimeSeries.record` for every request. It
+only updates an in-memory aggregate keyed by minute, so the request path
+never waits on Redis. A background task flushes the aggregate every
+``flush_interval`` seconds as one pipelined batch of ``HINCRBY`` calls.
+
+Rollups are pre-aggregated at write time into two tiers, and each key
+expires with its tier, so Redis behaves like a ring buffer:
+
+    {prefix}:1m:{epoch_minute}   one-minute buckets, kept ``minute_retention``
+    {prefix}:1h:{epoch_hour}     one-hour buckets, kept ``hour_retention``
+
+A bucket is a hash of integer counters; fields are ``t|<tool>|<stat>`` for
+tool calls, ``m|<method>|<stat>`` for other MCP methods and ``r|<role>``
+for requests per user role, where ``<stat>`` is ``n`` (count), ``e``
+(errors), ``d`` (duration sum in ms) or ``h<i>`` (latency histogram
+bucket). Distinct users per bucket live in a HyperLogLog at
+``<bucket key>:u``. Queries read the finest tier whose span and retention
+cover the range, so a 30 day dashboard query is a single pipeline over
+at most 720 hour hashes, independent of request volume.
+
+The auth gateway reads the same keys, so both services must point
+``METRICS_STORE_URL`` at the same Redis database.
+"""
+
+import asyncio
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+MINUTE = 60
+HOUR = 3600
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS_MS: Tuple[int, ...] = (50, 100, 200, 500)
+
+_STATS = {"n": "count", "e": "errors", "d": "duration_ms"}
+
+
+def _latency_bucket(duration_ms: float) -> int:
+    for index, bound in enumerate(LATENCY_BUCKETS_MS):
+        if duration_ms <= bound:
+            return index
+    return len(LATENCY_BUCKETS_MS)
+
+
+@dataclass
+class MetricsStoreConfig:
+    """Settings for :class:`MetricsTimeSeries`.
+
+    Attributes:
+        url: Redis URL shared by MCP workers and the auth gateway
+        prefix: Key prefix of the rollup buckets
+        flush_interval: Seconds between batched writes
+        minute_retention: Seconds one-minute buckets are kept
+        hour_retention: Seconds one-hour buckets are kept
+        minute_span: Longest query range answered from minute buckets
+    """
+
+    url: Optional[str] = None
+    prefix: str = "mcp_metrics"
+    flush_interval: float = 5.0
+    minute_retention: int = 24 * HOUR
+    hour_retention: int = 35 * 24 * HOUR
+    minute_span: int = 6 * HOUR
+
+    @classmethod
+    def from_env(cls) -> "MetricsStoreConfig":
+        """Read ``METRICS_STORE_*`` (falls back to ``REDIS_URL``)."""
+        return cls(
+            url=os.getenv("METRICS_STORE_URL") or os.getenv("REDIS_URL") or None,
+            prefix=os.getenv("METRICS_STORE_PREFIX", "mcp_metrics"),
+            flush_interval=float(os.getenv("METRICS_STORE_FLUSH_INTERVAL", "5")),
+            minute_retention=int(
+                float(os.getenv("METRICS_STORE_MINUTE_RETENTION_HOURS", "24")) * HOUR
+            ),
+            hour_retention=int(
+                float(os.getenv("METRICS_STORE_HOUR_RETENTION_DAYS", "35")) * 24 * HOUR
+            ),
+        )
+
+
+class MetricsTimeSeries:
+    """Buffered writer and rollup reader for request metrics.
+
+    Example:
+        ```python
+        store = MetricsTimeSeries(redis_client)
+        store.record("tools/call", "search_web", 120.5, error=False, user_id="u1")
+        await store.flush()  # normally done by the background task
+        window = await store.query(time.time() - 86400, time.time())
+        ```
+    """
+
+    def __init__(self, redis_client: Any, config: Optional[MetricsStoreConfig] = None):
+        self.redis = redis_client
+        self.config = config or MetricsStoreConfig()
+
+        # epoch minute -> field -> counter
+        self._pending: Dict[int, Dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._pending_users: Dict[int, set] = defaultdict(set)
+        self._pending_last_used: Dict[str, float] = {}
+
+        self._flush_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.recorded = 0
+        self.flushes = 0
+        self.flush_errors = 0
+        self.dropped = 0
+
+    def _key(self, resolution: int, bucket: int) -> str:
+        tier = "1m" if resolution == MINUTE else "1h"
+        return f"{self.config.prefix}:{tier}:{bucket}"
+
+    # -- write path -----------------------------------------------------
+
+    def record(
+        self,
+        method: str,
+        tool_name: Optional[str],
+        duration_ms: float,
+        error: bool,
+        user_id: Optional[str] = None,
+        role: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Add one request to the in-memory aggregate (never blocks)."""
+        if self._closed:
+            self.dropped += 1
+            return
+        if self._flush_task is None:
+            self._start()
+
+        now = time.time() if timestamp is None else timestamp
+        fields = self._pending[int(now // MINUTE)]
+        series = f"t|{tool_name}" if tool_name else f"m|{method}"
+        fields[f"{series}|n"] += 1
+        if error:
+            fields[f"{series}|e"] += 1
+        fields[f"{series}|d"] += duration_ms
+        fields[f"{series}|h{_latency_bucket(duration_ms)}"] += 1
+        if role:
+            fields[f"r|{role}"] += 1
+        if user_id:
+            self._pending_users[int(now // MINUTE)].add(user_id)
+        if tool_name and now > self._pending_last_used.get(tool_name, 0.0):
+            self._pending_last_used[tool_name] = now
+        self.recorded += 1
+
+    def _start(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_task = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write the pending aggregate to both tiers in one pipeline.
+
+        Returns:
+            Number of minute buckets written. Metrics are best effort: a
+            failed batch is dropped and counted in ``flush_errors``.
+        """
+        if not self._pending and not self._pending_users:
+            return 0
+        pending, self._pending = self._pending, defaultdict(lambda: defaultdict(float))
+        users, self._pending_users = self._pending_users, defaultdict(set)
+        last_used, self._pending_last_used = self._pending_last_used, {}
+
+        # Downsample locally so each hour key gets one increment per field
+        hourly: Dict[int, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        hourly_users: Dict[int, set] = defaultdict(set)
+        for minute, fields in pending.items():
+            for field, value in fields.items():
+                hourly[minute // 60][field] += value
+        for minute, ids in users.items():
+            hourly_users[minute // 60].update(ids)
+
+        pipe = self.redis.pipeline(transaction=False)
+        tiers = (
+            (MINUTE, pending, users, self.config.minute_retention),
+            (HOUR, hourly, hourly_users, self.config.hour_retention),
+        )
+        for resolution, buckets, bucket_users, retention in tiers:
+            # Expire relative to the end of the bucket, not the write time
+            for bucket, fields in buckets.items():
+                key = self._key(resolution, bucket)
+                for field, value in fields.items():
+                    pipe.hincrby(key, field, int(round(value)))
+                pipe.expireat(key, (bucket + 1) * resolution + retention)
+            for bucket, ids in bucket_users.items():
+                key = f"{self._key(resolution, bucket)}:u"
+                pipe.pfadd(key, *ids)
+                pipe.expireat(key, (bucket + 1) * resolution + retention)
+        if last_used:
+            pipe.hset(
+                f"{self.config.prefix}:last_used",
+                mapping={tool: f"{ts:.3f}" for tool, ts in last_used.items()},
+            )
+
+        try:
+            await pipe.execute()
+        except Exception as e:
+            self.flush_errors += 1
+            logger.warning(
+                "Metrics flush failed", error=str(e), buckets=len(pending)
+            )
+            return 0
+        self.flushes += 1
+        return len(pending)
+
+    async def close(self) -> None:
+        """Stop the background task and write what is still pending."""
+        self._closed = True
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    # -- read path ------------------------------------------------------
+
+    def resolution_for(self, start: float, end: float, now: Optional[float] = None) -> int:
+        """Finest tier that still holds ``start`` and suits the span."""
+        now = time.time() if now is None else now
+        if (
+            end - start <= self.config.minute_span
+            and start >= now - self.config.minute_retention
+        ):
+            return MINUTE
+        return HOUR
+
+    async def query(
+        self,
+        start: float,
+        end: float,
+        tool: Optional[str] = None,
+        step: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Aggregate the rollups covering ``[start, end)``.
+
+        Args:
+            start: Range start (epoch seconds)
+            end: Range end (epoch seconds)
+            tool: Only count calls of this tool
+            step: Timeline step in seconds (rounded down to a multiple of
+                the tier resolution)
+            now: Current time used for tier selection (defaults to now)
+
+        Returns:
+            ``totals``, per-tool ``tools``, ``roles``, latency ``histogram``,
+            ``timeline`` as ``[(step_start, count), ...]``, ``active_users``
+            and the ``resolution`` that answered the query.
+        """
+        resolution = self.resolution_for(start, end, now)
+        first, last = int(start // resolution), int((end - 1) // resolution)
+        buckets = list(range(first, last + 1))
+        step = max(resolution, (step or resolution) // resolution * resolution)
+
+        pipe = self.redis.pipeline(transaction=False)
+        for bucket in buckets:
+            pipe.hgetall(self._key(resolution, bucket))
+        pipe.hgetall(f"{self.config.prefix}:last_used")
+        results = await pipe.execute()
+        last_used = _decode_mapping(results.pop())
+
+        tools: Dict[str, Dict[str, Any]] = {}
+        roles: Dict[str, int] = defaultdict(int)
+        histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        totals = {"count": 0, "errors": 0, "duration_ms": 0}
+        timeline: Dict[int, int] = {
+            (bucket * resolution) // step * step: 0 for bucket in buckets
+        }
+
+        # Sum raw counters per timeline step first, so each distinct field
+        # name is parsed once per step instead of once per bucket
+        step_sums: Dict[int, Dict[Any, int]] = defaultdict(lambda: defaultdict(int))
+        for bucket, raw in zip(buckets, results):
+            if raw:
+                sums = step_sums[(bucket * resolution) // step * step]
+                for field, value in raw.items():
+                    sums[field] += int(value)
+
+        for step_start, sums in step_sums.items():
+            for field, value in sums.items():
+                if isinstance(field, bytes):
+                    field = field.decode()
+                kind, _, rest = field.partition("|")
+                if kind == "r":
+                    if tool is None:
+                        roles[rest] += value
+                    continue
+                name, _, stat = rest.rpartition("|")
+                if tool is not None and (kind != "t" or name != tool):
+                    continue
+                if stat == "n":
+                    totals["count"] += value
+                    timeline[step_start] += value
+                elif stat == "e":
+                    totals["errors"] += value
+                elif stat == "d":
+                    totals["duration_ms"] += value
+                elif stat.startswith("h"):
+                    histogram[int(stat[1:])] += value
+                if kind == "t" and stat in _STATS:
+                    entry = tools.setdefault(
+                        name,
+                        {"count": 0, "errors": 0, "duration_ms": 0, "last_used": None},
+                    )
+                    entry[_STATS[stat]] += value
+
+        for name, entry in tools.items():
+            if name in last_used:
+                entry["last_used"] = float(last_used[name])
+
+        active_users = 0
+        if tool is None and buckets:
+            active_users = await self.redis.pfcount(
+                *(f"{self._key(resolution, bucket)}:u" for bucket in buckets)
+            )
+
+        return {
+            "resolution": resolution,
+            "totals": totals,
+            "tools": tools,
+            "roles": dict(roles),
+            "histogram": histogram,
+            "timeline": sorted(timeline.items()),
+            "active_users": active_users,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer counters."""
+        return {
+            "recorded": self.recorded,
+            "flushes": self.flushes,
+            "flush_errors": self.flush_errors,
+            "dropped": self.dropped,
+            "pending_buckets": len(self._pending),
+        }
+
+
+def _decode_mapping(raw: Dict[Any, Any]) -> Dict[str, str]:
+    return {
+        (k.decode() if isinstance(k, bytes) else k): (
+            v.decode() if isinstance(v, bytes) else v
+        )
+        for k, v in (raw or {}).items()
+    }
+
+
+_store: Optional[MetricsTimeSeries] = None
+
+
+def get_metrics_store() -> Optional[MetricsTimeSeries]:
+    """Process-wide store from ``METRICS_STORE_*``; ``None`` when no Redis URL."""
+    global _store
+    if _store is None:
+        config = MetricsStoreConfig.from_env()
+        if not config.url:
+            return None
+        from src.utils.redis_pool import get_redis_registry
+
+        _store = MetricsTimeSeries(
+            get_redis_registry().get_client(config.url, decode_responses=True),
+            config,
+        )
+    return _store
@@ -0,0 +1,149 @@
+"""
+Fixed-memory streaming quantiles with time decay.
+
+``DecayingQuantileSketch`` is a DDSketch-style log-bucketed histogram:
+every value lands in the bucket ``ceil(log_gamma(value))``, so any
+quantile is returned within ``relative_accuracy`` of the true value. The
+bucket array is allocated once for the configured value range, so memory
+does not grow with the number of observations, and a quantile query is a
+single pass over that fixed array regardless of how many values were
+recorded.
+
+Recent observations count more than old ones (forward exponential decay):
+a value recorded ``half_life`` seconds ago weighs half as much as one
+recorded now, which makes the percentiles a sliding, time-decayed window
+instead of an all-time aggregate.
+"""
+
+import math
+import time
+from array import array
+from typing import Callable, Dict, Iterable
+
+# Rescale weights before they overflow float precision
+_MAX_WEIGHT = 2.0**40
+
+
+class DecayingQuantileSketch:
+    """Streaming quantile estimator with bounded memory and time decay.
+
+    Args:
+        relative_accuracy: Maximum relative error of returned quantiles.
+        min_value: Values at or below this are counted as zero.
+        max_value: Values above this are clamped to the last bucket.
+        half_life: Seconds after which an observation's weight halves.
+        clock: Monotonic time source (injectable for tests).
+
+    Example:
+        ```python
+        sketch = DecayingQuantileSketch(half_life=300)
+        sketch.add(12.5)
+        sketch.quantiles((0.5, 0.95, 0.99))
+        ```
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        min_value: float = 1e-3,
+        max_value: float = 3.6e6,
+        half_life: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.relative_accuracy = relative_accuracy
+        self.half_life = half_life
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._offset = math.ceil(math.log(min_value) / self._log_gamma)
+        size = math.ceil(math.log(max_value) / self._log_gamma) - self._offset + 1
+        self._buckets = array("d", bytes(8 * size))
+        self._zero = 0.0
+        self._weight_total = 0.0
+        self._weighted_sum = 0.0
+        self._clock = clock
+        self._landmark = clock()
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _weight(self) -> float:
+        now = self._clock()
+        weight = 2.0 ** ((now - self._landmark) / self.half_life)
+        if weight > _MAX_WEIGHT:
+            # Move the landmark to now: every stored weight shrinks by `weight`
+            scale = 1.0 / weight
+            for i, value in enumerate(self._buckets):
+                if value:
+                    self._buckets[i] = value * scale
+            self._zero *= scale
+            self._weight_total *= scale
+            self._weighted_sum *= scale
+            self._landmark = now
+            weight = 1.0
+        return weight
+
+    def add(self, value: float) -> None:
+        """Record one observation."""
+        weight = self._weight()
+        self.count += 1
+        self._weight_total += weight
+        self._weighted_sum += weight * value
+        if value <= self.min_value:
+            self._zero += weight
+            return
+        index = math.ceil(math.log(value) / self._log_gamma) - self._offset
+        index = min(max(index, 0), len(self._buckets) - 1)
+        self._buckets[index] += weight
+
+    def _bucket_value(self, index: int) -> float:
+        # Midpoint (in relative terms) of (gamma^(i-1), gamma^i]
+        return 2 * self._gamma ** (index + self._offset) / (self._gamma + 1)
+
+    def quantiles(self, qs: Iterable[float]) -> Dict[float, float]:
+        """Several quantiles in one pass over the buckets (0.0 when empty)."""
+        qs = sorted(qs)
+        result = {q: 0.0 for q in qs}
+        if self._weight_total <= 0:
+            return result
+
+        pending = iter(qs)
+        q = next(pending, None)
+        cumulative = self._zero
+        while q is not None and cumulative >= q * self._weight_total:
+            q = next(pending, None)
+        for index, weight in enumerate(self._buckets):
+            if q is None:
+                break
+            if not weight:
+                continue
+            cumulative += weight
+            while q is not None and cumulative >= q * self._weight_total:
+                result[q] = self._bucket_value(index)
+                q = next(pending, None)
+        while q is not None:
+            result[q] = self._bucket_value(len(self._buckets) - 1)
+            q = next(pending, None)
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimated q-quantile (0 <= q <= 1) of the decayed distribution."""
+        return self.quantiles((q,))[q]
+
+    def mean(self) -> float:
+        """Time-decayed mean (0.0 when empty)."""
+        if self._weight_total <= 0:
+            return 0.0
+        return self._weighted_sum / self._weight_total
+
+    def snapshot(self) -> Dict[str, float]:
+        """p50/p95/p99 and mean, rounded for metrics output."""
+        p = self.quantiles((0.5, 0.95, 0.99))
+        return {
+            "p50": round(p[0.5], 3),
+            "p95": round(p[0.95], 3),
+            "p99": round(p[0.99], 3),
+            "mean": round(self.mean(), 3),
+            "count": self.count,
+        }
@@ -0,0 +1,441 @@
+"""
+Process-wide Redis connection pools.
+
+Caches, the rate limiter and token stores obtain their clients from
+:func:`get_redis_registry` so a worker keeps a single tuned pool per Redis
+URL instead of one pool per component.
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import redis.asyncio as redis
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Commands whose single-key results may be served from the client-side cache
+_CACHEABLE_COMMANDS = frozenset({"GET", "EXISTS"})
+# Writes issued through our own clients invalidate the local copy immediately
+# (the server-side invalidation message arrives asynchronously)
+_WRITE_COMMANDS = frozenset(
+    {
+        "SET",
+        "SETEX",
+        "PSETEX",
+        "SETNX",
+        "GETSET",
+        "GETDEL",
+        "APPEND",
+        "INCR",
+        "INCRBY",
+        "DECR",
+        "DECRBY",
+        "EXPIRE",
+        "PEXPIRE",
+        "PERSIST",
+    }
+)
+_MULTI_KEY_DELETES = frozenset({"DEL", "UNLINK"})
+_INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+
+def _redact_url(url: str) -> str:
+    """Hide the password in a Redis URL for logs and metrics."""
+    parts = urlsplit(url)
+    if parts.password is None:
+        return url
+    netloc = parts.netloc.replace(f":{parts.password}@", ":***@")
+    return urlunsplit((parts.scheme, netloc, parts.path, parts.query, ""))
+
+
+def _as_str(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class LocalKeyCache:
+    """Bounded LRU cache of Redis read results for client-side caching.
+
+    Entries are dropped when Redis reports the key as modified (server-assisted
+    tracking), when they exceed ``ttl`` as a safety net, or when the
+    invalidation listener is lost. ``generation`` guards against storing a
+    value read before an invalidation that arrived while the read was in flight.
+    """
+
+    def __init__(
+        self, max_keys: int = 10000, ttl: float = 60.0, prefixes: Tuple[str, ...] = ()
+    ):
+        self.max_keys = max_keys
+        self.ttl = ttl
+        self.prefixes = prefixes
+        self.enabled = False
+        self.generation = 0
+
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def tracks(self, key: Any) -> bool:
+        """Whether invalidations for this key are delivered to us."""
+        return not self.prefixes or _as_str(key).startswith(self.prefixes)
+
+    def get(self, command: str, key: Any) -> Tuple[bool, Any]:
+        entry = self._entries.get((command, _as_str(key)))
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end((command, _as_str(key)))
+        self.hits += 1
+        return True, entry[1]
+
+    def put(self, command: str, key: Any, value: Any, generation: int) -> None:
+        if not self.enabled or generation != self.generation:
+            return
+        self._entries[(command, _as_str(key))] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end((command, _as_str(key)))
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Optional[List[Any]]) -> None:
+        """Drop cached entries for ``keys`` (``None`` means flush everything)."""
+        self.generation += 1
+        self.invalidations += 1
+        if keys is None:
+            self._entries.clear()
+            return
+        for key in keys:
+            name = _as_str(key)
+            for command in _CACHEABLE_COMMANDS:
+                self._entries.pop((command, name), None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "keys": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+class _RedisPoolEntry:
+    """One shared pool plus its optional invalidation listener."""
+
+    def __init__(
+        self,
+        url: str,
+        pool: "redis.ConnectionPool",
+        local_cache: Optional[LocalKeyCache] = None,
+        retry_interval: float = 5.0,
+    ):
+        self.url = url
+        self.pool = pool
+        self.local_cache = local_cache
+        self.clients = 0
+        self.retry_interval = retry_interval
+
+        self._tracking = False
+        self._retry_at = 0.0
+        self._lock = asyncio.Lock()
+        self._listener: Optional[asyncio.Task] = None
+        self._listener_conn: Optional[Any] = None
+
+    async def ensure_tracking(self) -> None:
+        """Start the invalidation listener once (retried after failures)."""
+        if (
+            self.local_cache is None
+            or self._tracking
+            or time.monotonic() < self._retry_at
+        ):
+            return
+
+        async with self._lock:
+            if self._tracking:
+                return
+            try:
+                conn = await self._open_listener()
+            except Exception as e:
+                self._retry_at = time.monotonic() + self.retry_interval
+                logger.warning(
+                    "Redis client-side cache disabled",
+                    url=_redact_url(self.url),
+                    error=str(e),
+                )
+                return
+
+            self._listener_conn = conn
+            self._tracking = True
+            self.local_cache.clear()
+            self.local_cache.enabled = True
+            self._listener = asyncio.create_task(self._listen(conn))
+
+    async def _open_listener(self) -> Any:
+        """Open a RESP2 connection that tracks keys and receives invalidations.
+
+        BCAST tracking is connection independent: every write to a key under the
+        configured prefixes is reported, so one redirecting connection covers
+        reads made through any connection of the pool.
+        """
+        kwargs = {**self.pool.connection_kwargs, "protocol": 2, "socket_timeout": None}
+        conn = self.pool.connection_class(**kwargs)
+        await conn.connect()
+
+        await conn.send_command("CLIENT", "ID")
+        client_id = await conn.read_response()
+
+        prefixes: List[str] = []
+        for prefix in self.local_cache.prefixes if self.local_cache else ():
+            prefixes.extend(["PREFIX", prefix])
+        await conn.send_command(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST", *prefixes
+        )
+        await conn.read_response()
+
+        await conn.send_command("SUBSCRIBE", _INVALIDATE_CHANNEL)
+        await conn.read_response()
+        return conn
+
+    async def _listen(self, conn: Any) -> None:
+        try:
+            while True:
+                message = await conn.read_response()
+                self.handle_invalidation(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                "Redis invalidation listener lost", url=_redact_url(self.url), error=str(e)
+            )
+        finally:
+            # Without invalidations the local copies can no longer be trusted
+            self._tracking = False
+            self._retry_at = time.monotonic() + self.retry_interval
+            if self.local_cache is not None:
+                self.local_cache.enabled = False
+                self.local_cache.clear()
+
+    def handle_invalidation(self, message: Any) -> None:
+        """Apply a ``__redis__:invalidate`` pub/sub message."""
+        if self.local_cache is None or not isinstance(message, (list, tuple)):
+            return
+        if len(message) != 3 or _as_str(message[0]) != "message":
+            return
+        if _as_str(message[1]) != _INVALIDATE_CHANNEL:
+            return
+        self.local_cache.invalidate(message[2])
+
+    def get_metrics(self) -> Dict[str, Any]:
+        in_use = len(self.pool._in_use_connections)
+        idle = len(self.pool._available_connections)
+        metrics: Dict[str, Any] = {
+            "url": _redact_url(self.url),
+            "clients": self.clients,
+            "max_connections": self.pool.max_connections,
+            "created_connections": in_use + idle,
+            "in_use_connections": in_use,
+            "idle_connections": idle,
+        }
+        if self.local_cache is not None:
+            metrics["client_side_cache"] = self.local_cache.get_stats()
+        return metrics
+
+    async def close(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._listener_conn is not None:
+            await self._listener_conn.disconnect()
+            self._listener_conn = None
+        await self.pool.disconnect()
+
+
+class _SharedRedis(redis.Redis):
+    """Redis client bound to a registry pool, serving cached reads locally."""
+
+    def __init__(self, entry: _RedisPoolEntry):
+        super().__init__(connection_pool=entry.pool)
+        self._entry = entry
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        cache = self._entry.local_cache
+        if cache is None:
+            return await super().execute_command(*args, **options)
+
+        await self._entry.ensure_tracking()
+        command = _as_str(args[0]).upper()
+
+        if (
+            cache.enabled
+            and command in _CACHEABLE_COMMANDS
+            and len(args) == 2
+            and cache.tracks(args[1])
+        ):
+            hit, value = cache.get(command, args[1])
+            if hit:
+                return value
+            generation = cache.generation
+            value = await super().execute_command(*args, **options)
+            cache.put(command, args[1], value, generation)
+            return value
+
+        if command in _MULTI_KEY_DELETES:
+            cache.invalidate(list(args[1:]))
+        elif command in _WRITE_COMMANDS and len(args) > 1:
+            cache.invalidate([args[1]])
+        return await super().execute_command(*args, **options)
+
+
+class RedisPoolRegistry:
+    """Process-wide registry handing out clients that share one pool per URL.
+
+    Caches, the rate limiter and token stores used to build their own
+    ``redis.from_url`` clients, so a worker held several independent pools
+    against the same server. Clients from this registry share a single tuned
+    pool per (URL, decode_responses) pair. Closing such a client does not
+    close the shared pool; use :meth:`close_all` on shutdown.
+
+    Optional client-side caching keeps GET/EXISTS results for keys under
+    ``cache_prefixes`` in process memory, invalidated through Redis
+    server-assisted tracking (``CLIENT TRACKING ... REDIRECT ... BCAST``).
+    Only enable it for prefixes that are read far more often than written.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 50,
+        health_check_interval: int = 30,
+        socket_keepalive: bool = True,
+        socket_connect_timeout: float = 5.0,
+        socket_timeout: float = 5.0,
+        protocol: int = 2,
+        client_side_cache: bool = False,
+        cache_max_keys: int = 10000,
+        cache_ttl: float = 60.0,
+        cache_prefixes: Tuple[str, ...] = (),
+    ):
+        """Initialize the registry (pools are created lazily per URL)."""
+        self.max_connections = max_connections
+        self.health_check_interval = health_check_interval
+        self.socket_keepalive = socket_keepalive
+        self.socket_connect_timeout = socket_connect_timeout
+        self.socket_timeout = socket_timeout
+        self.protocol = protocol
+        self.client_side_cache = client_side_cache
+        self.cache_max_keys = cache_max_keys
+        self.cache_ttl = cache_ttl
+        self.cache_prefixes = cache_prefixes
+
+        self._pools: Dict[Tuple[str, bool], _RedisPoolEntry] = {}
+
+    @classmethod
+    def from_env(cls) -> "RedisPoolRegistry":
+        """Build a registry from REDIS_* environment variables."""
+        prefixes = os.getenv("REDIS_CLIENT_CACHE_PREFIXES", "")
+        return cls(
+            max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "50")),
+            health_check_interval=int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30")),
+            socket_keepalive=os.getenv("REDIS_SOCKET_KEEPALIVE", "true").lower()
+            == "true",
+            socket_timeout=float(os.getenv("REDIS_SOCKET_TIMEOUT", "5.0")),
+            protocol=int(os.getenv("REDIS_PROTOCOL", "2")),
+            client_side_cache=os.getenv("REDIS_CLIENT_CACHE", "false").lower()
+            == "true",
+            cache_max_keys=int(os.getenv("REDIS_CLIENT_CACHE_MAX_KEYS", "10000")),
+            cache_ttl=float(os.getenv("REDIS_CLIENT_CACHE_TTL", "60")),
+            cache_prefixes=tuple(p.strip() for p in prefixes.split(",") if p.strip()),
+        )
+
+    def get_client(self, url: str, decode_responses: bool = True) -> redis.Redis:
+        """Return a client backed by the shared pool for ``url``."""
+        key = (url, decode_responses)
+        entry = self._pools.get(key)
+        if entry is None:
+            pool = redis.ConnectionPool.from_url(
+                url,
+                max_connections=self.max_connections,
+                health_check_interval=self.health_check_interval,
+                socket_keepalive=self.socket_keepalive,
+                socket_connect_timeout=self.socket_connect_timeout,
+                socket_timeout=self.socket_timeout,
+                protocol=self.protocol,
+                decode_responses=decode_responses,
+            )
+            local_cache = (
+                LocalKeyCache(self.cache_max_keys, self.cache_ttl, self.cache_prefixes)
+                if self.client_side_cache
+                else None
+            )
+            entry = _RedisPoolEntry(url, pool, local_cache)
+            self._pools[key] = entry
+            logger.info(
+                "Redis pool created",
+                url=_redact_url(url),
+                max_connections=self.max_connections,
+                client_side_cache=self.client_side_cache,
+            )
+
+        entry.clients += 1
+        return _SharedRedis(entry)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-pool connection counts and client-side cache statistics."""
+        pools = [entry.get_metrics() for entry in self._pools.values()]
+        return {
+            "pools": pools,
+            "total_pools": len(pools),
+            "total_connections": sum(p["created_connections"] for p in pools),
+        }
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Ping every pool."""
+        results = {}
+        for (url, _), entry in self._pools.items():
+            try:
+                await _SharedRedis(entry).ping()
+                results[_redact_url(url)] = "healthy"
+            except Exception as e:
+                results[_redact_url(url)] = f"unhealthy: {e}"
+        status = (
+            "healthy"
+            if all(r == "healthy" for r in results.values())
+            else "unhealthy"
+        )
+        return {"status": status, "pools": results}
+
+    async def close_all(self) -> None:
+        """Close every pool and its invalidation listener."""
+        entries = list(self._pools.values())
+        self._pools.clear()
+        for entry in entries:
+            await entry.close()
+        if entries:
+            logger.info("Redis pools closed", count=len(entries))
+
+
+_redis_registry: Optional[RedisPoolRegistry] = None
+
+
+def get_redis_registry() -> RedisPoolRegistry:
+    """Get the process-wide Redis pool registry (created from env on first use)."""
+    global _redis_registry
+    if _redis_registry is None:
+        _redis_registry = RedisPoolRegistry.from_env()
+    return _redis_registry
@@ -12,7 +12,7 @@ Sliding Window 알고리즘을 사용하여 시간 기반 정밀한 rate limitin
     - Graceful degradation 지원
 
 알고리즘:
-    1. Redis ZSET에 타임스탬프를 score로 요청 기록
+    1. Redis ZSET에 타임스탬프를 score로, "request_id:가중치"를 멤버로 요청 기록
     2. 윈도우 외부의 오래된 요청 자동 제거
     3. 현재 윈도우 내의 요청 수 계산
     4. 제한 초과 시 다음 가능 시간 계산
@@ -50,15 +50,12 @@ class RedisRateLimiter:
     -- 오래된 요청 제거
     redis.call('ZREMRANGEBYSCORE', key, '-inf', window_start)
     
-    -- 현재 윈도우 내의 총 가중치 계산
+    -- 현재 윈도우 내의 총 가중치 계산 (멤버 "request_id:weight"의 접미사)
     local current_weight = 0
     local requests = redis.call('ZRANGE', key, 0, -1, 'WITHSCORES')
     
     for i = 1, #requests, 2 do
-        local score = tonumber(requests[i + 1])
-        -- score의 소수 부분이 가중치를 나타냄
-        local req_weight = math.floor((score - math.floor(score)) * 1000 + 0.5)
-        if req_weight == 0 then req_weight = 1 end
+        local req_weight = tonumber(string.match(requests[i], ":(%d+)$")) or 1
         current_weight = current_weight + req_weight
     end
     
@@ -67,17 +64,15 @@ class RedisRateLimiter:
         -- 가장 오래된 요청의 만료 시간 계산
         if #requests > 0 then
             local oldest = tonumber(requests[2])
-            local oldest_timestamp = math.floor(oldest)
-            local retry_after = oldest_timestamp + window - now
-            return {0, current_weight, math.ceil(retry_after)}
+            local retry_after = oldest + window - now
+            return {0, current_weight, math.max(1, math.ceil(retry_after))}
         else
             return {0, current_weight, 1}
         end
     end
     
-    -- 요청 기록 (타임스탬프.가중치 형식으로 score 저장)
-    local score = now + (weight / 1000.0)
-    redis.call('ZADD', key, score, request_id)
+    -- 요청 기록 (score는 타임스탬프, 가중치는 멤버에 저장)
+    redis.call('ZADD', key, now, request_id .. ':' .. weight)
     redis.call('EXPIRE', key, window + 60)  -- 윈도우 + 버퍼
     
     return {1, current_weight + weight, 0}
@@ -114,6 +109,14 @@ class RedisRateLimiter:
             return f"rate_limit:{identifier}:{endpoint}"
         return f"rate_limit:{identifier}"
 
+    @staticmethod
+    def _member_weight(member: Any) -> int:
+        """ZSET 멤버("request_id:weight")에서 가중치 추출 (접미사가 없으면 1)"""
+        if isinstance(member, bytes):
+            member = member.decode()
+        _, sep, suffix = str(member).rpartition(":")
+        return int(suffix) if sep and suffix.isdigit() else 1
+
     async def check_rate_limit(
         self,
         identifier: str,
@@ -227,15 +230,9 @@ class RedisRateLimiter:
             total_weight = 0
             request_times = []
 
-            for _, score in requests:
-                # score가 float인지 확인
-                score_float = float(score)
-                timestamp = int(score_float)
-                # 소수 부분이 가중치를 나타냄
-                weight_part = score_float - timestamp
-                weight = int(weight_part * 1000 + 0.5) if weight_part > 0 else 1
-                total_weight += weight
-                request_times.append(timestamp)
+            for member, score in requests:
+                total_weight += self._member_weight(member)
+                request_times.append(float(score))
 
             # 다음 리셋 시간 계산
             if request_times:
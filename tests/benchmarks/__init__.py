@@ -0,0 +1 @@
+"""Performance benchmarks (pytest-benchmark)."""
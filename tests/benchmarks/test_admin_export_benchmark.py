@@ -0,0 +1,141 @@
+"""Benchmarks: admin user export, load-all vs. cursor streaming.
+
+"load-all" is the previous approach (read every user into memory, then
+write CSV row by row through a StringIO write/seek/truncate cycle);
+"stream" reads the same file database through
+SQLiteUserRepository.iter_export_batches and encodes one batch at a time.
+Besides wall time, each variant records the tracemalloc peak in
+``extra_info["peak_mb"]``: the streamed peak stays flat as ROWS grows.
+
+Run with:
+    uv run pytest tests/benchmarks/test_admin_export_benchmark.py -m benchmark -s
+"""
+
+import asyncio
+import csv
+import gzip
+import io
+import sqlite3
+import tracemalloc
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.database import Base, User as UserDB, create_engines
+from src.auth.export import USER_EXPORT_COLUMNS, stream_export
+from src.auth.repositories.sqlite_user_repository import SQLiteUserRepository
+
+ROWS = 20_000
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    path = tmp_path_factory.mktemp("export") / "auth.db"
+    url = f"sqlite+aiosqlite:///{path}"
+
+    async def create():
+        writer, reader = create_engines(url)
+        async with writer.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await writer.dispose()
+        await reader.dispose()
+
+    asyncio.run(create())
+    conn = sqlite3.connect(path)
+    created = datetime(2025, 1, 1).isoformat(sep=" ")
+    conn.executemany(
+        "INSERT INTO users (id, email, username, password_hash, is_verified,"
+        " is_active, created_at) VALUES (?, ?, ?, 'hash', 0, 1, ?)",
+        ((f"u{i:07d}", f"user{i}@bench.dev", f"user {i}", created) for i in range(ROWS)),
+    )
+    conn.executemany(
+        "INSERT INTO user_roles (user_id, role) VALUES (?, 'user')",
+        ((f"u{i:07d}",) for i in range(ROWS)),
+    )
+    conn.commit()
+    conn.close()
+    return url
+
+
+async def load_all(session):
+    """Previous export: every ORM row in memory, one StringIO cycle per row."""
+    users = (await session.execute(select(UserDB))).scalars().all()
+    output = io.StringIO()
+    writer = csv.writer(output)
+    size = 0
+    for user in users:
+        writer.writerow([user.id, user.username, user.email, "user", user.is_active])
+        size += len(output.getvalue().encode())
+        output.seek(0)
+        output.truncate(0)
+    return size
+
+
+async def stream(session, fmt, compress):
+    repository = SQLiteUserRepository(session)
+    size = 0
+    async for chunk in stream_export(
+        repository.iter_export_batches(1000), USER_EXPORT_COLUMNS, fmt, compress
+    ):
+        size += len(chunk)
+    return size
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "variant", ["load-all", "stream-csv", "stream-csv-gzip", "stream-ndjson"]
+)
+def test_user_export(benchmark, loop, database, variant):
+    """Export every user once; compare wall time and allocation peak."""
+    writer, reader = create_engines(database)
+
+    async def export():
+        async with AsyncSession(reader) as session:
+            if variant == "load-all":
+                return await load_all(session)
+            fmt = "ndjson" if variant == "stream-ndjson" else "csv"
+            return await stream(session, fmt, variant.endswith("gzip"))
+
+    def run():
+        tracemalloc.start()
+        try:
+            size = loop.run_until_complete(export())
+            benchmark.extra_info["peak_mb"] = round(
+                tracemalloc.get_traced_memory()[1] / 2**20, 1
+            )
+        finally:
+            tracemalloc.stop()
+        return size
+
+    benchmark.group = "admin-user-export"
+    size = benchmark.pedantic(run, rounds=1, iterations=1)
+    loop.run_until_complete(writer.dispose())
+    loop.run_until_complete(reader.dispose())
+
+    assert size > 0
+    print(f"\n{variant}: {size / 2**20:.1f} MB out, peak {benchmark.extra_info['peak_mb']} MB")
+    if variant.startswith("stream"):
+        assert benchmark.extra_info["peak_mb"] < 64
+
+
+def test_gzip_output_is_valid():
+    """The gzip variant produces a complete gzip member."""
+
+    async def rows():
+        yield [{"id": "u1", "roles": ["user"]}]
+
+    async def run():
+        return b"".join(
+            [c async for c in stream_export(rows(), USER_EXPORT_COLUMNS, "csv", True)]
+        )
+
+    assert gzip.decompress(asyncio.run(run())).startswith(b"ID,")
@@ -0,0 +1,61 @@
+"""Benchmarks: repeated /admin/roles/matrix refreshes with the render cache.
+
+"render" disables the cache (every request rebuilds the FastHTML tree, as
+before); "fragment-hit" serves the cached HTML for an unchanged roles
+version; "not-modified" is a browser/HTMX refresh that sends the previous
+ETag back and gets an empty 304.
+
+Run with:
+    uv run pytest tests/benchmarks/test_admin_render_cache_benchmark.py -m benchmark
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.auth import render_cache
+from src.auth.dependencies import require_admin
+from src.auth.models import UserResponse
+from src.auth.render_cache import RenderCache
+from src.auth.server import app
+
+ADMIN = UserResponse(
+    id="admin",
+    email="admin@bench.dev",
+    roles=["admin"],
+    is_active=True,
+    is_verified=True,
+    created_at=datetime(2025, 1, 1),
+)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    app.dependency_overrides[require_admin] = lambda: ADMIN
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("variant", ["render", "fragment-hit", "not-modified"])
+def test_roles_matrix_refresh(benchmark, client, monkeypatch, variant):
+    """One dashboard refresh of the role/tool permission matrix."""
+    cache = RenderCache(ttl=0 if variant == "render" else 300)
+    monkeypatch.setattr(render_cache, "_render_cache", cache)
+    first = client.get("/admin/roles/matrix")
+    headers = {}
+    if variant == "not-modified":
+        headers["If-None-Match"] = first.headers["etag"]
+
+    def refresh():
+        return client.get("/admin/roles/matrix", headers=headers)
+
+    benchmark.group = "admin-roles-matrix"
+    response = benchmark(refresh)
+
+    assert response.status_code == (304 if variant == "not-modified" else 200)
+    if variant != "not-modified":
+        assert response.text == first.text
@@ -0,0 +1,145 @@
+"""Benchmarks: auth gateway SQLite traffic under concurrency.
+
+Runs a mix of login / refresh / me requests (plus a trickle of
+registrations, the only writes) through SQLiteAuthService against a
+temporary file database, once with a plain engine and once with the tuned
+profile (WAL pragmas, single writer connection, query_only read pool).
+Passwords use a cheap hash so the database, not bcrypt, dominates.
+
+Run with:
+    uv run pytest tests/benchmarks/test_auth_sqlite_benchmark.py -m benchmark -s
+"""
+
+import asyncio
+import time
+
+import pytest
+from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.auth.database import Base, SQLiteEngineProfile, create_engines
+from src.auth.models import UserCreate, UserLogin
+from src.auth.services.auth_service_sqlite import SQLiteAuthService
+from src.auth.services.jwt_service import JWTService
+from src.utils.connection_manager import percentile
+
+USERS = 20
+CLIENTS = 24
+REQUESTS_PER_CLIENT = 40
+PASSWORD = "Bench123!pass"
+
+
+def plain_engines(url):
+    engine = create_async_engine(url, pool_pre_ping=True)
+    return engine, engine
+
+
+def tuned_engines(url):
+    return create_engines(url, SQLiteEngineProfile(read_pool_size=8))
+
+
+async def run_traffic(writer, reader):
+    """Run the request mix; return (latencies ms, errors, elapsed seconds)."""
+    write_session = sessionmaker(writer, class_=AsyncSession, expire_on_commit=False)
+    read_session = sessionmaker(reader, class_=AsyncSession, expire_on_commit=False)
+    service = SQLiteAuthService(
+        JWTService(secret_key="auth-sqlite-benchmark-secret-key-long-enough")
+    )
+    service.pwd_context = CryptContext(
+        schemes=["sha256_crypt"], sha256_crypt__rounds=1000
+    )
+
+    async with writer.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tokens = []
+    for i in range(USERS):
+        async with write_session() as session:
+            await service.register(
+                UserCreate(email=f"user{i}@bench.dev", password=PASSWORD), session
+            )
+        async with read_session() as session:
+            tokens.append(
+                await service.login(
+                    UserLogin(email=f"user{i}@bench.dev", password=PASSWORD), session
+                )
+            )
+
+    latencies = []
+    errors = []
+
+    async def client(index):
+        for n in range(REQUESTS_PER_CLIENT):
+            user = (index + n) % USERS
+            start = time.perf_counter()
+            try:
+                if n % 10 == 9:
+                    async with write_session() as session:
+                        await service.register(
+                            UserCreate(
+                                email=f"new{index}-{n}@bench.dev", password=PASSWORD
+                            ),
+                            session,
+                        )
+                    continue
+                async with read_session() as session:
+                    if n % 3 == 0:
+                        await service.login(
+                            UserLogin(email=f"user{user}@bench.dev", password=PASSWORD),
+                            session,
+                        )
+                    elif n % 3 == 1:
+                        await service.refresh_tokens(
+                            tokens[user].refresh_token, session
+                        )
+                    else:
+                        await service.get_current_user(
+                            tokens[user].access_token, session
+                        )
+                latencies.append((time.perf_counter() - start) * 1000)
+            except Exception as e:  # noqa: BLE001 - counted, not raised
+                errors.append(repr(e))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(CLIENTS)))
+    return latencies, errors, time.perf_counter() - start
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("profile", ["plain", "tuned"])
+def test_auth_sqlite_concurrency(benchmark, loop, tmp_path, profile):
+    """Concurrent login/refresh/me traffic with background registrations."""
+    make_engines = tuned_engines if profile == "tuned" else plain_engines
+    rounds = iter(range(1000))
+
+    def run():
+        url = f"sqlite+aiosqlite:///{tmp_path / f'auth-{next(rounds)}.db'}"
+        writer, reader = make_engines(url)
+
+        async def scenario():
+            try:
+                return await run_traffic(writer, reader)
+            finally:
+                await writer.dispose()
+                if reader is not writer:
+                    await reader.dispose()
+
+        return loop.run_until_complete(scenario())
+
+    benchmark.group = "auth-sqlite"
+    latencies, errors, elapsed = benchmark.pedantic(run, rounds=3, iterations=1)
+
+    benchmark.extra_info["reads_per_second"] = round(len(latencies) / elapsed, 1)
+    benchmark.extra_info["read_p50_ms"] = round(percentile(latencies, 50), 2)
+    benchmark.extra_info["read_p95_ms"] = round(percentile(latencies, 95), 2)
+
+    assert not errors, errors[:3]
+    assert len(latencies) == CLIENTS * REQUESTS_PER_CLIENT * 9 // 10
@@ -0,0 +1,48 @@
+"""Benchmarks: client-side merge-and-sort vs. ResultFusion top-k heap."""
+
+import pytest
+
+from src.retrievers.fusion import ResultFusion, result_key
+
+SOURCES = {
+    "tavily": [
+        {"url": f"https://example.com/{i}", "content": f"web {i}", "score": 1 / (i + 1)}
+        for i in range(500)
+    ],
+    "qdrant": [
+        {"id": str(i), "text": f"web {i * 2}", "score": 0.5 - i / 2000}
+        for i in range(500)
+    ],
+    "postgres": [{"id": i, "content": f"row {i}"} for i in range(500)],
+}
+TOP_K = 10
+
+
+def _merge_all():
+    """What clients did before: copy, dedupe, rank and sort every result."""
+    merged: dict[str, dict] = {}
+    for source, results in SOURCES.items():
+        for rank, result in enumerate(results, start=1):
+            key = result_key(result)
+            if key in merged:
+                merged[key]["fused_score"] += 1 / (60 + rank)
+            else:
+                merged[key] = {**result, "fused_score": 1 / (60 + rank)}
+    ranked = sorted(merged.values(), key=lambda r: r["fused_score"], reverse=True)
+    return ranked[:TOP_K]
+
+
+def _fuse():
+    fusion = ResultFusion(method="rrf")
+    for source, results in SOURCES.items():
+        fusion.add(source, results)
+    return fusion.top_k(TOP_K)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("variant", ["merge-all", "fusion"])
+def test_fusion_top_k(benchmark, variant):
+    """Merge 3 x 500 results down to a top-10 list."""
+    benchmark.group = "search-all-fusion"
+    result = benchmark(_merge_all if variant == "merge-all" else _fuse)
+    assert len(result) == TOP_K
@@ -0,0 +1,65 @@
+"""Benchmarks: synchronous request logging vs. AsyncLogSink.
+
+Measures the time LoggingMiddleware spends on the event loop per batch of
+requests with request-body logging enabled.
+"""
+
+import asyncio
+
+import pytest
+
+from src.middleware import LoggingMiddleware
+from src.utils.log_sink import AsyncLogSink
+
+BATCH = 200
+
+
+def _request() -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {
+            "name": "search_all",
+            "arguments": {"query": "bench " * 50, "token": "secret", "limit": 10},
+        },
+        "user": {"id": "bench", "email": "bench@example.com", "type": "user"},
+    }
+
+
+async def _handler(request):
+    return {"result": "ok"}
+
+
+def _discard(records):
+    pass
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("variant", ["sync", "sink", "sink-sampled"])
+def test_request_logging(benchmark, loop, variant):
+    """On-loop cost of request logging."""
+    sink = None
+    if variant != "sync":
+        sink = AsyncLogSink(writer=_discard, max_queue_size=BATCH * 1000)
+    middleware = LoggingMiddleware(
+        log_request_body=True,
+        sink=sink,
+        success_sample_rate=0.1 if variant == "sink-sampled" else 1.0,
+    )
+
+    async def batch():
+        for _ in range(BATCH):
+            await middleware(_request(), _handler)
+
+    benchmark.group = "request-logging"
+    benchmark(lambda: loop.run_until_complete(batch()))
+    if sink:
+        sink.close()
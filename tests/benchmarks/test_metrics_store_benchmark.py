@@ -0,0 +1,101 @@
+"""Benchmarks: analytics dashboard query over 30 days of MCP traffic.
+
+"raw-events" keeps every request and aggregates on each dashboard refresh
+(what an event log would need); "rollups" is MetricsTimeSeries reading the
+pre-aggregated hour buckets. The rollup query reads 720 hashes no matter
+how many requests were recorded. Redis is the in-memory fake from the unit
+tests, so the numbers show aggregation cost, not network latency.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from src.utils.metrics_store import HOUR, MetricsStoreConfig, MetricsTimeSeries
+from tests.unit.test_utils.test_metrics_store import FakeRedis
+
+DAYS = 30
+REQUESTS_PER_HOUR = 400
+TOOLS = ["search_web", "search_vectors", "search_database", "health_check"]
+NOW = 1735689600.0 + DAYS * 24 * HOUR
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def events():
+    rng = random.Random(0)
+    start = NOW - DAYS * 24 * HOUR
+    return [
+        (
+            start + rng.random() * DAYS * 24 * HOUR,
+            rng.choice(TOOLS),
+            rng.expovariate(1 / 120),
+            rng.random() < 0.02,
+            f"user-{rng.randrange(50)}",
+        )
+        for _ in range(DAYS * 24 * REQUESTS_PER_HOUR)
+    ]
+
+
+def aggregate_events(events, start, end):
+    tools = {}
+    users = set()
+    for ts, tool, duration, error, user in events:
+        if not start <= ts < end:
+            continue
+        stats = tools.setdefault(tool, {"count": 0, "errors": 0, "duration_ms": 0.0})
+        stats["count"] += 1
+        stats["errors"] += error
+        stats["duration_ms"] += duration
+        users.add(user)
+    return {"tools": tools, "active_users": len(users)}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("variant", ["raw-events", "rollups"])
+def test_thirty_day_dashboard_query(benchmark, loop, events, variant):
+    """Per-tool totals and active users for the last 30 days."""
+    start = NOW - DAYS * 24 * HOUR
+    if variant == "rollups":
+        store = MetricsTimeSeries(FakeRedis(), MetricsStoreConfig())
+        for ts, tool, duration, error, user in events:
+            store.record("tools/call", tool, duration, error, user, "user", ts)
+        loop.run_until_complete(store.flush())
+
+        def query():
+            return loop.run_until_complete(
+                store.query(start, NOW, step=24 * HOUR, now=NOW)
+            )
+
+    else:
+
+        def query():
+            return aggregate_events(events, start, NOW)
+
+    benchmark.group = "analytics-30d-query"
+    result = benchmark.pedantic(query, rounds=5, iterations=1)
+
+    assert sum(stats["count"] for stats in result["tools"].values()) == len(events)
+    assert result["active_users"] == 50
+
+
+@pytest.mark.benchmark
+def test_record_overhead(benchmark):
+    """Cost of recording one request on the MCP request path."""
+    store = MetricsTimeSeries(FakeRedis(), MetricsStoreConfig())
+
+    def record_batch():
+        for i in range(1000):
+            store.record("tools/call", TOOLS[i % 4], 42.0, False, "u1", "user", NOW)
+
+    benchmark.group = "analytics-record"
+    benchmark(record_batch)
+
+    assert store.recorded >= 1000
@@ -0,0 +1,92 @@
+"""Benchmarks: nested middleware chain vs. compiled MiddlewarePipeline.
+
+Run with:
+    uv run pytest tests/benchmarks -m benchmark --benchmark-only
+"""
+
+import asyncio
+
+import pytest
+
+from src.middleware import (
+    LoggingMiddleware,
+    MetricsMiddleware,
+    MiddlewarePipeline,
+    RateLimitMiddleware,
+    ValidationMiddleware,
+)
+
+BATCH = 200
+
+
+def _middlewares():
+    return [
+        LoggingMiddleware(),
+        ValidationMiddleware(),
+        RateLimitMiddleware(
+            requests_per_minute=10**9, requests_per_hour=10**9, burst_size=10**9
+        ),
+        MetricsMiddleware(),
+    ]
+
+
+def _request(method: str) -> dict:
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": method,
+        "params": {},
+        "user": {"id": "bench", "roles": ["user"]},
+    }
+    if method == "tools/call":
+        request["params"] = {"name": "search_web", "arguments": {"query": "bench"}}
+    return request
+
+
+async def _handler(request):
+    return {"result": "ok"}
+
+
+def _nested(middlewares):
+    """Original behavior: every layer wraps every request."""
+
+    async def run(request):
+        async def call(index, req):
+            if index == len(middlewares):
+                return await _handler(req)
+            return await middlewares[index](req, lambda r: call(index + 1, r))
+
+        return await call(0, request)
+
+    return run
+
+
+def _compiled(middlewares):
+    pipeline = MiddlewarePipeline(middlewares)
+
+    async def run(request):
+        return await pipeline.dispatch(request, _handler)
+
+    return run
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("method", ["tools/list", "tools/call"])
+@pytest.mark.parametrize("variant", ["nested", "compiled"])
+def test_middleware_chain(benchmark, loop, method, variant):
+    """Throughput of a batch of requests through the middleware stack."""
+    run = (_nested if variant == "nested" else _compiled)(_middlewares())
+
+    async def batch():
+        for _ in range(BATCH):
+            await run(_request(method))
+
+    benchmark.group = f"middleware-{method}"
+    benchmark(lambda: loop.run_until_complete(batch()))
@@ -0,0 +1,192 @@
+"""Benchmarks: permissions admin list, OFFSET + COUNT(*) vs. keyset + estimate.
+
+Seeds ROWS resource permissions and compares one page load of the admin
+table: "offset-count" is the previous query pair (exact COUNT(*) plus
+``ORDER BY granted_at DESC LIMIT/OFFSET``); "keyset-estimate" is
+PermissionService.list_resource_permissions with a cursor at the same depth
+plus estimate_permission_count.
+
+There is no PostgreSQL server here, so the connection is an in-memory SQLite
+stand-in with the same indexes: ``$n`` placeholders become ``:pn``, ILIKE
+becomes LIKE, and ``EXPLAIN (FORMAT JSON)`` is answered from the ANALYZE
+statistics (sqlite_stat1) the way the planner answers it from pg_statistic.
+
+Run with:
+    uv run pytest tests/benchmarks/test_permissions_keyset_benchmark.py -m benchmark
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+
+import pytest
+
+from src.auth.models import ResourceType
+from src.auth.services.permission_service import PermissionService, encode_cursor
+
+ROWS = 100_000
+LIMIT = 50
+ROLES = [f"role_{i}" for i in range(20)]
+TYPES = [t.value for t in ResourceType]
+
+SCHEMA = """
+CREATE TABLE resource_permissions (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER,
+    role_name TEXT,
+    resource_type TEXT NOT NULL,
+    resource_name TEXT NOT NULL,
+    actions TEXT NOT NULL,
+    conditions TEXT,
+    granted_at TEXT,
+    granted_by INTEGER,
+    expires_at TEXT
+);
+CREATE INDEX idx_resource_permissions_type_role_name
+    ON resource_permissions(resource_type, role_name, resource_name);
+CREATE INDEX idx_resource_permissions_type_role_id
+    ON resource_permissions(resource_type, role_name, id);
+CREATE INDEX idx_resource_permissions_user_keyset ON resource_permissions(user_id, id);
+CREATE INDEX idx_resource_permissions_role_keyset ON resource_permissions(role_name, id);
+"""
+
+# column -> (index, position of the column in the sqlite_stat1 "stat" string)
+STAT_COLUMNS = {
+    "resource_type": ("idx_resource_permissions_type_role_name", 1),
+    "role_name": ("idx_resource_permissions_role_keyset", 1),
+    "user_id": ("idx_resource_permissions_user_keyset", 1),
+}
+
+
+class SQLiteStandIn:
+    """asyncpg-like connection over sqlite3 (fetch / fetchval only)."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def _execute(self, sql, args):
+        sql = re.sub(r"\$(\d+)", r":p\1", sql).replace("ILIKE", "LIKE")
+        return self.conn.execute(sql, {f"p{i}": v for i, v in enumerate(args, 1)})
+
+    async def fetch(self, sql, *args):
+        return self._execute(sql, args).fetchall()
+
+    async def fetchval(self, sql, *args):
+        if sql.startswith("EXPLAIN (FORMAT JSON)"):
+            return json.dumps([{"Plan": {"Plan Rows": self._estimate(sql)}}])
+        return self._execute(sql, args).fetchone()[0]
+
+    def _estimate(self, sql):
+        """Table rows times the average equality selectivity from ANALYZE."""
+        stats = dict(
+            self.conn.execute(
+                "SELECT idx, stat FROM sqlite_stat1 WHERE tbl = 'resource_permissions'"
+            ).fetchall()
+        )
+        total = int(next(iter(stats.values())).split()[0])
+        rows = float(total)
+        for column, (index, position) in STAT_COLUMNS.items():
+            if f"{column} = $" in sql:
+                rows *= int(stats[index].split()[position]) / total
+        if "ILIKE" in sql:
+            rows *= 0.05
+        return max(1, int(rows))
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def connection():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO resource_permissions (id, user_id, role_name, resource_type,"
+        " resource_name, actions, conditions, granted_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (
+                i,
+                i if i % 10 == 0 else None,
+                None if i % 10 == 0 else ROLES[i % len(ROLES)],
+                TYPES[i % len(TYPES)],
+                f"schema_{i % 500}.table_{i}",
+                '["read"]',
+                "{}",
+                f"2025-01-01 00:00:{i:08d}",
+            )
+            for i in range(1, ROWS + 1)
+        ),
+    )
+    conn.execute("ANALYZE")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+SCENARIOS = {
+    # page 1_800 of the unfiltered list (skip=90_000)
+    "deep-page": ({}, 90_000),
+    # second page of one role's database permissions
+    "filtered": ({"resource_type": ResourceType.DATABASE, "role_name": "role_3"}, LIMIT),
+}
+
+
+async def offset_count(conn, filters, skip):
+    """Previous endpoint: exact COUNT(*) plus OFFSET pagination."""
+    where, params = [], []
+    for column, value in filters.items():
+        params.append(getattr(value, "value", value))
+        where.append(f"{column} = ?")
+    where_clause = f"WHERE {' AND '.join(where)}" if where else ""
+    total = conn.execute(
+        f"SELECT COUNT(*) FROM resource_permissions {where_clause}", params
+    ).fetchone()[0]
+    rows = conn.execute(
+        f"SELECT * FROM resource_permissions {where_clause}"
+        " ORDER BY granted_at DESC LIMIT ? OFFSET ?",
+        [*params, LIMIT, skip],
+    ).fetchall()
+    return total, rows
+
+
+async def keyset_estimate(service, filters, cursor):
+    page = await service.list_resource_permissions(**filters, limit=LIMIT, cursor=cursor)
+    total, _ = await service.estimate_permission_count(**filters)
+    return total, page.rows
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+@pytest.mark.parametrize("variant", ["offset-count", "keyset-estimate"])
+def test_permissions_page(benchmark, loop, connection, scenario, variant):
+    """Load one admin table page at the same depth with each strategy."""
+    filters, skip = SCENARIOS[scenario]
+    service = PermissionService(db_conn=SQLiteStandIn(connection))
+
+    # cursor pointing just past the first `skip` rows of the newest-first list
+    where = " AND ".join(
+        f"{column} = '{getattr(value, 'value', value)}'" for column, value in filters.items()
+    )
+    anchor = connection.execute(
+        f"SELECT id FROM resource_permissions {'WHERE ' + where if where else ''}"
+        " ORDER BY id DESC LIMIT 1 OFFSET ?",
+        (skip - 1,),
+    ).fetchone()[0]
+    cursor = encode_cursor(anchor)
+
+    def load():
+        if variant == "offset-count":
+            return loop.run_until_complete(offset_count(connection, filters, skip))
+        return loop.run_until_complete(keyset_estimate(service, filters, cursor))
+
+    benchmark.group = f"permissions-page-{scenario}"
+    total, rows = benchmark(load)
+
+    assert len(rows) == LIMIT
+    assert total > 0
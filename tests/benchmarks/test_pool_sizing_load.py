@@ -0,0 +1,134 @@
+"""Load test: adaptive PostgreSQL pool sizing under a load ramp.
+
+Drives PostgreSQLPoolManager through low -> high -> low concurrency and
+checks that the sizing controller grows the checkout limit under load and
+gives it back afterwards. By default the pool is a local stand-in that
+models a Postgres server (fixed query service time, connection setup
+cost); set ``LOADTEST_POSTGRES_DSN`` to run the same ramp against a real
+server with ``SELECT pg_sleep(...)`` queries.
+
+Run with:
+    uv run pytest tests/benchmarks/test_pool_sizing_load.py -m benchmark -s
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.utils.connection_manager import PostgreSQLPoolManager, percentile
+
+QUERY_SECONDS = 0.005
+CONNECT_SECONDS = 0.003
+# (concurrent clients, seconds)
+PHASES = [("warm", 2, 0.6), ("peak", 40, 1.2), ("cool", 2, 1.5)]
+
+
+class StandInConnection:
+    async def fetchval(self, query, *args):
+        await asyncio.sleep(QUERY_SECONDS)
+        return 1
+
+
+class StandInPool:
+    """Local stand-in for an asyncpg pool backed by a Postgres server."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.idle = []
+        self.opened = 0
+        self._slots = asyncio.Semaphore(max_size)
+
+    async def acquire(self):
+        await self._slots.acquire()
+        if self.idle:
+            return self.idle.pop()
+        await asyncio.sleep(CONNECT_SECONDS)
+        self.opened += 1
+        return StandInConnection()
+
+    async def release(self, conn):
+        self.idle.append(conn)
+        self._slots.release()
+
+    def get_size(self):
+        return self.opened
+
+    def get_idle_size(self):
+        return len(self.idle)
+
+    async def close(self):
+        self.idle.clear()
+
+
+async def run_ramp(manager):
+    """Run the load phases; return per-phase (limit, p95 wait ms, queries)."""
+    results = {}
+    for name, clients, seconds in PHASES:
+        waits = []
+        deadline = time.monotonic() + seconds
+
+        async def client():
+            while time.monotonic() < deadline:
+                start = time.monotonic()
+                async with manager.acquire() as conn:
+                    waits.append((time.monotonic() - start) * 1000)
+                    await conn.fetchval(f"SELECT pg_sleep({QUERY_SECONDS})")
+
+        await asyncio.gather(*(client() for _ in range(clients)))
+        results[name] = {
+            "limit": manager.capacity.limit,
+            "wait_p95_ms": round(percentile(waits, 95), 2),
+            "queries": len(waits),
+        }
+    return results
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.benchmark
+def test_pool_sizing_follows_load(benchmark, loop):
+    """The controller grows under the peak and shrinks once load drops."""
+    dsn = os.getenv("LOADTEST_POSTGRES_DSN")
+    manager = PostgreSQLPoolManager(
+        {
+            "dsn": dsn or "postgresql://stand-in/loadtest",
+            "min_size": 2,
+            "max_size": 30,
+            "autoscale": True,
+            "autoscale_interval": 0.1,
+            "autoscale_target_wait_ms": 5.0,
+            "autoscale_step": 4,
+            "autoscale_hysteresis": 2,
+            "autoscale_cooldown": 0.1,
+        }
+    )
+
+    async def scenario():
+        if dsn:
+            await manager.initialize()
+        else:
+            manager._pool = StandInPool(manager.max_size)
+            manager.sizer.start()
+        try:
+            return await run_ramp(manager)
+        finally:
+            await manager.close()
+
+    benchmark.group = "pool-sizing"
+    results = benchmark.pedantic(
+        lambda: loop.run_until_complete(scenario()), rounds=1, iterations=1
+    )
+    benchmark.extra_info.update(results)
+    benchmark.extra_info["decisions"] = dict(manager.sizer.counts)
+
+    assert results["warm"]["limit"] <= 10
+    assert results["peak"]["limit"] >= 14
+    assert results["cool"]["limit"] < results["peak"]["limit"]
+    assert manager.capacity.limit <= manager.max_size
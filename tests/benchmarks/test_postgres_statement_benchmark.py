@@ -0,0 +1,104 @@
+"""Benchmarks: repeated Postgres text searches with and without plan reuse.
+
+The fake connection mimics asyncpg's per-connection statement cache: SQL
+text it has not seen costs a 1 ms parse/plan round trip, cached text is
+free. "bound" runs text searches whose values are bind parameters (one
+statement shape); "literal" inlines the values into the SQL, so every
+distinct search is parsed and planned again.
+"""
+
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from unittest.mock import Mock
+
+import pytest
+
+from src.retrievers.postgres import PostgresRetriever
+
+BATCH = 50
+PARSE_LATENCY = 0.001
+TERMS = [f"term{i}" for i in range(10)]
+
+
+class StatementCachingConnection:
+    """Connection with an LRU statement cache keyed by SQL text."""
+
+    def __init__(self, cache_size=100):
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.prepares = 0
+
+    async def _prepare(self, sql):
+        if sql in self.cache:
+            self.cache.move_to_end(sql)
+            return
+        self.prepares += 1
+        await asyncio.sleep(PARSE_LATENCY)
+        self.cache[sql] = True
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def _rows(self, sql):
+        await self._prepare(sql)
+        for i in range(10):
+            yield {"id": i, "title": f"document {i}"}
+
+    def cursor(self, sql, *params, prefetch=None):
+        return self._rows(sql)
+
+
+def make_retriever(conn):
+    retriever = PostgresRetriever({"dsn": "postgresql://bench@localhost/bench"})
+
+    @asynccontextmanager
+    async def acquire(readonly=False):
+        yield conn
+
+    retriever._pool_manager = Mock(acquire=acquire)
+    retriever._connected = True
+    return retriever
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("variant", ["literal", "bound"])
+def test_repeated_text_search(benchmark, loop, variant):
+    """Search the same table for rotating terms and limits."""
+    conn = StatementCachingConnection()
+    retriever = make_retriever(conn)
+    counter = iter(range(10**9))
+
+    async def batch():
+        for _ in range(BATCH):
+            i = next(counter)
+            term, limit = TERMS[i % len(TERMS)], 5 + i % 7
+            if variant == "bound":
+                rows = retriever.retrieve(
+                    term, limit=limit, table="docs", search_columns=["title"]
+                )
+            else:
+                rows = retriever.retrieve(
+                    f"SELECT * FROM docs WHERE title ILIKE '%{term}%' "
+                    f"LIMIT {limit} OFFSET {i}"
+                )
+            async for _ in rows:
+                pass
+
+    benchmark.group = "postgres-statements"
+    benchmark(lambda: loop.run_until_complete(batch()))
+
+    benchmark.extra_info["prepares"] = conn.prepares
+    if variant == "bound":
+        assert conn.prepares == 1
+        assert retriever.get_statement_stats()["size"] == 1
@@ -0,0 +1,43 @@
+"""Benchmarks: wait-time percentile query after long uptime.
+
+"sorted-list" is the previous approach (keep every wait, sort on each
+health check); "sketch" is the fixed-memory DecayingQuantileSketch used by
+ConnectionPoolMetrics. The query cost of the sketch does not depend on
+how many waits were recorded.
+"""
+
+import random
+import statistics
+
+import pytest
+
+from src.utils.quantiles import DecayingQuantileSketch
+
+SAMPLES = 200_000
+
+
+@pytest.fixture(scope="module")
+def waits():
+    rng = random.Random(0)
+    return [rng.expovariate(1 / 5) for _ in range(SAMPLES)]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("variant", ["sorted-list", "sketch"])
+def test_percentile_query(benchmark, waits, variant):
+    """p50/p95/p99 of all recorded waits, as a health check reads them."""
+    if variant == "sketch":
+        sketch = DecayingQuantileSketch()
+        for wait in waits:
+            sketch.add(wait)
+        query = sketch.snapshot
+    else:
+
+        def query():
+            cuts = statistics.quantiles(waits, n=100)
+            return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+    benchmark.group = "wait-percentiles"
+    result = benchmark(query)
+
+    assert result["p99"] > result["p95"] > result["p50"] > 0
@@ -0,0 +1,65 @@
+"""Benchmarks: CachingRetriever hit path vs. backend path.
+
+The backend simulates a 2 ms round trip (a fast Qdrant/Postgres query);
+the cache uses an in-memory Redis client so the numbers show the
+decorator's own overhead (key normalization, JSON round trip).
+"""
+
+import asyncio
+
+import pytest
+
+from src.retrievers.base import Retriever, RetrieverHealth
+from src.retrievers.caching import CachingRetriever
+from tests.unit.test_retrievers.test_caching import fake_cache
+
+BATCH = 50
+BACKEND_LATENCY = 0.002
+
+
+class SlowRetriever(Retriever):
+    """Backend with fixed latency returning 10 documents."""
+
+    async def connect(self):
+        self._connected = True
+
+    async def disconnect(self):
+        self._connected = False
+
+    async def retrieve(self, query, limit=10, **kwargs):
+        await asyncio.sleep(BACKEND_LATENCY)
+        for i in range(limit):
+            yield {"id": i, "content": f"{query} document {i} " * 10, "score": 0.5}
+
+    async def health_check(self):
+        return RetrieverHealth(healthy=True, service_name="Slow")
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("variant", ["backend", "cache-hit"])
+def test_retriever_cache(benchmark, loop, variant):
+    """Repeated search for the same (differently spelled) query."""
+    retriever = CachingRetriever(SlowRetriever({}), "qdrant", cache=fake_cache())
+    retriever._use_cache = variant == "cache-hit"
+    queries = ["Vector  Search", "vector search", " VECTOR search "]
+
+    async def batch():
+        for i in range(BATCH):
+            async for _ in retriever.retrieve(queries[i % len(queries)]):
+                pass
+
+    # Warm the cache so the measured loop only sees hits
+    loop.run_until_complete(batch())
+
+    benchmark.group = "retriever-cache"
+    benchmark(lambda: loop.run_until_complete(batch()))
+
+    if variant == "cache-hit":
+        assert retriever.get_cache_stats()["misses"] == 1
@@ -0,0 +1,91 @@
+"""Benchmarks: refresh token revocation checks with and without the Bloom filter.
+
+RedisTokenRepository.is_token_valid on a batch of valid jtis, with REVOKED
+jtis in the revocation list. "no-filter" is the previous behaviour (EXISTS
+on revoked_tokens:<jti>, then EXISTS on refresh_token:<jti>); "bloom-filter"
+skips the revocation lookup whenever the in-process filter says the jti was
+never revoked. The stand-in Redis sleeps RTT seconds per command to model a
+network round trip; ``extra_info["round_trips"]`` is the per-check count.
+
+Run with:
+    uv run pytest tests/benchmarks/test_revocation_filter_benchmark.py -m benchmark
+"""
+
+import asyncio
+
+import pytest
+
+from src.auth.repositories.token_repository import RedisTokenRepository
+from src.auth.revocation_filter import BloomFilter, RevokedTokenFilter
+
+REVOKED = 10_000
+CHECKS = 200
+RTT = 0.0002
+
+
+class LatencyRedis:
+    """Key-existence stand-in that pays one simulated RTT per command."""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.commands = 0
+
+    async def exists(self, key):
+        self.commands += 1
+        await asyncio.sleep(RTT)
+        return int(key in self.keys)
+
+    async def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        for key in self.keys:
+            if key.startswith(prefix):
+                yield key
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def keys():
+    valid = [f"valid-{i}" for i in range(CHECKS)]
+    keys = {f"revoked_tokens:revoked-{i}" for i in range(REVOKED)}
+    keys.update(f"refresh_token:{jti}" for jti in valid)
+    return keys, valid
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("variant", ["no-filter", "bloom-filter"])
+def test_refresh_token_validation(benchmark, loop, keys, variant):
+    """Validate CHECKS non-revoked refresh tokens."""
+    keys, valid = keys
+    redis = LatencyRedis(keys)
+    revocation_filter = RevokedTokenFilter() if variant == "bloom-filter" else None
+    repository = RedisTokenRepository(redis, revocation_filter)
+    loop.run_until_complete(repository.start_revocation_filter())
+
+    async def validate():
+        return [await repository.is_token_valid(jti) for jti in valid]
+
+    benchmark.group = "refresh-token-validation"
+    redis.commands = 0
+    results = benchmark.pedantic(
+        lambda: loop.run_until_complete(validate()), rounds=5, iterations=1
+    )
+
+    assert all(results)
+    benchmark.extra_info["round_trips"] = redis.commands / (5 * CHECKS)
+
+
+@pytest.mark.benchmark
+def test_bloom_lookup(benchmark):
+    """In-process cost of one negative lookup in a full 100k filter."""
+    bloom = BloomFilter(capacity=100_000, error_rate=0.001)
+    for i in range(100_000):
+        bloom.add(f"revoked-{i}")
+
+    benchmark.group = "revocation-filter-lookup"
+    assert benchmark(lambda: "valid-jti" in bloom) is False
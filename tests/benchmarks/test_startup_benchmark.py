@@ -0,0 +1,107 @@
+"""Benchmarks: cold-start import time of the MCP server per profile.
+
+Each round runs a fresh interpreter under ``python -X importtime`` that
+imports ``src.server_unified`` and builds the FastMCP server for one
+profile (what a stdio client waits for before the handshake). The test
+fails when the cumulative import time exceeds the profile budget, or when
+a backend library that the profile does not use gets imported.
+
+Budgets are for a developer laptop; scale them on slow CI runners with
+``STARTUP_BUDGET_SCALE`` (e.g. ``STARTUP_BUDGET_SCALE=2``).
+
+Run with:
+    uv run pytest tests/benchmarks/test_startup_benchmark.py -m benchmark
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time budget per profile (seconds)
+BUDGETS = {
+    "BASIC": 1.6,
+    "AUTH": 1.8,
+    "CONTEXT": 1.8,
+    "CACHED": 2.0,
+    "COMPLETE": 2.0,
+}
+
+# Retriever backends are imported by the factory when a retriever is created,
+# never while building the server
+BACKENDS = {"qdrant_client", "asyncpg", "numpy"}
+# Auth (SQLAlchemy user store) and Redis only load when the profile enables them
+FORBIDDEN = {
+    "BASIC": BACKENDS | {"sqlalchemy", "redis", "src.auth.services.jwt_service"},
+    "AUTH": BACKENDS | {"sqlalchemy"},
+    "CONTEXT": BACKENDS | {"sqlalchemy"},
+    "CACHED": BACKENDS | {"sqlalchemy"},
+    "COMPLETE": BACKENDS | {"sqlalchemy"},
+}
+
+STARTUP = (
+    "from src.config import ServerConfig, ServerProfile\n"
+    "from src.server_unified import UnifiedMCPServer\n"
+    "UnifiedMCPServer(ServerConfig.from_profile(ServerProfile.{profile})).create_server()\n"
+)
+
+_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)")
+
+
+def measure_startup(profile: str) -> tuple[float, set[str]]:
+    """Return (cumulative import seconds, imported module names)."""
+    env = {
+        **os.environ,
+        "JWT_SECRET_KEY": "startup-benchmark-secret-key-long-enough",
+        "PYTHONDONTWRITEBYTECODE": "1",
+    }
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP.format(profile=profile)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    total_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, module = match.groups()
+        modules.add(module)
+        # Top-level imports already include their children
+        if len(indent) == 1:
+            total_us += int(cumulative)
+    return total_us / 1e6, modules
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("profile", list(BUDGETS))
+def test_startup_import_time(benchmark, profile):
+    """Cold-start imports stay within the profile budget."""
+    samples = []
+
+    def run():
+        seconds, modules = measure_startup(profile)
+        samples.append(seconds)
+        return modules
+
+    benchmark.group = "startup-importtime"
+    modules = benchmark.pedantic(run, rounds=3, iterations=1)
+
+    # Best of the rounds filters out noisy neighbours and cold disk caches
+    best = min(samples)
+    benchmark.extra_info["import_seconds"] = round(best, 3)
+    budget = BUDGETS[profile] * float(os.getenv("STARTUP_BUDGET_SCALE", "1"))
+
+    assert not FORBIDDEN[profile] & modules
+    assert best <= budget, f"{profile} imports took {best:.2f}s (budget {budget}s)"
@@ -0,0 +1,90 @@
+"""인증 데이터베이스 엔진 프로파일 테스트"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.auth.database import Base, SQLiteEngineProfile, create_engines
+
+
+class TestSQLiteEngineProfile:
+    """SQLite 튜닝 프로파일 테스트"""
+
+    def test_default_pragmas(self):
+        """기본 프로파일은 WAL과 NORMAL 동기화를 사용"""
+        pragmas = SQLiteEngineProfile().pragmas()
+
+        assert "PRAGMA journal_mode=WAL" in pragmas
+        assert "PRAGMA synchronous=NORMAL" in pragmas
+        assert "PRAGMA busy_timeout=5000" in pragmas
+        assert "PRAGMA cache_size=-65536" in pragmas
+        assert "PRAGMA query_only=ON" not in pragmas
+
+    def test_busy_timeout_precedes_journal_mode(self):
+        """WAL 전환이 잠금을 기다릴 수 있도록 busy_timeout을 먼저 적용"""
+        pragmas = SQLiteEngineProfile().pragmas()
+
+        assert pragmas.index("PRAGMA busy_timeout=5000") < pragmas.index(
+            "PRAGMA journal_mode=WAL"
+        )
+
+    def test_read_only_pragmas(self):
+        """읽기 연결은 query_only를 마지막에 적용"""
+        pragmas = SQLiteEngineProfile().pragmas(read_only=True)
+
+        assert pragmas[-1] == "PRAGMA query_only=ON"
+
+    def test_from_env(self, monkeypatch):
+        """환경변수에서 프로파일 생성"""
+        monkeypatch.setenv("AUTH_DB_JOURNAL_MODE", "delete")
+        monkeypatch.setenv("AUTH_DB_BUSY_TIMEOUT_MS", "250")
+        monkeypatch.setenv("AUTH_DB_READ_POOL_SIZE", "8")
+
+        profile = SQLiteEngineProfile.from_env()
+
+        assert profile.journal_mode == "DELETE"
+        assert profile.busy_timeout_ms == 250
+        assert profile.read_pool_size == 8
+        assert profile.synchronous == "NORMAL"
+
+
+class TestCreateEngines:
+    """쓰기/읽기 엔진 분리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_memory_database_shares_engine(self):
+        """메모리 DB는 연결마다 별도 DB이므로 엔진을 분리하지 않음"""
+        writer, reader = create_engines("sqlite+aiosqlite:///:memory:")
+        try:
+            assert writer is reader
+        finally:
+            await writer.dispose()
+
+    @pytest.mark.asyncio
+    async def test_file_database_applies_pragmas(self, tmp_path):
+        """파일 DB의 연결마다 PRAGMA가 적용되고 읽기 풀은 쓰기를 거부"""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}"
+        writer, reader = create_engines(
+            url, SQLiteEngineProfile(busy_timeout_ms=1234, read_pool_size=2)
+        )
+        try:
+            assert writer is not reader
+            assert writer.pool.size() == 1
+            assert reader.pool.size() == 2
+
+            async with writer.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                mode = await conn.scalar(text("PRAGMA journal_mode"))
+                sync = await conn.scalar(text("PRAGMA synchronous"))
+                assert mode == "wal"
+                assert sync == 1  # NORMAL
+
+            async with reader.connect() as conn:
+                assert await conn.scalar(text("PRAGMA busy_timeout")) == 1234
+                assert await conn.scalar(text("PRAGMA query_only")) == 1
+                assert await conn.scalar(text("SELECT count(*) FROM users")) == 0
+                with pytest.raises(OperationalError):
+                    await conn.execute(text("DELETE FROM users"))
+        finally:
+            await writer.dispose()
+            await reader.dispose()
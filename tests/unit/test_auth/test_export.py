@@ -0,0 +1,231 @@
+"""관리자 데이터 내보내기 스트리밍 테스트"""
+
+import gzip
+import io
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, UTC
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.database import Base, User as UserDB, create_engines, user_roles
+from src.auth.export import (
+    PERMISSION_EXPORT_COLUMNS,
+    USER_EXPORT_COLUMNS,
+    export_headers,
+    stream_export,
+    wants_gzip,
+)
+from src.auth.repositories.sqlite_user_repository import SQLiteUserRepository
+
+
+def user_row(index: int) -> dict:
+    return {
+        "id": f"u{index}",
+        "username": None,
+        "email": f"user{index}@example.com",
+        "roles": ["admin", "user"],
+        "is_active": True,
+        "is_verified": False,
+        "created_at": datetime(2025, 1, 1, 9, 30),
+        "updated_at": None,
+    }
+
+
+async def batches(count: int, batch_size: int):
+    for start in range(0, count, batch_size):
+        yield [user_row(i) for i in range(start, min(count, start + batch_size))]
+
+
+async def collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+class TestStreamExport:
+    """stream_export 형식별 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_csv_one_chunk_per_batch(self):
+        """헤더 다음 배치마다 한 조각씩 전송"""
+        chunks = [
+            chunk
+            async for chunk in stream_export(batches(5, 2), USER_EXPORT_COLUMNS, "csv")
+        ]
+
+        assert len(chunks) == 4
+        lines = b"".join(chunks).decode().splitlines()
+        assert lines[0] == "ID,사용자명,이메일,역할,활성화,이메일 인증,생성일,수정일"
+        assert lines[1] == (
+            'u0,,user0@example.com,"admin, user",예,아니오,2025-01-01 09:30:00,'
+        )
+        assert len(lines) == 6
+
+    @pytest.mark.asyncio
+    async def test_ndjson_gzip_roundtrip(self):
+        """NDJSON을 gzip 스트림으로 압축"""
+        body = await collect(
+            stream_export(batches(3, 2), USER_EXPORT_COLUMNS, "ndjson", gzip=True)
+        )
+
+        records = [json.loads(line) for line in gzip.decompress(body).splitlines()]
+        assert [r["id"] for r in records] == ["u0", "u1", "u2"]
+        assert records[0]["roles"] == ["admin", "user"]
+        assert records[0]["created_at"] == "2025-01-01T09:30:00"
+
+    @pytest.mark.asyncio
+    async def test_permission_conditions_as_json(self):
+        async def rows():
+            yield [
+                {
+                    "id": 1,
+                    "user_id": None,
+                    "role_name": "analyst",
+                    "resource_type": "database",
+                    "resource_name": "analytics.*",
+                    "actions": ["read"],
+                    "conditions": {"ip": "10.0.0.0/8"},
+                    "granted_at": datetime(2025, 1, 1, tzinfo=UTC),
+                    "expires_at": None,
+                }
+            ]
+
+        body = await collect(stream_export(rows(), PERMISSION_EXPORT_COLUMNS, "csv"))
+
+        assert '"{""ip"": ""10.0.0.0/8""}"' in body.decode()
+
+    @pytest.mark.asyncio
+    async def test_parquet_row_group_per_batch(self):
+        """Parquet은 배치마다 row group 하나"""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        body = await collect(stream_export(batches(5, 2), USER_EXPORT_COLUMNS, "parquet"))
+
+        parquet = pq.ParquetFile(io.BytesIO(body))
+        assert parquet.num_row_groups == 3
+        table = parquet.read()
+        assert table.num_rows == 5
+        assert table.column("roles").to_pylist()[0] == ["admin", "user"]
+
+    def test_gzip_negotiation(self):
+        """클라이언트가 gzip을 받고 Parquet이 아닐 때만 압축"""
+        assert wants_gzip("gzip, deflate, br", "csv") is True
+        assert wants_gzip("br", "csv") is False
+        assert wants_gzip("gzip", "parquet") is False
+        assert wants_gzip("gzip", "ndjson", compress=False) is False
+
+        headers = export_headers("users", "ndjson", gzip=True)
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Content-Disposition"].endswith("users.ndjson")
+
+
+class TestSQLiteUserExport:
+    """SQLiteUserRepository.iter_export_batches 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_streams_batches_with_roles(self, tmp_path):
+        """역할은 같은 쿼리에서 읽고 비밀번호 해시는 제외"""
+        writer, _ = create_engines(f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}")
+        try:
+            async with writer.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.execute(
+                    insert(UserDB),
+                    [
+                        {
+                            "id": f"u{i}",
+                            "email": f"user{i}@example.com",
+                            "password_hash": "hash",
+                            "created_at": datetime(2025, 1, 1 + i),
+                        }
+                        for i in range(5)
+                    ],
+                )
+                await conn.execute(
+                    insert(user_roles),
+                    [
+                        {"user_id": "u0", "role": "user"},
+                        {"user_id": "u0", "role": "admin"},
+                        {"user_id": "u1", "role": "user"},
+                    ],
+                )
+
+            async with AsyncSession(writer) as session:
+                repository = SQLiteUserRepository(session)
+                result = [b async for b in repository.iter_export_batches(batch_size=2)]
+
+            assert [len(batch) for batch in result] == [2, 2, 1]
+            first = result[0][0]
+            assert first["id"] == "u0"
+            assert first["roles"] == ["admin", "user"]
+            assert "password_hash" not in first
+            assert result[2][0]["roles"] == ["user"]
+        finally:
+            await writer.dispose()
+
+
+class FakeCursorConnection:
+    """서버 측 커서와 읽기 전용 트랜잭션을 기록하는 asyncpg 연결 대역"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.transactions = []
+
+    @asynccontextmanager
+    async def transaction(self, **options):
+        self.transactions.append(options)
+        yield
+
+    async def cursor(self, query, prefetch=None):
+        for row in self.rows:
+            yield row
+
+
+class FakePoolManager:
+    def __init__(self, conn):
+        self.conn = conn
+        self.readonly = []
+
+    @asynccontextmanager
+    async def acquire(self, readonly=False):
+        self.readonly.append(readonly)
+        yield self.conn
+
+
+class TestPermissionExport:
+    """권한 내보내기 연결 테스트 (postgres 저장소)"""
+
+    @pytest.fixture
+    def pool(self, monkeypatch):
+        monkeypatch.setenv("AUTH_USER_STORE", "postgres")
+        conn = FakeCursorConnection(
+            [{"id": i, "conditions": '{"max": 1}'} for i in range(3)]
+        )
+        pool = FakePoolManager(conn)
+        with patch("src.auth.user_store.get_pool_manager", return_value=pool):
+            yield pool
+
+    @pytest.mark.asyncio
+    async def test_export_streams_from_dedicated_read_connection(self, pool):
+        from src.auth.user_store import iter_permission_export_batches
+
+        batches = [b async for b in iter_permission_export_batches(batch_size=2)]
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[0][0]["conditions"] == {"max": 1}
+        assert pool.readonly == [True]
+        assert pool.conn.transactions == [{"readonly": True}]
+
+    @pytest.mark.asyncio
+    async def test_dependency_lends_pool_connection(self, pool, monkeypatch):
+        from src.auth.dependencies import get_permission_service
+
+        async for service in get_permission_service():
+            assert service.db_conn is pool.conn
+        assert pool.readonly == [False]
+
+        monkeypatch.setenv("AUTH_USER_STORE", "sqlite")
+        async for service in get_permission_service():
+            assert service.db_conn is None
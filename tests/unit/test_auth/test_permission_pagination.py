@@ -0,0 +1,207 @@
+"""권한 목록 키셋 페이지네이션 / 추정 개수 테스트"""
+
+import json
+from datetime import datetime, UTC
+
+import pytest
+
+from src.auth.models import ResourceType
+from src.auth.services import permission_service as service_module
+from src.auth.services.permission_service import (
+    PermissionService,
+    build_permission_filters,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def permission_row(permission_id: int) -> dict:
+    return {
+        "id": permission_id,
+        "user_id": None,
+        "role_name": "analyst",
+        "resource_type": "database",
+        "resource_name": f"analytics.table_{permission_id}",
+        "actions": ["read"],
+        "conditions": '{"ip": "10.0.0.0/8"}',
+        "granted_at": datetime(2025, 1, 1, tzinfo=UTC),
+        "granted_by": None,
+        "expires_at": None,
+    }
+
+
+class FakeConnection:
+    """실행된 SQL을 기록하고 준비된 결과를 돌려주는 asyncpg 연결 대역"""
+
+    def __init__(self, rows=None, values=None):
+        self.rows = rows or []
+        self.values = list(values or [])
+        self.executed = []
+
+    async def fetch(self, sql, *args):
+        self.executed.append((sql, args))
+        return self.rows
+
+    async def fetchval(self, sql, *args):
+        self.executed.append((sql, args))
+        return self.values.pop(0)
+
+
+def plan(rows: int) -> str:
+    return json.dumps([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": rows}}])
+
+
+class TestCursor:
+    """커서 인코딩 테스트"""
+
+    def test_roundtrip(self):
+        cursor = encode_cursor(1234, "prev")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (1234, "prev")
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["not-base64!", encode_cursor(1, "sideways"), "WyJuZXh0IiwiMSJd", "bnVsbA"],
+    )
+    def test_rejects_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError, match="커서"):
+            decode_cursor(cursor)
+
+
+class TestFilters:
+    """필터 SQL 구성 테스트"""
+
+    def test_equality_filters_lead_for_composite_index(self):
+        """resource_type, role_name 조건이 복합 인덱스 선두 컬럼 순서대로"""
+        conditions, params = build_permission_filters(
+            resource_type=ResourceType.DATABASE,
+            resource_name="analytics",
+            user_id=7,
+            role_name="analyst",
+        )
+
+        assert conditions == [
+            "resource_type = $1",
+            "role_name = $2",
+            "resource_name ILIKE $3",
+            "user_id = $4",
+        ]
+        assert params == ["database", "analyst", "%analytics%", 7]
+
+    def test_no_filters(self):
+        assert build_permission_filters() == ([], [])
+
+
+class TestListResourcePermissions:
+    """list_resource_permissions 키셋 페이지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_first_page(self):
+        """limit + 1개를 읽어 다음 페이지 유무를 판단"""
+        conn = FakeConnection(rows=[permission_row(i) for i in (30, 29, 28)])
+        service = PermissionService(db_conn=conn)
+
+        page = await service.list_resource_permissions(
+            resource_type=ResourceType.DATABASE, limit=2
+        )
+
+        sql, args = conn.executed[0]
+        assert "WHERE resource_type = $1" in sql
+        assert "ORDER BY id DESC" in sql
+        assert "OFFSET" not in sql
+        assert args == ("database", 3)
+        assert [row["id"] for row in page.rows] == [30, 29]
+        assert page.rows[0]["conditions"] == {"ip": "10.0.0.0/8"}
+        assert decode_cursor(page.next_cursor) == (29, "next")
+        assert page.prev_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_last_page(self):
+        conn = FakeConnection(rows=[permission_row(2), permission_row(1)])
+        service = PermissionService(db_conn=conn)
+
+        page = await service.list_resource_permissions(
+            limit=2, cursor=encode_cursor(3)
+        )
+
+        sql, args = conn.executed[0]
+        assert "WHERE id < $1" in sql
+        assert args == (3, 3)
+        assert page.next_cursor is None
+        assert decode_cursor(page.prev_cursor) == (2, "prev")
+
+    @pytest.mark.asyncio
+    async def test_prev_page_is_reversed(self):
+        """이전 페이지는 오름차순으로 읽고 최신순으로 뒤집음"""
+        conn = FakeConnection(rows=[permission_row(i) for i in (11, 12, 13)])
+        service = PermissionService(db_conn=conn)
+
+        page = await service.list_resource_permissions(
+            role_name="analyst", limit=2, cursor=encode_cursor(10, "prev")
+        )
+
+        sql, args = conn.executed[0]
+        assert "WHERE role_name = $1 AND id > $2" in sql
+        assert "ORDER BY id ASC" in sql
+        assert args == ("analyst", 10, 3)
+        assert [row["id"] for row in page.rows] == [12, 11]
+        assert decode_cursor(page.next_cursor) == (11, "next")
+        assert decode_cursor(page.prev_cursor) == (12, "prev")
+
+    @pytest.mark.asyncio
+    async def test_legacy_offset_applies_to_first_page_only(self):
+        """폐기 예정 skip은 첫 페이지에만 OFFSET으로 적용"""
+        conn = FakeConnection(rows=[permission_row(i) for i in (20, 19, 18)])
+        service = PermissionService(db_conn=conn)
+
+        page = await service.list_resource_permissions(limit=2, offset=10)
+
+        sql, args = conn.executed[0]
+        assert "OFFSET $2" in sql
+        assert args == (3, 10)
+        assert decode_cursor(page.next_cursor) == (19, "next")
+        assert decode_cursor(page.prev_cursor) == (20, "prev")
+
+        await service.list_resource_permissions(
+            limit=2, cursor=encode_cursor(19), offset=10
+        )
+
+        sql, args = conn.executed[1]
+        assert "OFFSET" not in sql
+        assert args == (19, 3)
+
+    @pytest.mark.asyncio
+    async def test_requires_connection(self):
+        with pytest.raises(RuntimeError):
+            await PermissionService().list_resource_permissions()
+
+
+class TestEstimatePermissionCount:
+    """estimate_permission_count 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_large_result_uses_planner_estimate(self):
+        """추정치가 크면 COUNT(*) 없이 반환"""
+        conn = FakeConnection(values=[plan(98_000)])
+        service = PermissionService(db_conn=conn)
+
+        count, estimated = await service.estimate_permission_count(role_name="analyst")
+
+        assert (count, estimated) == (98_000, True)
+        assert len(conn.executed) == 1
+        sql, args = conn.executed[0]
+        assert sql.startswith("EXPLAIN (FORMAT JSON)")
+        assert args == ("analyst",)
+
+    @pytest.mark.asyncio
+    async def test_small_result_is_counted_exactly(self, monkeypatch):
+        monkeypatch.setattr(service_module, "EXACT_COUNT_THRESHOLD", 100)
+        conn = FakeConnection(values=[json.loads(plan(40)), 37])
+        service = PermissionService(db_conn=conn)
+
+        count, estimated = await service.estimate_permission_count(user_id=7)
+
+        assert (count, estimated) == (37, False)
+        assert "SELECT COUNT(*)" in conn.executed[1][0]
+        assert conn.executed[1][1] == (7,)
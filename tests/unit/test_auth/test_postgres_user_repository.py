@@ -0,0 +1,487 @@
+"""PostgreSQL 사용자 저장소 및 SQLite 마이그레이션 테스트"""
+
+import json
+import os
+import sqlite3
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, UTC
+
+import asyncpg
+import pytest
+from jose import jwt
+
+from src.auth.migrate_to_postgres import (
+    copy_rows,
+    migrate,
+    read_redis_tokens,
+    read_sqlite,
+)
+from src.auth.repositories.postgres_user_repository import (
+    PostgresTokenRepository,
+    PostgresUserRepository,
+    ensure_schema,
+    validate_schema,
+)
+
+
+class FakeConnection:
+    """실행된 SQL을 기록하고 준비된 결과를 돌려주는 asyncpg 연결 대역"""
+
+    def __init__(
+        self, rows=None, status="INSERT 0 1", fail=None, error=asyncpg.UniqueViolationError
+    ):
+        self.rows = rows or []
+        self.status = status
+        self.fail = fail
+        self.error = error
+        self.executed = []
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+    async def execute(self, sql, *args):
+        self.executed.append((sql, args))
+        if self.fail and self.fail in sql:
+            raise self.error("duplicate key")
+        return self.status
+
+    async def fetchrow(self, sql, *args):
+        self.executed.append((sql, args))
+        return self.rows[0] if self.rows else None
+
+    async def fetch(self, sql, *args):
+        self.executed.append((sql, args))
+        return self.rows
+
+    async def fetchval(self, sql, *args):
+        self.executed.append((sql, args))
+        return self.rows[0] if self.rows else None
+
+
+class FakePoolManager:
+    def __init__(self, conn):
+        self.conn = conn
+        self.readonly = []
+
+    @asynccontextmanager
+    async def acquire(self, readonly=False):
+        self.readonly.append(readonly)
+        yield self.conn
+
+
+def user_row(**overrides):
+    row = {
+        "id": "u1",
+        "email": "user@example.com",
+        "username": "user",
+        "password_hash": "hash",
+        "is_active": True,
+        "is_verified": False,
+        "created_at": datetime(2025, 1, 1, tzinfo=UTC),
+        "updated_at": None,
+        "roles": ["admin", "user"],
+    }
+    row.update(overrides)
+    return row
+
+
+class TestPostgresUserRepository:
+    """PostgresUserRepository 테스트"""
+
+    def test_schema_name_is_validated(self):
+        """SQL에 삽입되는 스키마 이름은 식별자만 허용"""
+        assert validate_schema("auth_v2") == "auth_v2"
+        with pytest.raises(ValueError):
+            PostgresUserRepository(FakePoolManager(FakeConnection()), "auth; DROP")
+
+    @pytest.mark.asyncio
+    async def test_ensure_schema_creates_indexes(self):
+        """스키마 생성 시 email/role/jti 인덱스를 함께 생성"""
+        conn = FakeConnection()
+        await ensure_schema(FakePoolManager(conn), "auth")
+
+        sql = "\n".join(statement for statement, _ in conn.executed)
+        assert conn.transactions == 1
+        assert "users_email_key ON auth.users (email)" in sql
+        assert "user_roles_role_idx ON auth.user_roles (role, user_id)" in sql
+        assert "jti TEXT PRIMARY KEY" in sql
+        assert "'{}'" in sql
+
+    @pytest.mark.asyncio
+    async def test_create_inserts_user_and_roles_in_one_transaction(self):
+        """사용자와 역할을 한 트랜잭션에서 저장"""
+        conn = FakeConnection()
+        repo = PostgresUserRepository(FakePoolManager(conn))
+
+        user = await repo.create(
+            {
+                "email": "new@example.com",
+                "password_hash": "hash",
+                "roles": ["user", "admin", "user"],
+            }
+        )
+
+        assert conn.transactions == 1
+        assert len(conn.executed) == 2
+        roles_sql, roles_args = conn.executed[1]
+        assert "unnest($2::text[])" in roles_sql
+        assert roles_args == (user.id, ["user", "admin"])
+        assert user.roles == ["user", "admin"]
+
+    @pytest.mark.asyncio
+    async def test_create_duplicate_email_raises_value_error(self):
+        """이메일 중복은 SQLite 구현과 같은 ValueError"""
+        conn = FakeConnection(fail="INSERT INTO auth.users")
+        repo = PostgresUserRepository(FakePoolManager(conn))
+
+        with pytest.raises(ValueError, match="이미 등록된 이메일"):
+            await repo.create({"email": "dup@example.com", "password_hash": "hash"})
+
+    @pytest.mark.asyncio
+    async def test_update_maps_database_errors_to_value_error(self):
+        """수정도 생성과 같이 asyncpg 오류를 ValueError로 변환"""
+        conn = FakeConnection(fail="UPDATE auth.users")
+        repo = PostgresUserRepository(FakePoolManager(conn))
+        with pytest.raises(ValueError, match="이미 등록된 이메일"):
+            await repo.update("u1", {"email": "dup@example.com"})
+
+        conn = FakeConnection(
+            fail="INSERT INTO auth.user_roles", error=asyncpg.CheckViolationError
+        )
+        repo = PostgresUserRepository(FakePoolManager(conn))
+        with pytest.raises(ValueError, match="데이터베이스 오류"):
+            await repo.update("u1", {"roles": ["admin"]})
+
+    @pytest.mark.asyncio
+    async def test_get_by_email_fetches_roles_in_one_query(self):
+        """역할은 array_agg로 같은 쿼리에서 조회, 조회는 주 서버에서"""
+        conn = FakeConnection(rows=[user_row()])
+        manager = FakePoolManager(conn)
+        repo = PostgresUserRepository(manager)
+
+        user = await repo.get_by_email("user@example.com")
+
+        assert user.id == "u1"
+        assert user.roles == ["admin", "user"]
+        assert len(conn.executed) == 1
+        assert "u.email = $1" in conn.executed[0][0]
+        assert manager.readonly == [False]
+
+    @pytest.mark.asyncio
+    async def test_user_without_roles_defaults_to_user(self):
+        conn = FakeConnection(rows=[user_row(roles=[])])
+        repo = PostgresUserRepository(FakePoolManager(conn))
+
+        assert (await repo.get_by_id("u1")).roles == ["user"]
+
+    @pytest.mark.asyncio
+    async def test_update_only_sets_given_columns(self):
+        """전달된 컬럼만 SET하고 역할은 교체"""
+        conn = FakeConnection(rows=[user_row()], status="UPDATE 1")
+        repo = PostgresUserRepository(FakePoolManager(conn))
+
+        await repo.update("u1", {"is_active": False, "roles": ["viewer"]})
+
+        update_sql, update_args = conn.executed[0]
+        assert "SET is_active = $2, updated_at = $3" in update_sql
+        assert update_args[:2] == ("u1", False)
+        assert "DELETE FROM auth.user_roles" in conn.executed[1][0]
+        assert conn.executed[2][1] == ("u1", ["viewer"])
+
+    @pytest.mark.asyncio
+    async def test_update_missing_user_returns_none(self):
+        conn = FakeConnection(status="UPDATE 0")
+        repo = PostgresUserRepository(FakePoolManager(conn))
+
+        assert await repo.update("missing", {"roles": ["admin"]}) is None
+        assert len(conn.executed) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_relies_on_cascade(self):
+        conn = FakeConnection(status="DELETE 1")
+        repo = PostgresUserRepository(FakePoolManager(conn))
+
+        assert await repo.delete("u1") is True
+        assert len(conn.executed) == 1
+
+    @pytest.mark.asyncio
+    async def test_listing_reads_from_replicas(self):
+        """관리용 목록 조회는 읽기 복제본으로 라우팅"""
+        conn = FakeConnection(rows=[user_row(), user_row(id="u2")])
+        manager = FakePoolManager(conn)
+        repo = PostgresUserRepository(manager)
+
+        users = await repo.list_all(skip=10, limit=5)
+
+        assert [u.id for u in users] == ["u1", "u2"]
+        assert conn.executed[0][1] == (10, 5)
+        assert manager.readonly == [True]
+
+
+class TestPostgresTokenRepository:
+    """PostgresTokenRepository 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_not_stored(self):
+        conn = FakeConnection()
+        repo = PostgresTokenRepository(FakePoolManager(conn))
+
+        stored = await repo.store_refresh_token(
+            "jti-1", "u1", datetime.now(UTC) - timedelta(seconds=1)
+        )
+
+        assert stored is False
+        assert conn.executed == []
+
+    @pytest.mark.asyncio
+    async def test_revoke_and_validate_by_jti(self):
+        conn = FakeConnection(rows=[1], status="UPDATE 1")
+        repo = PostgresTokenRepository(FakePoolManager(conn))
+
+        assert await repo.is_token_valid("jti-1") is True
+        assert await repo.revoke_token("jti-1") is True
+        assert "WHERE jti = $1" in conn.executed[0][0]
+
+    @pytest.mark.asyncio
+    async def test_revoke_user_tokens_counts_rows(self):
+        conn = FakeConnection(status="UPDATE 3")
+        repo = PostgresTokenRepository(FakePoolManager(conn))
+
+        assert await repo.revoke_user_tokens("u1") == 3
+
+
+@pytest.fixture
+def sqlite_auth_db(tmp_path):
+    """SQLite 인증 DB 파일 (사용자 2명, 역할, 권한, 무효화 토큰)"""
+    path = tmp_path / "auth.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE users (
+            id TEXT PRIMARY KEY, email TEXT, username TEXT, password_hash TEXT,
+            is_verified BOOLEAN, is_active BOOLEAN,
+            created_at DATETIME, updated_at DATETIME
+        );
+        CREATE TABLE user_roles (user_id TEXT, role TEXT);
+        CREATE TABLE user_permissions (
+            user_id TEXT, tool_name TEXT, granted_at DATETIME, granted_by TEXT
+        );
+        CREATE TABLE revoked_tokens (
+            id TEXT PRIMARY KEY, token TEXT, revoked_at DATETIME, expires_at DATETIME
+        );
+        INSERT INTO users VALUES
+            ('u1', 'a@example.com', 'a', 'h1', 1, 1, '2025-01-01 09:00:00.000000', NULL),
+            ('u2', 'b@example.com', NULL, 'h2', 0, 0, '2025-01-02 09:00:00', NULL);
+        INSERT INTO user_roles VALUES ('u1', 'admin'), ('u1', 'admin'), ('u2', 'user');
+        INSERT INTO user_permissions VALUES ('u1', 'search_web', '2025-01-03 00:00:00', 'u1');
+        """
+    )
+    token = jwt.encode({"sub": "u1", "jti": "jti-1"}, "secret", algorithm="HS256")
+    conn.executemany(
+        "INSERT INTO revoked_tokens VALUES (?, ?, ?, ?)",
+        [
+            ("r1", token, "2025-01-04 00:00:00", "2099-01-01 00:00:00"),
+            ("r2", "not-a-jwt", "2025-01-04 00:00:00", "2099-01-01 00:00:00"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+class TestSQLiteMigration:
+    """SQLite → PostgreSQL 마이그레이션 테스트"""
+
+    def test_read_sqlite_maps_rows(self, sqlite_auth_db):
+        """행을 PostgreSQL 컬럼 순서로 변환 (시간대 없음은 UTC)"""
+        data = read_sqlite(sqlite_auth_db)
+
+        user = data["users"][0]
+        assert user[:6] == ("u1", "a@example.com", "a", "h1", True, True)
+        assert user[6] == datetime(2025, 1, 1, 9, tzinfo=UTC)
+        assert data["users"][1][4] is False
+        assert sorted(data["user_roles"]) == [("u1", "admin"), ("u2", "user")]
+        # 읽는 곳이 없는 도구 권한은 옮기지 않음
+        assert "user_permissions" not in data
+        # jti를 읽을 수 없는 토큰은 건너뜀
+        assert [row[:2] for row in data["revoked_tokens"]] == [("jti-1", "u1")]
+
+    def test_read_sqlite_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            read_sqlite(str(tmp_path / "missing.db"))
+
+    @pytest.mark.asyncio
+    async def test_copy_rows_batches_unnest_inserts(self, sqlite_auth_db):
+        """테이블별 컬럼 배열로 배치 INSERT"""
+        conn = FakeConnection(status="INSERT 0 1")
+        data = read_sqlite(sqlite_auth_db)
+
+        copied = await copy_rows(conn, "auth", data, batch_size=1)
+
+        users = [args for sql, args in conn.executed if "auth.users\n" in sql]
+        assert len(users) == 2  # 배치 크기 1
+        assert users[0][0] == ["u1"]
+        assert copied["users"] == 2
+        assert all("ON CONFLICT" in sql for sql, _ in conn.executed)
+
+    @pytest.mark.asyncio
+    async def test_dry_run_does_not_connect(self, sqlite_auth_db):
+        report = await migrate(
+            sqlite_auth_db, "postgresql://unused/auth", dry_run=True
+        )
+
+        assert report["read"] == {
+            "users": 2,
+            "user_roles": 2,
+            "revoked_tokens": 1,
+        }
+        assert report["copied"] == {}
+
+    @pytest.mark.asyncio
+    async def test_redis_refresh_tokens_are_read(self, sqlite_auth_db, monkeypatch):
+        """--redis-url이 있으면 발급된 리프레시 토큰도 읽음"""
+        import redis.asyncio
+
+        class FakeRedis:
+            def __init__(self, values):
+                self.values = values
+                self.closed = False
+
+            async def scan_iter(self, match, count=None):
+                for key in self.values:
+                    yield key
+
+            async def get(self, key):
+                return self.values[key]
+
+            async def aclose(self):
+                self.closed = True
+
+        client = FakeRedis(
+            {
+                "refresh_token:jti-2": json.dumps(
+                    {
+                        "jti": "jti-2",
+                        "user_id": "u2",
+                        "issued_at": "2025-01-05T00:00:00+00:00",
+                        "expires_at": "2099-01-01T00:00:00",
+                        "metadata": {"device": "cli"},
+                    }
+                )
+            }
+        )
+        monkeypatch.setattr(redis.asyncio, "from_url", lambda url, **kwargs: client)
+
+        tokens = await read_redis_tokens("redis://unused/0")
+        report = await migrate(
+            sqlite_auth_db,
+            "postgresql://unused/auth",
+            dry_run=True,
+            redis_url="redis://unused/0",
+        )
+
+        assert tokens == [
+            (
+                "jti-2",
+                "u2",
+                datetime(2025, 1, 5, tzinfo=UTC),
+                datetime(2099, 1, 1, tzinfo=UTC),
+                '{"device": "cli"}',
+            )
+        ]
+        assert client.closed
+        assert report["read"]["refresh_tokens"] == 1
+        # 무효화 목록이 나중에 적용되어 같은 jti는 revoked로 남음
+        assert list(report["read"]) == [
+            "refresh_tokens",
+            "users",
+            "user_roles",
+            "revoked_tokens",
+        ]
+
+
+@pytest.mark.skipif(
+    not os.getenv("AUTH_TEST_POSTGRES_DSN"),
+    reason="AUTH_TEST_POSTGRES_DSN이 없으면 실제 PostgreSQL 테스트 생략",
+)
+class TestPostgresMigrationIntegration:
+    """실제 PostgreSQL에서 unnest 삽입/역할 조인 SQL 검증"""
+
+    @pytest.fixture
+    async def pg(self):
+        dsn = os.environ["AUTH_TEST_POSTGRES_DSN"]
+        schema = f"auth_test_{uuid.uuid4().hex[:8]}"
+        conn = await asyncpg.connect(dsn)
+        try:
+            yield dsn, schema, conn
+        finally:
+            await conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+            await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_migrate_is_idempotent_and_skips_orphan_roles(
+        self, sqlite_auth_db, pg
+    ):
+        """재실행 시 중복 없음, 이메일 충돌로 건너뛴 사용자의 역할은 제외"""
+        dsn, schema, conn = pg
+        await ensure_schema(FakePoolManager(conn), schema)
+        # u2와 이메일이 같은 기존 사용자 → u2는 건너뜀
+        await conn.execute(
+            f"INSERT INTO {schema}.users (id, email, password_hash) "
+            "VALUES ('existing', 'b@example.com', 'h')"
+        )
+
+        first = await migrate(sqlite_auth_db, dsn, schema=schema)
+        second = await migrate(sqlite_auth_db, dsn, schema=schema)
+
+        assert first["copied"] == {"users": 1, "user_roles": 1, "revoked_tokens": 1}
+        # 무효화 토큰은 ON CONFLICT DO UPDATE라 갱신된 행으로 다시 집계됨
+        assert second["copied"]["users"] == second["copied"]["user_roles"] == 0
+        assert await conn.fetchval(f"SELECT count(*) FROM {schema}.users") == 2
+        roles = await conn.fetch(
+            f"SELECT user_id, role FROM {schema}.user_roles ORDER BY user_id"
+        )
+        assert [tuple(row) for row in roles] == [("u1", "admin")]
+        revoked = await conn.fetchrow(
+            f"SELECT user_id, revoked_at FROM {schema}.refresh_tokens "
+            "WHERE jti = 'jti-1'"
+        )
+        assert revoked["user_id"] == "u1"
+        assert revoked["revoked_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_refresh_tokens_upsert_keeps_revocations(self, pg):
+        """유효 토큰은 그대로 삽입, 무효화된 jti와 없는 사용자의 토큰은 제외"""
+        dsn, schema, conn = pg
+        manager = FakePoolManager(conn)
+        await ensure_schema(manager, schema)
+        await conn.execute(
+            f"INSERT INTO {schema}.users (id, email, password_hash) "
+            "VALUES ('u1', 'a@example.com', 'h')"
+        )
+        now = datetime.now(UTC)
+        later = now + timedelta(days=1)
+        data = {
+            "refresh_tokens": [
+                ("active", "u1", now, later, '{"device": "cli"}'),
+                ("revoked", "u1", now, later, "{}"),
+                ("orphan", "ghost", now, later, "{}"),
+                ("expired", "u1", now, now - timedelta(seconds=1), "{}"),
+            ],
+            "revoked_tokens": [("revoked", "u1", now, later)],
+        }
+
+        async with conn.transaction():
+            copied = await copy_rows(conn, schema, data, batch_size=10)
+
+        assert copied == {"refresh_tokens": 2, "revoked_tokens": 1}
+        repo = PostgresTokenRepository(manager, schema)
+        assert await repo.is_token_valid("active")
+        assert not await repo.is_token_valid("revoked")
+        assert not await repo.is_token_valid("orphan")
+        tokens = await repo.get_user_active_tokens("u1")
+        assert [token["metadata"] for token in tokens] == [{"device": "cli"}]
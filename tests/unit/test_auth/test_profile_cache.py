@@ -0,0 +1,208 @@
+"""/auth/me 사용자 프로필 캐시 테스트"""
+
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.auth.models import TokenData, User, UserResponse
+from src.auth.profile_cache import PROFILE_KEY_PREFIX, UserProfileCache
+from src.auth.services.auth_service_sqlite import (
+    AuthenticationError,
+    SQLiteAuthService,
+)
+
+
+def make_profile(user_id="u1", roles=None) -> UserResponse:
+    return UserResponse(
+        id=user_id,
+        email=f"{user_id}@example.com",
+        is_active=True,
+        is_verified=True,
+        roles=roles or ["user"],
+        created_at=datetime(2025, 1, 1, tzinfo=UTC),
+    )
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("src.auth.profile_cache.time.monotonic", clock)
+    return clock
+
+
+class TestUserProfileCache:
+    """UserProfileCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_hit_after_set_until_ttl(self, clock):
+        cache = UserProfileCache(ttl=30)
+        await cache.set(make_profile())
+
+        assert (await cache.get("u1")).id == "u1"
+        clock.now += 31
+        assert await cache.get("u1") is None
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_profile(self, clock):
+        cache = UserProfileCache(ttl=30)
+        await cache.set(make_profile())
+
+        await cache.invalidate("u1")
+
+        assert await cache.get("u1") is None
+        assert cache.invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_read_is_not_stored_after_invalidation(self, clock):
+        """DB 조회 중 무효화되면 조회 결과를 저장하지 않음"""
+        cache = UserProfileCache(ttl=30)
+        generation = cache.generation
+
+        await cache.invalidate("u1")  # 조회 도중 역할 변경
+        await cache.set(make_profile(roles=["user"]), generation)
+
+        assert await cache.get("u1") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self, clock):
+        cache = UserProfileCache(ttl=30, max_entries=2)
+        for user_id in ("u1", "u2", "u3"):
+            await cache.set(make_profile(user_id))
+
+        assert await cache.get("u1") is None
+        assert await cache.get("u3") is not None
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self, clock):
+        cache = UserProfileCache(ttl=0)
+        await cache.set(make_profile())
+
+        assert await cache.get("u1") is None
+        assert cache.get_stats()["enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_redis_layer_shared_between_instances(self, clock):
+        """다른 인스턴스가 저장한 프로필을 Redis에서 읽고 로컬에 적재"""
+        redis = FakeRedis()
+        writer = UserProfileCache(ttl=30, redis_client=redis)
+        reader = UserProfileCache(ttl=30, redis_client=redis)
+
+        await writer.set(make_profile(roles=["admin"]))
+        profile = await reader.get("u1")
+
+        assert profile.roles == ["admin"]
+        assert f"{PROFILE_KEY_PREFIX}u1:0" in redis.data
+        assert reader.redis_hits == 1
+
+        await writer.invalidate("u1")
+        assert await UserProfileCache(ttl=30, redis_client=redis).get("u1") is None
+
+    @pytest.mark.asyncio
+    async def test_stale_write_back_after_remote_invalidation(self, clock):
+        """다른 인스턴스가 무효화한 뒤 늦게 쓴 이전 프로필은 읽히지 않음"""
+        redis = FakeRedis()
+        loader = UserProfileCache(ttl=30, redis_client=redis)
+        invalidator = UserProfileCache(ttl=30, redis_client=redis)
+
+        assert await loader.get("u1") is None  # 미스: DB 조회 시작
+        generation = loader.generation
+        await invalidator.invalidate("u1")  # 다른 인스턴스에서 역할 변경
+        await loader.set(make_profile(roles=["admin"]), generation)
+
+        fresh = UserProfileCache(ttl=30, redis_client=redis)
+        assert await fresh.get("u1") is None
+
+        await fresh.set(make_profile(roles=["user"]))
+        profile = await UserProfileCache(ttl=30, redis_client=redis).get("u1")
+        assert profile.roles == ["user"]
+
+
+class TestCurrentUserCaching:
+    """SQLiteAuthService.get_current_user 캐시 적용 테스트"""
+
+    @pytest.fixture
+    def repository(self):
+        repository = Mock()
+        repository.get_by_id = AsyncMock(
+            return_value=User(
+                id="u1",
+                email="u1@example.com",
+                password_hash="hash",
+                roles=["user"],
+                created_at=datetime(2025, 1, 1, tzinfo=UTC),
+            )
+        )
+        return repository
+
+    @pytest.fixture
+    def service(self, repository):
+        jwt_service = Mock()
+        jwt_service.decode_token.return_value = TokenData(
+            user_id="u1", email="u1@example.com", roles=["user"], token_type="access"
+        )
+        service = SQLiteAuthService(jwt_service, profile_cache=UserProfileCache(ttl=30))
+        with patch(
+            "src.auth.services.auth_service_sqlite.get_user_repository",
+            return_value=repository,
+        ):
+            yield service
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_skips_database(self, service, repository):
+        first = await service.get_current_user("token", session=None)
+        second = await service.get_current_user("token", session=None)
+
+        assert first == second
+        assert repository.get_by_id.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reloads_roles(self, service, repository):
+        await service.get_current_user("token", session=None)
+
+        repository.get_by_id.return_value = repository.get_by_id.return_value.model_copy(
+            update={"roles": ["admin"]}
+        )
+        await service.profile_cache.invalidate("u1")
+
+        assert (await service.get_current_user("token", None)).roles == ["admin"]
+        assert repository.get_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_is_not_cached(self, service, repository):
+        repository.get_by_id.return_value = repository.get_by_id.return_value.model_copy(
+            update={"is_active": False}
+        )
+
+        for _ in range(2):
+            with pytest.raises(AuthenticationError):
+                await service.get_current_user("token", session=None)
+
+        assert repository.get_by_id.await_count == 2
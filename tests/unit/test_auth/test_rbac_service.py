@@ -206,6 +206,26 @@ class TestRBACService:
         assert rbac_service.check_tool_permission(roles_allowed, "search_all") is True
         assert rbac_service.check_tool_permission(roles_denied, "search_all") is False
 
+    def test_check_tool_permission_bulk_database_tools(
+        self, rbac_service: RBACService
+    ) -> None:
+        """대량 쓰기 도구 권한 확인 테스트"""
+        # Given - 단건 도구와 같은 역할 제약
+        for tool in ("bulk_create_database_records", "bulk_update_database_records"):
+            # When & Then
+            assert rbac_service.check_tool_permission(["admin"], tool) is True
+            assert rbac_service.check_tool_permission(["guest"], tool) is False
+
+        # 대량 삭제는 admin만 가능
+        assert (
+            rbac_service.check_tool_permission(["admin"], "bulk_delete_database_records")
+            is True
+        )
+        assert (
+            rbac_service.check_tool_permission(["user"], "bulk_delete_database_records")
+            is False
+        )
+
     def test_check_tool_permission_unknown_tool(
         self, rbac_service: RBACService
     ) -> None:
@@ -0,0 +1,190 @@
+"""관리자 화면 렌더 캐시 (ETag / 304) 테스트"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.auth import render_cache
+from src.auth.render_cache import (
+    METRICS,
+    PERMISSIONS,
+    ROLES,
+    USERS,
+    RenderCache,
+    cached_html_response,
+    etag_matches,
+)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = RenderCache(ttl=300)
+    monkeypatch.setattr(render_cache, "_render_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def client(cache):
+    """렌더 횟수를 세는 테스트 앱"""
+    app = FastAPI()
+    app.state.renders = []
+
+    @app.get("/matrix")
+    async def matrix(request: Request, page: int = 1):
+        async def render(lang: str) -> str:
+            app.state.renders.append(lang)
+            return f"<div>{lang}:{page}</div>"
+
+        return await cached_html_response(
+            request, "matrix", [ROLES], render, params=(page,)
+        )
+
+    @app.get("/page")
+    async def page(request: Request, user: str):
+        async def render(lang: str) -> str:
+            app.state.renders.append(lang)
+            return "<main>users</main>"
+
+        return await cached_html_response(
+            request,
+            "page",
+            [USERS],
+            render,
+            wrap=lambda html: f"<html>{user}{html}</html>",
+            vary=(user,),
+        )
+
+    return TestClient(app)
+
+
+class TestRenderCache:
+    """RenderCache 키/버전 테스트"""
+
+    def test_bump_changes_only_dependent_keys(self, cache):
+        """bump한 테이블을 읽는 화면의 키만 바뀜"""
+        roles_key = cache.key("matrix", [ROLES], "ko")
+        users_key = cache.key("users", [USERS], "ko")
+
+        cache.bump(ROLES)
+
+        assert cache.key("matrix", [ROLES], "ko") != roles_key
+        assert cache.key("users", [USERS], "ko") == users_key
+        assert cache.key("matrix", [ROLES], "en") != cache.key("matrix", [ROLES], "ko")
+
+    def test_epoch_differs_between_processes(self):
+        """재시작한 프로세스의 ETag는 일치하지 않음"""
+        assert RenderCache().key("m", [PERMISSIONS]) != RenderCache().key("m", [PERMISSIONS])
+
+    def test_metrics_version_is_time_window(self, cache, monkeypatch):
+        cache.window = 60
+        monkeypatch.setattr("src.auth.render_cache.time.time", lambda: 120.0)
+        first = cache.key("analytics", [METRICS])
+        monkeypatch.setattr("src.auth.render_cache.time.time", lambda: 179.0)
+        assert cache.key("analytics", [METRICS]) == first
+        monkeypatch.setattr("src.auth.render_cache.time.time", lambda: 180.0)
+        assert cache.key("analytics", [METRICS]) != first
+
+    def test_key_expires_with_ttl_bucket(self, cache, monkeypatch):
+        """카운터가 그대로여도 TTL 구간이 바뀌면 키(ETag)가 바뀜"""
+        monkeypatch.setattr("src.auth.render_cache.time.time", lambda: 600.0)
+        first = cache.key("matrix", [ROLES], "ko")
+        monkeypatch.setattr("src.auth.render_cache.time.time", lambda: 899.0)
+        assert cache.key("matrix", [ROLES], "ko") == first
+        monkeypatch.setattr("src.auth.render_cache.time.time", lambda: 900.0)
+        assert cache.key("matrix", [ROLES], "ko") != first
+
+    def test_lru_and_ttl(self, cache, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("src.auth.render_cache.time.monotonic", lambda: now[0])
+        cache.max_entries = 2
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.set("c", "C")
+
+        assert cache.get("a") is None
+        assert cache.get("c") == "C"
+        now[0] += 301
+        assert cache.get("c") is None
+
+    def test_etag_matches(self):
+        assert etag_matches('W/"abc"', 'W/"abc"')
+        assert etag_matches('"x", "abc"', 'W/"abc"')
+        assert etag_matches("*", 'W/"abc"')
+        assert not etag_matches('W/"abd"', 'W/"abc"')
+        assert not etag_matches(None, 'W/"abc"')
+
+
+class TestCachedHtmlResponse:
+    """cached_html_response 테스트"""
+
+    def test_not_modified_until_bump(self, client, cache):
+        """같은 버전이면 304, 쓰기 후에는 다시 렌더"""
+        first = client.get("/matrix")
+        etag = first.headers["etag"]
+
+        again = client.get("/matrix", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+
+        cache.bump(ROLES)
+        changed = client.get("/matrix", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert client.app.state.renders == ["ko", "ko"]
+
+    def test_fragment_cached_per_language_and_params(self, client):
+        """언어와 조회 조건별로 조각을 따로 캐시"""
+        client.get("/matrix")
+        client.get("/matrix")
+        english = client.get("/matrix", headers={"Accept-Language": "en-US"})
+        client.get("/matrix?page=2")
+
+        assert english.text == "<div>en:1</div>"
+        assert client.app.state.renders == ["ko", "en", "ko"]
+
+    def test_layout_varies_by_user_but_fragment_is_shared(self, client):
+        """전체 페이지: ETag는 사용자별, 조각 렌더는 한 번"""
+        alice = client.get("/page?user=alice")
+        bob = client.get("/page?user=bob")
+
+        assert alice.text == "<html>alice<main>users</main></html>"
+        assert bob.text == "<html>bob<main>users</main></html>"
+        assert alice.headers["etag"] != bob.headers["etag"]
+        assert client.app.state.renders == ["ko"]
+        assert (
+            client.get(
+                "/page?user=bob", headers={"If-None-Match": alice.headers["etag"]}
+            ).status_code
+            == 200
+        )
+
+    def test_render_errors_are_not_cached(self, cache):
+        app = FastAPI()
+        calls = []
+
+        @app.get("/broken")
+        async def broken(request: Request):
+            async def render(lang: str) -> str:
+                calls.append(lang)
+                raise RuntimeError("db down")
+
+            try:
+                return await cached_html_response(request, "broken", [USERS], render)
+            except RuntimeError:
+                return "error"
+
+        client = TestClient(app)
+        client.get("/broken")
+        client.get("/broken")
+
+        assert len(calls) == 2
+        assert cache.get_stats()["entries"] == 0
+
+    def test_disabled_cache_renders_every_time(self, client, cache):
+        cache.ttl = 0
+
+        first = client.get("/matrix")
+        client.get("/matrix")
+
+        assert "etag" not in first.headers
+        assert client.app.state.renders == ["ko", "ko"]
@@ -0,0 +1,299 @@
+"""무효화 토큰 jti Bloom 필터 테스트"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.auth.models import User
+from src.auth.repositories.token_repository import RedisTokenRepository
+from src.auth.revocation_filter import BloomFilter, RevokedTokenFilter
+from src.auth.services.auth_service_sqlite import (
+    AuthenticationError,
+    SQLiteAuthService,
+)
+from src.auth.services.jwt_service import JWTService
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    """명령 수를 세는 Redis 대역 (문자열 키, pub/sub)"""
+
+    def __init__(self):
+        self.data = {}
+        self.subscribers = {}
+        self.commands = []
+
+    async def exists(self, key):
+        self.commands.append("EXISTS")
+        return int(key in self.data)
+
+    async def get(self, key):
+        self.commands.append("GET")
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def srem(self, key, value):
+        pass
+
+    async def sadd(self, key, value):
+        pass
+
+    async def expire(self, key, ttl):
+        pass
+
+    async def publish(self, channel, message):
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(self.subscribers.get(channel, []))
+
+    async def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+def store(redis, jti, revoked=False):
+    expires_at = (datetime.utcnow() + timedelta(hours=1)).isoformat()
+    redis.data[f"refresh_token:{jti}"] = json.dumps(
+        {"jti": jti, "user_id": "u1", "expires_at": expires_at}
+    )
+    if revoked:
+        redis.data[f"revoked_tokens:{jti}"] = "{}"
+
+
+async def wait_until(predicate, timeout=1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+class TestBloomFilter:
+    """BloomFilter 테스트"""
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_near_target(self):
+        """용량만큼 채웠을 때 거짓 양성 비율이 목표의 두 배를 넘지 않음"""
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(f"revoked-{i}")
+
+        false_positives = sum(f"valid-{i}" in bloom for i in range(20000))
+        assert false_positives / 20000 < 0.02
+
+
+class TestRevokedTokenFilter:
+    """RevokedTokenFilter 테스트"""
+
+    def test_not_ready_answers_maybe(self):
+        """필터가 준비되기 전에는 모든 jti를 저장소에서 확인"""
+        revoked = RevokedTokenFilter()
+
+        assert revoked.ready is False
+        assert revoked.might_be_revoked("any-jti") is True
+
+    @pytest.mark.asyncio
+    async def test_rebuild_grows_capacity(self):
+        async def loader():
+            for i in range(300):
+                yield f"jti-{i}"
+
+        revoked = RevokedTokenFilter(capacity=100)
+        assert await revoked.rebuild(loader) == 300
+
+        assert revoked.might_be_revoked("jti-42") is True
+        assert revoked.might_be_revoked("fresh-jti") is False
+        assert revoked._filter.capacity == 600
+
+    @pytest.mark.asyncio
+    async def test_pubsub_updates_other_instances(self):
+        """한 인스턴스의 무효화가 다른 인스턴스 필터에 반영"""
+        redis = FakeRedis()
+        store(redis, "old", revoked=True)
+        gateway_a = RedisTokenRepository(redis, RevokedTokenFilter(redis))
+        gateway_b = RedisTokenRepository(redis, RevokedTokenFilter(redis))
+        for gateway in (gateway_a, gateway_b):
+            await gateway.start_revocation_filter()
+        await wait_until(lambda: gateway_a.revocation_filter.ready)
+        await wait_until(lambda: gateway_b.revocation_filter.ready)
+        try:
+            assert gateway_b.revocation_filter.might_be_revoked("old") is True
+
+            store(redis, "new")
+            assert gateway_b.revocation_filter.might_be_revoked("new") is False
+            assert await gateway_a.revoke_token("new") is True
+
+            await wait_until(lambda: "new" in gateway_b.revocation_filter._filter)
+            assert await gateway_b.is_token_valid("new") is False
+        finally:
+            for gateway in (gateway_a, gateway_b):
+                await gateway.stop_revocation_filter()
+
+    @pytest.mark.asyncio
+    async def test_subscription_failure_falls_back_to_store(self):
+        """구독이 끊기면 필터를 버리고, 다시 구독한 뒤 새로 생성"""
+        redis = FakeRedis()
+        revoked = RevokedTokenFilter(redis)
+        revoked.reconnect_delay = 0
+        states = []
+        failed = False
+
+        class FlakyPubSub(FakePubSub):
+            async def get_message(self, **kwargs):
+                nonlocal failed
+                if not failed:
+                    failed = True
+                    raise ConnectionError("connection lost")
+                return await super().get_message(**kwargs)
+
+        redis.pubsub = lambda: FlakyPubSub(redis)
+
+        async def loader():
+            states.append(revoked.ready)
+            yield "jti-1"
+
+        await revoked.start(loader)
+        try:
+            await wait_until(lambda: revoked.rebuilds == 2)
+            # 두 번째 생성은 필터를 버린 상태(저장소 확인)에서 시작
+            assert states == [False, False]
+            assert revoked.might_be_revoked("jti-1") is True
+        finally:
+            await revoked.stop()
+
+
+class TestRedisTokenRepositoryWithFilter:
+    """필터를 사용하는 RedisTokenRepository 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_valid_token_skips_revocation_lookup(self):
+        """필터가 "확실히 없음"이면 EXISTS 한 번 (토큰 키)"""
+        redis = FakeRedis()
+        store(redis, "valid")
+        repository = RedisTokenRepository(redis, RevokedTokenFilter())
+        await repository.start_revocation_filter()
+
+        assert await repository.is_token_valid("valid") is True
+        assert redis.commands == ["EXISTS"]
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_is_confirmed_in_store(self):
+        redis = FakeRedis()
+        store(redis, "revoked", revoked=True)
+        repository = RedisTokenRepository(redis, RevokedTokenFilter())
+        await repository.start_revocation_filter()
+
+        assert await repository.is_token_valid("revoked") is False
+        assert redis.commands == ["EXISTS"]
+        assert repository.revocation_filter.get_stats()["maybe"] == 1
+
+    @pytest.mark.asyncio
+    async def test_revoke_adds_to_local_filter(self):
+        redis = FakeRedis()
+        store(redis, "jti-1")
+        repository = RedisTokenRepository(redis, RevokedTokenFilter())
+        await repository.start_revocation_filter()
+
+        await repository.revoke_token("jti-1")
+
+        assert repository.revocation_filter.might_be_revoked("jti-1") is True
+        assert await repository.is_token_valid("jti-1") is False
+
+
+class TestRefreshPathRevocation:
+    """/auth/refresh 경로의 무효화 확인 (필터 → 저장소) 테스트"""
+
+    @pytest.fixture
+    async def gateway(self):
+        redis = FakeRedis()
+        repository = RedisTokenRepository(redis, RevokedTokenFilter(redis))
+        await repository.start_revocation_filter()
+        await wait_until(lambda: repository.revocation_filter.ready)
+
+        jwt_service = JWTService(
+            secret_key="refresh-path-secret-key-long-enough-for-hs256",
+            token_repository=repository,
+        )
+        users = Mock()
+        users.get_by_id = AsyncMock(
+            return_value=User(
+                id="u1",
+                email="u1@example.com",
+                password_hash="hash",
+                roles=["user"],
+                created_at=datetime(2025, 1, 1),
+            )
+        )
+        with patch(
+            "src.auth.services.auth_service_sqlite.get_user_repository",
+            return_value=users,
+        ):
+            yield redis, repository, SQLiteAuthService(jwt_service)
+        await repository.stop_revocation_filter()
+
+    async def issue(self, redis, service):
+        token = service.jwt_service.create_refresh_token(user_id="u1")
+        jti = service.jwt_service.decode_token(token).jti
+        await wait_until(lambda: f"refresh_token:{jti}" in redis.data)
+        return token, jti
+
+    @pytest.mark.asyncio
+    async def test_valid_refresh_token_passes_filter(self, gateway):
+        redis, repository, service = gateway
+        token, _ = await self.issue(redis, service)
+        redis.commands.clear()
+
+        tokens = await service.refresh_tokens(token, session=None)
+
+        assert tokens.refresh_token != token
+        # 필터가 "확실히 없음" → 무효화 목록 조회 없이 토큰 키만 확인
+        assert redis.commands == ["EXISTS"]
+        assert repository.revocation_filter.get_stats()["checks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_revoked_refresh_token_is_rejected(self, gateway):
+        redis, repository, service = gateway
+        token, jti = await self.issue(redis, service)
+        await repository.revoke_token(jti)
+
+        with pytest.raises(AuthenticationError):
+            await service.refresh_tokens(token, session=None)
+
+        assert repository.revocation_filter.get_stats()["maybe"] == 1
@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import random
 from unittest.mock import AsyncMock, MagicMock, patch
 import time
 
@@ -11,6 +12,11 @@ from src.utils.connection_manager import (
     QdrantClientManager,
     HTTPSessionManager,
     ConnectionPoolMetrics,
+    CapacityLimiter,
+    WaitReservoir,
+    percentile,
+    LocalKeyCache,
+    RedisPoolRegistry,
 )
 
 
@@ -27,7 +33,7 @@ class TestConnectionPoolMetrics:
         assert metrics.connection_errors == 0
         assert metrics.total_requests == 0
         assert metrics.pool_exhausted_count == 0
-        assert metrics.connection_wait_time_ms == []
+        assert metrics.wait_time_ms.count == 0
         assert metrics.reuse_rate == 0.0
 
     def test_record_connection_acquired(self):
@@ -38,13 +44,15 @@ class TestConnectionPoolMetrics:
         metrics.record_connection_acquired(wait_time_ms=0)
         assert metrics.active_connections == 1
         assert metrics.total_requests == 1
-        assert metrics.connection_wait_time_ms == [0]
+        assert metrics.wait_time_ms.count == 1
 
         # Record acquisition with wait
         metrics.record_connection_acquired(wait_time_ms=50)
         assert metrics.active_connections == 2
         assert metrics.total_requests == 2
-        assert metrics.connection_wait_time_ms == [0, 50]
+        assert metrics.wait_time_ms.count == 2
+        assert metrics.get_avg_wait_time() == pytest.approx(25, rel=0.01)
+        assert metrics.get_p95_wait_time() == pytest.approx(50, rel=0.01)
 
     def test_record_connection_released(self):
         """Test recording connection release."""
@@ -75,6 +83,51 @@ class TestConnectionPoolMetrics:
         assert metrics.calculate_reuse_rate() == 0.0
 
 
+class TestWaitReservoir:
+    """Test the bounded acquire-wait reservoir."""
+
+    def test_sample_is_bounded_and_drained(self):
+        reservoir = WaitReservoir(size=100, rng=random.Random(7))
+        for value in range(10_000):
+            reservoir.add(float(value))
+
+        samples, seen = reservoir.drain()
+
+        assert seen == 10_000
+        assert len(samples) == 100
+        # Uniform sample: the median lands near the true median
+        assert 3_500 < percentile(samples, 50) < 6_500
+        assert reservoir.drain() == ([], 0)
+
+    def test_percentile_handles_small_samples(self):
+        assert percentile([], 95) == 0.0
+        assert percentile([3.0], 95) == 3.0
+        metrics = ConnectionPoolMetrics()
+        metrics.record_connection_acquired(wait_time_ms=4.0)
+        assert metrics.get_p95_wait_time() == pytest.approx(4.0, rel=0.01)
+
+
+class TestCapacityLimiter:
+    """Test the adjustable checkout limit."""
+
+    @pytest.mark.asyncio
+    async def test_limit_blocks_and_raising_it_releases_waiters(self):
+        limiter = CapacityLimiter(1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done() and limiter.waiting == 1
+
+        await limiter.set_limit(2)
+        await asyncio.wait_for(waiter, 1)
+        assert limiter.in_use == 2
+
+        await limiter.release()
+        await limiter.release()
+        assert 0.0 < limiter.drain_utilization() <= 1.0
+
+
 class TestPostgreSQLPoolManager:
     """Test PostgreSQL connection pool manager."""
 
@@ -121,24 +174,62 @@ class TestPostgreSQLPoolManager:
 
     @pytest.mark.asyncio
     async def test_dynamic_pool_adjustment(self, pool_config):
-        """Test dynamic pool size adjustment based on load."""
-        manager = PostgreSQLPoolManager(pool_config)
-
-        mock_pool = AsyncMock()
-        mock_pool.get_size.return_value = 10
-        mock_pool.get_idle_size.return_value = 2
-        mock_pool.set_pool_size = AsyncMock()
-
-        manager._pool = mock_pool
+        """Test the sizing controller grows/shrinks with hysteresis and bounds."""
+        manager = PostgreSQLPoolManager(
+            {
+                **pool_config,
+                "autoscale": True,
+                "autoscale_hysteresis": 2,
+                "autoscale_cooldown": 0,
+            }
+        )
+        busy = {"wait_p95_ms": 5.0, "utilization": 0.95, "acquisitions": 100}
+        slow = {"wait_p95_ms": 120.0, "utilization": 0.5, "acquisitions": 100}
+        idle = {"wait_p95_ms": 0.1, "utilization": 0.05, "acquisitions": 3}
+        samples = [busy, busy, slow, slow] + [idle] * 6
+        manager.sizer.sample = lambda: {**samples.pop(0), "waiting": 0}
+
+        assert manager.capacity.limit == 10
+        actions = [(await manager.adjust_pool_size())["reason"] for _ in range(10)]
+
+        # Each change needs two agreeing ticks; shrinking stops at min_size
+        assert actions == [
+            "hysteresis",
+            "utilization",
+            "hysteresis",
+            "wait_p95",
+            "hysteresis",
+            "idle",
+            "hysteresis",
+            "idle",
+            "hysteresis",
+            "at_limit",
+        ]
+        assert manager.capacity.limit == 10
+        assert manager.sizer.counts == {"grow": 2, "shrink": 2, "hold": 6}
 
-        # Simulate high load (80% utilization)
-        manager.metrics.active_connections = 8
-        manager.metrics.total_connections = 10
+    @pytest.mark.asyncio
+    async def test_sizer_shrinks_after_idle_burst(self, pool_config):
+        """Test a slow burst does not pin p95 once the pool goes idle."""
+        manager = PostgreSQLPoolManager(
+            {
+                **pool_config,
+                "autoscale": True,
+                "autoscale_hysteresis": 2,
+                "autoscale_cooldown": 0,
+            }
+        )
+        await manager.resize(20)
+        for _ in range(50):
+            manager.metrics.record_connection_acquired(wait_time_ms=200.0)
 
-        await manager.adjust_pool_size()
+        burst = await manager.adjust_pool_size()
+        idle = [await manager.adjust_pool_size() for _ in range(4)]
 
-        # Should increase pool size
-        mock_pool.set_pool_size.assert_called_with(min_size=15, max_size=50)
+        assert burst["wait_p95_ms"] == 200.0 and burst["action"] == "hold"
+        # The reservoir is drained per tick: idle ticks see no waits
+        assert all(tick["wait_p95_ms"] == 0.0 for tick in idle)
+        assert manager.capacity.limit < 20
 
     @pytest.mark.asyncio
     async def test_connection_acquisition_with_metrics(self, pool_config):
@@ -162,7 +253,7 @@ class TestPostgreSQLPoolManager:
 
         # After release
         assert manager.metrics.active_connections == 0
-        assert len(manager.metrics.connection_wait_time_ms) == 1
+        assert manager.metrics.wait_time_ms.count == 1
 
     @pytest.mark.asyncio
     async def test_health_check(self, pool_config):
@@ -188,6 +279,116 @@ class TestPostgreSQLPoolManager:
         assert health["error_rate"] == 0.2
 
 
+class FakePool:
+    """asyncpg pool stand-in with a fixed replication lag."""
+
+    def __init__(self, name, lag=0.0):
+        self.name = name
+        self.lag = lag
+        self.fail = False
+        self.acquired = 0
+
+    async def acquire(self):
+        if self.fail:
+            raise OSError("replica down")
+        self.acquired += 1
+        return f"{self.name}-conn"
+
+    async def release(self, conn):
+        pass
+
+    async def fetchval(self, query):
+        if self.fail:
+            raise OSError("replica down")
+        return self.lag
+
+    def get_size(self):
+        return 2
+
+    async def close(self):
+        pass
+
+
+class TestPostgreSQLReplicaRouting:
+    """Test read routing across primary and replica pools."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = PostgreSQLPoolManager(
+            {
+                "dsn": "postgresql://primary/db",
+                "replica_dsns": ["postgresql://r0/db", "postgresql://r1/db"],
+                "max_size": 10,
+                "max_replica_lag": 5.0,
+            }
+        )
+        manager._pool = FakePool("primary")
+        for i, replica in enumerate(manager.replicas):
+            replica.pool = FakePool(f"r{i}")
+            replica.healthy = True
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_writes_use_primary_and_reads_least_outstanding(self, manager):
+        async with manager.acquire() as conn:
+            assert conn == "primary-conn"
+
+        async with manager.acquire(readonly=True) as first:
+            async with manager.acquire(readonly=True) as second:
+                assert {first, second} == {"r0-conn", "r1-conn"}
+                assert [r.outstanding for r in manager.replicas] == [1, 1]
+
+        pools = manager.get_pool_metrics()
+        assert pools["primary"]["total_requests"] == 1
+        assert pools["primary"]["reads"] == 0
+        assert pools["replica-0"]["total_requests"] == 1
+        assert pools["replica-1"]["total_requests"] == 1
+        assert pools["replica-0"]["outstanding"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lagging_and_failed_replicas_fall_back_to_primary(self, manager):
+        manager.replicas[0].pool.lag = 30.0
+        manager.replicas[1].pool.fail = True
+
+        await manager.check_replicas()
+
+        assert manager.replicas[0].lag_seconds == 30.0
+        assert not manager.replicas[1].healthy
+        async with manager.acquire(readonly=True) as conn:
+            assert conn == "primary-conn"
+        assert manager.primary_reads == 1
+
+        # Replica recovers once it catches up
+        manager.replicas[0].pool.lag = 0.5
+        await manager.check_replicas()
+        async with manager.acquire(readonly=True) as conn:
+            assert conn == "r0-conn"
+
+    @pytest.mark.asyncio
+    async def test_primary_reads_are_capped_by_read_budget(self):
+        manager = PostgreSQLPoolManager(
+            {"dsn": "postgresql://primary/db", "max_size": 5}
+        )
+        manager._pool = FakePool("primary")
+        assert manager.read_max_size == 4
+
+        holders = [manager.acquire(readonly=True) for _ in range(4)]
+        for holder in holders:
+            await holder.__aenter__()
+
+        blocked = asyncio.create_task(manager.acquire(readonly=True).__aenter__())
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        # Writes are not limited by the read budget
+        async with manager.acquire() as conn:
+            assert conn == "primary-conn"
+
+        await holders[0].__aexit__(None, None, None)
+        await asyncio.wait_for(blocked, 1)
+        for holder in holders[1:]:
+            await holder.__aexit__(None, None, None)
+
+
 class TestQdrantClientManager:
     """Test Qdrant client singleton manager."""
 
@@ -442,3 +643,128 @@ class TestConnectionManager:
         manager.postgresql.close.assert_called_once()
         manager.qdrant.close.assert_called_once()
         manager.http.close.assert_called_once()
+
+
+class TestLocalKeyCache:
+    """Test the client-side cache used by shared Redis clients."""
+
+    def test_lru_and_ttl(self):
+        """Test eviction by size and expiry by TTL."""
+        cache = LocalKeyCache(max_keys=2, ttl=60)
+        cache.enabled = True
+
+        for key in ("a", "b", "c"):
+            cache.put("GET", key, key.upper(), cache.generation)
+
+        assert cache.get("GET", "a") == (False, None)
+        assert cache.get("GET", "c") == (True, "C")
+
+        cache.ttl = -1
+        cache.put("GET", "d", "D", cache.generation)
+        assert cache.get("GET", "d") == (False, None)
+
+    def test_invalidation_and_generation(self):
+        """Test invalidated keys are dropped and racing reads are not stored."""
+        cache = LocalKeyCache()
+        cache.enabled = True
+        cache.put("GET", "k", "v1", cache.generation)
+
+        generation = cache.generation
+        cache.invalidate([b"k"])
+        cache.put("GET", "k", "stale", generation)
+
+        assert cache.get("GET", "k") == (False, None)
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_prefix_tracking(self):
+        """Test only keys under the configured prefixes are cached."""
+        cache = LocalKeyCache(prefixes=("profile:",))
+
+        assert cache.tracks("profile:1")
+        assert not cache.tracks("rate:1")
+
+
+class TestRedisPoolRegistry:
+    """Test the process-wide Redis pool registry."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_pool_per_url(self):
+        """Test one tuned pool per URL and decode mode."""
+        registry = RedisPoolRegistry(max_connections=7, health_check_interval=15)
+        url = "redis://:secret@localhost:6379/0"
+
+        first = registry.get_client(url)
+        second = registry.get_client(url)
+        raw = registry.get_client(url, decode_responses=False)
+
+        assert first.connection_pool is second.connection_pool
+        assert raw.connection_pool is not first.connection_pool
+        assert first.connection_pool.max_connections == 7
+        kwargs = first.connection_pool.connection_kwargs
+        assert kwargs["health_check_interval"] == 15
+        assert kwargs["socket_keepalive"] is True
+
+        # Closing a client leaves the shared pool usable for the others
+        await first.aclose()
+        assert second.connection_pool is registry.get_client(url).connection_pool
+
+        metrics = registry.get_metrics()
+        assert metrics["total_pools"] == 2
+        assert metrics["pools"][0]["url"] == "redis://:***@localhost:6379/0"
+        assert metrics["pools"][0]["clients"] == 3
+
+        await registry.close_all()
+        assert registry.get_metrics()["total_pools"] == 0
+
+    def test_from_env(self, monkeypatch):
+        """Test REDIS_* environment variables configure the registry."""
+        monkeypatch.setenv("REDIS_MAX_CONNECTIONS", "20")
+        monkeypatch.setenv("REDIS_CLIENT_CACHE", "true")
+        monkeypatch.setenv("REDIS_CLIENT_CACHE_PREFIXES", "a:, b:")
+
+        registry = RedisPoolRegistry.from_env()
+
+        assert registry.max_connections == 20
+        assert registry.client_side_cache is True
+        assert registry.cache_prefixes == ("a:", "b:")
+
+    @pytest.mark.asyncio
+    async def test_client_side_cache(self):
+        """Test GETs are served locally until Redis reports an invalidation."""
+        registry = RedisPoolRegistry(client_side_cache=True, cache_prefixes=("p:",))
+        client = registry.get_client("redis://localhost:6379/0")
+        entry = client._entry
+        # Pretend the invalidation listener is running
+        entry._tracking = True
+        entry.local_cache.enabled = True
+
+        backend = AsyncMock(side_effect=["v1", "v2", "other", "other", True, "v3"])
+        with patch("redis.asyncio.Redis.execute_command", backend):
+            assert await client.get("p:1") == "v1"
+            assert await client.get("p:1") == "v1"
+
+            entry.handle_invalidation(["message", "__redis__:invalidate", ["p:1"]])
+            assert await client.get("p:1") == "v2"
+
+            # Keys outside the tracked prefixes always go to Redis
+            await client.get("x:1")
+            await client.get("x:1")
+
+            # Own writes drop the local copy immediately
+            await client.set("p:1", "v3")
+            assert await client.get("p:1") == "v3"
+
+        assert backend.await_count == 6
+        assert entry.local_cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_manager_exposes_redis_metrics(self):
+        """Test Redis pools appear in get_all_metrics without skewing totals."""
+        manager = ConnectionManager({})
+        manager.redis = RedisPoolRegistry()
+        manager.redis.get_client("redis://localhost:6379/0")
+
+        metrics = await manager.get_all_metrics()
+
+        assert metrics["redis"]["total_pools"] == 1
+        assert metrics["total_requests"] == 0
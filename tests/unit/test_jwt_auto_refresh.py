@@ -6,13 +6,14 @@ import jwt
 import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi import HTTPException
+import httpx
 
 from src.auth.jwt_manager import (
     JWTManager,
     TokenPair,
     RefreshTokenStore,
     AutoRefreshClient,
+    TokenRefreshError,
 )
 
 
@@ -330,7 +331,7 @@ class TestAutoRefreshClient:
         auto_refresh_client.set_tokens(current_access, current_refresh, device_id)
 
         # Make a request that should trigger refresh
-        async def mock_request():
+        async def mock_request(*args, **kwargs):
             return {"data": "response"}
 
         with patch.object(
@@ -352,8 +353,11 @@ class TestAutoRefreshClient:
     @pytest.mark.asyncio
     async def test_retry_on_401(self, auto_refresh_client):
         """Test retry with token refresh on 401 response."""
-        # Set initial tokens
+        # Set initial tokens (not yet inside the proactive renewal window)
         auto_refresh_client.set_tokens("expired_token", "refresh_token", "device_xyz")
+        auto_refresh_client.jwt_manager.is_token_near_expiry = MagicMock(
+            return_value=False
+        )
 
         # Mock responses
         call_count = 0
@@ -364,7 +368,12 @@ class TestAutoRefreshClient:
 
             if call_count == 1:
                 # First call returns 401
-                raise HTTPException(status_code=401, detail="Token expired")
+                request = httpx.Request("GET", "https://api.example.com/api/test")
+                raise httpx.HTTPStatusError(
+                    "Token expired",
+                    request=request,
+                    response=httpx.Response(401, request=request),
+                )
             else:
                 # Second call succeeds after refresh
                 return {"data": "success"}
@@ -476,5 +485,170 @@ class TestAutoRefreshClient:
         assert auto_refresh_client.jwt_manager.refresh_tokens.call_count == 1
 
 
+
+class InMemoryRefreshTokenStore:
+    """Rotating refresh token store: only the latest token per device is valid."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.tokens = {}
+
+    async def store_token(self, user_id, refresh_token, device_id, metadata=None):
+        self.tokens[(user_id, device_id)] = refresh_token
+
+    async def validate_token(self, user_id, refresh_token, device_id):
+        # Widen the refresh window so concurrent callers overlap
+        await asyncio.sleep(self.delay)
+        return self.tokens.get((user_id, device_id)) == refresh_token
+
+    async def revoke_token(self, user_id, device_id):
+        self.tokens.pop((user_id, device_id), None)
+
+
+class StandInGateway:
+    """Local ASGI gateway that checks bearer tokens with the JWT manager."""
+
+    def __init__(self, jwt_manager):
+        self.jwt_manager = jwt_manager
+        self.rejected = set()
+        self.seen_tokens = []
+
+    async def __call__(self, scope, receive, send):
+        headers = dict(scope["headers"])
+        token = headers.get(b"authorization", b"").decode().removeprefix("Bearer ")
+        self.seen_tokens.append(token)
+        if token in self.rejected or not self.jwt_manager.validate_access_token(token):
+            status, body = 401, b'{"detail": "unauthorized"}'
+        else:
+            status, body = 200, json.dumps({"path": scope["path"]}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class TestSingleFlightRefresh:
+    """Concurrent requests against a stand-in gateway share one refresh."""
+
+    @pytest.fixture
+    def jwt_manager(self):
+        return JWTManager(
+            secret_key="test-secret-key-for-testing-only",
+            access_token_expire_minutes=15,
+            refresh_token_store=InMemoryRefreshTokenStore(),
+        )
+
+    @pytest.fixture
+    def gateway(self, jwt_manager):
+        return StandInGateway(jwt_manager)
+
+    @pytest.fixture
+    async def client(self, jwt_manager, gateway):
+        client = AutoRefreshClient(
+            jwt_manager=jwt_manager,
+            base_url="http://gateway",
+            retry_delay_seconds=0,
+            transport=httpx.ASGITransport(app=gateway),
+        )
+        pair = await jwt_manager.create_token_pair({"user_id": "user123"}, "device_xyz")
+        client.set_tokens(pair.access_token, pair.refresh_token, "device_xyz")
+        yield client
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_401s_refresh_once_and_replay(
+        self, client, gateway, jwt_manager
+    ):
+        """A burst of 401s triggers one refresh; every request is replayed."""
+        old_access, old_refresh = client._access_token, client._refresh_token
+        gateway.rejected.add(old_access)
+
+        results = await asyncio.gather(
+            *(client.request("GET", f"/api/items/{i}") for i in range(20))
+        )
+
+        assert [r["path"] for r in results] == [f"/api/items/{i}" for i in range(20)]
+        assert client.refresh_count == 1
+        assert client._access_token != old_access
+        # Rejected requests and ones queued behind the refresh all use the new token
+        assert gateway.seen_tokens.count(client._access_token) == 20
+        assert set(gateway.seen_tokens) == {old_access, client._access_token}
+
+        # The rotated refresh token is gone: a second refresh would have failed
+        with pytest.raises(TokenRefreshError):
+            await jwt_manager.refresh_tokens(old_refresh, "device_xyz")
+
+    @pytest.mark.asyncio
+    async def test_requests_queue_behind_in_flight_refresh(self, client, gateway):
+        """Requests started during a refresh go out with the new token."""
+        old_access = client._access_token
+        refresh = asyncio.create_task(client._refresh_tokens())
+        await asyncio.sleep(0)
+
+        results = await asyncio.gather(
+            *(client.request("GET", "/api/queued") for _ in range(5))
+        )
+        await refresh
+
+        assert len(results) == 5
+        assert client.refresh_count == 1
+        assert old_access not in gateway.seen_tokens
+        assert set(gateway.seen_tokens) == {client._access_token}
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_reaches_all_waiters_then_retries(
+        self, client, gateway, jwt_manager
+    ):
+        """A failed refresh fails every waiter once; the next call refreshes again."""
+        gateway.rejected.add(client._access_token)
+        jwt_manager.refresh_token_store.tokens.clear()
+
+        results = await asyncio.gather(
+            *(client.request("GET", "/api/items") for _ in range(5)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, TokenRefreshError) for r in results)
+        assert client.refresh_count == 1
+        assert client._refresh_future is None
+
+        with pytest.raises(TokenRefreshError):
+            await client.request("GET", "/api/items")
+        assert client.refresh_count == 2
+
+    @pytest.mark.asyncio
+    async def test_proactive_renewal_threshold_is_jittered(self, jwt_manager):
+        """Each token gets its own threshold within [threshold, threshold + jitter]."""
+        client = AutoRefreshClient(
+            jwt_manager=jwt_manager,
+            base_url="http://gateway",
+            refresh_threshold_minutes=5,
+            refresh_jitter_seconds=60,
+        )
+        thresholds = set()
+        for _ in range(20):
+            client.set_tokens("access", "refresh", "device_xyz")
+            thresholds.add(client._renewal_threshold_minutes)
+        await client.close()
+
+        assert all(5 <= t <= 6 for t in thresholds)
+        assert len(thresholds) > 1
+
+    @pytest.mark.asyncio
+    async def test_proactive_renewal_before_expiry(self, client, gateway, jwt_manager):
+        """A token inside the renewal window is refreshed before the request."""
+        old_access = client._access_token
+        client._renewal_threshold_minutes = 16  # token lives 15 minutes
+
+        await asyncio.gather(*(client.request("GET", "/api/items") for _ in range(10)))
+
+        assert client.refresh_count == 1
+        assert old_access not in gateway.seen_tokens
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,169 @@
+"""Unit tests for the compiled middleware pipeline."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from mcp.shared.exceptions import McpError
+
+from src.middleware.logging import LoggingMiddleware
+from src.middleware.metrics import MetricsMiddleware
+from src.middleware.pipeline import MiddlewarePipeline, RequestEnvelope
+from src.middleware.rate_limit import RateLimitMiddleware
+from src.middleware.validation import ValidationMiddleware
+
+
+class RecordingMiddleware:
+    """Middleware that records the envelope it sees."""
+
+    def __init__(self, applies_to=None, exempt_tools=()):
+        self.applies_to = applies_to
+        self.exempt_tools = frozenset(exempt_tools)
+        self.seen = []
+
+    async def __call__(self, request, call_next):
+        self.seen.append(RequestEnvelope.of(request))
+        return await call_next(request)
+
+
+@pytest.fixture
+def handler():
+    """Create terminal handler."""
+
+    async def handle(request):
+        return {"result": "success"}
+
+    return AsyncMock(side_effect=handle)
+
+
+def make_request(method="tools/call", tool_name="search_web", user=None):
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": {}}
+    if method == "tools/call":
+        request["params"] = {"name": tool_name, "arguments": {"query": "test"}}
+    request["user"] = user or {"id": "user123", "roles": ["user"]}
+    return request
+
+
+class TestRequestEnvelope:
+    """Test request envelope parsing."""
+
+    def test_parse_tool_call(self):
+        """Test tool name and arguments are extracted once."""
+        envelope = RequestEnvelope.parse(make_request())
+
+        assert envelope.method == "tools/call"
+        assert envelope.tool_name == "search_web"
+        assert envelope.tool_args == {"query": "test"}
+        assert envelope.route == "tools/call:search_web"
+        assert envelope.request_id
+
+    def test_envelope_is_immutable(self):
+        """Test envelope fields cannot be reassigned."""
+        envelope = RequestEnvelope.parse(make_request())
+
+        with pytest.raises(AttributeError):
+            envelope.method = "tools/list"
+
+    def test_reuses_existing_request_id(self):
+        """Test request_id already on the request is preserved."""
+        request = make_request()
+        request["request_id"] = "req-123"
+
+        assert RequestEnvelope.parse(request).request_id == "req-123"
+
+
+class TestMiddlewarePipeline:
+    """Test compiled middleware pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_envelope_shared_across_layers(self, handler):
+        """Test every layer sees the same parsed envelope."""
+        first, second = RecordingMiddleware(), RecordingMiddleware()
+        pipeline = MiddlewarePipeline([first, second])
+
+        result = await pipeline.dispatch(make_request(), handler)
+
+        assert result == {"result": "success"}
+        assert first.seen[0] is second.seen[0]
+
+    def test_fast_path_skips_tool_only_layers(self):
+        """Test tools/list and health_check skip rate limiting."""
+        pipeline = MiddlewarePipeline(
+            [
+                LoggingMiddleware(),
+                ValidationMiddleware(),
+                RateLimitMiddleware(),
+                MetricsMiddleware(),
+            ]
+        )
+
+        assert "RateLimitMiddleware" in pipeline.layer_names("tools/call", "search_web")
+        assert "RateLimitMiddleware" not in pipeline.layer_names("tools/list")
+        assert "RateLimitMiddleware" not in pipeline.layer_names(
+            "tools/call", "health_check"
+        )
+        assert pipeline.layer_names("tools/list") == [
+            "LoggingMiddleware",
+            "ValidationMiddleware",
+            "MetricsMiddleware",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_chain_calls_handler_directly(self, handler):
+        """Test methods with no applicable layers go straight to the handler."""
+        layer = RecordingMiddleware(applies_to={"tools/call"})
+        pipeline = MiddlewarePipeline([layer])
+
+        await pipeline.dispatch(make_request(method="tools/list"), handler)
+
+        assert layer.seen == []
+        handler.assert_called_once()
+        assert pipeline.get_layer_timings()["fast_path_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_layer_timings_recorded(self, handler):
+        """Test per-layer timings are collected."""
+        pipeline = MiddlewarePipeline([RecordingMiddleware(), RecordingMiddleware()])
+
+        for _ in range(3):
+            await pipeline.dispatch(make_request(), handler)
+
+        layers = pipeline.get_layer_timings()["layers"]
+        assert set(layers) == {"RecordingMiddleware", "RecordingMiddleware#2"}
+        assert layers["RecordingMiddleware"]["calls"] == 3
+        outer = layers["RecordingMiddleware"]
+        assert outer["avg_total_ms"] >= outer["avg_self_ms"]
+
+        pipeline.reset_layer_timings()
+        assert pipeline.get_layer_timings()["layers"]["RecordingMiddleware"]["calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_on_message_raises_on_rejection(self):
+        """Test JSON-RPC error dicts from layers become MCP errors."""
+        pipeline = MiddlewarePipeline([ValidationMiddleware()])
+        context = SimpleNamespace(
+            method="resources/list", message=SimpleNamespace()
+        )
+        call_next = AsyncMock(return_value=[])
+
+        with pytest.raises(McpError):
+            await pipeline.on_message(context, call_next)
+        call_next.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_message_passes_tool_call(self):
+        """Test FastMCP tool calls are translated and forwarded."""
+        pipeline = MiddlewarePipeline(
+            [ValidationMiddleware()],
+            user_resolver=lambda: {"id": "svc", "type": "service"},
+        )
+        context = SimpleNamespace(
+            method="tools/call",
+            message=SimpleNamespace(name="search_web", arguments={"query": "q"}),
+        )
+        call_next = AsyncMock(return_value="tool-result")
+
+        result = await pipeline.on_message(context, call_next)
+
+        assert result == "tool-result"
+        call_next.assert_called_once_with(context)
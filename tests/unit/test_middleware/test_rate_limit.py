@@ -4,7 +4,7 @@ import pytest
 import time
 from unittest.mock import AsyncMock
 
-from src.middleware.rate_limit import RateLimitMiddleware
+from src.middleware.rate_limit import RateLimitMiddleware, cache_only_backends
 
 
 @pytest.fixture
@@ -166,3 +166,103 @@ class TestRateLimitMiddleware:
         async with rate_limit_middleware._lock:
             requests = rate_limit_middleware._request_counts[user_id]
             assert len(requests) == 1  # Only the new request
+
+
+def tool_request(tool_name, user_id="user123"):
+    return {
+        "method": "tools/call",
+        "params": {"name": tool_name, "arguments": {"query": "q"}},
+        "user": {"id": user_id},
+        "jsonrpc": "2.0",
+        "id": 1,
+    }
+
+
+class TestWeightedRateLimit:
+    """Test per-tool costs and per-backend budgets."""
+
+    @pytest.mark.asyncio
+    async def test_heavy_tools_consume_limit_proportionally(self, mock_call_next):
+        """search_all costs 3 units, so 3 calls exhaust a limit of 10."""
+        middleware = RateLimitMiddleware(
+            requests_per_minute=10, requests_per_hour=100, burst_size=10
+        )
+
+        for _ in range(3):
+            result = await middleware(tool_request("search_all"), mock_call_next)
+            assert result == {"result": "success"}
+
+        # 9 units used: a cheap tool still fits, another search_all does not
+        blocked = await middleware(tool_request("search_all"), mock_call_next)
+        assert blocked["error"]["message"] == "Rate limit exceeded"
+        allowed = await middleware(tool_request("search_vectors"), mock_call_next)
+        assert allowed == {"result": "success"}
+
+        stats = await middleware.get_usage_stats("user123")
+        assert stats["minute_requests"] == 10
+
+    @pytest.mark.asyncio
+    async def test_custom_costs_and_redis_weight(self, mock_call_next):
+        """The tool cost is passed to the Redis sliding window as the weight."""
+        middleware = RateLimitMiddleware(tool_costs={"search_web": 5})
+        middleware._redis_limiter = AsyncMock()
+        middleware._redis_limiter.check_rate_limit.return_value = (True, {})
+
+        await middleware(tool_request("search_web"), mock_call_next)
+        await middleware(tool_request("search_all"), mock_call_next)
+
+        weights = [
+            call.kwargs["weight"]
+            for call in middleware._redis_limiter.check_rate_limit.await_args_list
+        ]
+        assert weights == [5, 1]
+
+    def test_rejects_non_positive_cost(self):
+        with pytest.raises(ValueError):
+            RateLimitMiddleware(tool_costs={"search_all": 0})
+        assert RateLimitMiddleware(tool_costs={"search_all": 1000}).tool_costs == {
+            "search_all": 1000
+        }
+
+    @pytest.mark.asyncio
+    async def test_backend_budget_degrades_to_cache_only(self):
+        """Over the Tavily budget the call proceeds with tavily marked cache-only."""
+        middleware = RateLimitMiddleware(
+            requests_per_minute=100, burst_size=100, backend_budgets={"tavily": 2}
+        )
+        seen = []
+
+        async def call_next(request):
+            seen.append(cache_only_backends())
+            return {"result": "success"}
+
+        for _ in range(2):
+            await middleware(tool_request("search_web"), call_next)
+        result = await middleware(tool_request("search_all"), call_next)
+        await middleware(tool_request("search_web", user_id="other"), call_next)
+
+        assert result == {"result": "success"}
+        assert seen == [frozenset(), frozenset(), {"tavily"}, frozenset()]
+        # The marker does not leak past the request
+        assert cache_only_backends() == frozenset()
+
+    @pytest.mark.asyncio
+    async def test_backend_budget_uses_redis_endpoint(self):
+        middleware = RateLimitMiddleware(backend_budgets={"tavily": 20})
+        middleware._redis_limiter = AsyncMock()
+        middleware._redis_limiter.check_rate_limit.side_effect = [
+            (True, {}),
+            (False, {"retry_after": 30}),
+        ]
+        seen = []
+
+        async def call_next(request):
+            seen.append(cache_only_backends())
+            return {"result": "success"}
+
+        await middleware(tool_request("search_web"), call_next)
+
+        budget_call = middleware._redis_limiter.check_rate_limit.await_args_list[1]
+        assert budget_call.kwargs["endpoint"] == "backend:tavily"
+        assert budget_call.kwargs["limit"] == 20
+        assert seen == [{"tavily"}]
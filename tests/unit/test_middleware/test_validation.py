@@ -95,6 +95,41 @@ class TestValidationMiddleware:
         assert "Method not found" in result["error"]["message"]
         mock_call_next.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_unrestricted_methods_pass(self, mock_call_next):
+        """Test allowed_methods=None leaves unknown methods to the server."""
+        middleware = ValidationMiddleware(allowed_methods=None)
+        request = {"jsonrpc": "2.0", "method": "resources/list", "params": {}, "id": 1}
+
+        result = await middleware(request, mock_call_next)
+
+        assert result == {"result": "success"}
+        mock_call_next.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_permission_checker_replaces_role_mapping(self, mock_call_next):
+        """Test tool access is decided by the permission checker when given."""
+        checker = lambda roles, tool: "admin" in roles  # noqa: E731
+        middleware = ValidationMiddleware(
+            allowed_methods=None, tool_permissions=None, permission_checker=checker
+        )
+
+        def call(roles):
+            return {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {"name": "get_metrics", "arguments": {}},
+                "user": {"roles": roles},
+                "id": 1,
+            }
+
+        assert await middleware(call(["admin"]), mock_call_next) == {
+            "result": "success"
+        }
+        denied = await middleware(call(["user"]), mock_call_next)
+        assert denied["error"]["code"] == -32603
+        mock_call_next.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_tool_call_permission_denied(
         self, validation_middleware, mock_call_next
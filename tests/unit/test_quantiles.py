@@ -0,0 +1,77 @@
+"""Unit tests for the time-decayed streaming quantile sketch."""
+
+import random
+
+import pytest
+
+from src.utils.quantiles import DecayingQuantileSketch
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDecayingQuantileSketch:
+    """Test accuracy, fixed memory and decay."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(42)
+        values = [rng.lognormvariate(2, 1) for _ in range(50_000)]
+        sketch = DecayingQuantileSketch(relative_accuracy=0.01, half_life=1e9)
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        estimates = sketch.quantiles((0.5, 0.95, 0.99))
+        for q, estimate in estimates.items():
+            exact = values[int(q * (len(values) - 1))]
+            assert estimate == pytest.approx(exact, rel=0.02)
+        assert sketch.mean() == pytest.approx(sum(values) / len(values), rel=1e-6)
+
+    def test_memory_is_fixed(self):
+        sketch = DecayingQuantileSketch()
+        size = len(sketch._buckets)
+        for value in range(100_000):
+            sketch.add(float(value))
+        assert len(sketch._buckets) == size
+        assert sketch.count == 100_000
+
+    def test_old_observations_decay(self):
+        clock = FakeClock()
+        sketch = DecayingQuantileSketch(half_life=60, clock=clock)
+        for _ in range(100):
+            sketch.add(500.0)
+
+        # Ten half-lives later a handful of fast waits dominate
+        clock.now = 600
+        for _ in range(10):
+            sketch.add(1.0)
+
+        assert sketch.quantile(0.5) == pytest.approx(1.0, rel=0.01)
+        assert sketch.mean() < 50
+
+    def test_weights_rescale_without_losing_shape(self):
+        clock = FakeClock()
+        sketch = DecayingQuantileSketch(half_life=1, clock=clock)
+        sketch.add(10.0)
+        clock.now = 100  # weight 2**100 forces a rescale
+        sketch.add(20.0)
+        sketch.add(20.0)
+
+        assert sketch.quantile(0.5) == pytest.approx(20.0, rel=0.01)
+
+    def test_empty_and_zero_values(self):
+        sketch = DecayingQuantileSketch()
+        assert sketch.snapshot() == {
+            "p50": 0.0,
+            "p95": 0.0,
+            "p99": 0.0,
+            "mean": 0.0,
+            "count": 0,
+        }
+        sketch.add(0.0)
+        assert sketch.quantile(0.99) == 0.0
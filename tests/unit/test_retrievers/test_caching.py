@@ -0,0 +1,264 @@
+"""Unit tests for the CachingRetriever decorator."""
+
+import fnmatch
+
+import pytest
+
+from src.cache import CacheConfig, RedisCache
+from src.retrievers.base import Retriever, RetrieverHealth
+from src.retrievers.cached_base import CachedRetriever
+from src.retrievers.caching import (
+    CachePolicy,
+    CachingRetriever,
+    DEFAULT_CACHE_POLICIES,
+    normalize_query,
+)
+from src.retrievers.factory import RetrieverFactory
+
+
+class FakeRedisClient:
+    """In-memory stand-in for the redis.asyncio client."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    async def scan_iter(self, match):
+        for key in list(self.store):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def delete(self, *keys):
+        return sum(self.store.pop(k, None) is not None for k in keys)
+
+    async def close(self):
+        pass
+
+
+def fake_cache():
+    cache = RedisCache(CacheConfig(key_prefix="test"))
+    cache._client = FakeRedisClient()
+    cache._connected = True
+    return cache
+
+
+class CountingRetriever(Retriever):
+    """Retriever that records every backend call."""
+
+    def __init__(self, config=None):
+        super().__init__(config or {})
+        self.calls = []
+
+    async def connect(self):
+        self._connected = True
+
+    async def disconnect(self):
+        self._connected = False
+
+    async def retrieve(self, query, limit=10, **kwargs):
+        self.calls.append((query, limit, kwargs))
+        for i in range(limit):
+            yield {"id": i, "query": query}
+
+    async def health_check(self):
+        return RetrieverHealth(healthy=True, service_name="Counting")
+
+
+async def _collect(retriever, query, **kwargs):
+    return [r async for r in retriever.retrieve(query, **kwargs)]
+
+
+class TestKeyNormalization:
+    """Test per-backend key normalization."""
+
+    def test_web_queries_are_normalized(self):
+        policy = DEFAULT_CACHE_POLICIES["tavily"]
+        assert normalize_query("  Python \t  Tutorial ", policy) == "python tutorial"
+
+    def test_sql_queries_are_not_case_folded(self):
+        policy = DEFAULT_CACHE_POLICIES["postgres"]
+        query = "SELECT * FROM users WHERE name = 'Alice  B'"
+        assert normalize_query(f"  {query} ", policy) == query
+
+    def test_equivalent_requests_share_key(self):
+        retriever = CachingRetriever(CountingRetriever(), "tavily", cache=fake_cache())
+
+        first = retriever.cache_key(
+            "Python Tutorial", 5, include_domains=["b.com", "a.com"]
+        )
+        second = retriever.cache_key(
+            "python   tutorial", 5, include_domains=["a.com", "b.com"]
+        )
+
+        assert first == second
+        assert first != retriever.cache_key("python tutorial", 6)
+
+
+class TestCachingRetriever:
+    """Test CachingRetriever behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_backend(self):
+        inner = CountingRetriever()
+        cache = fake_cache()
+        retriever = CachingRetriever(inner, "tavily", cache=cache)
+
+        first = await _collect(retriever, "Python", limit=2)
+        second = await _collect(retriever, " python ", limit=2)
+
+        assert first == second
+        assert len(inner.calls) == 1
+        assert list(cache._client.ttls.values()) == [300]
+        stats = retriever.get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["sets"]) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_ttl_policy_and_override(self):
+        cache = fake_cache()
+        retriever = CachingRetriever(
+            CountingRetriever(), "qdrant", cache=cache, cache_ttl=120
+        )
+
+        await _collect(retriever, "a", limit=1)
+        await _collect(retriever, "b", limit=1, cache_ttl=30)
+
+        assert sorted(cache._client.ttls.values()) == [30, 120]
+        # cache_ttl is consumed by the decorator, not passed to the backend
+        assert all("cache_ttl" not in kwargs for _, _, kwargs in retriever.inner.calls)
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_and_empty_results(self):
+        inner = CountingRetriever()
+        retriever = CachingRetriever(inner, "tavily", cache=fake_cache())
+
+        await _collect(retriever, "empty", limit=0)
+        await _collect(retriever, "empty", limit=0)
+        retriever._use_cache = False
+        await _collect(retriever, "q", limit=1)
+        await _collect(retriever, "q", limit=1)
+
+        assert len(inner.calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_per_call_bypass_leaves_shared_flag(self):
+        """use_cache=False skips the cache for one call only."""
+        inner = CountingRetriever()
+        retriever = CachingRetriever(inner, "tavily", cache=fake_cache())
+        await _collect(retriever, "q", limit=1)
+
+        bypass = retriever.retrieve("q", limit=1, use_cache=False)
+        first = await bypass.__anext__()
+        # A concurrent request still hits the cache while the bypass is open
+        assert await _collect(retriever, "q", limit=1) == [first]
+        await bypass.aclose()
+
+        assert retriever._use_cache is True
+        assert len(inner.calls) == 2
+        assert all("use_cache" not in kwargs for _, _, kwargs in inner.calls)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_pattern(self):
+        retriever = CachingRetriever(
+            CountingRetriever(), "tavily", cache=fake_cache()
+        )
+        await _collect(retriever, "python asyncio", limit=1)
+        await _collect(retriever, "rust", limit=1)
+
+        assert await retriever.invalidate_cache("*python*") == 1
+        assert await retriever.invalidate_cache() == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_connect_failure_degrades(self):
+        inner = CountingRetriever()
+        cache = RedisCache(CacheConfig(redis_url="redis://127.0.0.1:1/0"))
+        retriever = CachingRetriever(inner, "tavily", cache=cache)
+
+        await retriever.connect()
+
+        assert retriever.connected
+        assert retriever._use_cache is False
+        assert await _collect(retriever, "q", limit=1) == [{"id": 0, "query": "q"}]
+
+    @pytest.mark.asyncio
+    async def test_write_queries_bypass_cache(self):
+        """INSERT ... RETURNING runs every time and is never stored."""
+
+        class SqlRetriever(CountingRetriever):
+            def is_read_only(self, query):
+                return query.startswith("SELECT")
+
+        inner = SqlRetriever()
+        cache = fake_cache()
+        retriever = CachingRetriever(inner, "postgres", cache=cache)
+        write = "INSERT INTO docs (t) VALUES ('x') RETURNING id"
+
+        await _collect(retriever, write, limit=1)
+        await _collect(retriever, write, limit=1)
+        await _collect(retriever, "SELECT id FROM docs", limit=1)
+        await _collect(retriever, "SELECT id FROM docs", limit=1)
+
+        assert [query for query, _, _ in inner.calls] == [write, write, "SELECT id FROM docs"]
+        assert len(cache._client.store) == 1
+        assert await retriever.get_cached(write, limit=1) is None
+
+    @pytest.mark.asyncio
+    async def test_get_cached_never_calls_backend(self):
+        inner = CountingRetriever()
+        retriever = CachingRetriever(inner, "tavily", cache=fake_cache())
+
+        assert await retriever.get_cached("Python", limit=2) is None
+        await _collect(retriever, "Python", limit=2)
+
+        cached = await retriever.get_cached(" python ", limit=2, cache_ttl=30)
+        assert cached == [{"id": 0, "query": "Python"}, {"id": 1, "query": "Python"}]
+        assert len(inner.calls) == 1
+        retriever._use_cache = False
+        assert await retriever.get_cached("Python", limit=2) is None
+
+
+class TestFactoryCaching:
+    """Test the factory wraps retrievers when caching is configured."""
+
+    def test_factory_applies_caching(self):
+        factory = RetrieverFactory()
+        factory.register("counting", CountingRetriever)
+
+        plain = factory.create({"type": "counting"})
+        cached = factory.create(
+            {"type": "counting", "use_cache": True, "cache_ttl": 42}
+        )
+        layered = factory.create(
+            {"type": "counting", "use_cache": True, "resilience": {"hedge": False}}
+        )
+
+        assert isinstance(plain, CountingRetriever)
+        assert isinstance(cached, CachingRetriever)
+        assert cached.policy == CachePolicy(ttl=42)
+        # Cache is the outer layer so hits bypass timeouts and hedging
+        assert type(layered.inner).__name__ == "ResilientRetriever"
+
+    def test_factory_skips_cached_retriever_subclasses(self):
+        class SelfCaching(CachedRetriever):
+            async def _connect_impl(self):
+                pass
+
+            async def _disconnect_impl(self):
+                pass
+
+            async def _retrieve_impl(self, query, limit=10, **kwargs):
+                yield {}
+
+            async def health_check(self):
+                pass
+
+        factory = RetrieverFactory()
+        factory.register("self", SelfCaching)
+
+        assert isinstance(factory.create({"type": "self", "use_cache": True}), SelfCaching)
@@ -185,13 +185,13 @@ class TestRetrieverFactoryWithDefaults:
         # Create factory with defaults
         factory = RetrieverFactory(register_defaults=True)
 
-        # Check that default retrievers are registered
-        assert "tavily" in factory._retrievers
+        # Check that default retrievers are registered (by import path)
+        assert factory.list_available() == ["tavily", "postgres", "qdrant"]
 
         # Import TavilyRetriever to check it's registered
         from src.retrievers.tavily import TavilyRetriever
 
-        assert factory._retrievers["tavily"] == TavilyRetriever
+        assert factory.get_retriever_class("tavily") == TavilyRetriever
 
     def test_create_tavily_retriever(self):
         """Test creating a Tavily retriever through factory."""
@@ -233,7 +233,7 @@ class TestRetrieverFactorySingleton:
         factory2 = RetrieverFactory.get_default()
 
         assert factory1 is factory2
-        assert "tavily" in factory1._retrievers
+        assert "tavily" in factory1.list_available()
 
     def test_default_factory_persistence(self):
         """Test that registrations persist in default factory."""
@@ -329,3 +329,23 @@ class TestRetrieverFactoryConfigValidation:
 
         with pytest.raises(RetrieverFactoryError, match="Failed to create retriever"):
             factory.create(config)
+
+    def test_register_lazy_imports_on_first_use(self):
+        """Test import-path registration defers the import until create()."""
+        factory = RetrieverFactory()
+
+        with pytest.raises(ValueError, match="Import path"):
+            factory.register_lazy("bad", "no_colon_here")
+
+        factory.register_lazy("missing", "src.retrievers.does_not_exist:Nothing")
+        factory.register_lazy("tavily", "src.retrievers.tavily:TavilyRetriever")
+        assert factory.list_available() == ["missing", "tavily"]
+        assert "tavily" not in factory._retrievers
+
+        retriever = factory.create({"type": "tavily", "api_key": "tvly-key"})
+        assert type(retriever).__name__ == "TavilyRetriever"
+        assert "tavily" in factory._retrievers
+
+        # Missing optional backends surface as factory errors at creation time
+        with pytest.raises(RetrieverFactoryError, match="missing"):
+            factory.create({"type": "missing"})
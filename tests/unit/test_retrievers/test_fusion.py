@@ -0,0 +1,83 @@
+"""Unit tests for search result fusion."""
+
+import pytest
+
+from src.retrievers.fusion import ResultFusion, normalize_url, result_key
+
+
+class TestResultKey:
+    """Test deduplication keys."""
+
+    def test_url_normalization(self):
+        """Test equivalent URLs map to the same key."""
+        assert normalize_url("HTTPS://Example.com/a/?utm_source=x&b=1#top") == (
+            "https://example.com/a?b=1"
+        )
+        assert result_key({"url": "https://example.com/a/"}) == result_key(
+            {"url": "https://EXAMPLE.com/a"}
+        )
+
+    def test_content_hash(self):
+        """Test results without URL are keyed by normalized content."""
+        first = {"text": "Hello   World", "source": "qdrant", "id": "1"}
+        second = {"content": "hello world", "source": "postgres", "id": 7}
+
+        assert result_key(first) == result_key(second)
+
+    def test_id_fallback(self):
+        """Test rows without text are keyed by source and id."""
+        assert result_key({"id": 3, "source": "postgres"}) == "id:postgres:3"
+
+
+class TestResultFusion:
+    """Test ResultFusion."""
+
+    def test_invalid_method(self):
+        """Test unknown fusion methods are rejected."""
+        with pytest.raises(ValueError):
+            ResultFusion(method="max")
+
+    def test_rrf_rewards_agreement(self):
+        """Test documents found by several sources rank first."""
+        fusion = ResultFusion(method="rrf")
+        fusion.add(
+            "tavily",
+            [
+                {"url": "https://a.com", "score": 0.9},
+                {"url": "https://b.com", "score": 0.8},
+            ],
+        )
+        fusion.add("qdrant", [{"url": "https://b.com/", "score": 0.2}])
+
+        top = fusion.top_k(2)
+
+        assert top[0]["url"] == "https://b.com"
+        assert top[0]["fused_sources"] == {"tavily": 2, "qdrant": 1}
+        assert fusion.stats()["duplicates"] == 1
+
+    def test_score_blending_normalizes_per_source(self):
+        """Test raw scores from different scales are normalized."""
+        fusion = ResultFusion(method="score")
+        fusion.add("tavily", [{"url": "https://a.com", "score": 0.99},
+                              {"url": "https://b.com", "score": 0.98}])
+        fusion.add("qdrant", [{"text": "doc", "score": 0.31},
+                              {"text": "other", "score": 0.30}])
+        # No scores at all: rank-based scores
+        fusion.add("postgres", [{"id": 1, "title": "row"}])
+
+        top = fusion.top_k(5)
+        scores = {r.get("url") or r.get("text") or r.get("title"): r["fused_score"]
+                  for r in top}
+
+        assert scores["https://a.com"] == scores["doc"] == scores["row"] == 1.0
+        assert scores["https://b.com"] == scores["other"] == 0.0
+
+    def test_top_k_limits_and_depth(self):
+        """Test only top-k results are returned and depth bounds input."""
+        fusion = ResultFusion(depth=5)
+        fusion.add("s", [{"id": i, "source": "s"} for i in range(100)])
+
+        top = fusion.top_k(3)
+
+        assert [r["id"] for r in top] == [0, 1, 2]
+        assert fusion.stats()["candidates"] == 5
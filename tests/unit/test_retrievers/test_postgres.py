@@ -1,6 +1,7 @@
 """Unit tests for PostgreSQL database retriever."""
 
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import Mock, AsyncMock, patch
 import asyncpg
 
@@ -408,3 +409,297 @@ class TestPostgresRetrieverIntegration:
 
         assert len(results) == 1
         mock_connection.prepare.assert_called_once()
+
+
+class FakeCursorConnection:
+    """Connection stand-in that serves rows through a server-side cursor."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.fetched = 0
+        self.cursor_calls = []
+        self.fetch = AsyncMock(return_value=rows)
+        self.in_transaction = False
+        self.fail_next = None
+        self.schema_reloads = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+    async def _iterate(self):
+        for row in self.rows:
+            assert self.in_transaction, "cursor used outside a transaction"
+            self.fetched += 1
+            yield row
+
+    def cursor(self, *args, prefetch=None):
+        self.cursor_calls.append((args, prefetch))
+        if self.fail_next:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        return self._iterate()
+
+    async def reload_schema_state(self):
+        self.schema_reloads += 1
+
+
+def streaming_retriever(postgres_config, conn):
+    retriever = PostgresRetriever({**postgres_config, "cursor_prefetch": 50})
+
+    @asynccontextmanager
+    async def acquire(readonly=False):
+        yield conn
+
+    retriever._pool_manager = Mock(acquire=acquire)
+    retriever._connected = True
+    return retriever
+
+
+class TestPostgresRetrieverStreaming:
+    """Test rows stream through cursors with LIMIT pushed into SQL."""
+
+    async def test_select_streams_through_cursor(self, postgres_config):
+        conn = FakeCursorConnection([{"id": i} for i in range(1000)])
+        retriever = streaming_retriever(postgres_config, conn)
+
+        results = [
+            r
+            async for r in retriever.retrieve(
+                "SELECT * FROM users WHERE team = $1;", limit=5, params=["core"]
+            )
+        ]
+
+        assert results[0] == {"id": 0, "source": "postgres"}
+        assert len(results) == 5
+        assert conn.cursor_calls == [
+            (("SELECT * FROM users WHERE team = $1 LIMIT $2", "core", 5), 5)
+        ]
+        assert conn.fetched == 5
+        conn.fetch.assert_not_called()
+
+    async def test_text_search_binds_limit(self, postgres_config):
+        conn = FakeCursorConnection([{"id": 1}])
+        retriever = streaming_retriever(postgres_config, conn)
+
+        results = [
+            r
+            async for r in retriever.retrieve(
+                "alice", limit=500, table="users", search_columns=["name"]
+            )
+        ]
+
+        (sql, *params), prefetch = conn.cursor_calls[0]
+        assert "LIMIT $2" in sql
+        assert params == ["alice", 500]
+        assert prefetch == 50
+        assert results == [{"id": 1, "source": "postgres"}]
+
+    async def test_prepared_statement_stops_at_limit(self, postgres_config):
+        conn = FakeCursorConnection([{"id": i} for i in range(100)])
+        retriever = streaming_retriever(postgres_config, conn)
+
+        results = [
+            r
+            async for r in retriever.retrieve_prepared(
+                "SELECT * FROM users WHERE id > $1", 0, limit=3
+            )
+        ]
+
+        assert [r["id"] for r in results] == [0, 1, 2]
+        assert conn.cursor_calls == [
+            (("SELECT * FROM users WHERE id > $1 LIMIT $2", 0, 3), 3)
+        ]
+        assert conn.fetched == 3
+
+    async def test_write_returning_uses_fetch(self, postgres_config):
+        conn = FakeCursorConnection([{"id": 7}])
+        retriever = streaming_retriever(postgres_config, conn)
+
+        results = [
+            r
+            async for r in retriever.retrieve(
+                "INSERT INTO users (name) VALUES ('x') RETURNING id"
+            )
+        ]
+
+        assert results == [{"id": 7, "source": "postgres"}]
+        assert conn.cursor_calls == []
+        conn.fetch.assert_awaited_once()
+
+
+class TestPostgresRetrieverStatements:
+    """Test statement reuse through the prepared-statement registry."""
+
+    async def test_text_searches_share_one_statement(self, postgres_config):
+        conn = FakeCursorConnection([{"id": 1}])
+        retriever = streaming_retriever(postgres_config, conn)
+
+        for text, limit, team in [("a", 5, "x"), ("b", 20, "y"), ("c", 5, "x")]:
+            async for _ in retriever.retrieve(
+                text,
+                limit=limit,
+                table="docs",
+                search_columns=["title"],
+                filters={"team": team, "lang": "ko"},
+            ):
+                pass
+
+        statements = {args[0] for args, _ in conn.cursor_calls}
+        assert len(statements) == 1
+        assert "lang = $3 AND team = $4" in statements.pop()
+        assert conn.cursor_calls[1][0][1:] == ("b", 20, "ko", "y")
+
+        stats = retriever.get_statement_stats()
+        assert (stats["size"], stats["hits"], stats["misses"]) == (1, 2, 1)
+        assert next(iter(stats["statements"].values()))["calls"] == 3
+
+    async def test_schema_change_invalidates_and_retries(self, postgres_config):
+        conn = FakeCursorConnection([{"id": 1}])
+        conn.fail_next = asyncpg.exceptions.InvalidCachedStatementError(
+            "cached plan must not change result type"
+        )
+        retriever = streaming_retriever(postgres_config, conn)
+
+        results = [r async for r in retriever.retrieve("SELECT * FROM docs")]
+
+        assert results == [{"id": 1, "source": "postgres"}]
+        assert len(conn.cursor_calls) == 2
+        assert conn.schema_reloads == 1
+        assert retriever.get_statement_stats()["invalidations"] == 1
+
+
+class FakeBulkConnection(FakeCursorConnection):
+    """Connection stand-in recording COPY and set-based writes."""
+
+    def __init__(self, column_types):
+        super().__init__([])
+        self.fetch = AsyncMock(return_value=list(column_types.items()))
+        self.copied = []
+        self.executed = []
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        assert self.in_transaction
+        rows = list(records)
+        self.copied.append((table, columns, rows))
+        return f"COPY {len(rows)}"
+
+    async def execute(self, query, *args):
+        assert self.in_transaction
+        self.executed.append((query, args))
+        keys = args[0]
+        return f"{query.split()[0]} {len(keys)}"
+
+
+class TestPostgresRetrieverBulkWrites:
+    """Test COPY inserts and UNNEST-based updates/deletes."""
+
+    TYPES = {"id": "integer", "title": "text", "score": "double precision"}
+
+    async def test_bulk_insert_uses_copy(self, postgres_config):
+        conn = FakeBulkConnection(self.TYPES)
+        retriever = streaming_retriever(postgres_config, conn)
+
+        inserted = await retriever.bulk_insert(
+            "documents", [{"title": "a", "score": 1.0}, {"title": "b", "id": 9}]
+        )
+
+        assert inserted == 2
+        assert conn.copied == [
+            ("documents", ["title", "score", "id"], [("a", 1.0, None), ("b", None, 9)])
+        ]
+
+    async def test_bulk_update_groups_by_columns_and_batches(self, postgres_config):
+        conn = FakeBulkConnection(self.TYPES)
+        retriever = streaming_retriever(
+            {**postgres_config, "bulk_batch_size": 2}, conn
+        )
+        records = [{"id": i, "title": f"t{i}"} for i in range(3)]
+        records.append({"id": 7, "score": 0.5})
+
+        updated = await retriever.bulk_update("documents", records)
+
+        assert updated == 4
+        queries = [query for query, _ in conn.executed]
+        assert len(queries) == 3
+        assert "unnest($1::integer[], $2::text[])" in queries[0]
+        assert 'WHERE t."id" = v."id"' in queries[0]
+        assert conn.executed[1][1] == ([2], ["t2"])
+        assert "$2::double precision[]" in queries[2]
+        # Column types are looked up once per table
+        conn.fetch.assert_awaited_once()
+
+    async def test_bulk_update_rejects_unknown_columns(self, postgres_config):
+        conn = FakeBulkConnection(self.TYPES)
+        retriever = streaming_retriever(postgres_config, conn)
+
+        with pytest.raises(QueryError, match="Unknown column 'nope'"):
+            await retriever.bulk_update("documents", [{"id": 1, "nope": 2}])
+        assert conn.executed == []
+
+    async def test_bulk_delete_uses_any_array(self, postgres_config):
+        conn = FakeBulkConnection(self.TYPES)
+        retriever = streaming_retriever(postgres_config, conn)
+
+        deleted = await retriever.bulk_delete("documents", [1, 2, 3])
+
+        assert deleted == 3
+        assert conn.executed == [
+            ('DELETE FROM "documents" WHERE "id" = ANY($1::integer[])', ([1, 2, 3],))
+        ]
+
+
+    async def test_invalidate_statements_without_expiring_pool(self, postgres_config):
+        conn = FakeBulkConnection(self.TYPES)
+        retriever = streaming_retriever(postgres_config, conn)
+        retriever._pool_manager.expire_connections = AsyncMock()
+
+        await retriever.bulk_update("documents", [{"id": 1, "title": "a"}])
+        await retriever.invalidate_statements(expire_connections=False)
+        await retriever.bulk_update("documents", [{"id": 1, "title": "b"}])
+
+        # Column types are looked up again, pooled connections are kept
+        assert conn.fetch.await_count == 2
+        retriever._pool_manager.expire_connections.assert_not_awaited()
+
+class TestPostgresRetrieverReadRouting:
+    """Test which queries may be served by read replicas."""
+
+    @pytest.mark.parametrize(
+        "query, readonly",
+        [
+            ("SELECT * FROM docs", True),
+            ("  with t AS (SELECT 1) SELECT * FROM t", True),
+            ("SELECT * FROM docs FOR UPDATE", False),
+            ("SELECT * FROM docs FOR SHARE", False),
+            ("SELECT * INTO backup FROM docs", False),
+            ("WITH d AS (DELETE FROM docs RETURNING *) SELECT * FROM d", False),
+            ("SELECT nextval('docs_id_seq')", False),
+            ("INSERT INTO docs VALUES (1)", False),
+        ],
+    )
+    def test_is_read_only(self, postgres_config, query, readonly):
+        retriever = PostgresRetriever(postgres_config)
+        assert retriever._is_read_only(query) is readonly
+
+    async def test_retrieve_requests_replica_for_reads(self, postgres_config):
+        conn = FakeCursorConnection([{"id": 1}])
+        retriever = streaming_retriever(postgres_config, conn)
+        routes = []
+
+        @asynccontextmanager
+        async def acquire(readonly=False):
+            routes.append(readonly)
+            yield conn
+
+        retriever._pool_manager.acquire = acquire
+
+        for query in ["alice", "SELECT * FROM docs", "DELETE FROM docs RETURNING id"]:
+            async for _ in retriever.retrieve(query, table="docs"):
+                pass
+
+        assert routes == [True, True, False]
@@ -0,0 +1,318 @@
+"""Unit tests for the retriever resilience layer."""
+
+import asyncio
+
+import pytest
+
+from src.retrievers.base import QueryError, Retriever, RetrieverHealth
+from src.retrievers.factory import RetrieverFactory
+from src.retrievers.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    LatencyTracker,
+    ResilientRetriever,
+    RetryBudget,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedRetriever(Retriever):
+    """Retriever whose calls follow a script of delays and errors."""
+
+    def __init__(self, config=None, script=None):
+        super().__init__(config or {})
+        self.script = list(script or [])
+        self.calls = 0
+        self.yielded = 0
+        self._connected = True
+
+    async def connect(self):
+        self._connected = True
+
+    async def disconnect(self):
+        self._connected = False
+
+    async def retrieve(self, query, limit=10, **kwargs):
+        step = self.script[min(self.calls, len(self.script) - 1)] if self.script else 0
+        self.calls += 1
+        call = self.calls
+        if isinstance(step, Exception):
+            raise step
+        await asyncio.sleep(step)
+        for i in range(limit if query == "stream" else 1):
+            self.yielded += 1
+            yield {"id": call, "query": query, **({"row": i} if i else {})}
+            if query == "stream":
+                await asyncio.sleep(0)
+
+    def is_read_only(self, query):
+        return not query.startswith("DELETE")
+
+    async def health_check(self):
+        return RetrieverHealth(healthy=True, service_name="Scripted")
+
+    def backend_only(self):
+        return "inner"
+
+
+def _warm(retriever, seconds, samples=20):
+    for _ in range(samples):
+        retriever.latency.record(seconds)
+
+
+async def _collect(retriever):
+    return [r async for r in retriever.retrieve("q")]
+
+
+async def _collect_query(retriever, query):
+    return [r async for r in retriever.retrieve(query)]
+
+
+class TestPrimitives:
+    """Test latency tracker, breaker and retry budget."""
+
+    def test_latency_percentiles(self):
+        """Test percentiles need enough samples."""
+        tracker = LatencyTracker(window=100, min_samples=10)
+        assert tracker.percentile(0.95) is None
+
+        for i in range(100):
+            tracker.record(i / 100)
+
+        assert tracker.percentile(0.5) == 0.5
+        assert tracker.percentile(0.99) == 0.99
+
+    def test_circuit_breaker_lifecycle(self):
+        """Test closed -> open -> half_open -> closed transitions."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+        clock.now = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        # Only one probe at a time
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.snapshot() == {
+            "state": "closed",
+            "consecutive_failures": 0,
+            "open_count": 1,
+        }
+
+    def test_half_open_failure_reopens(self):
+        """Test a failed probe opens the breaker again."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now = 5
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.snapshot()["retry_in"] == 5
+
+    def test_retry_budget(self):
+        """Test retries are capped by the deposit ratio."""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.25, min_per_second=0, clock=clock)
+
+        assert not budget.try_acquire()
+        for _ in range(4):
+            budget.record_request()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+        assert budget.snapshot()["denied"] == 2
+
+
+class TestResilientRetriever:
+    """Test ResilientRetriever."""
+
+    def _wrap(self, inner, **kwargs):
+        kwargs.setdefault("retry_budget", RetryBudget(min_per_second=10))
+        return ResilientRetriever(inner, name="scripted", **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_delegates_to_inner(self):
+        """Test results, connection state and backend methods pass through."""
+        inner = ScriptedRetriever(script=[0])
+        retriever = self._wrap(inner)
+
+        assert await _collect(retriever) == [{"id": 1, "query": "q"}]
+        assert retriever.connected
+        assert retriever.backend_only() == "inner"
+
+        await retriever.disconnect()
+        assert not retriever.connected
+
+    @pytest.mark.asyncio
+    async def test_adaptive_timeout(self):
+        """Test the deadline follows p99 latency."""
+        inner = ScriptedRetriever(script=[0.5])
+        retriever = self._wrap(inner, min_timeout=0.01, hedge=False, max_retries=0)
+        assert retriever.current_timeout() == 30.0
+
+        _warm(retriever, 0.01)
+        assert retriever.current_timeout() == 0.02
+
+        with pytest.raises(QueryError, match="timed out"):
+            await _collect(retriever)
+        assert retriever.get_stats()["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins(self):
+        """Test a duplicate request is sent after p95 and the faster wins."""
+        inner = ScriptedRetriever(script=[1.0, 0])
+        retriever = self._wrap(inner, min_timeout=0.5)
+        _warm(retriever, 0.02)
+
+        results = await _collect(retriever)
+
+        assert results == [{"id": 2, "query": "q"}]
+        stats = retriever.get_stats()
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_respects_budget(self):
+        """Test no hedge is sent when the retry budget is empty."""
+        inner = ScriptedRetriever(script=[0.05, 0])
+        budget = RetryBudget(ratio=0, min_per_second=0)
+        retriever = self._wrap(inner, retry_budget=budget, min_timeout=0.5)
+        _warm(retriever, 0.01)
+
+        await _collect(retriever)
+
+        assert inner.calls == 1
+        assert retriever.get_stats()["hedged"] == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_rate_limit(self):
+        """Test short Retry-After is honoured, long one is not retried."""
+        limited = QueryError("rate limited", "scripted", {"retry_after": 0.01})
+        inner = ScriptedRetriever(script=[limited, 0])
+        retriever = self._wrap(inner)
+
+        assert await _collect(retriever) == [{"id": 2, "query": "q"}]
+        assert retriever.get_stats()["retries"] == 1
+
+        long_wait = QueryError("rate limited", "scripted", {"retry_after": 60})
+        inner.script, inner.calls = [long_wait, 0], 0
+        with pytest.raises(QueryError):
+            await _collect(retriever)
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_fails_fast(self):
+        """Test consecutive failures open the breaker and skip the backend."""
+        unavailable = QueryError("boom", "scripted", {"status_code": 503})
+        inner = ScriptedRetriever(script=[unavailable])
+        retriever = self._wrap(inner, failure_threshold=2, max_retries=0)
+
+        for _ in range(2):
+            with pytest.raises(QueryError):
+                await _collect(retriever)
+
+        with pytest.raises(CircuitOpenError):
+            await _collect(retriever)
+        assert inner.calls == 2
+
+        health = await retriever.health_check()
+        assert not health.healthy
+        assert health.details["resilience"]["breaker"]["state"] == "open"
+        assert retriever.get_stats()["short_circuited"] == 1
+
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_breaker_or_retry(self):
+        """Test bad SQL from one caller is neither retried nor counted as an outage."""
+        syntax_error = QueryError("syntax error at or near FORM", "scripted")
+        inner = ScriptedRetriever(script=[syntax_error])
+        retriever = self._wrap(inner, failure_threshold=2)
+
+        for _ in range(3):
+            with pytest.raises(QueryError, match="syntax"):
+                await _collect(retriever)
+
+        assert inner.calls == 3
+        stats = retriever.get_stats()
+        assert stats["breaker"]["state"] == "closed"
+        assert stats["retries"] == 0
+        assert stats["client_errors"] == 3
+
+    @pytest.mark.asyncio
+    async def test_transport_error_cause_is_transient(self):
+        """Test a wrapped connection failure is retried."""
+        reset = QueryError("Query failed", "scripted")
+        reset.__context__ = OSError("connection reset")
+        inner = ScriptedRetriever(script=[reset, 0])
+        retriever = self._wrap(inner)
+
+        assert await _collect(retriever) == [{"id": 2, "query": "q"}]
+        assert retriever.get_stats()["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_are_not_hedged_or_retried(self):
+        """Test a DELETE runs once even when slow or failing transiently."""
+        inner = ScriptedRetriever(script=[0.05])
+        retriever = self._wrap(inner, min_timeout=0.5)
+        _warm(retriever, 0.01)
+
+        results = [r async for r in retriever.retrieve("DELETE FROM docs")]
+        assert len(results) == 1
+        assert inner.calls == 1
+        assert retriever.get_stats()["hedged"] == 0
+
+        inner.script, inner.calls = [QueryError("x", "scripted", {"timeout": 1}), 0], 0
+        with pytest.raises(QueryError):
+            await _collect_query(retriever, "DELETE FROM docs")
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_results_stream_from_winner(self):
+        """Test results are yielded as the backend produces them, not buffered."""
+        inner = ScriptedRetriever(script=[0])
+        retriever = self._wrap(inner)
+
+        stream = retriever.retrieve("stream", limit=1000)
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert first == {"id": 1, "query": "stream"}
+        assert inner.yielded == 1
+        assert retriever.get_stats()["breaker"]["state"] == "closed"
+
+
+class TestFactoryIntegration:
+    """Test the factory applies the resilience layer on request."""
+
+    def test_factory_wraps_when_configured(self):
+        factory = RetrieverFactory()
+        factory.register("scripted", ScriptedRetriever)
+
+        plain = factory.create({"type": "scripted"})
+        wrapped = factory.create({"type": "scripted", "resilience": {"hedge": False}})
+
+        assert isinstance(plain, ScriptedRetriever)
+        assert isinstance(wrapped, ResilientRetriever)
+        assert isinstance(wrapped.inner, ScriptedRetriever)
+        assert wrapped.name == "scripted"
+        assert not wrapped.hedge
+        assert "resilience" not in wrapped.inner.config
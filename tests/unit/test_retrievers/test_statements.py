@@ -0,0 +1,77 @@
+"""Unit tests for the prepared-statement registry."""
+
+from src.retrievers.statements import PreparedStatementRegistry, normalize_sql
+
+
+class TestNormalizeSql:
+    """Test SQL shape normalization."""
+
+    def test_whitespace_and_semicolon(self):
+        sql = "  SELECT *\n  FROM docs\tWHERE id = $1 ;  "
+        assert normalize_sql(sql) == "SELECT * FROM docs WHERE id = $1"
+
+    def test_string_literals_are_preserved(self):
+        sql = "SELECT  'a  b' AS x,  'it''s  ok' AS y"
+        assert normalize_sql(sql) == "SELECT 'a  b' AS x, 'it''s  ok' AS y"
+
+    def test_line_comment_keeps_its_newline(self):
+        """Joining lines must not pull the WHERE clause into the comment."""
+        sql = "DELETE  FROM docs -- cleanup\n  WHERE id = 5"
+        assert normalize_sql(sql) == "DELETE FROM docs -- cleanup\n WHERE id = 5"
+
+    def test_dollar_quotes_are_preserved(self):
+        sql = "SELECT  $$a   b$$,  $fn$ x  $$ y $fn$,  a$b$c,  $1"
+        assert normalize_sql(sql) == "SELECT $$a   b$$, $fn$ x  $$ y $fn$, a$b$c, $1"
+
+    def test_identifiers_escape_strings_and_block_comments(self):
+        sql = "SELECT  \"a  b\",  E'it\\'s  x',  /* a /* b  */ c  */ 1"
+        assert normalize_sql(sql) == (
+            "SELECT \"a  b\", E'it\\'s  x', /* a /* b  */ c  */ 1"
+        )
+
+
+class TestPreparedStatementRegistry:
+    """Test registry reuse, eviction, stats and invalidation."""
+
+    def test_same_shape_is_a_hit(self):
+        registry = PreparedStatementRegistry(max_size=10)
+
+        first = registry.register("SELECT * FROM docs WHERE id = $1")
+        second = registry.register("SELECT *   FROM docs\nWHERE id = $1;")
+
+        assert first == second
+        assert (registry.hits, registry.misses) == (1, 1)
+
+    def test_lru_eviction_matches_cache_size(self):
+        registry = PreparedStatementRegistry(max_size=2)
+
+        a = registry.register("SELECT 1")
+        registry.register("SELECT 2")
+        registry.register("SELECT 1")
+        registry.register("SELECT 3")
+
+        stats = registry.get_stats()
+        assert stats["evictions"] == 1
+        assert set(stats["statements"]) == {a, "SELECT 3"}
+
+    def test_latency_stats_and_invalidation(self):
+        registry = PreparedStatementRegistry()
+        sql = registry.register("SELECT * FROM docs")
+
+        registry.record(sql, 4.0, rows=10)
+        registry.record(sql, 2.0, rows=5, error=True)
+
+        stats = registry.get_stats()["statements"][sql]
+        assert stats == {
+            "calls": 2,
+            "errors": 1,
+            "rows": 15,
+            "avg_ms": 3.0,
+            "max_ms": 4.0,
+        }
+
+        assert registry.invalidate() == 1
+        assert registry.get_stats()["size"] == 0
+        # Results for statements dropped by invalidation are ignored
+        registry.record(sql, 1.0)
+        assert registry.get_stats()["statements"] == {}
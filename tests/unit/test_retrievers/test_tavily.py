@@ -283,35 +283,23 @@ class TestTavilyRetrieverIntegration:
                 # After exiting context, should be disconnected
                 assert not retriever.connected
 
-    async def test_retry_on_rate_limit(self, tavily_config):
-        """Test retry logic on rate limit errors."""
+    async def test_rate_limit_raises_with_retry_after(self, tavily_config):
+        """Test rate limit errors surface Retry-After instead of sleeping."""
         retriever = TavilyRetriever(tavily_config)
         retriever._connected = True
 
-        # Create a mock client
-        mock_client = AsyncMock()
-        retriever._client = mock_client
-
-        # Mock rate limit response
         rate_limit_response = httpx.Response(
             status_code=429, headers={"Retry-After": "1"}
         )
 
-        with patch.object(
-            retriever._client, "post", new_callable=AsyncMock
-        ) as mock_post:
-            # First call returns rate limit, second succeeds
-            mock_post.side_effect = [
-                httpx.HTTPStatusError(
-                    "Rate limited", request=Mock(), response=rate_limit_response
-                ),
-                Mock(json=Mock(return_value={"results": [{"title": "Success"}]})),
-            ]
+        with patch.object(retriever, "_search", new_callable=AsyncMock) as mock_search:
+            mock_search.side_effect = httpx.HTTPStatusError(
+                "Rate limited", request=Mock(), response=rate_limit_response
+            )
 
-            results = []
-            async for result in retriever.retrieve("test query", limit=1):
-                results.append(result)
+            with pytest.raises(QueryError) as exc_info:
+                async for _ in retriever.retrieve("test query", limit=1):
+                    pass
 
-            assert len(results) == 1
-            assert results[0]["title"] == "Success"
-            assert mock_post.call_count == 2
+            assert exc_info.value.details == {"status_code": 429, "retry_after": 1.0}
+            assert mock_search.call_count == 1
@@ -0,0 +1,49 @@
+"""Unit tests for retriever warm-up helpers."""
+
+import pytest
+
+from src.retrievers.warmup import WarmupQuery, load_warmup_queries, prime_cache
+
+
+def test_load_warmup_queries(tmp_path):
+    """Test top-N loading, extra keys as params and skipping bad lines."""
+    path = tmp_path / "queries.jsonl"
+    path.write_text(
+        '{"source": "tavily", "query": "python", "limit": 5}\n'
+        "not json\n"
+        "\n"
+        '{"source": "qdrant", "query": "vectors", "collection": "docs"}\n'
+        '{"source": "postgres", "query": "users"}\n'
+    )
+
+    queries = load_warmup_queries(path, top_n=2)
+
+    assert queries == [
+        WarmupQuery("tavily", "python", 5),
+        WarmupQuery("qdrant", "vectors", 10, {"collection": "docs"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_prime_cache_counts_outcomes():
+    """Test queries are run through matching retrievers only."""
+    calls = []
+
+    class Retriever:
+        async def retrieve(self, query, limit=10, **kwargs):
+            calls.append((query, limit, kwargs))
+            if query == "boom":
+                raise RuntimeError("backend down")
+            yield {"id": 1}
+
+    stats = await prime_cache(
+        {"qdrant": Retriever()},
+        [
+            WarmupQuery("qdrant", "vectors", 3, {"collection": "docs"}),
+            WarmupQuery("qdrant", "boom"),
+            WarmupQuery("tavily", "python"),
+        ],
+    )
+
+    assert stats == {"primed": 1, "failed": 1, "skipped": 1}
+    assert ("vectors", 3, {"collection": "docs"}) in calls
@@ -1,11 +1,15 @@
 """Unit tests for unified MCP server."""
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import os
 
 from src.server_unified import UnifiedMCPServer, UserContext, main
 from src.config import ServerConfig, ServerProfile
+from src.retrievers.fusion import ResultFusion
 
 
 @pytest.fixture
@@ -151,6 +155,96 @@ class TestUnifiedMCPServer:
             mock_postgres.connect.assert_called_once()
             mock_qdrant.connect.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_init_retrievers_concurrent_with_timeout(self, complete_config):
+        """Test backends connect concurrently and a hung one is dropped."""
+        complete_config.retriever_config.connect_timeout = 0.2
+        server = UnifiedMCPServer(complete_config)
+
+        async def slow_connect():
+            await asyncio.sleep(0.15)
+
+        async def hung_connect():
+            await asyncio.sleep(10)
+
+        retrievers = {
+            "tavily": AsyncMock(connect=AsyncMock(side_effect=slow_connect)),
+            "postgres": AsyncMock(connect=AsyncMock(side_effect=slow_connect)),
+            "qdrant": AsyncMock(connect=AsyncMock(side_effect=hung_connect)),
+        }
+        server.factory = Mock()
+        server.factory.create.side_effect = lambda config: retrievers[config["type"]]
+
+        started = asyncio.get_running_loop().time()
+        errors = await server.init_retrievers()
+        elapsed = asyncio.get_running_loop().time() - started
+
+        # Sequential connects would take at least 0.5s
+        assert elapsed < 0.4
+        assert set(server.retrievers) == {"tavily", "postgres"}
+        assert len(errors) == 1 and errors[0].startswith("Qdrant:")
+
+    @pytest.mark.asyncio
+    async def test_lazy_connect_on_first_use(self, complete_config):
+        """Test lazy mode connects once, on first use, for concurrent callers."""
+        complete_config.retriever_config.lazy_connect = True
+        server = UnifiedMCPServer(complete_config)
+
+        retriever = AsyncMock()
+        retriever.connected = False
+
+        async def connect():
+            await asyncio.sleep(0.01)
+            retriever.connected = True
+
+        retriever.connect = AsyncMock(side_effect=connect)
+        server.factory = Mock()
+        server.factory.create.return_value = retriever
+
+        await server.init_retrievers()
+        retriever.connect.assert_not_called()
+
+        results = await asyncio.gather(
+            *(server._ensure_connected("postgres") for _ in range(5))
+        )
+
+        assert all(r is retriever for r in results)
+        retriever.connect.assert_called_once()
+        assert server._connect_tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_warm_up_gates_readiness(self, complete_config, tmp_path):
+        """Test /health stays not-ready until warm-up and cache priming finish."""
+        queries = tmp_path / "queries.jsonl"
+        queries.write_text(
+            '{"source": "tavily", "query": "python"}\n'
+            '{"source": "qdrant", "query": "vectors", "collection": "docs"}\n'
+        )
+        complete_config.retriever_config.warmup_enabled = True
+        complete_config.retriever_config.warmup_queries_file = str(queries)
+        server = UnifiedMCPServer(complete_config)
+
+        release = asyncio.Event()
+        retriever = AsyncMock()
+        retriever.connected = True
+
+        async def warm_up():
+            await release.wait()
+            return {"pool_connections": 2}
+
+        retriever.warm_up = AsyncMock(side_effect=warm_up)
+        server.retrievers = {"postgres": retriever}
+        assert server.readiness == "starting"
+
+        task = asyncio.create_task(server._start_up())
+        await asyncio.sleep(0)
+        assert server.readiness == "warming"
+
+        release.set()
+        await task
+        assert server.readiness == "ready"
+        retriever.warm_up.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_cleanup(self, complete_config):
         """Test server cleanup."""
@@ -373,6 +467,208 @@ class TestServerTools:
         assert len(result["results"]["postgres"]) == 1
         assert len(result["results"]["qdrant"]) == 1
 
+    @staticmethod
+    def _source(items, delay=0.0):
+        """Create a retriever mock yielding items after a delay."""
+        retriever = AsyncMock()
+        retriever.connected = True
+
+        async def retrieve(query, **kwargs):
+            await asyncio.sleep(delay)
+            for item in items:
+                yield item
+
+        retriever.retrieve = retrieve
+        return retriever
+
+    @pytest.mark.asyncio
+    async def test_search_all_early_return_cancels_stragglers(
+        self, mock_server, mock_context
+    ):
+        """Test search_all returns after N sources and cancels the rest."""
+        sources = {
+            "fast": self._source([{"id": 1}]),
+            "slow": self._source([{"id": 2}], delay=5),
+        }
+
+        gathered = await mock_server._gather_search_results(
+            sources, "q", 5, mock_context, min_sources=1
+        )
+
+        assert gathered["results"] == {"fast": [{"id": 1}]}
+        assert gathered["cancelled"] == ["slow"]
+        assert gathered["early_return"] is True
+        assert "slow" not in gathered["errors"]
+
+    @pytest.mark.asyncio
+    async def test_search_all_min_results(self, mock_server, mock_context):
+        """Test search_all returns once K results are collected."""
+        sources = {
+            "fast": self._source([{"id": i} for i in range(3)]),
+            "slow": self._source([{"id": 9}], delay=5),
+        }
+
+        gathered = await mock_server._gather_search_results(
+            sources, "q", 5, mock_context, min_results=3
+        )
+
+        assert len(gathered["results"]["fast"]) == 3
+        assert gathered["cancelled"] == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_search_all_deadlines(self, mock_server, mock_context):
+        """Test per-source and global deadlines."""
+        sources = {
+            "fast": self._source([{"id": 1}]),
+            "slow": self._source([{"id": 2}], delay=5),
+        }
+
+        gathered = await mock_server._gather_search_results(
+            sources, "q", 5, mock_context, source_timeout=0.05
+        )
+        assert gathered["results"] == {"fast": [{"id": 1}]}
+        assert "slow" in gathered["errors"]
+        assert gathered["cancelled"] == []
+        assert gathered["partial"] == []
+
+        async def trickle(query, **kwargs):
+            yield {"id": 3}
+            await asyncio.sleep(5)
+            yield {"id": 4}
+
+        sources["trickle"] = self._source([])
+        sources["trickle"].retrieve = trickle
+        gathered = await mock_server._gather_search_results(
+            sources, "q", 5, mock_context, source_timeout=0.05
+        )
+        assert gathered["results"]["trickle"] == [{"id": 3}]
+        assert gathered["partial"] == ["trickle"]
+        del sources["trickle"]
+
+        gathered = await mock_server._gather_search_results(
+            sources, "q", 5, mock_context, source_timeout=10, timeout=0.05
+        )
+        assert gathered["cancelled"] == ["slow"]
+        assert gathered["early_return"] is False
+        assert "slow" in gathered["errors"]
+
+    @pytest.mark.asyncio
+    async def test_search_all_streams_progress(self, mock_server, mock_context):
+        """Test each source is reported through a progress notification."""
+        sources = {
+            "a": self._source([{"id": 1}]),
+            "b": self._source([{"id": 2}], delay=0.01),
+        }
+
+        await mock_server._gather_search_results(
+            sources, "q", 5, mock_context, stream=True
+        )
+
+        calls = mock_context.report_progress.await_args_list
+        assert [c.kwargs["progress"] for c in calls] == [1, 2]
+        first = json.loads(calls[0].kwargs["message"])
+        assert first == {"source": "a", "results": [{"id": 1}]}
+
+    @pytest.mark.asyncio
+    async def test_search_all_fusion(self, mock_server, mock_context):
+        """Test sources are fused into one deduplicated ranking as they arrive."""
+        sources = {
+            "web": self._source([{"url": "https://a.com"}, {"url": "https://b.com"}]),
+            "vector": self._source([{"url": "https://b.com/"}], delay=0.01),
+        }
+        fusion = ResultFusion()
+
+        await mock_server._gather_search_results(
+            sources, "q", 5, mock_context, fusion=fusion
+        )
+
+        top = fusion.top_k(5)
+        assert [r["url"] for r in top] == ["https://b.com", "https://a.com"]
+        assert fusion.stats()["duplicates"] == 1
+
+    @pytest.mark.asyncio
+    async def test_search_all_cache_only_sources(self, mock_server, mock_context):
+        """Test over-budget sources answer from cache without calling the backend."""
+        from src.retrievers.caching import CachingRetriever
+
+        def caching(cached):
+            inner = self._source([{"id": "live"}])
+            inner.is_read_only = Mock(return_value=True)
+            cache = AsyncMock()
+            cache.get.return_value = cached
+            return CachingRetriever(inner, "tavily", cache=cache)
+
+        sources = {
+            "hit": caching([{"id": "cached"}]),
+            "miss": caching(None),
+            "live": self._source([{"id": "live"}]),
+        }
+
+        gathered = await mock_server._gather_search_results(
+            sources, "q", 5, mock_context, cache_only=frozenset({"hit", "miss"})
+        )
+
+        assert gathered["results"] == {
+            "hit": [{"id": "cached"}],
+            "live": [{"id": "live"}],
+        }
+        assert "캐시된 결과 없음" in gathered["errors"]["miss"]
+
+    @pytest.mark.asyncio
+    async def test_over_budget_searches_serve_cache(self, mock_server, mock_context):
+        """Test search_vectors/search_database answer from cache when over budget."""
+        from fastmcp.exceptions import ToolError
+        from src.retrievers.caching import CachingRetriever
+
+        def caching(name, cached):
+            inner = AsyncMock()
+            inner.connected = True
+            inner.is_read_only = Mock(return_value=True)
+            cache = AsyncMock()
+            cache.get.return_value = cached
+            return CachingRetriever(inner, name, cache=cache)
+
+        mock_server.retrievers = {
+            "qdrant": caching("qdrant", [{"id": "cached-vector"}]),
+            "postgres": caching("postgres", None),
+        }
+        tools = await mock_server.create_server().get_tools()
+
+        with patch(
+            "src.middleware.rate_limit.cache_only_backends",
+            return_value=frozenset({"qdrant", "postgres"}),
+        ):
+            result = await tools["search_vectors"].fn(
+                mock_context, query="q", collection="docs", access_token=None
+            )
+            with pytest.raises(ToolError, match="캐시된 결과가 없습니다"):
+                await tools["search_database"].fn(
+                    mock_context, query="q", access_token=None
+                )
+
+        assert result == [{"id": "cached-vector"}]
+        for retriever in mock_server.retrievers.values():
+            retriever.inner.retrieve.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_invalidates_caches(self, mock_server):
+        """Test bulk writes drop the cached results and statement/type caches."""
+        from src.retrievers.caching import CachingRetriever
+        from src.retrievers.postgres import PostgresRetriever
+
+        postgres = PostgresRetriever({"dsn": "postgresql://localhost/db"})
+        postgres.invalidate_statements = AsyncMock(return_value=0)
+        cache = AsyncMock()
+        cache.clear_namespace.return_value = 3
+        retriever = CachingRetriever(postgres, "postgres", cache=cache)
+
+        await mock_server._invalidate_after_bulk_write(retriever)
+
+        cache.clear_namespace.assert_awaited_once_with("postgres")
+        postgres.invalidate_statements.assert_awaited_once_with(
+            expire_connections=False
+        )
+
     @pytest.mark.asyncio
     async def test_health_check_tool(self, mock_server, mock_context):
         """Test health_check tool function."""
@@ -489,6 +785,93 @@ class TestCachingTools:
         assert stats["tavily"]["cache_namespace"] == "tavily:search"
 
 
+class TestMCPClientPermissions:
+    """Test the compiled middleware pipeline through an in-memory MCP client."""
+
+    @pytest.fixture
+    def complete_server(self):
+        """Create a COMPLETE-profile server with mocked retrievers and lifespan."""
+        config = ServerConfig.from_profile(ServerProfile.COMPLETE)
+        config.auth_config.internal_api_key = (
+            "mock-internal-api-key-that-is-long-enough-for-validation"
+        )
+        config.auth_config.jwt_secret_key = (
+            "mock-jwt-secret-key-that-is-long-enough-for-validation"
+        )
+        config.auth_config.require_auth = False
+        config.retriever_config.tavily_api_key = "tvly-mockkey123456789"
+        config.rate_limit_config.requests_per_hour = 3600
+        server = UnifiedMCPServer(config)
+
+        postgres = AsyncMock(spec=["connected", "bulk_delete"])
+        postgres.connected = True
+        postgres.bulk_delete = AsyncMock(return_value=2)
+        server.retrievers = {"postgres": postgres}
+        server.init_retrievers = AsyncMock(return_value=[])
+        server._start_up = AsyncMock()
+        server.cleanup = AsyncMock()
+        return server
+
+    @staticmethod
+    def _token_for(*roles):
+        from fastmcp.server.auth.providers.bearer import AccessToken
+
+        return AccessToken(
+            token="token",
+            client_id=f"{roles[0]}-1",
+            scopes=[],
+            resource=json.dumps({"email": "a@example.com", "roles": list(roles)}),
+        )
+
+    @pytest.mark.asyncio
+    async def test_admin_reaches_resources_prompts_and_management_tools(
+        self, complete_server
+    ):
+        """Test resources/prompts listing and admin-only tools pass validation."""
+        from fastmcp import Client
+
+        with patch(
+            "src.server_unified.get_access_token",
+            return_value=self._token_for("admin"),
+        ):
+            async with Client(complete_server.create_server()) as client:
+                assert await client.list_resources() == []
+                assert await client.list_prompts() == []
+
+                for tool, arguments in [
+                    ("get_metrics", {}),
+                    ("cache_stats", {}),
+                    ("invalidate_cache", {}),
+                    (
+                        "bulk_delete_database_records",
+                        {"table": "documents", "record_ids": ["1", "2"]},
+                    ),
+                ]:
+                    result = await client.call_tool(tool, arguments)
+                    assert not result.is_error, tool
+
+        complete_server.retrievers["postgres"].bulk_delete.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_user_denied_bulk_delete(self, complete_server):
+        """Test RBAC minimum roles are enforced on the MCP tool path."""
+        from fastmcp import Client
+        from fastmcp.exceptions import ToolError
+
+        with patch(
+            "src.server_unified.get_access_token",
+            return_value=self._token_for("user"),
+        ):
+            async with Client(complete_server.create_server()) as client:
+                with pytest.raises(ToolError, match="Permission denied"):
+                    await client.call_tool(
+                        "bulk_delete_database_records",
+                        {"table": "documents", "record_ids": ["1"]},
+                    )
+
+        complete_server.retrievers["postgres"].bulk_delete.assert_not_called()
+
+
 class TestMainFunction:
     """Test the main entry point."""
 
@@ -0,0 +1,154 @@
+"""Unit tests for the asynchronous batched log sink."""
+
+import threading
+
+import pytest
+
+from src.middleware.logging import LoggingMiddleware
+from src.utils.log_sink import AsyncLogSink
+
+
+class CollectingWriter:
+    """Writer that records batches, optionally blocking until released."""
+
+    def __init__(self, block: bool = False):
+        self.batches = []
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def __call__(self, records):
+        self.release.wait(5)
+        self.batches.append(records)
+
+    @property
+    def records(self):
+        return [record for batch in self.batches for record in batch]
+
+
+class TestAsyncLogSink:
+    """Test AsyncLogSink."""
+
+    def test_close_flushes_pending_records(self):
+        """Test all enqueued records are written before close returns."""
+        writer = CollectingWriter()
+        sink = AsyncLogSink(writer=writer, batch_size=10, flush_interval=0.01)
+
+        for i in range(25):
+            assert sink.emit("info", "event", {"i": i})
+        sink.close()
+
+        assert [fields["i"] for _, _, fields in writer.records] == list(range(25))
+        assert all(len(batch) <= 10 for batch in writer.batches)
+        stats = sink.get_stats()
+        assert stats["written"] == 25
+        assert stats["dropped"] == 0
+
+    def test_drop_on_overflow(self):
+        """Test records are dropped and counted when the queue is full."""
+        writer = CollectingWriter(block=True)
+        sink = AsyncLogSink(writer=writer, max_queue_size=2, batch_size=1)
+
+        results = [sink.emit("info", "event", {"i": i}) for i in range(10)]
+        writer.release.set()
+        sink.close()
+
+        assert results.count(False) == sink.get_stats()["dropped"]
+        assert sink.get_stats()["dropped"] > 0
+
+    def test_lazy_fields_resolved_in_writer(self):
+        """Test lazy fields are computed only when the record is written."""
+        writer = CollectingWriter()
+        sink = AsyncLogSink(writer=writer, flush_interval=0.01)
+        calls = []
+
+        sink.emit("info", "event", {}, lazy={"body": lambda: calls.append(1) or "x"})
+        sink.close()
+
+        assert calls == [1]
+        assert writer.records[0][2]["body"] == "x"
+
+    def test_emit_after_close_is_dropped(self):
+        """Test emitting after close does not raise."""
+        sink = AsyncLogSink(writer=CollectingWriter())
+        sink.close()
+
+        assert sink.emit("info", "event", {}) is False
+        assert sink.get_stats()["dropped"] == 1
+
+
+class TestLoggingMiddlewareSink:
+    """Test LoggingMiddleware with a sink and sampling."""
+
+    @pytest.fixture
+    def request_data(self):
+        return {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "search_web", "arguments": {"password": "pw"}},
+            "user": {"id": "user123"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_sampled_out_requests_skip_sanitize(self, request_data):
+        """Test successful fast requests dropped by sampling are never sanitized."""
+        writer = CollectingWriter()
+        sink = AsyncLogSink(writer=writer, flush_interval=0.01)
+        middleware = LoggingMiddleware(
+            log_request_body=True, sink=sink, success_sample_rate=0.0
+        )
+        middleware._sanitize_data = lambda data: pytest.fail("sanitized")
+
+        async def call_next(request):
+            return {"result": "ok"}
+
+        await middleware(request_data, call_next)
+        sink.close()
+
+        assert writer.records == []
+        assert middleware.get_logging_stats()["sampled_out"] == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_always_logged(self, request_data):
+        """Test error responses bypass sampling and sanitize lazily."""
+        writer = CollectingWriter()
+        sink = AsyncLogSink(writer=writer, flush_interval=0.01)
+        middleware = LoggingMiddleware(
+            log_request_body=True, sink=sink, success_sample_rate=0.0
+        )
+
+        async def call_next(request):
+            return {"error": {"code": -32603, "message": "boom"}}
+
+        await middleware(request_data, call_next)
+        sink.close()
+
+        events = [(level, event) for level, event, _ in writer.records]
+        assert events == [("info", "MCP 요청 수신"), ("error", "MCP 요청 완료")]
+        body = writer.records[0][2]["request_body"]
+        assert body["params"]["arguments"]["password"] == "[REDACTED]"
+
+    @pytest.mark.asyncio
+    async def test_deferred_bodies_are_snapshotted(self, request_data):
+        """Test later mutations do not race with sanitizing on the writer thread."""
+        writer = CollectingWriter(block=True)
+        sink = AsyncLogSink(writer=writer, batch_size=1, flush_interval=0.01)
+        middleware = LoggingMiddleware(
+            log_request_body=True, log_response_body=True, sink=sink
+        )
+        response = {"result": "ok"}
+
+        async def call_next(request):
+            return response
+
+        await middleware(request_data, call_next)
+        request_data["params"] = {"name": "changed"}
+        response["result"] = "changed"
+        writer.release.set()
+        sink.close()
+
+        bodies = [fields for _, _, fields in writer.records]
+        assert bodies[0]["request_body"]["params"]["name"] == "search_web"
+        assert "request_id" not in bodies[0]["request_body"]
+        assert bodies[1]["response_body"] == {"result": "ok"}
@@ -0,0 +1,223 @@
+"""Unit tests for the Redis-backed metrics time-series store."""
+
+import pytest
+
+from src.middleware.metrics import MetricsMiddleware
+from src.utils.metrics_store import (
+    HOUR,
+    MINUTE,
+    MetricsStoreConfig,
+    MetricsTimeSeries,
+)
+
+# 2025-01-01 00:00:00 UTC
+T0 = 1735689600.0
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self):
+        self.redis.pipelines.append(len(self.commands))
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+        return [
+            getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class FakeRedis:
+    """In-memory subset of the commands used by MetricsTimeSeries."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.hlls = {}
+        self.expiry = {}
+        self.pipelines = []
+        self.fail = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + amount)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def expireat(self, key, when):
+        self.expiry[key] = when
+
+    def pfadd(self, key, *values):
+        self.hlls.setdefault(key, set()).update(values)
+
+    async def pfcount(self, *keys):
+        return len(set().union(*(self.hlls.get(key, set()) for key in keys)))
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+async def store(redis):
+    store = MetricsTimeSeries(redis, MetricsStoreConfig(prefix="m"))
+    yield store
+    await store.close()
+
+
+class TestMetricsTimeSeries:
+    """Test MetricsTimeSeries."""
+
+    def test_record_only_buffers(self, store, redis):
+        """Test recording does not touch Redis until flush."""
+        store.record("tools/call", "search_web", 40, False, timestamp=T0)
+
+        assert redis.pipelines == []
+        assert store.get_stats()["pending_buckets"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_both_tiers_in_one_pipeline(self, store, redis):
+        """Test one flush pre-aggregates minute and hour rollups."""
+        for second in (0, 30, 90):
+            store.record(
+                "tools/call", "search_web", 120, False, user_id="u1",
+                timestamp=T0 + second,
+            )
+        store.record("tools/call", "search_web", 700, True, timestamp=T0 + 95)
+
+        assert await store.flush() == 2
+
+        minute = int(T0 // MINUTE)
+        hour = int(T0 // HOUR)
+        assert len(redis.pipelines) == 1
+        assert redis.hashes[f"m:1m:{minute}"]["t|search_web|n"] == "2"
+        assert redis.hashes[f"m:1m:{minute + 1}"]["t|search_web|e"] == "1"
+        assert redis.hashes[f"m:1h:{hour}"]["t|search_web|n"] == "4"
+        assert redis.hashes[f"m:1h:{hour}"]["t|search_web|d"] == "1060"
+        assert redis.hlls[f"m:1h:{hour}:u"] == {"u1"}
+        # Keys expire after the tier's retention, measured from the bucket end
+        assert redis.expiry[f"m:1m:{minute}"] == (minute + 1) * MINUTE + 24 * HOUR
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_is_counted(self, store, redis):
+        """Test a failed batch is dropped without raising."""
+        store.record("tools/call", "search_web", 10, False, timestamp=T0)
+        redis.fail = True
+
+        assert await store.flush() == 0
+        assert store.flush_errors == 1
+        assert store.get_stats()["pending_buckets"] == 0
+
+    @pytest.mark.asyncio
+    async def test_query_aggregates_rollups(self, store, redis):
+        """Test totals, per-tool stats, histogram, roles and timeline."""
+        store.record("tools/call", "search_web", 40, False, "u1", "admin", T0)
+        store.record("tools/call", "search_web", 300, True, "u2", "user", T0 + 60)
+        store.record("tools/call", "search_vectors", 80, False, "u1", "admin", T0 + 120)
+        store.record("tools/list", None, 5, False, "u2", "user", T0 + 120)
+        await store.flush()
+
+        window = await store.query(T0, T0 + 180, step=120, now=T0 + 180)
+
+        assert window["totals"] == {"count": 4, "errors": 1, "duration_ms": 425}
+        assert window["tools"]["search_web"]["count"] == 2
+        assert window["tools"]["search_web"]["last_used"] == T0 + 60
+        assert "tools/list" not in window["tools"]
+        assert window["histogram"] == [2, 1, 0, 1, 0]
+        assert window["roles"] == {"admin": 2, "user": 2}
+        assert window["active_users"] == 2
+        assert window["timeline"] == [(T0, 2), (T0 + 120, 2)]
+
+    @pytest.mark.asyncio
+    async def test_query_filters_by_tool(self, store):
+        """Test a tool filter only counts that tool's calls."""
+        store.record("tools/call", "search_web", 40, False, timestamp=T0)
+        store.record("tools/call", "search_vectors", 80, True, timestamp=T0)
+        store.record("tools/list", None, 5, False, timestamp=T0)
+        await store.flush()
+
+        window = await store.query(T0, T0 + 60, tool="search_vectors", now=T0 + 60)
+
+        assert window["totals"] == {"count": 1, "errors": 1, "duration_ms": 80}
+        assert list(window["tools"]) == ["search_vectors"]
+
+    def test_long_ranges_read_hour_rollups(self, store):
+        """Test tier selection by span and minute retention."""
+        now = T0
+        assert store.resolution_for(now - HOUR, now, now=now) == MINUTE
+        assert store.resolution_for(now - 24 * HOUR, now, now=now) == HOUR
+        assert store.resolution_for(now - 30 * 24 * HOUR, now, now=now) == HOUR
+        # Older than the minute retention even though the span is short
+        assert store.resolution_for(now - 48 * HOUR, now - 47 * HOUR, now=now) == HOUR
+
+    @pytest.mark.asyncio
+    async def test_thirty_day_query_is_one_pipeline(self, store, redis):
+        """Test a 30 day query reads one hour hash per hour in one round trip."""
+        now = T0 + 30 * 24 * HOUR
+        for day in range(30):
+            store.record("tools/call", "search_web", 50, False, timestamp=T0 + day * 24 * HOUR)
+        await store.flush()
+        redis.pipelines.clear()
+
+        window = await store.query(now - 30 * 24 * HOUR, now, step=24 * HOUR, now=now)
+
+        assert window["resolution"] == HOUR
+        assert redis.pipelines == [30 * 24 + 1]
+        assert window["totals"]["count"] == 30
+        assert len(window["timeline"]) == 30
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self, store, redis):
+        """Test close stops the background task and writes what is left."""
+        store.record("tools/call", "search_web", 10, False)
+        assert store._flush_task is not None
+
+        await store.close()
+
+        assert store._flush_task.cancelled()
+        assert len(redis.pipelines) == 1
+        assert store.flushes == 1
+        store.record("tools/call", "search_web", 10, False)
+        assert store.dropped == 1
+
+
+class TestMetricsMiddlewareTimeSeries:
+    """Test MetricsMiddleware writes to the time-series store."""
+
+    @pytest.mark.asyncio
+    async def test_requests_are_recorded_with_role(self, store, redis):
+        middleware = MetricsMiddleware(timeseries=store)
+        request = {
+            "method": "tools/call",
+            "params": {"name": "search_web"},
+            "user": {"id": "u1", "roles": ["user", "admin"]},
+        }
+
+        async def call_next(req):
+            return {"result": "ok"}
+
+        await middleware(request, call_next)
+        await store.close()
+
+        fields = {}
+        for key, values in redis.hashes.items():
+            if ":1h:" in key:
+                fields.update(values)
+        assert fields["t|search_web|n"] == "1"
+        assert fields["r|admin"] == "1"
+        assert store.recorded == 1
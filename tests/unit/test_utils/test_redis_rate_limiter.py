@@ -133,12 +133,11 @@ class TestRedisRateLimiter:
         """Test usage stats with weighted requests."""
         current_time = time.time()
 
-        # Mock Redis responses with weights
-        # Score format: timestamp.weight (weight as decimal part * 1000)
+        # Member format: request_id:weight, score is the raw timestamp
         mock_redis.zrange.return_value = [
-            ("req1", current_time - 30 + 0.002),  # weight 2
-            ("req2", current_time - 10 + 0.003),  # weight 3
-            ("req3", current_time - 5 + 0.001),  # weight 1
+            ("req1:2", current_time - 30.123),
+            (b"req2:3", current_time - 10.987),
+            ("req3:1", current_time - 5.5),
         ]
 
         stats = await rate_limiter.get_usage_stats("user123")
@@ -146,6 +145,27 @@ class TestRedisRateLimiter:
         assert stats["current_usage"] == 6  # 2 + 3 + 1 = 6
         assert stats["request_count"] == 3
 
+    @pytest.mark.asyncio
+    async def test_lua_script_accumulates_exact_weights(self):
+        """Weights summed by the Lua script match the costs charged."""
+        lupa = pytest.importorskip("lupa")
+        limiter = RedisRateLimiter(
+            redis_client=_LuaZSetRedis(lupa), window_seconds=60, default_limit=20
+        )
+
+        for weight in (1, 2, 3):
+            allowed, info = await limiter.check_rate_limit("user123", weight=weight)
+            assert allowed is True
+        assert info["current_usage"] == 6
+        assert (await limiter.get_usage_stats("user123"))["current_usage"] == 6
+
+        allowed_calls = 0
+        for _ in range(20):
+            allowed, _info = await limiter.check_rate_limit("user123", weight=1)
+            allowed_calls += allowed
+        assert allowed_calls == 14
+        assert _info["current_usage"] == 20
+
     @pytest.mark.asyncio
     async def test_reset_limit(self, rate_limiter, mock_redis):
         """Test resetting rate limit for a user."""
@@ -232,3 +252,44 @@ class TestRedisRateLimiter:
         assert results[2][0] is True
         assert results[3][0] is False
         assert results[3][1]["retry_after"] == 10
+
+
+class _LuaZSetRedis:
+    """In-memory ZSET store that runs LUA_SCRIPT through lupa."""
+
+    def __init__(self, lupa):
+        self.zsets = {}
+        self.lua = lupa.LuaRuntime(unpack_returned_tuples=True)
+        self.lua.globals().redis = self.lua.table(call=self._call)
+
+    def _call(self, command, key, *args):
+        zset = self.zsets.setdefault(key, {})
+        if command == "ZREMRANGEBYSCORE":
+            high = float(args[1])
+            for member in [m for m, score in zset.items() if score <= high]:
+                del zset[member]
+            return 0
+        if command == "ZRANGE":
+            flat = []
+            for member, score in sorted(zset.items(), key=lambda item: item[1]):
+                flat += [member, repr(score)]
+            return self.lua.table(*flat)
+        if command == "ZADD":
+            zset[args[1]] = float(args[0])
+            return 1
+        return 1
+
+    async def script_load(self, script):
+        self.script = self.lua.eval("function(KEYS, ARGV) " + script + " end")
+        return "sha"
+
+    async def evalsha(self, sha, numkeys, *keys_and_args):
+        keys = self.lua.table(*keys_and_args[:numkeys])
+        argv = self.lua.table(*keys_and_args[numkeys:])
+        return list(self.script(keys, argv).values())
+
+    async def zremrangebyscore(self, key, low, high):
+        self._call("ZREMRANGEBYSCORE", key, low, high)
+
+    async def zrange(self, key, start, end, withscores=False):
+        return sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])